@@ -1,15 +1,37 @@
-"""CLI command exports for amplifier-app-cli."""
+"""CLI command exports for amplifier-app-cli.
 
-from .init import auto_init_from_env
-from .init import check_first_run
-from .init import init_cmd
-from .init import prompt_first_run_init
-from .module import module
-from .provider import provider
-from .run import register_run_command
-from .session import register_session_commands
-from .source import source
-from .tool import tool
+Exports resolve on first access so importing one command module (the CLI
+imports them on dispatch) does not import every other one.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from .init import auto_init_from_env
+    from .init import check_first_run
+    from .init import init_cmd
+    from .init import prompt_first_run_init
+    from .module import module
+    from .provider import provider
+    from .run import register_run_command
+    from .session import register_session_commands
+    from .source import source
+    from .tool import tool
+
+_EXPORTS = {
+    "auto_init_from_env": ".init",
+    "check_first_run": ".init",
+    "init_cmd": ".init",
+    "module": ".module",
+    "prompt_first_run_init": ".init",
+    "provider": ".provider",
+    "register_run_command": ".run",
+    "register_session_commands": ".session",
+    "source": ".source",
+    "tool": ".tool",
+}
 
 __all__ = [
     "auto_init_from_env",
@@ -23,3 +45,12 @@ __all__ = [
     "source",
     "tool",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    # Importing ".module" binds the submodule under the same name; the export wins
+    globals()[name] = value
+    return value
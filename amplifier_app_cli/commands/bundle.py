@@ -6,7 +6,9 @@ Bundles are the configuration format for configuring Amplifier sessions.
 from __future__ import annotations
 
 import asyncio
+import re
 import sys
+from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import cast
@@ -834,6 +836,65 @@ def bundle_current():
         )
 
 
+@bundle.command(name="freeze")
+@click.argument("name", required=False)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Snapshot file to write (default: ./<name>.snapshot)",
+)
+def bundle_freeze(name: str | None, output: Path | None):
+    """Freeze a fully prepared bundle into an offline snapshot file.
+
+    Prepares NAME (default: the active bundle) with all app-level behaviors,
+    then records the mount plan, agent metadata, module import paths and the
+    commits of the cached modules it uses. Boot from it with
+    'amplifier run --snapshot FILE': no registry lookups, git resolution or
+    dependency installs.
+
+    Module code stays in ~/.amplifier/cache; ship that alongside the
+    snapshot. Settings overrides (providers, API keys) are applied at run
+    time and are never written to the snapshot.
+    """
+    from ..runtime.config import prepare_bundle
+    from ..runtime.snapshot import SnapshotError
+    from ..runtime.snapshot import write_snapshot
+
+    app_settings = AppSettings()
+    name = name or app_settings.get_active_bundle() or "anchors"
+    output = output or Path(f"{re.sub(r'[^A-Za-z0-9._-]+', '-', name)}.snapshot")
+
+    sys_path_before = set(sys.path)
+    try:
+        prepared = asyncio.run(
+            prepare_bundle(name, app_settings, console, use_plan_cache=False)
+        )
+        info = write_snapshot(
+            output,
+            name,
+            prepared,
+            sys_path_added=[p for p in sys.path if p not in sys_path_before],
+        )
+    except FileNotFoundError:
+        console.print(f"[red]Error:[/red] Bundle '{name}' not found")
+        sys.exit(1)
+    except (SnapshotError, OSError) as exc:
+        console.print(f"[red]Error:[/red] {escape_markup(exc)}")
+        sys.exit(1)
+    except Exception as exc:
+        console.print(
+            f"[red]Error:[/red] Failed to prepare bundle: {escape_markup(exc)}"
+        )
+        sys.exit(1)
+
+    console.print(f"[green]✓[/green] Froze bundle '{name}' to {output}")
+    console.print(f"  Pinned modules: {len(info.pinned)}")
+    console.print(f"  Module paths: {len(info.sys_path)}")
+    console.print(f"\n[dim]Run with: amplifier run --snapshot {output} PROMPT[/dim]")
+
+
 def _find_bundle_scope(app_settings: AppSettings) -> ScopeType | None:
     """Find which scope has a bundle setting (for auto-clear).
 
@@ -0,0 +1,39 @@
+"""Session entry commands: run, continue, resume and session.
+
+These drive the REPL and single-shot runners in main.py, so importing them
+pulls in the whole session runtime. main registers them as lazy commands
+pointing here; this module builds them on first dispatch.
+"""
+
+import click
+
+from ..main import check_first_run
+from ..main import execute_single
+from ..main import get_module_search_paths
+from ..main import interactive_chat
+from ..main import prompt_first_run_init
+from .run import register_run_command
+from .session import register_session_commands
+
+# Holder group for registration; main's cli loads each command from here.
+_commands = click.Group()
+
+run_command = register_run_command(
+    _commands,
+    interactive_chat=interactive_chat,
+    execute_single=execute_single,
+    get_module_search_paths=get_module_search_paths,
+    check_first_run=check_first_run,
+    prompt_first_run_init=prompt_first_run_init,
+)
+register_session_commands(
+    _commands,
+    interactive_chat=interactive_chat,
+    execute_single=execute_single,
+    get_module_search_paths=get_module_search_paths,
+)
+continue_command = _commands.commands["continue"]
+resume_command = _commands.commands["resume"]
+session_group = _commands.commands["session"]
+
+__all__ = ["continue_command", "resume_command", "run_command", "session_group"]
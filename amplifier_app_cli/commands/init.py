@@ -1,6 +1,12 @@
 """First-run detection, auto-initialization, and init dashboard for Amplifier."""
 
+import hashlib
+import json
 import logging
+import os
+import sys
+import sysconfig
+import tempfile
 
 import click
 from rich.console import Console
@@ -12,6 +18,7 @@ from rich.table import Table
 from ..key_manager import KeyManager
 from ..lib.settings import AppSettings, Scope
 from ..paths import create_config_manager
+from ..paths import get_install_state_path
 from ..ui.scope import (
     is_scope_change_available,
     print_scope_indicator,
@@ -34,6 +41,9 @@ from ..lib.merge_utils import _provider_key
 console = Console()
 logger = logging.getLogger(__name__)
 
+# install-state.json key holding the fingerprint of the last passing check
+_FIRST_RUN_STATE_KEY = "first_run_check"
+
 
 def _get_settings() -> AppSettings:
     """Get AppSettings instance. Extracted for testability."""
@@ -132,8 +142,20 @@ def check_first_run() -> bool:
     Return value stays driven by the ACTIVE provider only: True means "push the
     user into the add-a-provider prompt", which a non-active provider failing to
     install must never trigger.
+
+    A passing check is memoized in install-state.json under a fingerprint of
+    the CLI version, configured provider sources and install locations (see
+    _first_run_fingerprint()). While the fingerprint matches, validation is
+    skipped; any change, or anything rewriting the install state, re-runs it.
     """
     config = create_config_manager()
+
+    # Steady state: nothing the check depends on changed since it last passed
+    fingerprint = _first_run_fingerprint(config)
+    if fingerprint is not None and _read_first_run_state() == fingerprint:
+        logger.debug("check_first_run: install state unchanged since last check")
+        return False
+
     provider_mgr = ProviderManager(config)
     current_provider = provider_mgr.get_current_provider()
 
@@ -207,6 +229,9 @@ def check_first_run() -> bool:
         if _is_provider_module_installed(current_provider.module_id):
             # Active provider is usable - session can start.
             logger.debug("check_first_run: auto-install succeeded, no init needed")
+            if not still_missing:
+                # The install changed the environment; fingerprint it afresh
+                _write_first_run_state(_first_run_fingerprint(config))
             console.print()
             return False
         else:
@@ -222,9 +247,105 @@ def check_first_run() -> bool:
         f"check_first_run: provider {current_provider.module_id} configured and installed, "
         "no init needed"
     )
+    _write_first_run_state(fingerprint)
     return False
 
 
+def _first_run_fingerprint(config: AppSettings) -> str | None:
+    """Fingerprint of everything check_first_run()'s passing result depends on.
+
+    Covers the CLI and Python versions, the configured provider modules and
+    their sources, the install directories provider packages land in
+    (directory mtimes change when a distribution is added or removed), and
+    the entries of the module cache that editable provider installs point at.
+
+    Returns None when there is nothing worth memoizing (no providers
+    configured, or settings that cannot be read).
+    """
+    import importlib.metadata
+
+    try:
+        providers = config.get_provider_overrides()
+    except Exception as e:  # pragma: no cover - defensive, settings are best-effort
+        logger.debug(f"Could not read configured providers: {e}")
+        return None
+    if not isinstance(providers, list) or not providers:
+        return None
+
+    try:
+        cli_version = importlib.metadata.version("amplifier-app-cli")
+    except importlib.metadata.PackageNotFoundError:
+        cli_version = None
+
+    install_dirs = []
+    for directory in sorted(
+        {sysconfig.get_path("purelib"), sysconfig.get_path("platlib")}
+    ):
+        try:
+            install_dirs.append((directory, os.stat(directory).st_mtime_ns))
+        except OSError:
+            install_dirs.append((directory, None))
+
+    # Entry names, not the directory mtime: install-state.json itself lives here
+    cache_dir = get_install_state_path().parent
+    try:
+        with os.scandir(cache_dir) as entries:
+            cached = sorted(entry.name for entry in entries if entry.is_dir())
+    except OSError:
+        cached = []
+
+    key = {
+        "cli": cli_version,
+        "python": sys.version,
+        "providers": [
+            [entry.get("module"), entry.get("source")]
+            for entry in providers
+            if isinstance(entry, dict)
+        ],
+        "install_dirs": install_dirs,
+        "module_cache": cached,
+    }
+    encoded = json.dumps(key, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _read_install_state() -> dict:
+    try:
+        state = json.loads(get_install_state_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _read_first_run_state() -> str | None:
+    entry = _read_install_state().get(_FIRST_RUN_STATE_KEY)
+    return entry.get("fingerprint") if isinstance(entry, dict) else None
+
+
+def _write_first_run_state(fingerprint: str | None) -> None:
+    """Record a passing check in install-state.json (best-effort, atomic)."""
+    if fingerprint is None:
+        return
+    state = _read_install_state()
+    if state.get(_FIRST_RUN_STATE_KEY) == {"fingerprint": fingerprint}:
+        return
+    state[_FIRST_RUN_STATE_KEY] = {"fingerprint": fingerprint}
+
+    path = get_install_state_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f, indent=2)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError as e:
+        logger.debug(f"Could not record first-run check in install state: {e}")
+
+
 def _bounded_confirm(
     console_arg: Console,
     prompt: str,
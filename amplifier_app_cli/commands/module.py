@@ -490,9 +490,9 @@ def module_update(module_id: str | None, check_only: bool, mutable_only: bool):
         console.print("Checking for updates...")
 
         async def _check():
-            import httpx
+            from ..utils.source_status import create_check_client
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
+            async with create_check_client() as client:
                 return await check_all_sources(client=client, include_all_cached=True)
 
         report = asyncio.run(_check())
@@ -10,6 +10,7 @@ import sys
 import threading
 import uuid
 from collections.abc import Callable, Iterator
+from pathlib import Path
 from typing import Any
 
 import click
@@ -22,7 +23,9 @@ from ..effective_config import get_effective_config_summary
 from ..lib.settings import AppSettings
 from ..paths import create_config_manager
 from ..runtime.config import resolve_config
+from ..runtime.snapshot import SnapshotError
 from ..session_store import extract_session_mode
+from ..startup_profile import startup_profiler
 from ..types import (
     ExecuteSingleProtocol,
     InteractiveChatProtocol,
@@ -89,53 +92,24 @@ def _scoped_sigint_handler(handler: Any) -> Iterator[bool]:
 
 
 def _run_startup_update_check() -> None:
-    """Run the startup update check, but let Ctrl+C skip it immediately and
-    fall through to the user's actual command instead of the whole
-    invocation dying (GAP-023).
-
-    Before this fix, the pre-REPL "Checking for updates..." phase (this
-    function's caller, ``asyncio.run(check_and_notify())``) ran with no
-    SIGINT handling of its own -- ``_execute_with_interrupt``'s handler
-    (main.py, installed inside the per-turn wrapper) and the headless goal
-    path's ``_goal_sigint_handler`` (main.py) both install a handler
-    *around the operation they guard*; this phase runs earlier than either,
-    so it had no equivalent. A Ctrl+C here fell through to Click's default
-    top-level (EOFError, KeyboardInterrupt) handler, which prints
-    "Aborted!" and kills the ENTIRE ``amplifier run`` invocation -- not
-    just the optional, best-effort update check. Measured on native
-    Windows: the interrupt was not merely delayed, it destroyed the user's
-    whole command over an update check they never asked to wait on.
-
-    Fix: run the check on its own event loop with its own SIGINT handler
-    (same pattern as the two handlers above), so a Ctrl+C here cancels only
-    this task -- printing a clear message -- and the caller proceeds to run
-    the user's actual prompt/command normally.
+    """Start the startup update check in the background.
+
+    The check (``check_and_notify``: HTTP requests with 10 s timeouts across
+    every cached module) used to run to completion before bundle preparation
+    even started, and needed its own scoped SIGINT handler so a Ctrl+C there
+    skipped only the check instead of killing the whole invocation (GAP-023).
+
+    It now runs on a daemon thread overlapping bundle preparation and session
+    init, so it is never on the critical path of the first turn and a Ctrl+C
+    reaches the main thread's own handling as usual. The "updates available"
+    notice is printed by ``notify_if_updates()`` once the user reaches a
+    prompt (or after single-shot output). At exit a check still running gets
+    a short bounded wait to save its time; past that it is abandoned and
+    simply retried next start.
     """
-    from ..utils.startup_checker import check_and_notify
+    from ..utils.startup_checker import start_background_check
 
-    interrupted = False
-
-    def _update_check_sigint_handler(signum, frame):
-        nonlocal interrupted
-        interrupted = True
-        for task in asyncio.all_tasks(loop):
-            task.cancel()
-
-    loop = asyncio.new_event_loop()
-    with _scoped_sigint_handler(_update_check_sigint_handler):
-        try:
-            asyncio.set_event_loop(loop)
-            task = loop.create_task(check_and_notify())
-            try:
-                loop.run_until_complete(task)
-            except asyncio.CancelledError:
-                pass
-        finally:
-            asyncio.set_event_loop(None)
-            loop.close()
-
-    if interrupted:
-        console.print("[dim]Update check skipped (Ctrl+C) -- continuing...[/dim]")
+    start_background_check()
 
 
 def _resolve_config_interruptibly(
@@ -143,15 +117,15 @@ def _resolve_config_interruptibly(
     bundle_name: str | None,
     app_settings: AppSettings,
     console: Any,
+    use_plan_cache: bool = True,
+    snapshot: Path | None = None,
 ) -> tuple[dict[str, Any], Any]:
     """Wrap resolve_config() with a scoped SIGINT handler and a clean
     cancellation message (GAP-027).
 
     resolve_config() -- bundle discovery, git clone/fetch, compose,
-    activate -- runs EARLIER than every other SIGINT-aware phase in this
-    file: earlier than _run_startup_update_check() (GAP-023's own scoped
-    handler, above) and earlier than main.py's per-turn
-    _execute_with_interrupt() handler. Before this fix it had none of its
+    activate -- runs EARLIER than every other SIGINT-aware phase: earlier
+    than main.py's per-turn _execute_with_interrupt() handler. Before this fix it had none of its
     own, so a Ctrl+C here fell all the way through to Python's raw
     default SIGINT handler with:
 
@@ -180,13 +154,13 @@ def _resolve_config_interruptibly(
          is pure timing luck.
 
     This is a genuinely different location and cause from GAP-014
-    (git.py's unbounded wait), GAP-023 (the update-check phase, which
-    runs AFTER this one), GAP-025 (git.py's BaseException cleanup), and
+    (git.py's unbounded wait), GAP-023 (the update-check phase, now a
+    background thread), GAP-025 (git.py's BaseException cleanup), and
     GAP-026 (subprocess_runner.py's delegation cancellation) -- none of
     those touch this call site, and none of them install any
     acknowledgment or containment for an interrupt landing here.
 
-    Fix: same established pattern as _run_startup_update_check() -- a
+    Fix: the same pattern GAP-023 used for the update check -- a
     scoped SIGINT handler installed only for the duration of this call,
     printing the same "Cancelling..." convention used everywhere else in
     the app the moment Ctrl+C is pressed (fixing the missing-feedback
@@ -222,6 +196,8 @@ def _resolve_config_interruptibly(
                 bundle_name=bundle_name,
                 app_settings=app_settings,
                 console=console,
+                use_plan_cache=use_plan_cache,
+                snapshot=snapshot,
             )
         except KeyboardInterrupt:
             console.print("[red]Bundle preparation cancelled.[/red]")
@@ -259,6 +235,17 @@ def register_run_command(
         default="text",
         help="Output format: text (markdown), json (response only), json-trace (full execution detail)",
     )
+    @click.option(
+        "--no-config-cache",
+        is_flag=True,
+        help="Re-prepare the bundle instead of reusing the cached mount plan",
+    )
+    @click.option(
+        "--snapshot",
+        type=click.Path(exists=True, dir_okay=False, path_type=Path),
+        default=None,
+        help="Boot from a frozen bundle snapshot (see 'amplifier bundle freeze')",
+    )
     def run(
         prompt: str | None,
         bundle: str | None,
@@ -269,10 +256,46 @@ def register_run_command(
         resume: str | None,
         verbose: bool,
         output_format: str,
+        no_config_cache: bool,
+        snapshot: Path | None,
     ):
         """Execute a prompt or start an interactive session."""
+        from ..daemon import requested_socket
         from ..session_store import SessionStore
 
+        # Opt-in warm daemon (`amplifier serve`); only single-shot runs forward
+        daemon_socket = requested_socket()
+        if daemon_socket is not None and mode == "single":
+            from ..daemon import forward_run
+
+            piped = None
+            if prompt is None and not sys.stdin.isatty():
+                piped = sys.stdin.read()
+            if prompt is not None or piped is not None:
+                code = forward_run(
+                    sys.argv[1:], socket_path=daemon_socket, stdin=piped
+                )
+                if code is not None:
+                    sys.exit(code)
+                # No daemon answered: run here, reusing the input already read
+                if piped and piped.strip():
+                    prompt = piped
+
+        # A snapshot fixes the bundle; it wins over saved and active bundles
+        if snapshot:
+            from ..runtime.snapshot import read_snapshot_info
+
+            if bundle:
+                console.print(
+                    "[red]Error:[/red] --snapshot cannot be combined with --bundle"
+                )
+                sys.exit(1)
+            try:
+                bundle = read_snapshot_info(snapshot).bundle
+            except SnapshotError as exc:
+                console.print(f"[red]Error:[/red] {escape_markup(exc)}")
+                sys.exit(1)
+
         # Handle --resume flag
         if resume:
             store = SessionStore()
@@ -290,7 +313,8 @@ def register_run_command(
                 sys.exit(1)
 
             try:
-                transcript, metadata = store.load(resume)
+                # Full transcript is parsed when the session restores it
+                transcript, metadata = store.load_lazy(resume)
                 console.print(f"[green]✓[/green] Resuming session: {resume}")
                 console.print(f"  Messages: {len(transcript)}")
 
@@ -323,14 +347,17 @@ def register_run_command(
             transcript = None
             metadata = None
 
-        config_manager = create_config_manager()
+        with startup_profiler.phase("settings"):
+            config_manager = create_config_manager()
 
-        # Check for active bundle from settings (via 'amplifier bundle use')
-        # CLI --bundle flag takes precedence over settings
-        if not bundle:
-            bundle_settings = config_manager.get_merged_settings().get("bundle", {})
-            if isinstance(bundle_settings, dict):
-                bundle = bundle_settings.get("active")
+            # Check for active bundle from settings (via 'amplifier bundle use')
+            # CLI --bundle flag takes precedence over settings
+            if not bundle:
+                bundle_settings = config_manager.get_merged_settings().get(
+                    "bundle", {}
+                )
+                if isinstance(bundle_settings, dict):
+                    bundle = bundle_settings.get("active")
 
         # Default to anchors bundle when no explicit bundle is configured
         if not bundle:
@@ -339,7 +366,9 @@ def register_run_command(
         # Check if first run init is needed
         # This runs unconditionally - --provider just selects from configured providers,
         # it doesn't bypass the need for configuration
-        if check_first_run():
+        with startup_profiler.phase("first-run check"):
+            needs_init = check_first_run()
+        if needs_init:
             if sys.stdin.isatty():
                 prompt_first_run_init(console)
             else:
@@ -349,8 +378,16 @@ def register_run_command(
 
                 auto_init_from_env(console)
 
+        # Start the update check (unified startup_checker with settings.yaml);
+        # it overlaps bundle preparation and session init. Snapshot starts are
+        # meant for offline machines and skip it.
+        if not snapshot:
+            with startup_profiler.phase("update check (start)"):
+                _run_startup_update_check()
+
         # Agent loading is now handled via foundation's bundle.load_agent_metadata()
-        app_settings = AppSettings()
+        with startup_profiler.phase("app settings"):
+            app_settings = AppSettings()
 
         # Track configuration source for display (always bundle mode now)
         config_source_name = f"bundle:{bundle}"
@@ -360,15 +397,22 @@ def register_run_command(
         # message instead of a raw traceback landing wherever an interrupt
         # happens to surface (see _resolve_config_interruptibly docstring).
         try:
-            config_data, prepared_bundle = _resolve_config_interruptibly(
-                bundle_name=bundle,
-                app_settings=app_settings,
-                console=console,
-            )
+            with startup_profiler.phase("bundle preparation"):
+                config_data, prepared_bundle = _resolve_config_interruptibly(
+                    bundle_name=bundle,
+                    app_settings=app_settings,
+                    console=console,
+                    use_plan_cache=not no_config_cache,
+                    snapshot=snapshot,
+                )
         except FileNotFoundError as exc:
             # Bundle not found - display error gracefully without traceback
             console.print(f"[red]Error:[/red] {escape_markup(exc)}")
             sys.exit(1)
+        except SnapshotError as exc:
+            # Snapshot unreadable, from another install, or its modules are gone
+            console.print(f"[red]Error:[/red] {escape_markup(exc)}")
+            sys.exit(1)
         except BundleValidationError as exc:
             # Bundle validation failed (e.g., malformed YAML, missing required fields)
             console.print()
@@ -545,9 +589,6 @@ def register_run_command(
                 if prepared_bundle and hasattr(prepared_bundle, "mount_plan"):
                     prepared_bundle.mount_plan["providers"] = updated_providers
 
-        # Run update check (uses unified startup_checker with settings.yaml)
-        _run_startup_update_check()
-
         if mode == "chat":
             # Interactive mode - supports optional initial_prompt for auto-execution
             # Check for piped input if no prompt provided
@@ -645,6 +686,16 @@ def register_run_command(
                     )
                 )
 
+            # Announce updates after the response, never ahead of it. JSON
+            # output has no notice, but a finished check still saves its time.
+            from ..utils.startup_checker import notify_if_updates
+            from ..utils.startup_checker import persist_finished_check
+
+            if output_format == "text":
+                notify_if_updates(console)
+            else:
+                persist_finished_check()
+
     return run
 
 
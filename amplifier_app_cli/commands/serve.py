@@ -0,0 +1,90 @@
+"""Warm daemon command (``amplifier serve``).
+
+See ``amplifier_app_cli/daemon.py`` for the protocol and request isolation.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import click
+
+from ..console import console
+from ..daemon import DAEMON_ENV
+from ..daemon import RunDaemon
+from ..daemon import daemon_request
+from ..daemon import get_socket_path
+from ..utils.error_format import escape_markup
+
+
+@click.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Socket to listen on (default: ~/.amplifier/serve.sock)",
+)
+@click.option(
+    "--idle-timeout",
+    type=click.FloatRange(min=0),
+    default=1800.0,
+    show_default=True,
+    help="Exit after this many seconds without requests (0: never)",
+)
+@click.option("--status", "show_status", is_flag=True, help="Show the running daemon")
+@click.option("--stop", is_flag=True, help="Stop the running daemon")
+def serve(
+    socket_path: Path | None, idle_timeout: float, show_status: bool, stop: bool
+):
+    """Serve `amplifier run` from a warm background process.
+
+    Keeps imported modules and prepared bundles in memory between runs.
+    Point single-shot runs at it with AMPLIFIER_DAEMON=1 (or the socket
+    path); they fall back to running locally when no daemon answers.
+    Interactive sessions always run locally.
+
+    \b
+    Examples:
+      amplifier serve &
+      AMPLIFIER_DAEMON=1 amplifier run "summarize README.md"
+      amplifier serve --stop
+    """
+    socket_path = socket_path or get_socket_path()
+
+    if show_status or stop:
+        reply = daemon_request(socket_path, "stop" if stop else "status")
+        if reply is None:
+            console.print(f"[yellow]No daemon running at {socket_path}[/yellow]")
+            sys.exit(1)
+        if stop:
+            console.print("[green]✓[/green] Daemon stopped")
+            return
+        status = reply.get("status", {})
+        console.print(f"[bold]Daemon[/bold] pid {status.get('pid')} on {socket_path}")
+        console.print(f"  Uptime: {status.get('uptime')}s")
+        console.print(f"  Requests served: {status.get('requests')}")
+        return
+
+    from ..runtime.plan_cache import retain_in_memory
+
+    # Prepared bundles stay in memory between requests, not just on disk
+    retain_in_memory()
+    daemon = RunDaemon(socket_path, idle_timeout=idle_timeout)
+    console.print(f"[dim]Serving on {socket_path} (use {DAEMON_ENV}=1)[/dim]")
+    try:
+        restart = daemon.serve_forever()
+    except RuntimeError as e:
+        console.print(f"[red]Error:[/red] {escape_markup(e)}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        restart = False
+
+    if restart:
+        console.print("[dim]Sources or settings changed; restarting daemon[/dim]")
+        sys.stdout.flush()
+        # Re-run the same command line in a fresh interpreter
+        os.execv(sys.executable, sys.orig_argv)
+    console.print("[dim]Daemon stopped[/dim]")
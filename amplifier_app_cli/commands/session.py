@@ -6,9 +6,10 @@ import asyncio
 import json
 import sys
 from collections.abc import Callable
+from collections.abc import Sequence
 from datetime import UTC
 from datetime import datetime
-from datetime import timedelta
+from decimal import Decimal
 from pathlib import Path
 
 import click
@@ -17,13 +18,20 @@ from rich.prompt import Prompt
 from rich.table import Table
 
 from ..console import console
+from ..cost_history import sum_prior_cost_usd
 from ..ui.item_renderer import ItemRenderer
 from ..ui.view_policy import resolve_view, view_flags
 from ..utils.error_format import escape_markup
 from ..lib.settings import AppSettings
 from ..project_utils import get_project_slug
 from ..runtime.config import resolve_config
-from ..session_store import SessionStore, extract_session_mode
+from ..session_cleanup import CleanupPolicy
+from ..session_cleanup import SessionUsage
+from ..session_cleanup import execute_cleanup
+from ..session_cleanup import measure_sessions
+from ..session_cleanup import plan_cleanup
+from ..session_store import LazyTranscript, SessionStore, extract_session_mode
+from ..turn_index import TurnIndex
 from ..types import (
     ExecuteSingleProtocol,
     InteractiveChatProtocol,
@@ -37,7 +45,6 @@ try:
         get_fork_preview,
         get_session_lineage,
         get_turn_summary,
-        count_turns,
         ForkResult,
     )
 
@@ -79,7 +86,9 @@ def _prepare_resume_context(
     console: "Console",
     *,
     bundle_override: str | None = None,
-) -> tuple[str, list, dict, dict, list, "PreparedBundle | None", str | None, str]:
+) -> tuple[
+    str, LazyTranscript, dict, dict, list, "PreparedBundle | None", str | None, str
+]:
     """Prepare context for resuming a session.
 
     Handles the common logic for loading and configuring a session resume:
@@ -97,7 +106,7 @@ def _prepare_resume_context(
     Returns:
         Tuple of:
             - session_id: str (confirmed session ID)
-            - transcript: list (conversation messages)
+            - transcript: LazyTranscript (conversation messages)
             - metadata: dict (session metadata)
             - config_data: dict (resolved config)
             - search_paths: list (module search paths)
@@ -106,7 +115,9 @@ def _prepare_resume_context(
             - active_bundle: str (display name like "bundle:foundation")
     """
     store = SessionStore()
-    transcript, metadata = store.load(session_id)
+    # Transcript is parsed lazily: resume display reads only its tail, and the
+    # full history is materialized when the session restores its context.
+    transcript, metadata = store.load_lazy(session_id)
 
     # Extract bundle from saved session metadata
     saved_bundle, _ = extract_session_mode(metadata)
@@ -165,7 +176,7 @@ def _prepare_resume_context(
 
 
 def _display_session_history(
-    transcript: list[dict],
+    transcript: Sequence[dict],
     metadata: dict,
     *,
     show_thinking: bool = False,
@@ -176,7 +187,8 @@ def _display_session_history(
     Uses shared message renderer for consistency with live chat.
 
     Args:
-        transcript: List of message dictionaries from SessionStore
+        transcript: List of message dictionaries from SessionStore, or a
+            LazyTranscript (only its tail is read when limiting messages)
         metadata: Session metadata (session_id, created, bundle, etc.)
         show_thinking: Whether to show thinking blocks
         max_messages: Max messages to show (0 = all, default 10)
@@ -213,14 +225,26 @@ def _display_session_history(
     console.print(Panel.fit(banner_text, border_style="cyan"))
     console.print()
 
-    # Filter to user/assistant messages only
-    display_messages = [m for m in transcript if m.get("role") in ("user", "assistant")]
-
     # Handle message limiting
     skipped_count = 0
-    if max_messages > 0 and len(display_messages) > max_messages:
-        skipped_count = len(display_messages) - max_messages
-        display_messages = display_messages[-max_messages:]
+    if (
+        isinstance(transcript, LazyTranscript)
+        and not transcript.materialized
+        and max_messages > 0
+    ):
+        # Read only the tail; earlier lines (any role) are counted, not parsed
+        display_messages = transcript.tail(max_messages, roles=("user", "assistant"))
+        skipped_count = max(len(transcript) - len(display_messages), 0)
+    else:
+        # Filter to user/assistant messages only
+        display_messages = [
+            m for m in transcript if m.get("role") in ("user", "assistant")
+        ]
+        if max_messages > 0 and len(display_messages) > max_messages:
+            skipped_count = len(display_messages) - max_messages
+            display_messages = display_messages[-max_messages:]
+
+    if skipped_count:
         console.print(
             f"[dim]... {skipped_count} earlier messages. Use --full-history to see all[/dim]"
         )
@@ -636,15 +660,10 @@ def register_session_commands(
                     continue
 
                 store = SessionStore(base_dir=sessions_dir)
-                for session_id in store.list_sessions():
-                    session_path = sessions_dir / session_id
-                    try:
-                        mtime = session_path.stat().st_mtime
-                        all_sessions.append(
-                            (project_dir.name, session_id, session_path, mtime)
-                        )
-                    except Exception:
-                        continue
+                for info in store.list_session_info():
+                    all_sessions.append(
+                        (project_dir.name, info["id"], info, info.get("mtime") or 0)
+                    )
 
             all_sessions.sort(key=lambda x: x[3], reverse=True)
             all_sessions = all_sessions[:limit]
@@ -664,32 +683,16 @@ def register_session_commands(
             table.add_column("Modified", style="yellow")
             table.add_column("Msgs", justify="right")
 
-            for project_slug, session_id, session_path, mtime in all_sessions:
+            for project_slug, session_id, info, mtime in all_sessions:
                 modified = datetime.fromtimestamp(mtime, tz=UTC).strftime(
                     "%Y-%m-%d %H:%M"
                 )
-                transcript_file = session_path / "transcript.jsonl"
-                message_count = "?"
-                if transcript_file.exists():
-                    try:
-                        with open(transcript_file, encoding="utf-8") as f:
-                            message_count = str(sum(1 for _ in f))
-                    except Exception:
-                        pass
-
-                # Get session name from metadata
-                session_name = ""
-                try:
-                    metadata_file = session_path / "metadata.json"
-                    if metadata_file.exists():
-                        import json
-
-                        metadata = json.loads(metadata_file.read_text())
-                        session_name = metadata.get("name", "")
-                        if len(session_name) > 30:
-                            session_name = session_name[:27] + "..."
-                except Exception:
-                    pass
+                message_count = _format_message_count(info)
+
+                # Get session name from the session index
+                session_name = info.get("name") or ""
+                if len(session_name) > 30:
+                    session_name = session_name[:27] + "..."
 
                 display_slug = (
                     project_slug
@@ -755,9 +758,21 @@ def register_session_commands(
         is_flag=True,
         help="Include full transcript in output",
     )
+    @click.option(
+        "--turn",
+        "-t",
+        "turn",
+        type=int,
+        help="Include only the transcript of this turn (reads just that turn)",
+    )
     @view_flags
     def sessions_show(
-        session_id: str, with_transcript: bool, compact: bool, detailed: bool, fmt: str
+        session_id: str,
+        with_transcript: bool,
+        turn: int | None,
+        compact: bool,
+        detailed: bool,
+        fmt: str,
     ):
         """Show session metadata and details."""
         store = SessionStore()
@@ -772,7 +787,13 @@ def register_session_commands(
             sys.exit(1)
 
         try:
-            transcript, metadata = store.load(session_id)
+            # Full transcript is only parsed for --with-transcript
+            transcript, metadata = store.load_lazy(session_id)
+            turn_messages = (
+                TurnIndex(store.base_dir / session_id).read_messages(turn, turn)
+                if turn is not None
+                else None
+            )
         except Exception as exc:
             console.print(f"[red]Error loading session:[/red] {escape_markup(exc)}")
             sys.exit(1)
@@ -799,10 +820,14 @@ def register_session_commands(
         else:
             renderer.render_one(item, view=view)
 
-        if with_transcript:
+        if turn_messages is not None:
+            console.print(f"\n[bold]Turn {turn}:[/bold]")
+            for message in turn_messages:
+                console.print(json.dumps(message, indent=2))
+        elif with_transcript:
             console.print("\n[bold]Transcript:[/bold]")
-            for turn in transcript:
-                console.print(json.dumps(turn, indent=2))
+            for message in transcript:
+                console.print(json.dumps(message, indent=2))
 
     @session.command(name="fork")
     @click.argument("session_id")
@@ -859,27 +884,20 @@ def register_session_commands(
             console.print(f"[red]Error:[/red] {escape_markup(e)}")
             sys.exit(1)
 
+        store.restore(session_id)
         session_dir = store.base_dir / session_id
 
+        turn_index = TurnIndex(session_dir)
+
         # If no turn specified, show interactive selection or use latest
         if turn is None:
-            # Load transcript to count turns
+            # Count turns from the turn index (no transcript parse)
             transcript_path = session_dir / "transcript.jsonl"
             if not transcript_path.exists():
                 console.print(f"[red]Error:[/red] No transcript found for session")
                 sys.exit(1)
 
-            messages = []
-            with open(transcript_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            messages.append(json.loads(line))
-                        except json.JSONDecodeError:
-                            continue
-
-            max_turns = count_turns(messages)
+            max_turns = turn_index.turn_count()
             if max_turns == 0:
                 console.print(
                     "[red]Error:[/red] Session has no user messages to fork from"
@@ -896,9 +914,12 @@ def register_session_commands(
             console.print()
 
             turns_to_show = min(max_turns, 10)
+            # Parse only the previewed turns; turn t is turn t - first + 1 here
+            first_shown = max_turns - turns_to_show + 1
+            messages = turn_index.read_messages(first_shown)
             for t in range(max_turns, max(0, max_turns - turns_to_show), -1):
                 try:
-                    summary = get_turn_summary(messages, t)
+                    summary = get_turn_summary(messages, t - first_shown + 1)
                     user_preview = summary["user_content"][:55]
                     if len(summary["user_content"]) > 55:
                         user_preview += "..."
@@ -951,12 +972,19 @@ def register_session_commands(
 
         # Perform the fork
         try:
+            # Events are copied here, bounded by the turn index, rather than
+            # wholesale by fork_session
             result = fork_session(
                 session_dir,
                 turn=turn,
                 new_session_id=new_name,
-                include_events=not no_events,
+                include_events=False,
             )
+            events_count = 0
+            if not no_events:
+                events_count = _copy_events_through_turn(
+                    turn_index, turn, store.base_dir / result.session_id
+                )
 
             console.print(
                 f"[green]✓[/green] Forked session created: {result.session_id}"
@@ -964,8 +992,8 @@ def register_session_commands(
             console.print(f"  Messages: {result.message_count}")
             console.print(f"  Parent: {result.parent_id[:8]}...")
             console.print(f"  Forked at turn: {result.forked_from_turn}")
-            if result.events_count > 0:
-                console.print(f"  Events copied: {result.events_count}")
+            if events_count > 0:
+                console.print(f"  Events copied: {events_count}")
             console.print()
             console.print(
                 f"Resume with: [cyan]amplifier session resume {result.session_id[:8]}[/cyan]"
@@ -1018,7 +1046,10 @@ def register_session_commands(
             import shutil
 
             session_path = store.base_dir / session_id
-            shutil.rmtree(session_path)
+            if session_path.exists():
+                shutil.rmtree(session_path)
+            store.archive.evict(session_id)
+            store.index.remove(session_id)
             console.print(f"[green]✓[/green] Deleted session: {session_id}")
         except Exception as exc:
             console.print(f"[red]Error deleting session:[/red] {escape_markup(exc)}")
@@ -1131,23 +1162,223 @@ def register_session_commands(
             sys.exit(1)
 
     @session.command(name="cleanup")
-    @click.option("--days", "-d", default=30, help="Delete sessions older than N days")
+    @click.option(
+        "--days",
+        "-d",
+        type=int,
+        default=None,
+        help="Delete sessions older than N days (default 30 if no other policy)",
+    )
+    @click.option(
+        "--max-size",
+        default=None,
+        help="Delete oldest sessions until the total fits this size (e.g. 5G)",
+    )
+    @click.option(
+        "--keep-last",
+        type=click.IntRange(min=0),
+        default=None,
+        help="Keep only the newest N sessions of each project",
+    )
+    @click.option(
+        "--all-projects", is_flag=True, help="Apply the policy to every project"
+    )
+    @click.option(
+        "--dry-run", is_flag=True, help="Report what would be deleted and exit"
+    )
+    @click.option(
+        "--jobs", "-j", type=click.IntRange(min=1), default=4, help="Parallel deletes"
+    )
     @click.option("--force", "-f", is_flag=True, help="Skip confirmation")
-    def sessions_cleanup(days: int, force: bool):
-        """Delete sessions older than N days."""
+    def sessions_cleanup(
+        days: int | None,
+        max_size: str | None,
+        keep_last: int | None,
+        all_projects: bool,
+        dry_run: bool,
+        jobs: int,
+        force: bool,
+    ):
+        """Delete old sessions by age, total size, or count.
+
+        A session matching any policy is deleted; spawned sub-sessions go
+        with their parent. Use --dry-run to see the space that would be
+        reclaimed.
+        """
+        if days is not None and days < 0:
+            raise click.BadParameter("days must be non-negative", param_hint="--days")
+        max_bytes = _parse_size(max_size) if max_size is not None else None
+        if days is None and max_bytes is None and keep_last is None:
+            days = 30
+        policy = CleanupPolicy(days=days, max_bytes=max_bytes, keep_last=keep_last)
+
+        stores = _cleanup_stores(all_projects)
+        plan = plan_cleanup(measure_sessions(stores), policy)
+        reclaim = sum(usage.bytes for usage in plan)
+
+        if not plan:
+            console.print("[green]✓[/green] No sessions match the cleanup policy")
+            return
+
+        if dry_run:
+            _display_cleanup_plan(plan, all_projects=all_projects)
+            console.print(
+                f"Would delete {len(plan)} sessions and reclaim "
+                f"{_format_bytes(reclaim)} [dim](dry run)[/dim]"
+            )
+            return
+
+        if not force:
+            confirm = console.input(
+                f"Delete {len(plan)} sessions ({_format_bytes(reclaim)})? [y/N]: "
+            )
+            if confirm.lower() != "y":
+                console.print("[yellow]Cancelled[/yellow]")
+                return
+
+        removed, freed = execute_cleanup(plan, max_workers=jobs)
+
+        console.print(
+            f"[green]✓[/green] Removed {removed} sessions, "
+            f"reclaimed {_format_bytes(freed)}"
+        )
+
+    @session.command(name="archive")
+    @click.option(
+        "--days", "-d", default=30, help="Archive sessions older than N days"
+    )
+    @click.option(
+        "--max-size",
+        default=None,
+        help="Evict least recently used archives beyond this total size (e.g. 2G)",
+    )
+    @click.option("--force", "-f", is_flag=True, help="Skip confirmation")
+    def sessions_archive(days: int, max_size: str | None, force: bool):
+        """Compress sessions older than N days into the session archive.
+
+        Archived sessions stay in `session list` and are restored
+        automatically on resume, show or fork.
+        """
         store = SessionStore()
+        quota = _parse_size(max_size) if max_size is not None else None
 
         if not force:
-            confirm = console.input(f"Delete sessions older than {days} days? [y/N]: ")
+            prompt = f"Archive sessions older than {days} days?"
+            if quota is not None:
+                prompt += f" Archives beyond {_format_bytes(quota)} are deleted."
+            confirm = console.input(f"{prompt} [y/N]: ")
             if confirm.lower() != "y":
                 console.print("[yellow]Cancelled[/yellow]")
                 return
 
-        cutoff = datetime.now(UTC) - timedelta(days=days)
-        removed = store.cleanup_old_sessions(days=days)
+        archived = store.archive_old_sessions(days=days)
+        original = sum(entry["original_bytes"] for entry in archived.values())
+        compressed = sum(entry["archive_bytes"] for entry in archived.values())
+        console.print(
+            f"[green]✓[/green] Archived {len(archived)} sessions: "
+            f"{_format_bytes(original)} -> {_format_bytes(compressed)}"
+        )
+
+        if quota is not None:
+            evicted = store.archive.plan_quota(quota)
+            freed = sum(store.archive.evict(session_id) for session_id in evicted)
+            if evicted:
+                console.print(
+                    f"[green]✓[/green] Deleted {len(evicted)} least recently used "
+                    f"archives ({_format_bytes(freed)})"
+                )
+
+    @session.command(name="cost")
+    @click.argument("session_id", required=False, default=None)
+    @click.option("--limit", "-n", default=20, help="Number of sessions to show")
+    @click.option(
+        "--all-projects", is_flag=True, help="Show per-project totals for all projects"
+    )
+    def sessions_cost(session_id: str | None, limit: int, all_projects: bool):
+        """Show recorded LLM cost for a session, the project, or all projects.
+
+        Totals come from each session's cost checkpoint, so only events
+        appended since the last check are read.
+        """
+        if all_projects:
+            projects_dir = Path.home() / ".amplifier" / "projects"
+            rows = []
+            if projects_dir.exists():
+                for project_dir in sorted(projects_dir.iterdir()):
+                    sessions_dir = project_dir / "sessions"
+                    if not sessions_dir.is_dir():
+                        continue
+                    total = _project_cost(SessionStore(base_dir=sessions_dir))
+                    if total is not None:
+                        rows.append((project_dir.name, total))
+
+            if not rows:
+                console.print("[yellow]No recorded cost found.[/yellow]")
+                return
+
+            table = Table(
+                title="Cost by Project", show_header=True, header_style="bold cyan"
+            )
+            table.add_column("Project", style="magenta")
+            table.add_column("Cost (USD)", justify="right")
+            for project_slug, total in sorted(rows, key=lambda r: r[1], reverse=True):
+                table.add_row(project_slug, _format_cost(total))
+            console.print(table)
+            console.print(
+                f"[bold]Total:[/bold] {_format_cost(sum(t for _, t in rows))}"
+            )
+            return
+
+        store = SessionStore()
+
+        if session_id:
+            try:
+                session_id = store.find_session(session_id, top_level_only=False)
+            except FileNotFoundError:
+                console.print(
+                    f"[red]Error:[/red] No session found matching '{session_id}'"
+                )
+                sys.exit(1)
+            except ValueError as e:
+                console.print(f"[red]Error:[/red] {escape_markup(e)}")
+                sys.exit(1)
 
+            total = _session_cost(store, session_id)
+            if total is None:
+                console.print(f"Session {session_id}: [dim]no cost recorded[/dim]")
+            else:
+                console.print(f"Session {session_id}: {_format_cost(total)}")
+            return
+
+        # Per-session rows for recent sessions (sub-sessions have their own
+        # events.jsonl), plus the total across every session in the project
+        costs = [
+            (info, _session_cost(store, info["id"]))
+            for info in store.list_session_info(top_level_only=False)
+        ]
+        costs = [(info, total) for info, total in costs if total is not None]
+        if not costs:
+            console.print("[yellow]No recorded cost found.[/yellow]")
+            return
+
+        table = Table(
+            title=f"Session Cost ({get_project_slug()})",
+            show_header=True,
+            header_style="bold cyan",
+        )
+        table.add_column("Name", style="cyan", max_width=30)
+        table.add_column("Session ID", style="green")
+        table.add_column("Cost (USD)", justify="right")
+        for info, total in costs[:limit]:
+            table.add_row(
+                info.get("name") or "[dim]unnamed[/dim]",
+                info["id"][:8] + "..." + ("*" if "_" in info["id"] else ""),
+                _format_cost(total),
+            )
+        console.print(table)
         console.print(
-            f"[green]✓[/green] Removed {removed} sessions older than {cutoff:%Y-%m-%d}"
+            f"[bold]Project total:[/bold] {_format_cost(sum(t for _, t in costs))} "
+            f"[dim]({len(costs)} sessions; * = sub-session)[/dim]"
         )
 
     # Register interactive resume on root CLI (not session subgroup)
@@ -1203,6 +1434,52 @@ def register_session_commands(
         _interactive_resume_impl(ctx, limit, sessions_resume, force_bundle=force_bundle)
 
 
+def _copy_events_through_turn(
+    turn_index: TurnIndex, turn: int, target_dir: Path
+) -> int:
+    """Copy the parent's events up to the end of ``turn`` into a fork.
+
+    Seeks to the turn boundary from the turn index instead of parsing
+    events.jsonl. Returns the number of events copied.
+    """
+    source = turn_index.events_file
+    if not source.exists() or not target_dir.is_dir():
+        return 0
+
+    end = turn_index.events_end_offset(turn)
+    remaining = end if end is not None else source.stat().st_size
+    count = 0
+    with open(source, "rb") as src, open(target_dir / "events.jsonl", "wb") as dst:
+        while remaining > 0:
+            chunk = src.read(min(1024 * 1024, remaining))
+            if not chunk:
+                break
+            dst.write(chunk)
+            count += chunk.count(b"\n")
+            remaining -= len(chunk)
+    return count
+
+
+def _session_cost(store: SessionStore, session_id: str) -> Decimal | None:
+    """Total recorded LLM cost for one session (checkpoint-accelerated)."""
+    return sum_prior_cost_usd(store.base_dir / session_id / "events.jsonl")
+
+
+def _project_cost(store: SessionStore) -> Decimal | None:
+    """Total recorded LLM cost across every session in a project."""
+    totals = [
+        total
+        for session_id in store.list_sessions(top_level_only=False)
+        if (total := _session_cost(store, session_id)) is not None
+    ]
+    return sum(totals, Decimal("0")) if totals else None
+
+
+def _format_cost(total: Decimal) -> str:
+    """Format a USD cost for display."""
+    return f"${total:.4f}"
+
+
 def _format_time_ago(dt: datetime) -> str:
     """Format a datetime as a human-readable time ago string.
 
@@ -1244,7 +1521,6 @@ def _get_session_display_info(store: SessionStore, session_id: str) -> dict:
     Returns:
         Dict with keys: session_id, name, bundle, turn_count, time_ago, mtime
     """
-    session_path = store.base_dir / session_id
     info = {
         "session_id": session_id,
         "name": "",
@@ -1254,36 +1530,93 @@ def _get_session_display_info(store: SessionStore, session_id: str) -> dict:
         "mtime": 0,
     }
 
-    # Get modification time
-    try:
-        mtime = session_path.stat().st_mtime
+    # Summary comes from the session index (no transcript/metadata parsing)
+    indexed = store.get_session_info(session_id)
+    if not indexed:
+        return info
+
+    mtime = indexed.get("mtime") or 0
+    if mtime:
         info["mtime"] = mtime
-        dt = datetime.fromtimestamp(mtime, tz=UTC)
-        info["time_ago"] = _format_time_ago(dt)
-    except Exception:
-        pass
+        info["time_ago"] = _format_time_ago(datetime.fromtimestamp(mtime, tz=UTC))
+    info["turn_count"] = _format_message_count(indexed)
+    info["bundle"] = indexed.get("bundle") or "unknown"
+    info["name"] = indexed.get("name") or ""
 
-    # Get message count from transcript
-    transcript_file = session_path / "transcript.jsonl"
-    if transcript_file.exists():
-        try:
-            with open(transcript_file, encoding="utf-8") as f:
-                info["turn_count"] = str(sum(1 for _ in f))
-        except Exception:
-            pass
+    return info
 
-    # Get bundle and name from metadata
-    metadata_file = session_path / "metadata.json"
-    if metadata_file.exists():
-        try:
-            with open(metadata_file, encoding="utf-8") as f:
-                metadata = json.load(f)
-                info["bundle"] = metadata.get("bundle", "unknown")
-                info["name"] = metadata.get("name", "")
-        except Exception:
-            pass
 
-    return info
+def _format_message_count(info: dict) -> str:
+    """Format an index record's message count for display ("?" if unknown).
+
+    Archived sessions are marked, since opening them restores the archive.
+    """
+    count = info.get("message_count")
+    text = "?" if count is None else str(count)
+    return f"{text} (archived)" if info.get("archived") else text
+
+
+def _parse_size(value: str) -> int:
+    """Parse a size like ``500M`` or ``2G`` (binary units) into bytes."""
+    units = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+    text = value.strip().upper().removesuffix("B").removesuffix("I")
+    number, unit = text, ""
+    if text and text[-1] in units:
+        number, unit = text[:-1], text[-1]
+    try:
+        size = float(number)
+    except ValueError:
+        raise click.BadParameter(f"Invalid size: {value}") from None
+    if size < 0:
+        raise click.BadParameter(f"Invalid size: {value}")
+    return int(size * units[unit])
+
+
+def _format_bytes(size: int) -> str:
+    """Format a byte count for display (e.g. ``1.5 MB``)."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def _cleanup_stores(all_projects: bool) -> list[SessionStore]:
+    """Session stores a cleanup applies to (current project or all)."""
+    if not all_projects:
+        return [SessionStore()]
+    projects_dir = Path.home() / ".amplifier" / "projects"
+    if not projects_dir.exists():
+        return []
+    return [
+        SessionStore(base_dir=project_dir / "sessions")
+        for project_dir in sorted(projects_dir.iterdir())
+        if (project_dir / "sessions").is_dir()
+    ]
+
+
+def _display_cleanup_plan(plan: list[SessionUsage], *, all_projects: bool) -> None:
+    """Show the sessions a cleanup would delete."""
+    table = Table(
+        title="Sessions to delete", show_header=True, header_style="bold cyan"
+    )
+    if all_projects:
+        table.add_column("Project", style="magenta", max_width=20)
+    table.add_column("Session ID", style="green")
+    table.add_column("Modified", style="yellow")
+    table.add_column("Size", justify="right")
+    table.add_column("Reason")
+    for usage in plan:
+        row = [
+            usage.session_id[:8] + "...",
+            datetime.fromtimestamp(usage.mtime, tz=UTC).strftime("%Y-%m-%d %H:%M"),
+            _format_bytes(usage.bytes),
+            usage.reason,
+        ]
+        if all_projects:
+            row.insert(0, usage.store.base_dir.parent.name)
+        table.add_row(*row)
+    console.print(table)
 
 
 def _interactive_resume_impl(
@@ -1451,36 +1784,23 @@ def _display_project_sessions(
     view: str = "compact",
     fmt: str = "text",
 ) -> None:
-    session_ids = store.list_sessions()[:limit]
+    sessions = store.list_session_info()[:limit]
 
-    if not session_ids:
+    if not sessions:
         console.print("[yellow]No sessions found.[/yellow]")
         return
 
     items: list[dict] = []
-    for session_id in session_ids:
-        session_path = store.base_dir / session_id
-        try:
-            mtime = session_path.stat().st_mtime
-            modified = datetime.fromtimestamp(mtime, tz=UTC).strftime("%Y-%m-%d %H:%M")
-        except Exception:
-            modified = "unknown"
-
-        session_name = ""
-        try:
-            metadata = store.get_metadata(session_id)
-            session_name = metadata.get("name", "")
-        except Exception:
-            pass
-
-        transcript_file = session_path / "transcript.jsonl"
-        message_count = "?"
-        if transcript_file.exists():
-            try:
-                with open(transcript_file) as f:
-                    message_count = str(sum(1 for _ in f))
-            except Exception:
-                pass
+    for info in sessions:
+        session_id = info["id"]
+        mtime = info.get("mtime")
+        modified = (
+            datetime.fromtimestamp(mtime, tz=UTC).strftime("%Y-%m-%d %H:%M")
+            if mtime
+            else "unknown"
+        )
+        session_name = info.get("name") or ""
+        message_count = _format_message_count(info)
 
         short_id = session_id[:8] + "..."
         items.append(
@@ -30,6 +30,7 @@ from ..paths import create_foundation_resolver
 from ..paths import get_effective_scope
 from ..provider_sources import DEFAULT_PROVIDER_SOURCES
 from ..provider_sources import is_local_path
+from ..runtime.plan_cache import clear_plan_cache
 
 
 def _is_module_path(path: Path) -> bool:
@@ -247,6 +248,7 @@ def source_add(
         app_settings.add_source_override(identifier, source_uri, scope=scope)
     else:
         app_settings.add_bundle_source_override(identifier, source_uri, scope=scope)
+    clear_plan_cache()
 
     scope_labels = {
         "local": "local (.amplifier/settings.local.yaml)",
@@ -373,6 +375,8 @@ def source_remove(
         )
     if provider_cleaned:
         console.print("[green]✓ Updated provider config to use default source[/green]")
+    if removed_module or removed_bundle or provider_cleaned:
+        clear_plan_cache()
     if not removed_module and not removed_bundle and not provider_cleaned:
         console.print(f"[yellow]Source override for {identifier} not found[/yellow]")
 
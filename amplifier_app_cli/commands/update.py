@@ -903,9 +903,32 @@ def _show_verbose_report(
                     )
                     console.print()
 
+    _print_remote_check_timings(report)
     print_legend()
 
 
+def _print_remote_check_timings(report) -> None:
+    """List the remote SHA requests behind the module report, slowest first."""
+    timings = getattr(report, "remote_checks", None)
+    if not timings:
+        return
+
+    sources = sum(t.sources for t in timings)
+    console.print("[bold cyan]Remote checks[/bold cyan]")
+    console.print(f"[dim]{len(timings)} requests for {sources} sources[/dim]")
+    console.print()
+    for timing in sorted(timings, key=lambda t: t.seconds, reverse=True):
+        line = Text(f"  {timing.seconds * 1000:>6.0f} ms  ", style="dim")
+        line.append(timing.url, style="magenta")
+        line.append(f" ({timing.ref})", style="dim")
+        if timing.sources > 1:
+            line.append(f"  x{timing.sources}", style="dim")
+        if timing.error:
+            line.append(f"  {timing.error}", style="yellow")
+        console.print(line)
+    console.print()
+
+
 def _format_update_progress(name: str, phase: str) -> str:
     """Format an update progress callback into a human-readable label for the spinner.
 
@@ -927,6 +950,7 @@ def _format_update_progress(name: str, phase: str) -> str:
         "failed": f"Failed to update {name}",
         "installing": f"Installing {name} (uv tool install)...",
         "checking_deps": f"Checking {name} dependencies...",
+        "installing_deps": f"Installing dependencies for {name}...",
         "updating_bundle": f"Loading bundle {name}...",
         "refreshing_bundle": f"Refreshing bundle {name}...",
     }
@@ -1105,9 +1129,9 @@ def update(check_only: bool, yes: bool, force: bool, verbose: bool):
         console.print("  Checking modules...")
 
     async def _check_sources():
-        import httpx
+        from ..utils.source_status import create_check_client
 
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with create_check_client() as client:
             return await check_all_sources(
                 client=client, include_all_cached=True, force=force
             )
@@ -1271,6 +1295,11 @@ def update(check_only: bool, yes: bool, force: bool, verbose: bool):
     finally:
         spinner.stop()
 
+    # Cached mount plans may point at module checkouts that were just replaced
+    from ..runtime.plan_cache import clear_plan_cache
+
+    clear_plan_cache()
+
     # Show results
     console.print()
     # Determine overall success including bundles
@@ -23,12 +23,20 @@ Design notes:
   provider contributor never double-count the same spend.
 - Everything here is best-effort and must never break session startup: missing
   or corrupt event files simply yield no restored cost.
+- ``events.jsonl`` can grow to hundreds of MB, so the running sum is kept in a
+  ``cost_checkpoint.json`` sidecar (total, byte offset, inode, and a short
+  fingerprint of the bytes before the offset). Each call only scans bytes
+  appended since the checkpoint; SessionStore.save() advances it as the
+  session runs, so resume and ``amplifier session cost`` are near-instant.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import tempfile
 from decimal import Decimal
 from decimal import InvalidOperation
 from pathlib import Path
@@ -40,6 +48,11 @@ logger = logging.getLogger(__name__)
 SESSION_COST_CHANNEL = "session.cost"
 _LLM_RESPONSE_EVENT = "llm:response"
 
+CHECKPOINT_FILENAME = "cost_checkpoint.json"
+
+# Bytes before the checkpoint offset that must be unchanged for it to be valid
+_FINGERPRINT_BYTES = 256
+
 
 def sum_prior_cost_usd(events_path: Path) -> Decimal | None:
     """Sum ``cost_usd`` across every ``llm:response`` event in ``events_path``.
@@ -47,6 +60,11 @@ def sum_prior_cost_usd(events_path: Path) -> Decimal | None:
     Returns the cumulative cost as a ``Decimal``, or ``None`` when the file is
     missing/unreadable or contains no cost data. Never raises.
 
+    Resumes from the ``cost_checkpoint.json`` sidecar when it still matches the
+    file (same inode, not truncated, same bytes before the offset), scans only
+    what was appended since, and advances the checkpoint. A checkpoint that no
+    longer matches is discarded and the file is rescanned from the start.
+
     The file is read one line at a time to stay memory-safe: ``llm:response``
     lines can be very large (they may carry full request payloads), so parsed
     events are never all held in memory at once. A cheap substring pre-filter
@@ -55,30 +73,26 @@ def sum_prior_cost_usd(events_path: Path) -> Decimal | None:
     if not events_path.is_file():
         return None
 
-    total: Decimal | None = None
+    checkpoint_path = events_path.with_name(CHECKPOINT_FILENAME)
     try:
-        with events_path.open("r", encoding="utf-8") as handle:
+        with events_path.open("rb") as handle:
+            stat = os.fstat(handle.fileno())
+            total, offset = _read_checkpoint(checkpoint_path, handle, stat)
+            handle.seek(offset)
+
+            # Only complete lines advance the checkpoint; a trailing partial
+            # line (still being written) is summed but rescanned next time.
+            pending: Decimal | None = None
             for line in handle:
-                if _LLM_RESPONSE_EVENT not in line:
-                    continue
-                try:
-                    event = json.loads(line)
-                except (json.JSONDecodeError, ValueError):
-                    continue
-                if not isinstance(event, dict):
-                    continue
-                if event.get("event") != _LLM_RESPONSE_EVENT:
-                    continue
-
-                data = event.get("data")
-                usage = data.get("usage") if isinstance(data, dict) else None
-                cost = usage.get("cost_usd") if isinstance(usage, dict) else None
-                if cost is None:
-                    continue
-                try:
-                    total = (total or Decimal("0")) + Decimal(str(cost))
-                except (InvalidOperation, ValueError):
-                    continue
+                cost = _llm_response_cost(line)
+                if not line.endswith(b"\n"):
+                    pending = cost
+                    break
+                offset += len(line)
+                if cost is not None:
+                    total = (total or Decimal("0")) + cost
+
+            _write_checkpoint(checkpoint_path, handle, stat, total, offset)
     except OSError:
         logger.debug(
             "Could not read events for prior session cost: %s",
@@ -87,9 +101,88 @@ def sum_prior_cost_usd(events_path: Path) -> Decimal | None:
         )
         return None
 
+    if pending is not None:
+        total = (total or Decimal("0")) + pending
     return total
 
 
+def _llm_response_cost(line: bytes) -> Decimal | None:
+    """Extract ``data.usage.cost_usd`` from one ``llm:response`` event line."""
+    if _LLM_RESPONSE_EVENT.encode() not in line:
+        return None
+    try:
+        event = json.loads(line)
+    except (json.JSONDecodeError, ValueError):
+        return None
+    if not isinstance(event, dict):
+        return None
+    if event.get("event") != _LLM_RESPONSE_EVENT:
+        return None
+
+    data = event.get("data")
+    usage = data.get("usage") if isinstance(data, dict) else None
+    cost = usage.get("cost_usd") if isinstance(usage, dict) else None
+    if cost is None:
+        return None
+    try:
+        return Decimal(str(cost))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def _fingerprint(handle: Any, offset: int) -> str:
+    """Hash the bytes just before ``offset`` (detects in-place rewrites)."""
+    start = max(offset - _FINGERPRINT_BYTES, 0)
+    handle.seek(start)
+    return hashlib.sha256(handle.read(offset - start)).hexdigest()
+
+
+def _read_checkpoint(
+    checkpoint_path: Path, handle: Any, stat: os.stat_result
+) -> tuple[Decimal | None, int]:
+    """Return ``(total, offset)`` to resume from, or ``(None, 0)`` to rescan."""
+    try:
+        checkpoint = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+        offset = int(checkpoint["offset"])
+        if (
+            checkpoint.get("inode") != stat.st_ino
+            or offset > stat.st_size
+            or checkpoint.get("fingerprint") != _fingerprint(handle, offset)
+        ):
+            return None, 0
+        total = checkpoint.get("total")
+        return (Decimal(total) if total is not None else None), offset
+    except (OSError, ValueError, KeyError, TypeError, InvalidOperation):
+        return None, 0
+
+
+def _write_checkpoint(
+    checkpoint_path: Path,
+    handle: Any,
+    stat: os.stat_result,
+    total: Decimal | None,
+    offset: int,
+) -> None:
+    """Atomically persist the running total (best-effort)."""
+    checkpoint = {
+        "total": str(total) if total is not None else None,
+        "offset": offset,
+        "inode": stat.st_ino,
+        "fingerprint": _fingerprint(handle, offset),
+    }
+    try:
+        fd, tmp = tempfile.mkstemp(dir=checkpoint_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(checkpoint, f)
+            os.replace(tmp, checkpoint_path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except OSError:
+        logger.debug("Could not write cost checkpoint %s", checkpoint_path)
+
+
 def restore_session_cost(
     coordinator: Any,
     session_id: str,
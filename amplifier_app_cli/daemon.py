@@ -0,0 +1,566 @@
+"""Warm local daemon for ``amplifier run`` (``amplifier serve``).
+
+Every ``amplifier run`` imports the CLI, prepares the bundle and imports each
+module again before the first token. ``amplifier serve`` keeps one process
+that has already paid for that: imported module code stays in ``sys.modules``
+and prepared bundles stay in the mount-plan cache's in-memory tier
+(runtime/plan_cache.py).
+
+Clients opt in with ``AMPLIFIER_DAEMON=1`` (default socket) or
+``AMPLIFIER_DAEMON=<socket path>``. Single-shot ``amplifier run`` then sends
+its arguments, working directory, environment and piped stdin to the daemon
+and relays the streamed output; interactive sessions always run locally. When
+no daemon takes the request, the client runs the command itself.
+
+Protocol (one JSON object per line over ~/.amplifier/serve.sock):
+
+    client -> {"argv": [...], "cwd": "...", "env": {...}, "stdin": "...",
+               "isatty": bool}
+           or {"control": "status" | "stop"}
+    daemon -> {"stream": "stdout" | "stderr", "data": "..."}   (repeated)
+    daemon -> {"exit": <code>} | {"status": {...}} | {"unavailable": "..."}
+
+Requests are served one at a time on the daemon's main thread. Each runs the
+regular ``run`` command -- and so gets its own AmplifierSession -- with the
+client's cwd, environment and stdio swapped in (all process-wide state). A
+client that disconnects mid-request interrupts it as Ctrl+C would. While a
+request runs, other run requests are answered ``{"unavailable": "busy"}`` at
+once, so their clients run locally instead of queueing behind it.
+
+The daemon exits after ``idle_timeout`` seconds without requests. It asks to
+be restarted when the CLI packages, cached module checkouts or user settings
+change, since module code it has already imported cannot be reloaded.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import os
+import select
+import signal
+import socket
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from .utils.cache_management import get_amplifier_dir
+
+logger = logging.getLogger(__name__)
+
+DAEMON_ENV = "AMPLIFIER_DAEMON"
+SOCKET_FILENAME = "serve.sock"
+
+# Seconds between checks for changed sources and settings while idle
+_WATCH_INTERVAL = 5.0
+# Seconds a client waits to connect before running the command itself
+_CONNECT_TIMEOUT = 1.0
+# Seconds a busy daemon waits for a turned-away client's request line
+_BUSY_READ_TIMEOUT = 1.0
+
+
+def get_socket_path() -> Path:
+    """Return ~/.amplifier/serve.sock path."""
+    return get_amplifier_dir() / SOCKET_FILENAME
+
+
+def requested_socket() -> Path | None:
+    """Socket named by AMPLIFIER_DAEMON, or None when the daemon is not wanted."""
+    value = os.environ.get(DAEMON_ENV, "").strip()
+    if value.lower() in ("", "0", "false", "no"):
+        return None
+    if value.lower() in ("1", "true", "yes"):
+        return get_socket_path()
+    return Path(value).expanduser()
+
+
+def forward_run(
+    argv: list[str], *, socket_path: Path, stdin: str | None = None
+) -> int | None:
+    """Run ``amplifier <argv>`` in the daemon, relaying its output.
+
+    Args:
+        argv: Command line after the program name (e.g. ["run", "hello"])
+        socket_path: Daemon socket
+        stdin: Piped input to hand to the command, if any
+
+    Returns:
+        The command's exit code, or None if no daemon took the request (the
+        caller then runs the command itself)
+    """
+    request = {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+        "stdin": stdin,
+        "isatty": sys.stdout.isatty(),
+    }
+    conn = _connect(socket_path)
+    if conn is None:
+        return None
+
+    started = False
+    with conn:
+        try:
+            conn.sendall(_encode(request))
+            for message in _messages(conn):
+                if "stream" in message:
+                    started = True
+                    stream = sys.stderr if message["stream"] == "stderr" else sys.stdout
+                    stream.write(message["data"])
+                    stream.flush()
+                elif "exit" in message:
+                    return int(message["exit"])
+                elif "unavailable" in message:
+                    reason = message["unavailable"]
+                    logger.debug(f"Daemon declined request: {reason}")
+                    return None
+        except KeyboardInterrupt:
+            # Closing the connection interrupts the request in the daemon
+            return 130
+        except (OSError, ValueError) as e:
+            logger.debug(f"Lost connection to daemon: {e}")
+
+    if not started:
+        # Nothing ran yet (e.g. the daemon restarted); safe to run locally
+        return None
+    print("Error: lost connection to the amplifier daemon", file=sys.stderr)
+    return 1
+
+
+def daemon_request(socket_path: Path, control: str) -> dict[str, Any] | None:
+    """Send a control request ("status" or "stop") to a running daemon.
+
+    Returns:
+        The daemon's reply, or None if no daemon is listening
+    """
+    conn = _connect(socket_path)
+    if conn is None:
+        return None
+    with conn:
+        try:
+            conn.sendall(_encode({"control": control}))
+            for message in _messages(conn):
+                return message
+        except (OSError, ValueError) as e:
+            logger.debug(f"Daemon control request failed: {e}")
+    return None
+
+
+def run_cli(argv: list[str]) -> int:
+    """Run ``amplifier <argv>`` in this process and return its exit code."""
+    import click
+
+    from .main import cli
+
+    try:
+        result = cli.main(args=argv, prog_name="amplifier", standalone_mode=False)
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    except click.ClickException as e:
+        e.show(file=sys.stderr)
+        return e.exit_code
+    except click.Abort:
+        print("Aborted!", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    except Exception:
+        traceback.print_exc()
+        return 1
+    return result if isinstance(result, int) else 0
+
+
+def source_signature() -> str:
+    """Summarize what imported module code depends on.
+
+    Covers the CLI/foundation/core versions, the CLI's own source files, the
+    commits of cached modules and the user settings file (which can point
+    modules at other sources; its ``updates`` bookkeeping is ignored). Everything else a request depends on is
+    checked per request by the mount-plan cache fingerprint.
+    """
+    from .lib.settings import SettingsPaths
+    from .runtime.plan_cache import _cached_module_shas
+    from .runtime.plan_cache import _distribution_versions
+    from .runtime.plan_cache import _settings_content
+
+    inputs = {
+        "versions": _distribution_versions(),
+        "package": _newest_source_mtime(Path(__file__).parent),
+        "cached_modules": _cached_module_shas(),
+        "settings": _settings_content(SettingsPaths.default().global_settings),
+    }
+    return json.dumps(inputs, sort_keys=True, default=str)
+
+
+class RunDaemon:
+    """Serves ``amplifier`` command lines over a Unix domain socket.
+
+    Contract:
+    - Inputs: requests from forward_run() and daemon_request() clients
+    - Outputs: streamed stdout/stderr and an exit code per request
+    - Side Effects: Binds socket_path (mode 0600) and removes it on exit;
+      swaps cwd, environment and stdio while a request runs; installs a
+      SIGINT handler (must run on the main thread)
+    - Errors: RuntimeError if another daemon already serves socket_path
+    """
+
+    def __init__(
+        self,
+        socket_path: Path,
+        *,
+        idle_timeout: float,
+        execute: Callable[[list[str]], int] = run_cli,
+        signature: Callable[[], str] = source_signature,
+    ):
+        """Initialize a daemon (nothing is bound until serve_forever).
+
+        Args:
+            socket_path: Unix socket to listen on
+            idle_timeout: Exit after this many seconds without requests
+                (0 disables the timeout)
+            execute: Runs one command line in-process and returns its exit code
+            signature: Changes whenever the daemon must restart to serve
+                current code
+        """
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.requests = 0
+        self._execute = execute
+        self._signature = signature
+        self._server: socket.socket | None = None
+        self._started = time.time()
+        self._stopping = False
+        self._client_cancelled = False
+
+    def serve_forever(self) -> bool:
+        """Serve requests until idle, stopped or stale.
+
+        Returns:
+            True if the daemon should be restarted (its sources or settings
+            changed), False if it stopped for good
+        """
+        baseline = self._signature()
+        server = self._bind()
+        interval = _WATCH_INTERVAL
+        if self.idle_timeout:
+            interval = min(interval, self.idle_timeout)
+        server.settimeout(interval)
+        previous_handler = signal.signal(signal.SIGINT, self._idle_sigint)
+        last_request = time.monotonic()
+        try:
+            while not self._stopping:
+                try:
+                    conn, _ = server.accept()
+                except TimeoutError:
+                    if self._signature() != baseline:
+                        logger.info("Sources or settings changed; restarting")
+                        return True
+                    idle = time.monotonic() - last_request
+                    if self.idle_timeout and idle >= self.idle_timeout:
+                        logger.info(f"Idle for {idle:.0f}s; stopping")
+                        return False
+                    continue
+                with conn:
+                    conn.settimeout(None)
+                    if self._signature() != baseline:
+                        _send(conn, threading.Lock(), {"unavailable": "restarting"})
+                        return True
+                    self._handle(conn)
+                last_request = time.monotonic()
+            return False
+        finally:
+            signal.signal(signal.SIGINT, previous_handler)
+            self.close()
+
+    def close(self) -> None:
+        """Stop listening and remove the socket."""
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+            self.socket_path.unlink(missing_ok=True)
+
+    def _bind(self) -> socket.socket:
+        path = self.socket_path
+        if path.exists() or path.is_symlink():
+            if daemon_request(path, "status") is not None:
+                raise RuntimeError(f"An amplifier daemon is already serving {path}")
+            # Left behind by a daemon that did not exit cleanly
+            path.unlink()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # The socket runs commands as this user: nobody else may connect
+        previous_umask = os.umask(0o177)
+        try:
+            server.bind(str(path))
+        except OSError as e:
+            server.close()
+            raise RuntimeError(f"Cannot listen on {path}: {e}") from e
+        finally:
+            os.umask(previous_umask)
+        server.listen()
+        self._server = server
+        return server
+
+    def _handle(self, conn: socket.socket) -> None:
+        lock = threading.Lock()
+        try:
+            request = next(_messages(conn), None)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Unreadable request: {e}")
+            return
+        if not isinstance(request, dict):
+            return  # Connection probe
+
+        control = request.get("control")
+        if control == "status":
+            _send(conn, lock, {"status": self._status()})
+            return
+        if control == "stop":
+            self._stopping = True
+            _send(conn, lock, {"exit": 0})
+            return
+
+        try:
+            argv = [str(arg) for arg in request["argv"]]
+        except (KeyError, TypeError) as e:
+            _send(conn, lock, {"unavailable": f"malformed request: {e}"})
+            return
+
+        self.requests += 1
+        logger.info(f"Request {self.requests}: amplifier {' '.join(argv)}")
+        done = threading.Event()
+        watcher = threading.Thread(
+            target=self._watch_disconnect,
+            args=(conn, done),
+            name="amplifier-daemon-disconnect",
+            daemon=True,
+        )
+        turner = threading.Thread(
+            target=self._turn_away_while_busy,
+            args=(done,),
+            name="amplifier-daemon-busy",
+            daemon=True,
+        )
+        code = 1
+        try:
+            with _client_process_state(request, conn, lock):
+                signal.signal(signal.SIGINT, self._request_sigint)
+                watcher.start()
+                turner.start()
+                try:
+                    code = self._execute(argv)
+                finally:
+                    done.set()
+                    signal.signal(signal.SIGINT, self._idle_sigint)
+        except KeyboardInterrupt:
+            code = 130
+        except Exception as e:
+            logger.exception(f"Request failed: {e}")
+        watcher.join(timeout=1.0)
+        # Must be gone before the main loop accepts again
+        if turner.ident is not None:
+            turner.join()
+        try:
+            _send(conn, lock, {"exit": code})
+        except OSError:
+            pass  # Client already gone
+
+    def _turn_away_while_busy(self, done: threading.Event) -> None:
+        """Answer other clients while a request runs on the main thread.
+
+        Run requests get ``{"unavailable": "busy"}`` so forward_run() falls
+        back to a local run; status and stop are answered as usual.
+        """
+        server = self._server
+        if server is None:
+            return
+        while not done.is_set():
+            try:
+                readable, _, _ = select.select([server], [], [], 0.2)
+                if not readable:
+                    continue
+                conn, _ = server.accept()
+            except (OSError, ValueError):
+                return  # Server closed
+            with conn:
+                try:
+                    conn.settimeout(_BUSY_READ_TIMEOUT)
+                    request = next(_messages(conn), None)
+                    if not isinstance(request, dict):
+                        continue  # Connection probe
+                    lock = threading.Lock()
+                    control = request.get("control")
+                    if control == "status":
+                        _send(conn, lock, {"status": self._status()})
+                    elif control == "stop":
+                        self._stopping = True
+                        _send(conn, lock, {"exit": 0})
+                    else:
+                        _send(conn, lock, {"unavailable": "busy"})
+                except (OSError, ValueError) as e:
+                    logger.debug(f"Could not answer client while busy: {e}")
+
+    def _watch_disconnect(self, conn: socket.socket, done: threading.Event) -> None:
+        """Interrupt the running request when its client disconnects."""
+        while not done.is_set():
+            try:
+                readable, _, _ = select.select([conn], [], [], 0.2)
+                if not readable or conn.recv(1024):
+                    continue  # Still connected (stray input is discarded)
+            except (OSError, ValueError):
+                pass
+            if not done.is_set():
+                logger.info("Client disconnected; interrupting request")
+                self._client_cancelled = True
+                os.kill(os.getpid(), signal.SIGINT)
+            return
+
+    def _request_sigint(self, signum: int, frame: Any) -> None:
+        # Interrupts the request; a pending client cancel is consumed here, so
+        # the next Ctrl+C in the idle loop stops the daemon as usual
+        self._client_cancelled = False
+        raise KeyboardInterrupt
+
+    def _idle_sigint(self, signum: int, frame: Any) -> None:
+        if self._client_cancelled:
+            # A client's interrupt still pending when its request finished
+            self._client_cancelled = False
+            return
+        raise KeyboardInterrupt
+
+    def _status(self) -> dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "socket": str(self.socket_path),
+            "uptime": round(time.time() - self._started, 1),
+            "requests": self.requests,
+            "idle_timeout": self.idle_timeout,
+        }
+
+
+class _RelayStream(io.TextIOBase):
+    """Text stream that forwards writes to a client as protocol messages."""
+
+    def __init__(
+        self, conn: socket.socket, lock: threading.Lock, name: str, tty: bool
+    ):
+        self._conn = conn
+        self._lock = lock
+        self._name = name
+        self._tty = tty
+        self._peer_gone = False
+
+    @property
+    def encoding(self) -> str:
+        return "utf-8"
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self._tty
+
+    def write(self, data: str) -> int:
+        if data and not self._peer_gone:
+            try:
+                _send(self._conn, self._lock, {"stream": self._name, "data": data})
+            except OSError:
+                self._peer_gone = True  # Output of a cancelled request is dropped
+        return len(data)
+
+
+@contextmanager
+def _client_process_state(
+    request: dict[str, Any], conn: socket.socket, lock: threading.Lock
+) -> Iterator[None]:
+    """Run the enclosed block with the client's cwd, environment and stdio."""
+    from .console import console
+
+    tty = bool(request.get("isatty"))
+    saved_cwd = os.getcwd()
+    saved_env = dict(os.environ)
+    saved_stdio = (sys.stdin, sys.stdout, sys.stderr)
+    saved_console_file = console.file
+
+    env = {str(k): str(v) for k, v in (request.get("env") or {}).items()}
+    env.pop(DAEMON_ENV, None)  # Never forward back to this daemon
+    try:
+        os.chdir(request.get("cwd") or saved_cwd)
+        os.environ.clear()
+        os.environ.update(env)
+        sys.stdin = io.StringIO(request.get("stdin") or "")
+        sys.stdout = _RelayStream(conn, lock, "stdout", tty)
+        sys.stderr = _RelayStream(conn, lock, "stderr", tty)
+        console.file = sys.stdout
+        yield
+    finally:
+        console.file = saved_console_file
+        sys.stdin, sys.stdout, sys.stderr = saved_stdio
+        os.environ.clear()
+        os.environ.update(saved_env)
+        os.chdir(saved_cwd)
+
+
+def _connect(socket_path: Path) -> socket.socket | None:
+    try:
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    except OSError as e:  # No AF_UNIX on this platform
+        logger.debug(f"Cannot reach amplifier daemon: {e}")
+        return None
+    try:
+        conn.settimeout(_CONNECT_TIMEOUT)
+        conn.connect(str(socket_path))
+        conn.settimeout(None)
+    except OSError as e:
+        logger.debug(f"No amplifier daemon at {socket_path}: {e}")
+        conn.close()
+        return None
+    return conn
+
+
+def _encode(message: dict[str, Any]) -> bytes:
+    return (json.dumps(message) + "\n").encode("utf-8")
+
+
+def _send(conn: socket.socket, lock: threading.Lock, message: dict[str, Any]) -> None:
+    data = _encode(message)
+    with lock:
+        conn.sendall(data)
+
+
+def _messages(conn: socket.socket) -> Iterator[dict[str, Any]]:
+    """Yield protocol messages from a connection until it closes."""
+    buffer = b""
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            return
+        buffer += chunk
+        while b"\n" in buffer:
+            line, buffer = buffer.split(b"\n", 1)
+            if line.strip():
+                yield json.loads(line)
+
+
+def _newest_source_mtime(package_dir: Path) -> int:
+    newest = 0
+    for root, dirs, files in os.walk(package_dir):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        for name in files:
+            if name.endswith(".py"):
+                try:
+                    newest = max(newest, os.stat(os.path.join(root, name)).st_mtime_ns)
+                except OSError:
+                    continue
+    return newest
@@ -4,6 +4,8 @@ Saves transcript.jsonl after each tool completion (tool:post event),
 providing crash recovery between tool calls rather than just between turns.
 
 This is a non-blocking hook that uses the existing SessionStore for atomic writes.
+When a SessionWriter is supplied, the write itself happens on the writer's
+background thread so the event loop is never blocked on disk I/O.
 """
 
 from __future__ import annotations
@@ -19,6 +21,7 @@ if TYPE_CHECKING:
     from amplifier_core import AmplifierSession
 
 from .session_store import SessionStore
+from .session_writer import SessionWriter
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +33,8 @@ class IncrementalSaveHook:
     - Listens for: tool:post events
     - Side effects: Writes transcript.jsonl and metadata.json via SessionStore
     - Debouncing: Skips save if message count hasn't changed since last save
-    - Thread safety: Uses SessionStore's atomic write mechanism
+    - Thread safety: Uses SessionStore's atomic write mechanism; with a
+      SessionWriter, saves are queued to its single worker thread
 
     Usage:
         hook = IncrementalSaveHook(session, store, session_id, bundle_name, config)
@@ -44,6 +48,7 @@ class IncrementalSaveHook:
         session_id: str,
         bundle_name: str,
         config: dict[str, Any],
+        writer: SessionWriter | None = None,
     ):
         """Initialize incremental save hook.
 
@@ -53,12 +58,14 @@ class IncrementalSaveHook:
             session_id: Session identifier
             bundle_name: Bundle name for metadata (e.g., "bundle:foundation")
             config: Session configuration for extracting model info
+            writer: Optional background writer; saves block the loop without it
         """
         self.session = session
         self.store = store
         self.session_id = session_id
         self.bundle_name = bundle_name
         self.config = config
+        self.writer = writer
         self._last_message_count = 0
 
     async def on_tool_post(self, event: str, data: dict[str, Any]):
@@ -95,30 +102,25 @@ class IncrementalSaveHook:
             # Update debounce counter
             self._last_message_count = current_count
 
-            # Extract model name from config
-            model_name = self._extract_model_name()
-
-            # Load existing metadata to preserve fields like name, description
-            # that may have been set by other hooks (e.g., session-naming)
-            existing_metadata = self.store.get_metadata(self.session_id) or {}
-
-            # Build metadata, preserving existing fields while updating dynamic ones
-            metadata = {
-                **existing_metadata,  # Preserve name, description, etc.
-                "session_id": self.session_id,
-                "created": existing_metadata.get(
-                    "created", datetime.now(UTC).isoformat()
-                ),
-                "bundle": self.bundle_name,
-                "model": model_name,
-                "turn_count": len([m for m in messages if m.get("role") == "user"]),
-                "incremental": True,  # Distinguish from final saves
-                # Store working_dir for session sync between CLI and web
-                "working_dir": str(Path.cwd().resolve()),
-            }
-
-            # Save via SessionStore (atomic writes)
-            self.store.save(self.session_id, messages, metadata)
+            if self.writer is not None:
+                # Queue for the background writer (coalesced with older saves)
+                snapshot = list(messages)
+                self.writer.submit(
+                    self.session_id,
+                    snapshot,
+                    lambda existing: self._build_metadata(snapshot, existing),
+                )
+            else:
+                # Load existing metadata to preserve fields like name, description
+                # that may have been set by other hooks (e.g., session-naming)
+                existing_metadata = self.store.get_metadata(self.session_id) or {}
+
+                # Save via SessionStore (atomic writes)
+                self.store.save(
+                    self.session_id,
+                    messages,
+                    self._build_metadata(messages, existing_metadata),
+                )
 
             tool_name = data.get("tool_name", "unknown")
             logger.debug(
@@ -131,6 +133,28 @@ class IncrementalSaveHook:
 
         return HookResult(action="continue")
 
+    def _build_metadata(self, messages: list, existing_metadata: dict) -> dict:
+        """Build metadata, preserving existing fields while updating dynamic ones.
+
+        Args:
+            messages: Current context messages
+            existing_metadata: Metadata currently on disk
+
+        Returns:
+            Metadata dictionary to save
+        """
+        return {
+            **existing_metadata,  # Preserve name, description, etc.
+            "session_id": self.session_id,
+            "created": existing_metadata.get("created", datetime.now(UTC).isoformat()),
+            "bundle": self.bundle_name,
+            "model": self._extract_model_name(),
+            "turn_count": len([m for m in messages if m.get("role") == "user"]),
+            "incremental": True,  # Distinguish from final saves
+            # Store working_dir for session sync between CLI and web
+            "working_dir": str(Path.cwd().resolve()),
+        }
+
     def _extract_model_name(self) -> str:
         """Extract model name from session config.
 
@@ -154,6 +178,7 @@ def register_incremental_save(
     session_id: str,
     bundle_name: str,
     config: dict[str, Any],
+    writer: SessionWriter | None = None,
 ) -> IncrementalSaveHook | None:
     """Register incremental save hook on session.
 
@@ -166,6 +191,7 @@ def register_incremental_save(
         session_id: Session identifier
         bundle_name: Bundle name for metadata (e.g., "bundle:foundation")
         config: Session configuration
+        writer: Optional background writer to perform saves off the event loop
 
     Returns:
         The created hook instance, or None if hooks not available
@@ -175,7 +201,9 @@ def register_incremental_save(
         logger.debug("Hooks not available, skipping incremental save registration")
         return None
 
-    hook = IncrementalSaveHook(session, store, session_id, bundle_name, config)
+    hook = IncrementalSaveHook(
+        session, store, session_id, bundle_name, config, writer=writer
+    )
 
     # Register with priority 900 (high, but below trace collector at 1000)
     # This ensures tracing completes before we save
@@ -9,6 +9,7 @@ modules from git sources before session creation.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import re
@@ -48,6 +49,8 @@ def _activation_is_strict() -> bool:
     )
 
 
+# Upper bound on behavior repositories loaded (fetched) at the same time
+_MAX_CONCURRENT_BEHAVIOR_LOADS = 4
 
 # A "namespace:path" include (e.g. "foo:behaviors/extra") is a reference
 # into the bundle registry's namespace lookup, not a fetchable URI. It must
@@ -68,6 +71,22 @@ def _is_namespace_path(source: str) -> bool:
     return bool(_NAMESPACE_PATH_PATTERN.match(source))
 
 
+# URI prefixes that indicate direct loading without discovery
+_BUNDLE_URI_PREFIXES = ("git+", "file://", "http://", "https://", "zip+")
+
+
+def resolve_bundle_uri(bundle_name: str, discovery: AppBundleDiscovery) -> str | None:
+    """Return the URI a bundle name loads from (a URI is returned as is).
+
+    Returns:
+        The bundle URI, or None if discovery does not know the name
+    """
+    if bundle_name.startswith(_BUNDLE_URI_PREFIXES):
+        logger.info(f"Input is URI, loading directly: {bundle_name}")
+        return bundle_name
+    return discovery.find(bundle_name)
+
+
 async def load_and_prepare_bundle(
     bundle_name: str,
     discovery: AppBundleDiscovery,
@@ -143,15 +162,8 @@ async def load_and_prepare_bundle(
             source_overrides={"tool-task": "/local/path/to/module"},
         )
     """
-    # Check if input looks like a URI rather than a bundle name
-    # URI prefixes that indicate direct loading without discovery
-    uri_prefixes = ("git+", "file://", "http://", "https://", "zip+")
-    if bundle_name.startswith(uri_prefixes):
-        logger.info(f"Input is URI, loading directly: {bundle_name}")
-        uri = bundle_name
-    else:
-        # 1. Discover bundle URI via CLI search paths
-        uri = discovery.find(bundle_name)
+    # 1. Discover bundle URI via CLI search paths (URIs are used directly)
+    uri = resolve_bundle_uri(bundle_name, discovery)
     if not uri:
         available = discovery.list_bundles()
         raise FileNotFoundError(
@@ -178,16 +190,20 @@ async def load_and_prepare_bundle(
     logger.debug(f"Loaded bundle: {bundle.name} v{bundle.version}")
 
     # 3. Compose additional behavior bundles (app-level policies like notifications)
+    # Behaviors are loaded concurrently, then composed in their given order
     if compose_behaviors:
-        for behavior_uri in compose_behaviors:
-            behavior_name = _extract_behavior_name(behavior_uri)
+        behavior_bundles = await _load_behaviors(
+            compose_behaviors, discovery, progress_callback
+        )
+        for behavior_uri, behavior_bundle in zip(
+            compose_behaviors, behavior_bundles, strict=True
+        ):
+            if behavior_bundle is None:
+                continue  # Load failed and was logged; behaviors are optional
             logger.info(f"Composing behavior: {behavior_uri}")
             if progress_callback:
-                progress_callback("composing", behavior_name)
+                progress_callback("composing", _extract_behavior_name(behavior_uri))
             try:
-                behavior_bundle = await load_bundle(
-                    behavior_uri, registry=discovery.registry
-                )
                 bundle = bundle.compose(behavior_bundle)
                 logger.debug(
                     f"Composed behavior '{behavior_bundle.name}' onto '{bundle.name}'"
@@ -243,6 +259,49 @@ async def load_and_prepare_bundle(
     return prepared
 
 
+async def _load_behaviors(
+    behavior_uris: list[str],
+    discovery: AppBundleDiscovery,
+    progress_callback: Callable[[str, str], None] | None = None,
+) -> list[Bundle | None]:
+    """Load behavior bundles concurrently, preserving input order.
+
+    Behaviors from the same repository (e.g. the notify bundle and its
+    desktop/push subdirectories) load one after another, so two loads never
+    fetch the same git checkout at once. At most
+    ``_MAX_CONCURRENT_BEHAVIOR_LOADS`` repositories load at a time.
+
+    Returns:
+        One entry per URI: the loaded Bundle, or None if loading failed
+        (logged as a warning, matching the sequential behavior before)
+    """
+    results: list[Bundle | None] = [None] * len(behavior_uris)
+    by_repository: dict[str, list[int]] = {}
+    for index, uri in enumerate(behavior_uris):
+        by_repository.setdefault(uri.split("#", 1)[0], []).append(index)
+
+    if progress_callback:
+        progress_callback("loading", f"{len(behavior_uris)} behaviors")
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_BEHAVIOR_LOADS)
+
+    async def load_repository(indexes: list[int]) -> None:
+        async with semaphore:
+            for index in indexes:
+                uri = behavior_uris[index]
+                logger.info(f"Loading behavior: {uri}")
+                try:
+                    results[index] = await load_bundle(
+                        uri, registry=discovery.registry
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to compose behavior '{uri}': {e}")
+
+    await asyncio.gather(
+        *(load_repository(indexes) for indexes in by_repository.values())
+    )
+    return results
+
+
 async def compose_and_prepare_bundles(
     bundle_names: list[str],
     discovery: AppBundleDiscovery,
@@ -5,8 +5,11 @@ Philosophy: Simple, scope-aware YAML settings.
 
 from __future__ import annotations
 
+import copy
 import os
 import tempfile
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -56,6 +59,112 @@ class NotificationFlags:
     push_enabled: bool
 
 
+# Files modified this recently are re-read: a rewrite within the filesystem's
+# timestamp granularity may leave (mtime, size) unchanged ("racy" entries)
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class SettingsFileCache:
+    """Process-wide cache of parsed settings files and merged results.
+
+    Keyed by each file's (mtime_ns, size, inode), so edits from any process
+    invalidate entries on the next read; AppSettings._write_scope also drops
+    the entry it replaces. Callers always receive deep copies.
+
+    Contract:
+    - Inputs: settings file paths
+    - Outputs: parsed YAML content (None for missing or malformed files)
+    - Side Effects: None beyond memory
+    - Errors: Parse errors are cached as None, matching how every reader
+      skips malformed files
+    """
+
+    def __init__(self) -> None:
+        self._files: dict[Path, tuple[tuple[int, int, int], Any]] = {}
+        self._merged: dict[tuple, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self.parses = 0
+        self.hits = 0
+
+    def load(self, path: Path) -> Any:
+        """Parsed content of a settings file, or None if missing/malformed."""
+        content, _stamp = self._load(path)
+        return copy.deepcopy(content)
+
+    def merged(self, paths: list[Path], merge) -> dict[str, Any]:
+        """Merge the files in order with ``merge(base, overlay)``, memoized."""
+        loaded = [(path, *self._load(path)) for path in paths]
+        key = tuple((path, stamp) for path, _content, stamp in loaded)
+        cacheable = all(stamp is not False for _path, _content, stamp in loaded)
+        with self._lock:
+            cached = self._merged.get(key) if cacheable else None
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        result: dict[str, Any] = {}
+        for _path, content, _stamp in loaded:
+            if content is None:
+                continue
+            try:
+                result = merge(result, content)
+            except Exception:
+                pass  # Skip malformed files
+        if cacheable:
+            with self._lock:
+                self._merged[key] = result
+        # The result shares nested objects with cached file contents
+        return copy.deepcopy(result)
+
+    def invalidate(self, path: Path) -> None:
+        with self._lock:
+            self._files.pop(path, None)
+            self._merged = {
+                key: value
+                for key, value in self._merged.items()
+                if all(entry[0] != path for entry in key)
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._files.clear()
+            self._merged.clear()
+
+    def _load(self, path: Path) -> tuple[Any, tuple[int, int, int] | None | bool]:
+        """Return (shared content, stamp).
+
+        The stamp is None for a missing file and False when the file is too
+        recently modified to be trusted (content is then parsed, not cached).
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            return None, None
+        stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+        with self._lock:
+            entry = self._files.get(path)
+            if entry is not None and entry[0] == stamp:
+                self.hits += 1
+                return entry[1], stamp
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                content = yaml.safe_load(f) or {}
+        except Exception:
+            content = None
+        with self._lock:
+            self.parses += 1
+            if time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS:
+                self._files.pop(path, None)
+                return content, False
+            self._files[path] = (stamp, content)
+        return content, stamp
+
+
+# Shared by every AppSettings instance in the process
+settings_file_cache = SettingsFileCache()
+
+
 @dataclass
 class SettingsPaths:
     """Standard paths for settings files."""
@@ -116,7 +225,6 @@ class AppSettings:
 
     def get_merged_settings(self) -> dict[str, Any]:
         """Load and merge settings from all scopes."""
-        result: dict[str, Any] = {}
         # Order: global -> project -> local -> session (most specific wins)
         paths_to_check = [
             self.paths.global_settings,
@@ -126,15 +234,7 @@ class AppSettings:
         if self.paths.session_settings:
             paths_to_check.append(self.paths.session_settings)
 
-        for path in paths_to_check:
-            if path.exists():
-                try:
-                    with open(path, encoding="utf-8") as f:
-                        content = yaml.safe_load(f) or {}
-                    result = self._deep_merge(result, content)
-                except Exception:
-                    pass  # Skip malformed files
-        return result
+        return settings_file_cache.merged(paths_to_check, self._deep_merge)
 
     # ----- Bundle settings -----
 
@@ -374,11 +474,12 @@ class AppSettings:
         ]
 
         for path in paths_to_check:
-            if path is None or not path.exists():
+            if path is None:
+                continue
+            content = settings_file_cache.load(path)
+            if content is None:
                 continue
             try:
-                with open(path, encoding="utf-8") as f:
-                    content = yaml.safe_load(f) or {}
                 scope_providers = content.get("config", {}).get("providers", [])
                 if not isinstance(scope_providers, list) or not scope_providers:
                     continue
@@ -781,11 +882,12 @@ class AppSettings:
         ]
 
         for scope_name, path in scopes_to_check:
-            if path is None or not path.exists():
+            if path is None:
+                continue
+            content = settings_file_cache.load(path)
+            if content is None:
                 continue
             try:
-                with open(path, encoding="utf-8") as f:
-                    content = yaml.safe_load(f) or {}
                 paths_list = (
                     content.get("modules", {})
                     .get("tools", [{}])[0]
@@ -962,11 +1064,12 @@ class AppSettings:
         ]
 
         for scope_name, path in scopes_to_check:
-            if path is None or not path.exists():
+            if path is None:
+                continue
+            content = settings_file_cache.load(path)
+            if content is None:
                 continue
             try:
-                with open(path, encoding="utf-8") as f:
-                    content = yaml.safe_load(f) or {}
                 paths_list = self._get_tool_config_paths(content, "denied_write_paths")
                 for p in paths_list:
                     if p not in seen_paths:
@@ -1053,10 +1156,9 @@ class AppSettings:
                 / session_id
                 / "settings.yaml"
             )
-            if session_settings_path.exists():
+            session_settings = settings_file_cache.load(session_settings_path)
+            if session_settings is not None:
                 try:
-                    with open(session_settings_path, encoding="utf-8") as f:
-                        session_settings = yaml.safe_load(f) or {}
                     session_tools = session_settings.get("modules", {}).get("tools", [])
                     if session_tools:
                         tools = self._merge_tool_lists(tools, session_tools)
@@ -1205,14 +1307,8 @@ class AppSettings:
 
     def _read_scope(self, scope: Scope) -> dict[str, Any]:
         """Read settings from a specific scope."""
-        path = self._get_scope_path(scope)
-        if not path.exists():
-            return {}
-        try:
-            with open(path, encoding="utf-8") as f:
-                return yaml.safe_load(f) or {}
-        except Exception:
-            return {}
+        content = settings_file_cache.load(self._get_scope_path(scope))
+        return content if content is not None else {}
 
     def _write_scope(self, scope: Scope, settings: dict[str, Any]) -> None:
         """Write settings to a specific scope.
@@ -1250,6 +1346,8 @@ class AppSettings:
         except BaseException:
             Path(tmp).unlink(missing_ok=True)
             raise
+        finally:
+            settings_file_cache.invalidate(path)
 
     def _scope_lock(self, scope: Scope) -> BaseFileLock:
         """Advisory file lock guarding the read-modify-write critical
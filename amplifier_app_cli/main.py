@@ -14,57 +14,16 @@ from typing import TYPE_CHECKING, Any
 
 import click
 
+from amplifier_app_cli.startup_profile import startup_profiler
 from amplifier_app_cli.utils.help_formatter import AmplifierGroup
 
 if TYPE_CHECKING:
+    from amplifier_core import AmplifierSession
     from amplifier_foundation.bundle import PreparedBundle
-from amplifier_core import (
-    AmplifierSession,
-    ModuleValidationError,  # pyright: ignore[reportAttributeAccessIssue]
-)
-from amplifier_core.llm_errors import LLMError
-from amplifier_foundation import sanitize_message
-from prompt_toolkit import PromptSession
-from prompt_toolkit.formatted_text import HTML
-from prompt_toolkit.history import FileHistory, InMemoryHistory
-from prompt_toolkit.key_binding import KeyBindings
-from rich.panel import Panel
-
-# Errors that mean the terminal can never satisfy the REPL, so retrying is
-# pointless. See the REPL loop's handler for the full story: on Windows without
-# a real console, prompt_toolkit's Win32Output raises before the loop reaches
-# any await, so the "keep going" catch-all turns into an unkillable busy spin.
-#
-# `prompt_toolkit.output.win32` asserts `sys.platform == "win32"` at import, so
-# this must stay guarded. On POSIX the tuple is empty and `except ()` catches
-# nothing -- the POSIX path is byte-identical in effect to what shipped.
-if sys.platform == "win32":  # pragma: no cover - platform-specific
-    from prompt_toolkit.output.win32 import NoConsoleScreenBufferError
-
-    _TERMINAL_UNUSABLE_ERRORS: tuple[type[BaseException], ...] = (
-        NoConsoleScreenBufferError,
-    )
-else:
-    _TERMINAL_UNUSABLE_ERRORS = ()
-
-
-from .commands.agents import agents as agents_group
-from .commands.allowed_dirs import allowed_dirs as allowed_dirs_group
-from .commands.bundle import bundle as bundle_group
-from .commands.denied_dirs import denied_dirs as denied_dirs_group
-from .commands.init import check_first_run, init_cmd, prompt_first_run_init
-from .commands.module import module as module_group
-from .commands.notify import notify as notify_group
-from .commands.provider import provider as provider_group
-from .commands.reset import reset as reset_cmd
-from .commands.routing import routing_group
-from .commands.run import register_run_command
-from .commands.session import register_session_commands
-from .commands.source import source as source_group
-from .commands.tool import tool as tool_group
-from .commands.update import update as update_cmd
-from .commands.version import version as version_cmd
-from .console import Markdown, console
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.formatted_text import HTML
+
+from .console import console
 from .dedicated_tty_input import close_dedicated_tty_input, get_dedicated_tty_input
 from .effective_config import get_effective_config_summary
 from .key_manager import KeyManager
@@ -72,46 +31,62 @@ from .provider_diagnostics import DEFAULT_TIMEOUT_S as _PROVIDER_DIAGNOSTIC_TIME
 from .provider_diagnostics import format_model_line
 from .provider_diagnostics import invoke_list_models
 from .provider_diagnostics import test_provider_connectivity
-from .session_runner import SessionConfig, create_initialized_session
-from .session_store import SessionStore
-from .stdout_offload import patch_stdout_offloaded as patch_stdout
 from .ui.dashboard_renderer import DashboardRenderer
 from .ui.dashboard_renderer import _redact_value as _dr_redact_value
-from .ui.error_display import display_llm_error, display_validation_error
 from .ui.item_renderer import ItemRenderer
 from .ui.log_filter import LLMErrorLogFilter
 from .ui.view_policy import resolve_view
 from .utils.error_format import escape_markup
 from .utils.version import get_core_version, get_version
 
+# The session runtime (amplifier-core, amplifier-foundation, prompt_toolkit and
+# the REPL's UI modules) is imported inside interactive_chat, execute_single and
+# CommandProcessor, and the commands that drive it (run, continue, resume,
+# session) are registered lazily below. `amplifier --help`, `--version` and the
+# management commands never pay for it.
+
+
+def _terminal_unusable_errors() -> tuple[type[BaseException], ...]:
+    """Errors that mean the terminal can never satisfy the REPL.
+
+    Retrying is pointless for these. See the REPL loop's handler for the full
+    story: on Windows without a real console, prompt_toolkit's Win32Output
+    raises before the loop reaches any await, so the "keep going" catch-all
+    turns into an unkillable busy spin.
+
+    `prompt_toolkit.output.win32` asserts `sys.platform == "win32"` at import,
+    so this must stay guarded. On POSIX the tuple is empty and `except ()`
+    catches nothing.
+    """
+    if sys.platform == "win32":  # pragma: no cover - platform-specific
+        from prompt_toolkit.output.win32 import NoConsoleScreenBufferError
+
+        return (NoConsoleScreenBufferError,)
+    return ()
+
 
 def _report_terminal_unusable(exc: BaseException, *, verbose: bool = False) -> None:
     """Explain an unusable terminal in terms the user can act on.
 
-    Shared by every site that can hit ``_TERMINAL_UNUSABLE_ERRORS`` so the
+    Shared by every site that can hit ``_terminal_unusable_errors()`` so the
     message stays identical no matter where the failure surfaces. Without this,
     a user piping or redirecting ``amplifier`` on Windows got a raw
     prompt_toolkit traceback naming ``Win32Output`` -- accurate, but it points
     at a library internal rather than at what they did or what to do instead.
     """
-    # Local imports: this helper is defined above main.py's own import block so
-    # it can sit next to the _TERMINAL_UNUSABLE_ERRORS tuple it belongs to.
-    from .console import console as _console
-    from .utils.error_format import escape_markup as _escape
-
-    _console.print(f"[red]Cannot run an interactive session:[/red] {_escape(exc)}")
-    _console.print(
+    console.print(f"[red]Cannot run an interactive session:[/red] {escape_markup(exc)}")
+    console.print(
         "[yellow]The terminal has no console screen buffer. This happens when "
         "output is piped or redirected, or when running without a real "
         "console.[/yellow]"
     )
-    _console.print(
+    console.print(
         "Run interactively in a real terminal (Windows Terminal, conhost, or "
         "cmd.exe), or use a non-interactive command such as "
         "[cyan]amplifier run[/cyan]."
     )
     if verbose:
-        _console.print_exception()
+        console.print_exception()
 
 
 logger = logging.getLogger(__name__)
@@ -209,10 +184,6 @@ def _attach_llm_error_filter() -> None:
 KeyManager()
 
 
-# Placeholder for the run command; assigned after registration below
-_run_command: Callable | None = None
-
-
 def _detect_shell() -> str | None:
     """Detect current shell from $SHELL environment variable.
 
@@ -633,7 +604,7 @@ class CommandProcessor:
         """
         return _dr_redact_value(key, value)
 
-    def __init__(self, session: AmplifierSession, bundle_name: str = "unknown"):
+    def __init__(self, session: "AmplifierSession", bundle_name: str = "unknown"):
         self.session = session
         self.bundle_name = bundle_name
         self.configurator: Any = None
@@ -1208,6 +1179,8 @@ class CommandProcessor:
             messages = await context.get_messages()
 
             # Sanitize messages to handle ThinkingBlock and other non-serializable objects
+            from amplifier_foundation import sanitize_message
+
             from .session_store import SessionStore
 
             store = SessionStore()
@@ -3130,10 +3103,22 @@ def get_module_search_paths() -> list[Path]:
     return paths
 
 
+def _print_version(ctx: click.Context, _param: click.Parameter, value: bool) -> None:
+    """Eager --version callback; resolves the version only when requested."""
+    if not value or ctx.resilient_parsing:
+        return
+    click.echo(f"amplifier, version {get_version()} (core {get_core_version()})")
+    ctx.exit()
+
+
 @click.group(cls=AmplifierGroup, invoke_without_command=True)
-@click.version_option(
-    version=f"{get_version()} (core {get_core_version()})",
-    prog_name="amplifier",
+@click.option(
+    "--version",
+    is_flag=True,
+    expose_value=False,
+    is_eager=True,
+    callback=_print_version,
+    help="Show the version and exit.",
 )
 @click.option(
     "--install-completion",
@@ -3142,9 +3127,34 @@ def get_module_search_paths() -> list[Path]:
     default=None,
     help="Install shell completion for the specified shell (bash, zsh, or fish)",
 )
+@click.option(
+    "--profile-startup",
+    type=click.Choice(["table", "json"]),
+    is_flag=False,
+    flag_value="table",
+    default=None,
+    help="Report wall time per startup phase on stderr (table or json)",
+)
+@click.option(
+    "--profile-startup-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="With --profile-startup, also dump a cProfile file per phase here",
+)
 @click.pass_context
-def cli(ctx, install_completion):
+def cli(ctx, install_completion, profile_startup, profile_startup_dir):
     """Amplifier - AI-powered modular development platform."""
+    if profile_startup or profile_startup_dir:
+        from .lib.settings import settings_file_cache
+
+        startup_profiler.enable(profile_startup or "table", profile_startup_dir)
+        startup_profiler.add_counter(
+            "settings files parsed", lambda: settings_file_cache.parses
+        )
+        startup_profiler.add_counter(
+            "settings parses avoided", lambda: settings_file_cache.hits
+        )
+
     # Handle --install-completion flag
     if install_completion:
         # Auto-detect shell (always, no argument needed)
@@ -3206,10 +3216,8 @@ def cli(ctx, install_completion):
     # Note: Update check happens inside run command (not here, to avoid slowing other commands)
     # For initial prompt support, use: amplifier run --mode chat "prompt"
     if ctx.invoked_subcommand is None:
-        if _run_command is None:
-            raise RuntimeError("Run command not registered")
         ctx.invoke(
-            _run_command,
+            cli.get_command(ctx, "run"),
             prompt=None,
             bundle=None,  # Will check settings for active bundle
             provider=None,
@@ -3220,7 +3228,7 @@ def cli(ctx, install_completion):
         )
 
 
-async def process_runtime_mentions(session: AmplifierSession, prompt: str) -> str:
+async def process_runtime_mentions(session: "AmplifierSession", prompt: str) -> str:
     """Process @mentions in user input at runtime.
 
     Returns the prompt with <context_file> XML blocks prepended for any resolved
@@ -3290,7 +3298,7 @@ def _pinned_provider_name(session: Any) -> str | None:
 def _build_prompt_message(
     get_active_mode: Callable | None = None,
     get_pinned_provider: Callable | None = None,
-) -> HTML:
+) -> "HTML":
     """Build the REPL prompt, composing the optional indicators.
 
     Renders (mode leftmost, then pin, then the prompt caret)::
@@ -3313,6 +3321,7 @@ def _build_prompt_message(
     When neither indicator applies, the returned markup is byte-for-byte
     identical to the pre-pin prompt.
     """
+    from prompt_toolkit.formatted_text import HTML
 
     def _indicator(getter: Callable | None) -> str | None:
         if getter is None:
@@ -3348,7 +3357,7 @@ def _build_prompt_message(
 def _create_prompt_session(
     get_active_mode: Callable | None = None,
     get_pinned_provider: Callable | None = None,
-) -> PromptSession:
+) -> "PromptSession":
     """Create configured PromptSession for REPL.
 
     Provides:
@@ -3373,6 +3382,10 @@ def _create_prompt_session(
     - User experience: History is project-scoped (aligned with sessions)
     - Reliable keys: Ctrl-J works in all terminals
     """
+    from prompt_toolkit import PromptSession
+    from prompt_toolkit.history import FileHistory, InMemoryHistory
+    from prompt_toolkit.key_binding import KeyBindings
+
     from amplifier_app_cli.project_utils import get_project_slug
 
     project_slug = get_project_slug()
@@ -3471,6 +3484,17 @@ async def interactive_chat(
         initial_prompt: Optional prompt to auto-execute before entering interactive loop
         initial_transcript: If provided, restore this transcript (resume mode)
     """
+    from amplifier_core import ModuleValidationError  # pyright: ignore[reportAttributeAccessIssue]
+    from amplifier_core.llm_errors import LLMError
+    from rich.panel import Panel
+
+    from .session_runner import SessionConfig, create_initialized_session
+    from .session_store import SessionStore
+    from .stdout_offload import patch_stdout_offloaded as patch_stdout
+    from .ui.error_display import display_llm_error, display_validation_error
+
+    terminal_unusable_errors = _terminal_unusable_errors()
+
     # === SESSION CREATION (unified via create_initialized_session) ===
     session_config = SessionConfig(
         config=config,
@@ -3483,7 +3507,8 @@ async def interactive_chat(
     )
 
     # Create fully initialized session (handles all setup including resume)
-    initialized = await create_initialized_session(session_config, console)
+    with startup_profiler.phase("session creation"):
+        initialized = await create_initialized_session(session_config, console)
     session = initialized.session
     actual_session_id = initialized.session_id
 
@@ -3497,10 +3522,18 @@ async def interactive_chat(
     # Create session store for saving
     store = SessionStore()
 
+    # Saves run on a background writer thread; _save_session() awaits its
+    # flush barrier at turn end, and the REPL teardown closes it.
+    from .session_writer import SessionWriter
+
+    writer = SessionWriter(store)
+
     # Register incremental save hook for crash recovery between tool calls
     from .incremental_save import register_incremental_save
 
-    register_incremental_save(session, store, actual_session_id, bundle_name, config)
+    register_incremental_save(
+        session, store, actual_session_id, bundle_name, config, writer=writer
+    )
 
     # Register /goal auto-continue progress renderer (docs/GOAL_COMMAND.md).
     # The orchestrator emits orchestrator:goal_progress instead of printing
@@ -3510,6 +3543,9 @@ async def interactive_chat(
 
     register_goal_progress_hook(session)
 
+    # Notice from the background startup update check (commands/run.py)
+    from .utils.startup_checker import notify_if_updates
+
     # Show banner only for NEW sessions (resume shows banner via history display in commands/session.py)
     if not session_config.is_resume:
         config_summary = get_effective_config_summary(config, bundle_name)
@@ -3543,7 +3579,7 @@ async def interactive_chat(
             ),
             get_pinned_provider=lambda: _pinned_provider_name(command_processor.session),
         )
-    except _TERMINAL_UNUSABLE_ERRORS as e:
+    except terminal_unusable_errors as e:
         _report_terminal_unusable(e, verbose=verbose)
         await initialized.cleanup()
         close_dedicated_tty_input()
@@ -3561,26 +3597,32 @@ async def interactive_chat(
         return "unknown"
 
     # Helper to save session after each turn
-    async def _save_session():
+    async def _save_session(*, rewrite: bool = False):
         context = session.coordinator.get("context")
         if context and hasattr(context, "get_messages"):
             messages = await context.get_messages()
-            # Load existing metadata to preserve fields like name, description
-            # that may have been set by other hooks (e.g., session-naming)
-            existing_metadata = store.get_metadata(actual_session_id) or {}
-            metadata = {
-                **existing_metadata,  # Preserve name, description, etc.
-                "session_id": actual_session_id,
-                "created": existing_metadata.get(
-                    "created", datetime.now(UTC).isoformat()
-                ),
-                "bundle": bundle_name,
-                "model": _extract_model_name(),
-                "turn_count": len([m for m in messages if m.get("role") == "user"]),
-                # Store working_dir for session sync between CLI and web
-                "working_dir": str(Path.cwd().resolve()),
-            }
-            store.save(actual_session_id, messages, metadata)
+            model_name = _extract_model_name()
+            turn_count = len([m for m in messages if m.get("role") == "user"])
+
+            # Existing metadata is read on the writer thread so fields set by
+            # other hooks (e.g., session-naming: name, description) are preserved
+            def _build_metadata(existing_metadata: dict) -> dict:
+                return {
+                    **existing_metadata,  # Preserve name, description, etc.
+                    "session_id": actual_session_id,
+                    "created": existing_metadata.get(
+                        "created", datetime.now(UTC).isoformat()
+                    ),
+                    "bundle": bundle_name,
+                    "model": model_name,
+                    "turn_count": turn_count,
+                    # Store working_dir for session sync between CLI and web
+                    "working_dir": str(Path.cwd().resolve()),
+                }
+
+            writer.submit(actual_session_id, messages, _build_metadata, rewrite=rewrite)
+            # Turn-end durability barrier (also drains queued incremental saves)
+            await writer.flush()
 
     # Helper to detect and repair broken transcripts before each turn
     async def _repair_transcript_if_needed():
@@ -3621,8 +3663,9 @@ async def interactive_chat(
             if hasattr(context, "set_messages"):
                 await context.set_messages(repaired)
 
-            # Persist immediately so the fix survives further interruptions
-            await _save_session()
+            # Persist immediately so the fix survives further interruptions.
+            # Repair may rewrite earlier history, so don't append onto the old file.
+            await _save_session(rewrite=True)
 
             logger.warning(
                 "Pre-turn transcript repair: %s (orphaned tool calls: %s).",
@@ -3886,11 +3929,11 @@ async def interactive_chat(
         # Windows without a real console that raises NoConsoleScreenBufferError
         # from Win32Output. Checking up front means one clear message instead of
         # the same failure surfacing differently from two call sites.
-        if _TERMINAL_UNUSABLE_ERRORS:
+        if terminal_unusable_errors:
             try:
                 with patch_stdout():
                     pass
-            except _TERMINAL_UNUSABLE_ERRORS as e:
+            except terminal_unusable_errors as e:
                 _report_terminal_unusable(e, verbose=verbose)
                 # No explicit teardown here: this `return` is inside the try,
                 # so the finally below runs and does the whole teardown --
@@ -3899,6 +3942,10 @@ async def interactive_chat(
                 # it, which the teardown tests correctly caught.
                 return
 
+        # Startup ends where the user can type (or the initial prompt runs)
+        startup_profiler.finish("first prompt")
+        notify_if_updates(console)
+
         # Execute initial prompt if provided
         if initial_prompt:
             console.print(
@@ -3922,6 +3969,8 @@ async def interactive_chat(
                 # patch_stdout_offloaded (see stdout_offload.py) -- same
                 # freeze risk applies to any background Rich writes that
                 # land while the user is composing input.
+                # Background update check finished since the last prompt
+                notify_if_updates(console)
                 with patch_stdout():
                     user_input = await prompt_session.prompt_async()
 
@@ -4014,7 +4063,7 @@ async def interactive_chat(
             except LLMError as e:
                 display_llm_error(console, e, verbose=verbose)
 
-            except _TERMINAL_UNUSABLE_ERRORS as e:
+            except terminal_unusable_errors as e:
                 # MUST precede the catch-all below, and MUST break.
                 #
                 # On Windows with stdout not attached to a real console (piped,
@@ -4063,6 +4112,12 @@ async def interactive_chat(
         if hooks:
             await hooks.emit(CLEANUP_FINALLY_BEGIN, {"session_id": actual_session_id})
 
+        # Drain queued background saves before tearing the session down
+        try:
+            await writer.close()
+        except Exception as e:
+            logger.warning(f"Final session save failed: {e}")
+
         # session:end is emitted by session.cleanup() (the canonical kernel path).
         # Do NOT emit it here — that would duplicate the event.
         await initialized.cleanup()
@@ -4115,6 +4170,14 @@ async def execute_single(
         prepared_bundle: PreparedBundle for bundle mode
         initial_transcript: If provided, restore this transcript (resume mode)
     """
+    from amplifier_core import ModuleValidationError  # pyright: ignore[reportAttributeAccessIssue]
+    from amplifier_core.llm_errors import LLMError
+
+    from .console import Markdown
+    from .session_runner import SessionConfig, create_initialized_session
+    from .session_store import SessionStore
+    from .ui.error_display import display_llm_error, display_validation_error
+
     # === OUTPUT REDIRECTION (must happen before any console output) ===
     # In JSON mode, redirect all output to stderr so only JSON goes to stdout
     if output_format in ["json", "json-trace"]:
@@ -4149,7 +4212,8 @@ async def execute_single(
     )
 
     # Create fully initialized session (handles all setup including resume)
-    initialized = await create_initialized_session(session_config, console)
+    with startup_profiler.phase("session creation"):
+        initialized = await create_initialized_session(session_config, console)
     session = initialized.session
     actual_session_id = initialized.session_id
 
@@ -4181,6 +4245,8 @@ async def execute_single(
 
         register_goal_progress_hook(session)
 
+        startup_profiler.finish("execution setup")
+
         # === /goal support in headless mode (see docs/GOAL_COMMAND.md) ===
         # The auto-continue loop itself now lives in the orchestrator (see
         # loop-streaming's execute()), so headless mode only needs to set
@@ -4488,42 +4554,63 @@ async def execute_single(
             console.file = original_console_file
 
 
-# Register standalone commands
-cli.add_command(agents_group)
-cli.add_command(allowed_dirs_group)
-cli.add_command(denied_dirs_group)
-cli.add_command(bundle_group)
-cli.add_command(init_cmd)
-cli.add_command(module_group)
-cli.add_command(notify_group)
-cli.add_command(provider_group)
-cli.add_command(routing_group)
-cli.add_command(source_group)
-cli.add_command(tool_group)
-cli.add_command(update_cmd)
-cli.add_command(version_cmd)
-cli.add_command(reset_cmd)
-
-
-# Note: The *_with_session variants were removed in favor of unified functions
-# that accept optional initial_transcript parameter for resume functionality.
-# See execute_single() and interactive_chat() above.
-
-_run_command = register_run_command(
-    cli,
-    interactive_chat=interactive_chat,
-    execute_single=execute_single,
-    get_module_search_paths=get_module_search_paths,
-    check_first_run=check_first_run,
-    prompt_first_run_init=prompt_first_run_init,
-)
-
-register_session_commands(
-    cli,
-    interactive_chat=interactive_chat,
-    execute_single=execute_single,
-    get_module_search_paths=get_module_search_paths,
-)
+# Register subcommands. They are imported on dispatch; the short help here
+# drives `amplifier --help` so listing commands imports none of them. Keep it
+# in sync with each command's docstring (tests/test_lazy_commands.py).
+# run/continue/resume/session live in commands/entry.py, which binds them to
+# interactive_chat and execute_single above.
+_LAZY_COMMANDS = {
+    "agents": ("agents:agents", "Manage Amplifier agents."),
+    "allowed-dirs": (
+        "allowed_dirs:allowed_dirs",
+        "Manage directories the AI can write to.",
+    ),
+    "bundle": ("bundle:bundle", "Manage Amplifier bundles (configuration format)."),
+    "continue": (
+        "entry:continue_command",
+        "Resume the most recent session.",
+    ),
+    "denied-dirs": (
+        "denied_dirs:denied_dirs",
+        "Manage directories the AI is blocked from writing to.",
+    ),
+    "init": ("init:init_cmd", "Interactive setup — manage providers and routing."),
+    "module": ("module:module", "Manage Amplifier modules."),
+    "notify": ("notify:notify", "Configure notification settings."),
+    "provider": ("provider:provider", "Manage AI providers."),
+    "reset": ("reset:reset", "Reinstall Amplifier while preserving your data."),
+    "resume": ("entry:resume_command", "Interactively select and resume a session."),
+    "routing": ("routing:routing_group", "Manage model routing matrices."),
+    "run": ("entry:run_command", "Execute a prompt or start an interactive session."),
+    "serve": (
+        "serve:serve",
+        "Serve `amplifier run` from a warm background process.",
+    ),
+    "session": ("entry:session_group", "Manage Amplifier sessions."),
+    "source": ("source:source", "Manage source overrides for modules."),
+    "tool": ("tool:tool", "Invoke tools from a bundle."),
+    "update": ("update:update", "Update Amplifier to latest version."),
+    "version": ("version:version", "Show Amplifier version information."),
+}
+for _name, (_target, _short_help) in _LAZY_COMMANDS.items():
+    cli.add_lazy_command(_name, f"amplifier_app_cli.commands.{_target}", _short_help)
+
+
+def check_first_run() -> bool:
+    """Deferred import of commands.init.check_first_run (used by `run`)."""
+    from .commands.init import check_first_run as _check_first_run
+
+    return _check_first_run()
+
+
+def prompt_first_run_init(console_arg: Any) -> bool:
+    """Deferred import of commands.init.prompt_first_run_init (used by `run`)."""
+    from .commands.init import prompt_first_run_init as _prompt_first_run_init
+
+    return _prompt_first_run_init(console_arg)
+
+
+startup_profiler.imports_done()
 
 
 def main():
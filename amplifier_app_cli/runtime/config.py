@@ -6,6 +6,7 @@ import asyncio
 import logging
 import os
 import re
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
@@ -31,6 +32,8 @@ async def resolve_bundle_config(
     *,
     session_id: str | None = None,
     project_slug: str | None = None,
+    use_plan_cache: bool = True,
+    snapshot: Path | None = None,
 ) -> tuple[dict[str, Any], PreparedBundle]:
     """Resolve configuration from bundle using foundation's prepare workflow.
 
@@ -46,6 +49,10 @@ async def resolve_bundle_config(
         console: Optional console for status messages.
         session_id: Optional session ID to include session-scoped tool overrides.
         project_slug: Optional project slug (required if session_id provided).
+        use_plan_cache: Reuse a cached PreparedBundle when none of its inputs
+            changed (see runtime/plan_cache.py). False forces preparation.
+        snapshot: Boot from a frozen snapshot (see runtime/snapshot.py)
+            instead of discovering and preparing the bundle.
 
     Returns:
         Tuple of (mount_plan_config, PreparedBundle).
@@ -55,122 +62,22 @@ async def resolve_bundle_config(
     Raises:
         FileNotFoundError: If bundle not found.
         RuntimeError: If preparation fails.
+        SnapshotError: If the snapshot cannot be used.
     """
-    from ..lib.bundle_loader import AppBundleDiscovery
-    from ..lib.bundle_loader.prepare import load_and_prepare_bundle
-    from ..paths import get_bundle_search_paths
-
-    discovery = AppBundleDiscovery(search_paths=get_bundle_search_paths())
-
-    # Set up progress spinner for bundle preparation
-    status = None
-    if console:
-        status = console.status(
-            f"[dim]Preparing bundle '{bundle_name}'...[/dim]",
-            spinner="dots",
-        )
-        status.start()
-
-    def _on_progress(action: str, detail: str) -> None:
-        if status:
-            label = _format_progress(action, detail)
-            status.update(f"[dim]Preparing '{bundle_name}': {label}[/dim]")
-
-    try:
-        # Build behavior URIs from app-level settings
-        # These are app-level policies: compose behavior bundles before prepare()
-        # so modules get properly downloaded and installed via normal bundle machinery
-        compose_behaviors: list[str] = []
-
-        # Modes system (runtime behavior overlays like /mode plan, /mode review)
-        # Always available - users choose to use /mode commands or not
-        compose_behaviors.extend(_build_modes_behaviors())
-
-        # CLI self-expertise (app-cli:cli-expert + a thin awareness pointer).
-        # Always composed: every session should be able to answer "how does
-        # this CLI work?" by delegating rather than guessing. Sourced from the
-        # installed package on disk, never a git URI, so the expert's docs
-        # always match the running CLI version.
-        compose_behaviors.extend(_build_app_cli_behaviors())
-
-        # Skills system (tool-skills module + curated Microsoft skills
-        # collection + visibility config + context instructions). Always
-        # composed, regardless of base bundle, so a tool-skills entry always
-        # exists for _ensure_default_skills_dirs() to append the CLI's own
-        # packaged skills dir onto.
-        compose_behaviors.extend(_build_skills_behaviors())
-
-        # Wayfinder (in-session guidance channel). Always composed so every
-        # user gets the public wayfinder channel by default -- not just those
-        # who add an internal app bundle (e.g. made-support) that also brings
-        # it. Only the PUBLIC behavior is composed here; internal content packs
-        # ride separately via made-support's own hooks-wayfinder content_sources
-        # config, which layers on AFTER this (app bundles compose last), so no
-        # internal content leaks into the public default.
-        compose_behaviors.extend(_build_wayfinder_behaviors())
-
-        # Notification behaviors (desktop and push notifications). The flags
-        # object is the single source of truth for "is this enabled?" — the
-        # hook-override emitter in AppSettings.get_notification_hook_overrides()
-        # reads the same flags so the two paths cannot disagree.
-        compose_behaviors.extend(
-            _build_notification_behaviors(app_settings.get_notification_flags())
-        )
+    from ..startup_profile import startup_profiler
 
-        # Add app bundles (user-configured bundles that are always composed)
-        # App bundles are explicit user configuration, composed AFTER notification behaviors
-        app_bundles = app_settings.get_app_bundles()
-        if app_bundles:
-            compose_behaviors = compose_behaviors + app_bundles
+    if snapshot is not None:
+        from .snapshot import load_snapshot
 
-        # Get source overrides from unified settings
-        # This enables settings.yaml overrides to take effect at prepare time
-        source_overrides = app_settings.get_source_overrides()
-
-        # Get module sources from 'amplifier source add' (sources.modules in settings.yaml)
-        module_sources = app_settings.get_module_sources()
-
-        # CRITICAL: Also extract provider sources from config.providers[]
-        # Providers are configured via 'amplifier provider use' and stored in config.providers,
-        # not in overrides section. Bundle.prepare() needs these sources to download provider modules.
-        provider_overrides = app_settings.get_provider_overrides()
-        provider_sources = {
-            provider["module"]: provider["source"]
-            for provider in provider_overrides
-            if isinstance(provider, dict)
-            and "module" in provider
-            and "source" in provider
-        }
-
-        # Merge all source overrides with proper precedence:
-        # sources.modules (general) < overrides.<id>.source (specific) < config.providers[].source (most specific)
-        combined_sources = {**module_sources, **source_overrides, **provider_sources}
-
-        # Get bundle source overrides from settings (sources.bundles in settings.yaml)
-        bundle_sources = app_settings.get_bundle_sources()
-
-        # Load and prepare bundle (downloads modules from git sources)
-        # If compose_behaviors is provided, those behaviors are composed onto the bundle
-        # BEFORE prepare() runs, so their modules get installed correctly
-        # If combined_sources is provided, module sources are resolved before download
-        prepared = await load_and_prepare_bundle(
-            bundle_name,
-            discovery,
-            compose_behaviors=compose_behaviors if compose_behaviors else None,
-            source_overrides=combined_sources if combined_sources else None,
-            bundle_source_overrides=bundle_sources if bundle_sources else None,
-            progress_callback=_on_progress if status else None,
+        with startup_profiler.phase("snapshot load"):
+            _info, prepared = load_snapshot(snapshot)
+    else:
+        prepared = await prepare_bundle(
+            bundle_name, app_settings, console, use_plan_cache=use_plan_cache
         )
 
-        # Load full agent metadata from .md files (for descriptions)
-        # Foundation handles this via load_agent_metadata() after source_base_paths is populated
-        prepared.bundle.load_agent_metadata()
-
-        # Get the mount plan from the prepared bundle (now includes agent descriptions)
-        bundle_config = prepared.mount_plan
-    finally:
-        if status:
-            status.stop()
+    # Get the mount plan from the prepared bundle (includes agent descriptions)
+    bundle_config = prepared.mount_plan
 
     # ── General config overrides ──────────────────────────────────────────
     # The overrides.<id>.config section in settings.yaml provides a single
@@ -345,6 +252,197 @@ async def resolve_bundle_config(
     return bundle_config, prepared
 
 
+async def prepare_bundle(
+    bundle_name: str,
+    app_settings: AppSettings,
+    console: Console | None = None,
+    *,
+    use_plan_cache: bool = True,
+) -> PreparedBundle:
+    """Load, compose and prepare a bundle, before any settings overrides.
+
+    Composes the app-level behaviors, downloads and activates modules and
+    loads agent metadata, or reuses a cached result (runtime/plan_cache.py).
+    The result holds no secrets: resolve_bundle_config() applies settings
+    overrides and environment expansion afterwards.
+
+    Args:
+        bundle_name: Bundle to load (e.g., "foundation").
+        app_settings: App settings (behaviors and source overrides).
+        console: Optional console for the progress spinner.
+        use_plan_cache: Reuse a cached PreparedBundle when none of its inputs
+            changed. False forces preparation.
+
+    Raises:
+        FileNotFoundError: If bundle not found.
+        RuntimeError: If preparation fails.
+    """
+    from ..lib.bundle_loader import AppBundleDiscovery
+    from ..lib.bundle_loader.prepare import load_and_prepare_bundle
+    from ..lib.bundle_loader.prepare import resolve_bundle_uri
+    from ..paths import get_bundle_search_paths
+    from ..startup_profile import startup_profiler
+    from .plan_cache import load_prepared
+    from .plan_cache import plan_fingerprint
+    from .plan_cache import store_prepared
+
+    with startup_profiler.phase("bundle discovery"):
+        discovery = AppBundleDiscovery(search_paths=get_bundle_search_paths())
+
+    # Set up progress spinner for bundle preparation
+    status = None
+    if console:
+        status = console.status(
+            f"[dim]Preparing bundle '{bundle_name}'...[/dim]",
+            spinner="dots",
+        )
+        status.start()
+
+    def _on_progress(action: str, detail: str) -> None:
+        startup_profiler.progress(action, detail)
+        if status:
+            label = _format_progress(action, detail)
+            status.update(f"[dim]Preparing '{bundle_name}': {label}[/dim]")
+
+    try:
+        # Build behavior URIs from app-level settings
+        # These are app-level policies: compose behavior bundles before prepare()
+        # so modules get properly downloaded and installed via normal bundle machinery
+        compose_behaviors: list[str] = []
+
+        # Modes system (runtime behavior overlays like /mode plan, /mode review)
+        # Always available - users choose to use /mode commands or not
+        compose_behaviors.extend(_build_modes_behaviors())
+
+        # CLI self-expertise (app-cli:cli-expert + a thin awareness pointer).
+        # Always composed: every session should be able to answer "how does
+        # this CLI work?" by delegating rather than guessing. Sourced from the
+        # installed package on disk, never a git URI, so the expert's docs
+        # always match the running CLI version.
+        compose_behaviors.extend(_build_app_cli_behaviors())
+
+        # Skills system (tool-skills module + curated Microsoft skills
+        # collection + visibility config + context instructions). Always
+        # composed, regardless of base bundle, so a tool-skills entry always
+        # exists for _ensure_default_skills_dirs() to append the CLI's own
+        # packaged skills dir onto.
+        compose_behaviors.extend(_build_skills_behaviors())
+
+        # Wayfinder (in-session guidance channel). Always composed so every
+        # user gets the public wayfinder channel by default -- not just those
+        # who add an internal app bundle (e.g. made-support) that also brings
+        # it. Only the PUBLIC behavior is composed here; internal content packs
+        # ride separately via made-support's own hooks-wayfinder content_sources
+        # config, which layers on AFTER this (app bundles compose last), so no
+        # internal content leaks into the public default.
+        compose_behaviors.extend(_build_wayfinder_behaviors())
+
+        # Notification behaviors (desktop and push notifications). The flags
+        # object is the single source of truth for "is this enabled?" — the
+        # hook-override emitter in AppSettings.get_notification_hook_overrides()
+        # reads the same flags so the two paths cannot disagree.
+        compose_behaviors.extend(
+            _build_notification_behaviors(app_settings.get_notification_flags())
+        )
+
+        # Add app bundles (user-configured bundles that are always composed)
+        # App bundles are explicit user configuration, composed AFTER notification behaviors
+        app_bundles = app_settings.get_app_bundles()
+        if app_bundles:
+            compose_behaviors = compose_behaviors + app_bundles
+
+        # Get source overrides from unified settings
+        # This enables settings.yaml overrides to take effect at prepare time
+        source_overrides = app_settings.get_source_overrides()
+
+        # Get module sources from 'amplifier source add' (sources.modules in settings.yaml)
+        module_sources = app_settings.get_module_sources()
+
+        # CRITICAL: Also extract provider sources from config.providers[]
+        # Providers are configured via 'amplifier provider use' and stored in config.providers,
+        # not in overrides section. Bundle.prepare() needs these sources to download provider modules.
+        provider_overrides = app_settings.get_provider_overrides()
+        provider_sources = {
+            provider["module"]: provider["source"]
+            for provider in provider_overrides
+            if isinstance(provider, dict)
+            and "module" in provider
+            and "source" in provider
+        }
+
+        # Merge all source overrides with proper precedence:
+        # sources.modules (general) < overrides.<id>.source (specific) < config.providers[].source (most specific)
+        combined_sources = {**module_sources, **source_overrides, **provider_sources}
+
+        # Get bundle source overrides from settings (sources.bundles in settings.yaml)
+        bundle_sources = app_settings.get_bundle_sources()
+
+        # Warm start: reuse the prepared bundle from a previous run when none
+        # of its inputs changed. Cached BEFORE resolve_bundle_config() applies
+        # overrides (those depend on settings and expand secrets from the
+        # environment).
+        fingerprint = None
+        prepared = None
+        if use_plan_cache:
+            try:
+                # Keyed by what the name resolves to; unknown names skip the
+                # cache and fail in preparation as usual
+                bundle_uri = resolve_bundle_uri(bundle_name, discovery)
+                if bundle_uri is None:
+                    raise LookupError(f"bundle '{bundle_name}' not found")
+                fingerprint = plan_fingerprint(
+                    bundle_name,
+                    app_settings,
+                    bundle_uri=bundle_uri,
+                    compose_behaviors=compose_behaviors,
+                    source_overrides=combined_sources,
+                    bundle_sources=bundle_sources,
+                )
+                with startup_profiler.phase("mount plan cache lookup"):
+                    prepared = load_prepared(fingerprint)
+            except Exception as e:
+                logger.debug(f"Mount plan cache unavailable: {e}")
+            if prepared is not None:
+                logger.debug(f"Using cached mount plan for bundle '{bundle_name}'")
+
+        if prepared is None:
+            sys_path_before = set(sys.path)
+
+            # Load and prepare bundle (downloads modules from git sources)
+            # If compose_behaviors is provided, those behaviors are composed onto the bundle
+            # BEFORE prepare() runs, so their modules get installed correctly
+            # If combined_sources is provided, module sources are resolved before download
+            with startup_profiler.phase("load and prepare"):
+                prepared = await load_and_prepare_bundle(
+                    bundle_name,
+                    discovery,
+                    compose_behaviors=compose_behaviors if compose_behaviors else None,
+                    source_overrides=combined_sources if combined_sources else None,
+                    bundle_source_overrides=bundle_sources if bundle_sources else None,
+                    progress_callback=(
+                        _on_progress if status or startup_profiler.enabled else None
+                    ),
+                )
+
+            # Load full agent metadata from .md files (for descriptions)
+            # Foundation handles this via load_agent_metadata() after source_base_paths is populated
+            with startup_profiler.phase("agent metadata"):
+                prepared.bundle.load_agent_metadata()
+
+            if fingerprint is not None:
+                store_prepared(
+                    fingerprint,
+                    prepared,
+                    sys_path_added=[p for p in sys.path if p not in sys_path_before],
+                )
+
+    finally:
+        if status:
+            status.stop()
+
+    return prepared
+
+
 def _sync_overrides_to_bundle(
     prepared: "PreparedBundle",
     bundle_config: dict[str, Any],
@@ -1117,6 +1215,8 @@ async def resolve_config_async(
     console: Console | None = None,
     session_id: str | None = None,
     project_slug: str | None = None,
+    use_plan_cache: bool = True,
+    snapshot: Path | None = None,
 ) -> tuple[dict[str, Any], "PreparedBundle | None"]:
     """Unified config resolution (async) - THE golden path for all config loading.
 
@@ -1132,6 +1232,8 @@ async def resolve_config_async(
         console: Optional console for output
         session_id: Optional session ID for session-scoped tool overrides
         project_slug: Optional project slug (required if session_id provided)
+        use_plan_cache: Allow reusing a cached prepared bundle (warm start)
+        snapshot: Boot from a frozen bundle snapshot instead of preparing
 
     Returns:
         Tuple of (config_data dict, PreparedBundle)
@@ -1147,6 +1249,8 @@ async def resolve_config_async(
             console=console,
             session_id=session_id,
             project_slug=project_slug,
+            use_plan_cache=use_plan_cache,
+            snapshot=snapshot,
         )
         return config_data, prepared_bundle
     else:
@@ -1161,6 +1265,8 @@ async def resolve_config_async(
             console=console,
             session_id=session_id,
             project_slug=project_slug,
+            use_plan_cache=use_plan_cache,
+            snapshot=snapshot,
         )
         return config_data, prepared_bundle
 
@@ -1172,6 +1278,8 @@ def resolve_config(
     console: Console | None = None,
     session_id: str | None = None,
     project_slug: str | None = None,
+    use_plan_cache: bool = True,
+    snapshot: Path | None = None,
 ) -> tuple[dict[str, Any], "PreparedBundle | None"]:
     """Unified config resolution (sync wrapper) - THE golden path for all config loading.
 
@@ -1184,6 +1292,8 @@ def resolve_config(
         console: Optional console for output
         session_id: Optional session ID for session-scoped tool overrides
         project_slug: Optional project slug (required if session_id provided)
+        use_plan_cache: Allow reusing a cached prepared bundle (warm start)
+        snapshot: Boot from a frozen bundle snapshot instead of preparing
 
     Returns:
         Tuple of (config_data dict, PreparedBundle)
@@ -1206,6 +1316,8 @@ def resolve_config(
                 console=console,
                 session_id=session_id,
                 project_slug=project_slug,
+                use_plan_cache=use_plan_cache,
+                snapshot=snapshot,
             )
         )
         # Force GC while logger is suppressed to clean up orphaned httpx clients
@@ -1219,6 +1331,7 @@ __all__ = [
     "resolve_config",
     "resolve_config_async",
     "resolve_bundle_config",
+    "prepare_bundle",
     "deep_merge",
     "expand_env_vars",
     "inject_user_providers",
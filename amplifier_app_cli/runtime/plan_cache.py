@@ -0,0 +1,385 @@
+"""Persistent cache of prepared bundles for warm starts.
+
+``resolve_bundle_config`` spends most of a start in ``load_and_prepare_bundle``
+(load -> compose -> prepare -> activate) and ``load_agent_metadata()``, even
+when nothing changed since the last run. This cache stores the PreparedBundle
+as it stands right after preparation -- before settings overrides and
+environment expansion are applied, so no secrets are written -- under a
+fingerprint of everything preparation depends on:
+
+- the resolved bundle URI, composed behaviors, module and bundle source
+  overrides
+- the parsed settings.yaml files (minus the ``updates`` section, which the
+  update check rewrites) and the bundle registry (mtime + size)
+- the commit SHAs recorded for cached git modules/bundles
+- CLI, foundation, core and Python versions, AMPLIFIER_ALLOW_PARTIAL_BUNDLE
+
+Local (non-cached) bundle directories are checked on every hit against the
+modification times recorded at store time, so editing a local bundle or
+behavior file invalidates the entry. ``amplifier update`` and
+``amplifier source add/remove`` clear the cache explicitly, and
+``amplifier run --no-config-cache`` bypasses it.
+
+    ~/.amplifier/cache/mount-plans/<fingerprint>.pickle
+    ~/.amplifier/cache/mount-plans/<fingerprint>.unpicklable  (marker)
+
+A prepared bundle that cannot be pickled is reported once and marked, so later
+starts with the same inputs neither retry nor warn again.
+
+Long-lived processes (``amplifier serve``) call ``retain_in_memory()`` so hits
+skip the disk read. Entries stay pickled in memory: every hit still returns a
+private copy that the caller may mutate.
+
+Any problem reading, validating or writing an entry falls back to a normal
+preparation; the cache never makes a start fail.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+from ..lib.settings import AppSettings
+from ..lib.settings import settings_file_cache
+from ..utils.cache_management import get_cache_dir
+from ..utils.cache_management import get_registry_path
+
+if TYPE_CHECKING:
+    from amplifier_foundation.bundle import PreparedBundle
+
+logger = logging.getLogger(__name__)
+
+PLAN_CACHE_DIRNAME = "mount-plans"
+
+# Bump when the stored entry layout changes
+_FORMAT_VERSION = 1
+# Entries kept (most recently written); older ones are pruned on store
+_MAX_ENTRIES = 8
+# Local bundle trees larger than this are not watched (and not cached)
+_MAX_WATCHED_FILES = 5000
+_WATCHED_SUFFIXES = (".md", ".yaml", ".yml")
+_CACHE_META_FILENAME = ".amplifier_cache_meta.json"
+_VERSIONED_DISTRIBUTIONS = (
+    "amplifier-app-cli",
+    "amplifier-foundation",
+    "amplifier-core",
+)
+
+# Settings sections that never affect preparation (update-check bookkeeping)
+_IGNORED_SETTINGS_KEYS = ("updates",)
+
+# Pickled entries kept by long-lived processes (see retain_in_memory)
+_memory_entries: dict[str, bytes] = {}
+_retain_in_memory = False
+
+
+def get_plan_cache_dir() -> Path:
+    """Return ~/.amplifier/cache/mount-plans path."""
+    return get_cache_dir() / PLAN_CACHE_DIRNAME
+
+
+def plan_fingerprint(
+    bundle_name: str,
+    app_settings: AppSettings,
+    *,
+    bundle_uri: str,
+    compose_behaviors: list[str],
+    source_overrides: dict[str, str],
+    bundle_sources: dict[str, str],
+) -> str:
+    """Fingerprint the inputs of bundle preparation.
+
+    Only stats and small metadata reads; no bundle loading. ``bundle_uri``
+    is the URI discovery resolved the name to, so re-pointing a name at
+    another source changes the fingerprint.
+    """
+    paths = app_settings.paths
+    settings_files = [
+        paths.global_settings,
+        paths.project_settings,
+        paths.local_settings,
+        paths.session_settings,
+    ]
+    inputs = {
+        "format": _FORMAT_VERSION,
+        "versions": _distribution_versions(),
+        "bundle": bundle_name,
+        "bundle_uri": bundle_uri,
+        "compose_behaviors": compose_behaviors,
+        "source_overrides": sorted(source_overrides.items()),
+        "bundle_sources": sorted(bundle_sources.items()),
+        "allow_partial": os.environ.get("AMPLIFIER_ALLOW_PARTIAL_BUNDLE", ""),
+        "settings": [
+            (str(path), _settings_content(path)) for path in settings_files if path
+        ],
+        "registry": _stat_stamp(get_registry_path()),
+        "cached_modules": _cached_module_shas(),
+        "local_sources": [
+            (source, _stat_stamp(Path(source) / "pyproject.toml"))
+            for source in sorted(set(source_overrides.values()))
+            if _is_local_path(source)
+        ],
+    }
+    encoded = json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def load_prepared(fingerprint: str) -> PreparedBundle | None:
+    """Return the cached PreparedBundle for a fingerprint, if still valid."""
+    path = get_plan_cache_dir() / f"{fingerprint}.pickle"
+    payload = _memory_entries.pop(fingerprint, None)
+    try:
+        if payload is None:
+            payload = path.read_bytes()
+        entry = pickle.loads(payload)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Discarding unreadable mount plan cache entry {path}: {e}")
+        path.unlink(missing_ok=True)
+        return None
+
+    if not isinstance(entry, dict) or entry.get("format") != _FORMAT_VERSION:
+        return None
+    for directory, stamp in entry.get("watch", {}).items():
+        if _tree_stamp(Path(directory)) != stamp:
+            logger.debug(f"Mount plan cache stale: {directory} changed")
+            return None
+    _remember(fingerprint, payload)
+
+    # Re-apply import paths that activation added in the original run
+    for entry_path in entry.get("sys_path", []):
+        if entry_path not in sys.path and Path(entry_path).exists():
+            sys.path.append(entry_path)
+
+    return entry["prepared"]
+
+
+def store_prepared(
+    fingerprint: str, prepared: PreparedBundle, *, sys_path_added: list[str]
+) -> None:
+    """Cache a freshly prepared bundle (before overrides are applied to it).
+
+    Args:
+        fingerprint: Output of plan_fingerprint() for this preparation
+        prepared: PreparedBundle returned by load_and_prepare_bundle
+        sys_path_added: sys.path entries added while preparing
+    """
+    cache_dir = get_plan_cache_dir()
+    marker = cache_dir / f"{fingerprint}.unpicklable"
+    if marker.exists():
+        logger.debug("Mount plan is not cacheable (already reported)")
+        return
+
+    watch = {}
+    for directory in _local_bundle_dirs(prepared):
+        stamp = _tree_stamp(directory)
+        if stamp is None:
+            logger.debug(f"Not caching mount plan: {directory} too large to watch")
+            return
+        watch[str(directory)] = stamp
+
+    entry: dict[str, Any] = {
+        "format": _FORMAT_VERSION,
+        "watch": watch,
+        "sys_path": sys_path_added,
+        "prepared": prepared,
+    }
+    try:
+        payload = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        # Every later start with these inputs misses too: say so once, and
+        # remember it across processes so starts stay quiet until they change
+        logger.warning(
+            f"Mount plan cache disabled: prepared bundle is not picklable: {e}"
+        )
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+            _prune(cache_dir)
+        except OSError as write_error:
+            logger.debug(f"Failed to record unpicklable mount plan: {write_error}")
+        return
+    _remember(fingerprint, payload)
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, cache_dir / f"{fingerprint}.pickle")
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        _prune(cache_dir)
+    except OSError as e:
+        logger.debug(f"Failed to write mount plan cache: {e}")
+
+
+def retain_in_memory(enabled: bool = True) -> None:
+    """Also keep cache entries in process memory (for long-lived processes)."""
+    global _retain_in_memory
+    _retain_in_memory = enabled
+    if not enabled:
+        _memory_entries.clear()
+
+
+def clear_plan_cache() -> int:
+    """Remove all cached mount plans. Returns the number of entries removed."""
+    _memory_entries.clear()
+    cache_dir = get_plan_cache_dir()
+    if not cache_dir.exists():
+        return 0
+    removed = 0
+    for path in cache_dir.glob("*.pickle"):
+        try:
+            path.unlink()
+            removed += 1
+        except OSError as e:
+            logger.debug(f"Failed to remove mount plan cache entry {path}: {e}")
+    # Markers are not entries; an update may have made the bundle picklable
+    for path in cache_dir.glob("*.unpicklable"):
+        try:
+            path.unlink()
+        except OSError as e:
+            logger.debug(f"Failed to remove mount plan cache marker {path}: {e}")
+    return removed
+
+
+def _remember(fingerprint: str, payload: bytes) -> None:
+    if not _retain_in_memory:
+        return
+    # Most recently used last; the oldest entries are dropped first
+    _memory_entries.pop(fingerprint, None)
+    _memory_entries[fingerprint] = payload
+    for stale in list(_memory_entries)[:-_MAX_ENTRIES]:
+        del _memory_entries[stale]
+
+
+def _prune(cache_dir: Path) -> None:
+    for pattern in ("*.pickle", "*.unpicklable"):
+        entries = sorted(
+            cache_dir.glob(pattern), key=lambda p: p.stat().st_mtime, reverse=True
+        )
+        for path in entries[_MAX_ENTRIES:]:
+            path.unlink(missing_ok=True)
+
+
+def _distribution_versions() -> dict[str, str | None]:
+    import importlib.metadata
+
+    versions: dict[str, str | None] = {"python": sys.version}
+    for name in _VERSIONED_DISTRIBUTIONS:
+        try:
+            versions[name] = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            versions[name] = None
+    return versions
+
+
+def _settings_content(path: Path) -> Any:
+    """Parsed settings file without the sections preparation ignores."""
+    content = settings_file_cache.load(path)
+    if isinstance(content, dict):
+        for key in _IGNORED_SETTINGS_KEYS:
+            content.pop(key, None)
+    return content
+
+
+def _stat_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _cached_module_shas() -> list[tuple[str, str]]:
+    """Commit SHA of each cached git module/bundle (two directory levels)."""
+    cache_dir = get_cache_dir()
+    shas = []
+    try:
+        entries = [p for p in cache_dir.iterdir() if p.is_dir()]
+    except OSError:
+        return []
+    for entry in entries:
+        if entry.name == PLAN_CACHE_DIRNAME:
+            continue
+        candidates = [entry / _CACHE_META_FILENAME]
+        if not candidates[0].exists():
+            try:
+                candidates = [
+                    child / _CACHE_META_FILENAME
+                    for child in entry.iterdir()
+                    if child.is_dir()
+                ]
+            except OSError:
+                continue
+        for meta_file in candidates:
+            try:
+                meta = json.loads(meta_file.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                continue
+            if isinstance(meta, dict):
+                relative = str(meta_file.parent.relative_to(cache_dir))
+                shas.append((relative, str(meta.get("commit", ""))))
+    return sorted(shas)
+
+
+def _is_local_path(source: str) -> bool:
+    if source.startswith("file://"):
+        return True
+    return "://" not in source and not source.startswith(("git+", "zip+"))
+
+
+def _local_bundle_dirs(prepared: PreparedBundle) -> list[Path]:
+    """Bundle source directories that live outside the download cache."""
+    bundle = getattr(prepared, "bundle", None)
+    paths = dict(getattr(bundle, "source_base_paths", None) or {})
+    base_path = getattr(bundle, "base_path", None)
+    if base_path:
+        paths["__base__"] = base_path
+
+    cache_dir = get_cache_dir().resolve()
+    local = set()
+    for value in paths.values():
+        try:
+            directory = Path(value).resolve()
+        except (OSError, TypeError):
+            continue
+        if directory.is_file():
+            directory = directory.parent
+        if directory.is_dir() and not directory.is_relative_to(cache_dir):
+            local.add(directory)
+    return sorted(local)
+
+
+def _tree_stamp(directory: Path) -> tuple[int, int] | None:
+    """(newest mtime_ns, file count) of bundle definition files in a tree.
+
+    Returns None for trees with too many files to watch cheaply.
+    """
+    newest = 0
+    count = 0
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if not d.startswith(".") and d != "__pycache__"]
+        for name in files:
+            if not name.endswith(_WATCHED_SUFFIXES):
+                continue
+            count += 1
+            if count > _MAX_WATCHED_FILES:
+                return None
+            try:
+                newest = max(newest, os.stat(os.path.join(root, name)).st_mtime_ns)
+            except OSError:
+                continue
+    return (newest, count)
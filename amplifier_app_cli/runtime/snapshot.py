@@ -0,0 +1,208 @@
+"""Frozen bundle snapshots for offline, reproducible starts.
+
+``amplifier bundle freeze`` captures a fully prepared bundle -- the resolved
+mount plan with composed behaviors and agent metadata, the module import
+paths activation added, and the commits of the cached modules it uses -- in
+one file. ``amplifier run --snapshot FILE`` boots from that file without
+registry lookups, git resolution or dependency installs.
+
+Layout: one JSON header line (readable without unpickling), then the pickled
+PreparedBundle as it stands right after preparation, the same as the
+mount-plan cache stores it (runtime/plan_cache.py). Settings overrides and
+environment expansion are applied at run time, so no secrets are written.
+
+Module code is not copied: the snapshot expects the module cache
+(~/.amplifier/cache) it was frozen against at the same location. Snapshots
+are pickles -- only run ones you created.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import sys
+import tempfile
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ..utils.cache_management import get_cache_dir
+from .plan_cache import _cached_module_shas
+from .plan_cache import _distribution_versions
+
+if TYPE_CHECKING:
+    from amplifier_foundation.bundle import PreparedBundle
+
+SNAPSHOT_KIND = "amplifier-bundle-snapshot"
+
+# Bump when the header or payload layout changes
+_FORMAT_VERSION = 1
+
+
+class SnapshotError(Exception):
+    """A snapshot is unreadable or does not match this installation."""
+
+
+@dataclass
+class SnapshotInfo:
+    """Snapshot header: what was frozen, and against which installation."""
+
+    bundle: str
+    created: str
+    versions: dict[str, str | None]
+    sys_path: list[str] = field(default_factory=list)
+    # (cache directory relative to ~/.amplifier/cache, commit) per module used
+    pinned: list[tuple[str, str]] = field(default_factory=list)
+
+
+def write_snapshot(
+    path: Path,
+    bundle_name: str,
+    prepared: PreparedBundle,
+    *,
+    sys_path_added: list[str],
+) -> SnapshotInfo:
+    """Freeze a prepared bundle (before settings overrides) into ``path``.
+
+    Args:
+        path: Snapshot file to write (replaced atomically)
+        bundle_name: Name the bundle was prepared under
+        prepared: PreparedBundle from prepare_bundle()
+        sys_path_added: sys.path entries added while preparing
+
+    Raises:
+        SnapshotError: If the prepared bundle cannot be serialized
+    """
+    info = SnapshotInfo(
+        bundle=bundle_name,
+        created=datetime.now().isoformat(timespec="seconds"),
+        versions=_distribution_versions(),
+        sys_path=sys_path_added,
+        pinned=_pinned_modules(prepared, sys_path_added),
+    )
+    try:
+        payload = pickle.dumps(prepared, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        raise SnapshotError(f"Bundle '{bundle_name}' cannot be frozen: {e}") from e
+    header = {"kind": SNAPSHOT_KIND, "format": _FORMAT_VERSION, **asdict(info)}
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            f.write(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return info
+
+
+def read_snapshot_info(path: Path) -> SnapshotInfo:
+    """Read and check a snapshot's header without loading the bundle.
+
+    Raises:
+        SnapshotError: If the file is not a usable snapshot for this install
+    """
+    try:
+        with open(path, "rb") as f:
+            header_line = f.readline()
+    except OSError as e:
+        raise SnapshotError(f"Cannot read snapshot {path}: {e}") from e
+    return _parse_header(path, header_line)
+
+
+def load_snapshot(path: Path) -> tuple[SnapshotInfo, PreparedBundle]:
+    """Load a frozen PreparedBundle and re-apply its module import paths.
+
+    Raises:
+        SnapshotError: If the file is not a usable snapshot for this install
+            or the modules it was frozen with are missing or at other commits
+    """
+    try:
+        with open(path, "rb") as f:
+            info = _parse_header(path, f.readline())
+            missing = [p for p in info.sys_path if not Path(p).exists()]
+            if missing:
+                raise SnapshotError(
+                    f"Snapshot {path} needs module paths that are missing: "
+                    f"{', '.join(missing)}"
+                )
+            current = dict(_cached_module_shas())
+            changed = [
+                relative
+                for relative, commit in info.pinned
+                if current.get(relative) != commit
+            ]
+            if changed:
+                raise SnapshotError(
+                    f"Snapshot {path} was frozen with other commits of "
+                    f"{', '.join(changed)}; re-create it with 'amplifier bundle freeze'"
+                )
+            prepared = pickle.load(f)
+    except SnapshotError:
+        raise
+    except Exception as e:
+        raise SnapshotError(f"Cannot load snapshot {path}: {e}") from e
+
+    for entry_path in info.sys_path:
+        if entry_path not in sys.path:
+            sys.path.append(entry_path)
+    return info, prepared
+
+
+def _parse_header(path: Path, header_line: bytes) -> SnapshotInfo:
+    try:
+        header = json.loads(header_line)
+    except ValueError:
+        header = None
+    if not isinstance(header, dict) or header.get("kind") != SNAPSHOT_KIND:
+        raise SnapshotError(f"{path} is not an amplifier bundle snapshot")
+    if header.get("format") != _FORMAT_VERSION:
+        raise SnapshotError(
+            f"Snapshot {path} uses format {header.get('format')}; "
+            "re-create it with 'amplifier bundle freeze'"
+        )
+
+    info = SnapshotInfo(
+        bundle=header["bundle"],
+        created=header.get("created", ""),
+        versions=header.get("versions", {}),
+        sys_path=list(header.get("sys_path", [])),
+        pinned=[tuple(entry) for entry in header.get("pinned", [])],
+    )
+    current = _distribution_versions()
+    changed = sorted(
+        name for name, version in info.versions.items() if current.get(name) != version
+    )
+    if changed:
+        raise SnapshotError(
+            f"Snapshot {path} was frozen with different {', '.join(changed)}; "
+            "re-create it with 'amplifier bundle freeze'"
+        )
+    return info
+
+
+def _pinned_modules(
+    prepared: PreparedBundle, sys_path_added: list[str]
+) -> list[tuple[str, str]]:
+    """Commits of the cached module/bundle checkouts the prepared bundle uses."""
+    bundle = getattr(prepared, "bundle", None)
+    used = [Path(p) for p in sys_path_added]
+    used += [
+        Path(p) for p in (getattr(bundle, "source_base_paths", None) or {}).values()
+    ]
+    if getattr(bundle, "base_path", None):
+        used.append(Path(bundle.base_path))
+
+    cache_dir = get_cache_dir()
+    return [
+        (relative, commit)
+        for relative, commit in _cached_module_shas()
+        if any(path.is_relative_to(cache_dir / relative) for path in used)
+    ]
@@ -0,0 +1,237 @@
+"""Compressed cold-storage tier for old sessions.
+
+Old sessions are dominated by events.jsonl and are rarely reopened. Archiving
+packs a session directory into a gzip-compressed tarball and removes the
+directory:
+
+    <sessions_dir>/.archive/<session_id>.tar.gz
+    <sessions_dir>/.archive/manifest.json
+
+The manifest keeps each archived session's index summary (name, bundle,
+message count, ...) so archived sessions still appear in ``session list`` and
+resolve in ``find_session``. SessionStore restores an archive transparently
+the first time a session is loaded (resume, show, fork).
+
+A size quota evicts archives least-recently-used first, where "used" is the
+session's last activity before it was archived (restoring a session removes
+its archive, so archives are never accessed in place).
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from filelock import FileLock
+
+from amplifier_app_cli.session_blobs import iter_blob_refs
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIRNAME = ".archive"
+MANIFEST_FILENAME = "manifest.json"
+
+
+class SessionArchive:
+    """Archive store for the sessions under one sessions directory.
+
+    Contract:
+    - Inputs: session_id of a session directory under base_dir
+    - Outputs: manifest entries (summary, sizes, timestamps) per archive
+    - Side Effects: Creates/removes <base_dir>/.archive/*.tar.gz and the
+      session directories they replace
+    - Errors: OSError/tarfile.TarError from archive I/O propagate to callers
+    """
+
+    def __init__(self, base_dir: Path):
+        self.base_dir = base_dir
+        self.archive_dir = base_dir / ARCHIVE_DIRNAME
+        self.manifest_path = self.archive_dir / MANIFEST_FILENAME
+        self._lock = FileLock(str(self.manifest_path) + ".lock", timeout=30)
+
+    def archive_path(self, session_id: str) -> Path:
+        return self.archive_dir / f"{session_id}.tar.gz"
+
+    def is_archived(self, session_id: str) -> bool:
+        return self.archive_path(session_id).is_file()
+
+    def entries(self) -> dict[str, dict]:
+        """Manifest entries for archives that exist, keyed by session_id."""
+        if not self.manifest_path.exists():
+            return {}
+        manifest = self._read_manifest()
+        return {
+            session_id: entry
+            for session_id, entry in manifest.items()
+            if self.is_archived(session_id)
+        }
+
+    def archive(self, session_id: str, summary: dict | None = None) -> dict:
+        """Compress a session directory into the archive and remove it.
+
+        Args:
+            session_id: Session to archive
+            summary: Index summary to keep listing the session
+
+        Returns:
+            The manifest entry written
+
+        Raises:
+            FileNotFoundError: If the session directory does not exist
+        """
+        # Imported per call: every SessionStore builds a SessionArchive, and
+        # tarfile (with its compression modules) is only needed here
+        import tarfile
+
+        session_dir = self.base_dir / session_id
+        if not session_dir.is_dir():
+            raise FileNotFoundError(f"Session '{session_id}' not found")
+
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        original_bytes = _dir_size(session_dir)
+        last_used = session_dir.stat().st_mtime
+        target = self.archive_path(session_id)
+
+        # Write to a temp file first so a crash never leaves a partial archive
+        # next to a deleted session
+        fd, tmp = tempfile.mkstemp(dir=self.archive_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            with tarfile.open(tmp, "w:gz", compresslevel=6) as tar:
+                tar.add(session_dir, arcname=session_id)
+            os.replace(tmp, target)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        entry = {
+            "archived_at": time.time(),
+            "last_used": last_used,
+            "original_bytes": original_bytes,
+            "archive_bytes": target.stat().st_size,
+            "summary": {**(summary or {}), "id": session_id},
+        }
+        with self._lock:
+            manifest = self._read_manifest()
+            manifest[session_id] = entry
+            self._write_manifest(manifest)
+
+        shutil.rmtree(session_dir)
+        logger.info(
+            f"Archived session {session_id}: "
+            f"{original_bytes} -> {entry['archive_bytes']} bytes"
+        )
+        return entry
+
+    def restore(self, session_id: str) -> dict | None:
+        """Extract an archived session back into its directory.
+
+        Returns:
+            The index summary recorded at archive time, or None if the
+            session was not archived
+        """
+        import tarfile
+
+        source = self.archive_path(session_id)
+        if not source.is_file():
+            return None
+
+        with self._lock:
+            # Another process may have restored it while we waited
+            if not source.is_file():
+                return None
+            staging = Path(tempfile.mkdtemp(dir=self.archive_dir))
+            try:
+                with tarfile.open(source, "r:gz") as tar:
+                    if hasattr(tarfile, "data_filter"):
+                        tar.extractall(staging, filter="data")
+                    else:  # Python < 3.11.4; archives are our own output
+                        tar.extractall(staging)
+                os.replace(staging / session_id, self.base_dir / session_id)
+            finally:
+                shutil.rmtree(staging, ignore_errors=True)
+
+            manifest = self._read_manifest()
+            entry = manifest.pop(session_id, {})
+            self._write_manifest(manifest)
+            source.unlink()
+
+        logger.info(f"Restored archived session {session_id}")
+        return entry.get("summary")
+
+    def blob_refs(self, session_id: str) -> set[str]:
+        """Tool-result blobs referenced by an archived session's transcript."""
+        import tarfile
+
+        refs: set[str] = set()
+        try:
+            with tarfile.open(self.archive_path(session_id), "r:gz") as tar:
+                for member in tar.getmembers():
+                    if not member.name.endswith(
+                        ("transcript.jsonl", "transcript.jsonl.backup")
+                    ):
+                        continue
+                    f = tar.extractfile(member)
+                    if f is not None:
+                        refs.update(iter_blob_refs(f))
+        except (OSError, tarfile.TarError) as e:
+            logger.warning(f"Failed to read archive of session {session_id}: {e}")
+        return refs
+
+    def evict(self, session_id: str) -> int:
+        """Delete an archive permanently. Returns the bytes freed."""
+        path = self.archive_path(session_id)
+        freed = path.stat().st_size if path.is_file() else 0
+        with self._lock:
+            path.unlink(missing_ok=True)
+            manifest = self._read_manifest()
+            manifest.pop(session_id, None)
+            self._write_manifest(manifest)
+        return freed
+
+    def plan_quota(self, max_bytes: int) -> list[str]:
+        """Archives to evict (least recently used first) to fit ``max_bytes``."""
+        entries = sorted(
+            self.entries().items(), key=lambda item: item[1].get("last_used", 0)
+        )
+        total = sum(entry.get("archive_bytes", 0) for _, entry in entries)
+        evict = []
+        for session_id, entry in entries:
+            if total <= max_bytes:
+                break
+            evict.append(session_id)
+            total -= entry.get("archive_bytes", 0)
+        return evict
+
+    def _read_manifest(self) -> dict:
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            return manifest if isinstance(manifest, dict) else {}
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _write_manifest(self, manifest: dict) -> None:
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.archive_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(tmp, self.manifest_path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+def _dir_size(path: Path) -> int:
+    """Total size in bytes of the files under a directory."""
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
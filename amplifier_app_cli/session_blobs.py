@@ -0,0 +1,155 @@
+"""Content-addressed store for large tool-result payloads.
+
+Tool results (file reads, grep output, bash logs) dominate transcript size.
+SessionStore moves tool-message content above a size threshold into a blob
+shared by all sessions of a project, and keeps only a reference in
+transcript.jsonl:
+
+    <sessions_dir>/.blobs/<sha256[:2]>/<sha256>
+    {"role": "tool", ..., "content_ref": {"sha256": "...", "bytes": 81234}}
+
+A blob holds the JSON encoding of the original ``content`` value, so string
+and block-list contents round-trip exactly. Identical payloads (the same file
+read twice, forked sessions) are stored once. Readers rehydrate references
+transparently; see ``BlobStore.rehydrate``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+BLOBS_DIRNAME = ".blobs"
+CONTENT_REF_KEY = "content_ref"
+
+# Tool results whose encoded content is at least this large are offloaded
+DEFAULT_BLOB_THRESHOLD = 16 * 1024
+
+# Unreferenced blobs touched this recently survive collection: a live session
+# may have just (re)used one and not yet appended the line referencing it
+BLOB_GC_GRACE_SECONDS = 24 * 3600
+
+
+class BlobStore:
+    """Deduplicating blob directory for the sessions under one sessions dir.
+
+    Contract:
+    - Inputs: sanitized message dicts to offload / rehydrate
+    - Outputs: messages with content replaced by (or restored from) a
+      ``content_ref``
+    - Side Effects: Writes <base_dir>/.blobs/<xx>/<sha256> files
+    - Errors: A missing or unreadable blob is logged and rehydrated as a
+      placeholder string rather than failing the whole transcript load
+    """
+
+    def __init__(self, base_dir: Path, threshold: int = DEFAULT_BLOB_THRESHOLD):
+        self.base_dir = base_dir
+        self.blob_dir = base_dir / BLOBS_DIRNAME
+        self.threshold = threshold
+
+    def blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest[:2] / digest
+
+    def offload(self, message: dict) -> dict:
+        """Replace a large tool result's content with a blob reference.
+
+        Args:
+            message: Sanitized message dict (not modified)
+
+        Returns:
+            The message itself, or a copy referencing the stored blob
+        """
+        if message.get("role") != "tool" or "content" not in message:
+            return message
+        payload = json.dumps(message["content"], ensure_ascii=False).encode("utf-8")
+        if len(payload) < self.threshold:
+            return message
+
+        digest = hashlib.sha256(payload).hexdigest()
+        self._write_blob(digest, payload)
+        offloaded = {k: v for k, v in message.items() if k != "content"}
+        offloaded[CONTENT_REF_KEY] = {"sha256": digest, "bytes": len(payload)}
+        return offloaded
+
+    def rehydrate(self, message: dict) -> dict:
+        """Restore referenced content in place (no-op for inline messages)."""
+        if not isinstance(message, dict):
+            return message
+        ref = message.pop(CONTENT_REF_KEY, None)
+        if ref is None:
+            return message
+
+        digest = ref.get("sha256", "") if isinstance(ref, dict) else ""
+        try:
+            message["content"] = json.loads(self.blob_path(digest).read_bytes())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Missing tool result blob {digest}: {e}")
+            message["content"] = f"[tool result unavailable: blob {digest} missing]"
+        return message
+
+    def collect(
+        self, referenced: Iterable[str], grace: float = BLOB_GC_GRACE_SECONDS
+    ) -> int:
+        """Delete blobs not in ``referenced``. Returns the bytes freed.
+
+        Blobs written or reused within the last ``grace`` seconds are kept
+        (see ``_write_blob``), so collection never races a live session.
+        """
+        keep = set(referenced)
+        freed = 0
+        if not self.blob_dir.exists():
+            return 0
+        cutoff = time.time() - grace
+        for path in self.blob_dir.glob("*/*"):
+            if path.name in keep or path.suffix == ".tmp":
+                continue
+            try:
+                stat = path.stat()
+                if stat.st_mtime >= cutoff:
+                    continue
+                path.unlink()
+                freed += stat.st_size
+            except OSError as e:
+                logger.debug(f"Failed to remove blob {path}: {e}")
+        return freed
+
+    def _write_blob(self, digest: str, payload: bytes) -> None:
+        path = self.blob_path(digest)
+        try:
+            # Content-addressed: an existing blob is identical. Touch it so
+            # collect() treats it as fresh until our reference is written.
+            os.utime(path)
+            return
+        except FileNotFoundError:
+            pass
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+def iter_blob_refs(lines: Iterable[bytes]) -> Iterable[str]:
+    """Yield the blob digests referenced by raw transcript lines."""
+    marker = CONTENT_REF_KEY.encode()
+    for line in lines:
+        if marker not in line:
+            continue
+        try:
+            ref = json.loads(line).get(CONTENT_REF_KEY)
+        except (json.JSONDecodeError, AttributeError):
+            continue
+        if isinstance(ref, dict) and ref.get("sha256"):
+            yield ref["sha256"]
@@ -0,0 +1,227 @@
+"""Size-aware session cleanup across one or more projects.
+
+Cleanup runs in three steps so callers can report before deleting:
+
+1. ``measure_sessions`` computes each session's disk usage in parallel
+   (one ``os.scandir`` walk per session directory on a thread pool).
+2. ``plan_cleanup`` applies a ``CleanupPolicy`` and returns the sessions to
+   delete, each with the reason it was selected (a dry run stops here).
+3. ``execute_cleanup`` deletes the planned sessions with bounded concurrency
+   and updates each project's session index.
+
+A spawned sub-session (``{parent_id}_{agent}``) is measured, planned and
+deleted together with its parent, so cleanup never orphans part of a tree.
+Archived sessions are not considered; the archive has its own size quota.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from amplifier_app_cli.session_store import SessionStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEASURE_WORKERS = 8
+DEFAULT_DELETE_WORKERS = 4
+
+
+@dataclass
+class CleanupPolicy:
+    """Which sessions to delete. A session matching any rule is deleted.
+
+    Attributes:
+        days: Delete sessions not modified for this many days
+        max_bytes: Delete oldest sessions until the total fits this budget
+        keep_last: Delete all but the newest N sessions of each project
+    """
+
+    days: int | None = None
+    max_bytes: int | None = None
+    keep_last: int | None = None
+
+
+@dataclass
+class SessionUsage:
+    """Disk usage of a top-level session and its spawned sub-sessions."""
+
+    store: SessionStore
+    session_id: str
+    session_ids: list[str] = field(default_factory=list)
+    mtime: float = 0.0
+    bytes: int = 0
+    reason: str = ""
+
+
+def measure_sessions(
+    stores: list[SessionStore], *, max_workers: int = DEFAULT_MEASURE_WORKERS
+) -> list[SessionUsage]:
+    """Measure every session directory of the given stores in parallel.
+
+    Args:
+        stores: One SessionStore per project to measure
+        max_workers: Size of the measuring thread pool
+
+    Returns:
+        Usage per top-level session (sub-sessions folded into their parent)
+    """
+    dirs = []
+    for store in stores:
+        try:
+            with os.scandir(store.base_dir) as it:
+                dirs.extend(
+                    (store, entry.name, entry.path)
+                    for entry in it
+                    if not entry.name.startswith(".")
+                    and entry.is_dir(follow_symlinks=False)
+                )
+        except OSError as e:
+            logger.debug(f"Failed to list sessions in {store.base_dir}: {e}")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        measured = list(pool.map(lambda d: _measure_dir(d[2]), dirs))
+
+    usages: dict[tuple[int, str], SessionUsage] = {}
+    for (store, session_id, _path), (mtime, size) in zip(dirs, measured, strict=True):
+        root_id = session_id.split("_", 1)[0]
+        usage = usages.setdefault(
+            (id(store), root_id), SessionUsage(store=store, session_id=root_id)
+        )
+        usage.session_ids.append(session_id)
+        usage.mtime = max(usage.mtime, mtime)
+        usage.bytes += size
+
+    for usage in usages.values():
+        # Delete sub-sessions before their parent
+        usage.session_ids.sort(key=lambda sid: (sid == usage.session_id, sid))
+    return list(usages.values())
+
+
+def plan_cleanup(
+    usages: list[SessionUsage], policy: CleanupPolicy, *, now: float | None = None
+) -> list[SessionUsage]:
+    """Select the sessions a policy deletes, oldest first.
+
+    Args:
+        usages: Output of measure_sessions
+        policy: Rules to apply
+        now: Reference time for the age rule (default: current time)
+
+    Returns:
+        Sessions to delete, each with ``reason`` set
+    """
+    now = time.time() if now is None else now
+    selected: dict[int, SessionUsage] = {}
+
+    def select(usage: SessionUsage, reason: str) -> None:
+        if id(usage) not in selected:
+            usage.reason = reason
+            selected[id(usage)] = usage
+
+    oldest_first = sorted(usages, key=lambda u: u.mtime)
+
+    if policy.days is not None:
+        cutoff = now - policy.days * 86400
+        for usage in oldest_first:
+            if usage.mtime < cutoff:
+                select(usage, f"older than {policy.days} days")
+
+    if policy.keep_last is not None:
+        by_project: dict[int, list[SessionUsage]] = {}
+        for usage in oldest_first:
+            by_project.setdefault(id(usage.store), []).append(usage)
+        for project in by_project.values():
+            excess = len(project) - policy.keep_last
+            for usage in project[: max(excess, 0)]:
+                select(usage, f"beyond newest {policy.keep_last}")
+
+    if policy.max_bytes is not None:
+        total = sum(u.bytes for u in usages if id(u) not in selected)
+        for usage in oldest_first:
+            if total <= policy.max_bytes:
+                break
+            if id(usage) not in selected:
+                select(usage, "over size budget")
+                total -= usage.bytes
+
+    return sorted(selected.values(), key=lambda u: u.mtime)
+
+
+def execute_cleanup(
+    plan: list[SessionUsage], *, max_workers: int = DEFAULT_DELETE_WORKERS
+) -> tuple[int, int]:
+    """Delete planned sessions with bounded concurrency.
+
+    Args:
+        plan: Output of plan_cleanup
+        max_workers: Maximum concurrent directory deletions
+
+    Returns:
+        (session directories removed, bytes freed)
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(_delete_usage, plan))
+
+    removed = 0
+    freed = 0
+    stores: dict[int, SessionStore] = {}
+    for usage, deleted in zip(plan, results, strict=True):
+        # Index and cursor updates stay on the calling thread
+        for session_id in deleted:
+            usage.store.invalidate_transcript(session_id)
+            usage.store.index.remove(session_id)
+            logger.info(f"Removed old session: {session_id} ({usage.reason})")
+        if len(deleted) == len(usage.session_ids):
+            freed += usage.bytes
+        removed += len(deleted)
+        if deleted:
+            stores[id(usage.store)] = usage.store
+
+    for store in stores.values():
+        freed += store.collect_blobs()
+    return removed, freed
+
+
+def _delete_usage(usage: SessionUsage) -> list[str]:
+    """Remove a session's directories (worker thread). Returns those removed."""
+    deleted = []
+    for session_id in usage.session_ids:
+        try:
+            shutil.rmtree(usage.store.base_dir / session_id)
+            deleted.append(session_id)
+        except Exception as e:
+            logger.error(f"Failed to remove session {session_id}: {e}")
+    return deleted
+
+
+def _measure_dir(path: str) -> tuple[float, int]:
+    """Return (directory mtime, total file bytes) using iterative scandir."""
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return 0.0, 0
+
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return mtime, total
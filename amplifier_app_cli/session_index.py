@@ -0,0 +1,237 @@
+"""Persistent per-project index of sessions.
+
+Listing sessions used to stat every session directory, parse every
+metadata.json and count the lines of every transcript.jsonl. The index keeps
+that summary in one compact append log next to the sessions:
+
+    ~/.amplifier/projects/<project-slug>/sessions/.index.jsonl
+
+Each line is a partial record ``{"id": ..., <fields>}`` (fields merge onto the
+previous record for that id) or a tombstone ``{"id": ..., "deleted": true}``.
+SessionStore appends a line on save/update_metadata/cleanup. Readers replay
+the log, heal drift against the actual session directories (sessions written
+by older versions or other tools, sessions deleted by hand), and compact the
+log once it is mostly superseded lines.
+
+Indexed fields: name, bundle, model, mtime, message_count, parent_id.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from filelock import FileLock
+from filelock import Timeout
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".index.jsonl"
+
+# Compact once the log holds this many more lines than live records (x2)
+_COMPACT_SLACK = 256
+
+
+class SessionIndex:
+    """Append-log index of the sessions under one sessions directory.
+
+    Contract:
+    - Inputs: session_id plus summary fields via record()/remove()
+    - Outputs: dict of session_id -> summary record via entries()/get()
+    - Side Effects: Appends to / compacts <base_dir>/.index.jsonl
+    - Errors: Index I/O problems are logged, never raised; the index is a
+      cache and is rebuilt from the session directories when in doubt
+    """
+
+    def __init__(self, base_dir: Path):
+        self.base_dir = base_dir
+        self.path = base_dir / INDEX_FILENAME
+        self._lock = FileLock(str(self.path) + ".lock", timeout=10)
+        # Memoized replay of the log, keyed by the log's (mtime_ns, size, inode)
+        self._records: dict[str, dict] | None = None
+        self._line_count = 0
+        self._signature: tuple[int, int, int] | None = None
+
+    def record(self, session_id: str, **fields) -> None:
+        """Upsert fields for a session."""
+        self._append({"id": session_id, **fields})
+
+    def remove(self, session_id: str) -> None:
+        """Record that a session no longer exists."""
+        self._append({"id": session_id, "deleted": True})
+
+    def get(self, session_id: str) -> dict | None:
+        """Get the record for one session without a drift check.
+
+        Falls back to reading the session directory if it isn't indexed.
+        """
+        record = self._load().get(session_id)
+        if record is None and (self.base_dir / session_id).is_dir():
+            record = self.scan_session(session_id)
+        return record
+
+    def entries(self) -> dict[str, dict]:
+        """Get all session records, healing drift against the directories.
+
+        Drift detection costs one directory listing (no per-session stat);
+        only sessions missing from the index are read from disk.
+        """
+        records = dict(self._load())
+        try:
+            with os.scandir(self.base_dir) as it:
+                on_disk = {
+                    entry.name
+                    for entry in it
+                    if not entry.name.startswith(".") and entry.is_dir()
+                }
+        except OSError:
+            return {}
+
+        stale = records.keys() - on_disk
+        missing = on_disk - records.keys()
+        if stale or missing:
+            logger.debug(
+                f"Session index drift in {self.base_dir}: "
+                f"{len(missing)} unindexed, {len(stale)} removed"
+            )
+        for session_id in stale:
+            del records[session_id]
+        for session_id in missing:
+            records[session_id] = self.scan_session(session_id)
+
+        if stale or missing or self._line_count > 2 * len(records) + _COMPACT_SLACK:
+            self._write(records)
+        return records
+
+    def rebuild(self) -> dict[str, dict]:
+        """Discard the log and re-index every session directory."""
+        records: dict[str, dict] = {}
+        if self.base_dir.exists():
+            for session_dir in self.base_dir.iterdir():
+                if session_dir.is_dir() and not session_dir.name.startswith("."):
+                    records[session_dir.name] = self.scan_session(session_dir.name)
+        self._write(records)
+        return records
+
+    def scan_session(self, session_id: str) -> dict:
+        """Build a record by reading a session directory (the slow path)."""
+        session_dir = self.base_dir / session_id
+        record: dict = {"id": session_id, "mtime": 0, "message_count": None}
+        try:
+            record["mtime"] = session_dir.stat().st_mtime
+        except OSError:
+            pass
+
+        transcript_file = session_dir / "transcript.jsonl"
+        if transcript_file.exists():
+            try:
+                with open(transcript_file, encoding="utf-8") as f:
+                    record["message_count"] = sum(1 for _ in f)
+            except Exception:
+                pass
+
+        metadata_file = session_dir / "metadata.json"
+        if metadata_file.exists():
+            try:
+                with open(metadata_file, encoding="utf-8") as f:
+                    record.update(summarize_metadata(json.load(f)))
+            except Exception:
+                pass
+        return record
+
+    def _stat_signature(self) -> tuple[int, int, int] | None:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _load(self) -> dict[str, dict]:
+        """Replay the log (memoized until the file changes)."""
+        signature = self._stat_signature()
+
+        if self._records is not None and signature == self._signature:
+            return self._records
+
+        records: dict[str, dict] = {}
+        line_count = 0
+        if signature is not None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    for line in f:
+                        line_count += 1
+                        _apply_line(records, line)
+            except OSError as e:
+                logger.debug(f"Failed to read session index {self.path}: {e}")
+
+        self._records = records
+        self._line_count = line_count
+        self._signature = signature
+        return records
+
+    def _append(self, entry: dict) -> None:
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        try:
+            with self._lock:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line)
+        except (OSError, Timeout) as e:
+            logger.debug(f"Failed to update session index {self.path}: {e}")
+
+    def _write(self, records: dict[str, dict], *, merge: bool = True) -> None:
+        """Atomically replace the log with one line per live record.
+
+        ``records`` derives from the log as last loaded. If another process
+        appended since, those newer lines are applied to ``records`` (in
+        place) before replacing, so they are not lost; if the log was
+        replaced meanwhile (another compaction), this one is skipped.
+        """
+        try:
+            with self._lock:
+                signature = self._stat_signature()
+                if merge and signature != self._signature and signature is not None:
+                    base = self._signature
+                    if base is None or base[2] != signature[2] or signature[1] < base[1]:
+                        return
+                    with open(self.path, encoding="utf-8") as f:
+                        f.seek(base[1])
+                        for line in f:
+                            _apply_line(records, line)
+                fd, tmp = tempfile.mkstemp(
+                    dir=self.base_dir, prefix=".index-", suffix=".tmp"
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        for record in records.values():
+                            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    os.replace(tmp, self.path)
+                except BaseException:
+                    Path(tmp).unlink(missing_ok=True)
+                    raise
+        except (OSError, Timeout) as e:
+            logger.debug(f"Failed to compact session index {self.path}: {e}")
+
+
+def _apply_line(records: dict[str, dict], line: str) -> None:
+    """Apply one log line (partial record or tombstone) to ``records``."""
+    try:
+        entry = json.loads(line)
+        session_id = entry.pop("id")
+    except (json.JSONDecodeError, KeyError, AttributeError):
+        return  # Torn or foreign line; drift check heals
+    if entry.get("deleted"):
+        records.pop(session_id, None)
+    else:
+        # New dict: callers may hold shallow copies of the memoized replay
+        records[session_id] = {**records.get(session_id, {"id": session_id}), **entry}
+
+
+def summarize_metadata(metadata: dict) -> dict:
+    """Extract the indexed fields from session metadata."""
+    return {
+        "name": metadata.get("name", ""),
+        "bundle": metadata.get("bundle", "unknown"),
+        "model": metadata.get("model", "unknown"),
+        "parent_id": metadata.get("parent_id"),
+    }
@@ -40,6 +40,7 @@ from amplifier_core import ModuleValidationError
 
 from .lib.settings import AppSettings
 from .session_store import SessionStore
+from .startup_profile import startup_profiler
 from .ui.error_display import display_validation_error
 from .utils.error_format import escape_markup
 
@@ -143,6 +144,7 @@ async def create_initialized_session(
     from .ui import CLIDisplaySystem
 
     # Step 1: Check first run / auto-install providers
+    startup_profiler.progress("step 1: first-run check")
     # This is critical - without this, resume commands fail after updates
     if check_first_run():
         # For new interactive sessions, prompt for setup
@@ -158,6 +160,7 @@ async def create_initialized_session(
                 auto_init_from_env(console)
 
     # Step 2: Generate session ID if not provided
+    startup_profiler.progress("step 2: session id and metadata")
     session_id = config.session_id or str(uuid.uuid4())
 
     # Set root session metadata once — propagates to all child sessions via config deep-merge.
@@ -187,6 +190,7 @@ async def create_initialized_session(
         pass  # CWD may be unavailable in sandboxed/container environments
 
     # Step 3: Create CLI UX systems (app-layer policy)
+    startup_profiler.progress("step 3: UX systems")
     approval_system = CLIApprovalSystem()
     display_system = CLIDisplaySystem()
 
@@ -227,11 +231,13 @@ async def create_initialized_session(
         )
 
     # Step 7: Restore transcript (resume only)
+    startup_profiler.progress("step 7: restore transcript")
     # NOTE: Transcript repair (orphaned tool calls, ordering violations) is handled
     # by _repair_transcript_if_needed() in main.py, which runs before every LLM call.
     # This covers both resume and mid-session Ctrl+C cases in a single code path.
     if config.is_resume and config.initial_transcript:
-        transcript_to_restore = config.initial_transcript
+        # Materializes a LazyTranscript (resume paths defer the full parse to here)
+        transcript_to_restore = list(config.initial_transcript)
 
         context = session.coordinator.get("context")
         if context and hasattr(context, "set_messages"):
@@ -282,6 +288,7 @@ async def create_initialized_session(
     # registering a synthetic historical contributor on this session's own
     # coordinator. Best-effort: never blocks startup.
     if config.is_resume:
+        startup_profiler.progress("step 7.5: restore session cost")
         from .cost_history import restore_session_cost
 
         try:
@@ -291,6 +298,7 @@ async def create_initialized_session(
             logger.debug("Prior session cost restore skipped", exc_info=True)
 
     # Step 10: Register approval provider (app-layer policy)
+    startup_profiler.progress("step 10: approval provider")
     from .approval_provider import CLIApprovalProvider
     from .stdin_arbiter import StdinArbiter
 
@@ -304,6 +312,7 @@ async def create_initialized_session(
         logger.debug("Registered CLIApprovalProvider for interactive approvals")
 
     # Step 11: Create SessionConfigurator (if foundation available and bundle present)
+    startup_profiler.progress("step 11: session configurator")
     configurator = None
     if config.prepared_bundle is not None:
         try:
@@ -384,6 +393,7 @@ async def _create_bundle_session(
     assert prepared_bundle is not None  # Guaranteed by is_bundle_mode check
 
     # Step 4a: Wrap bundle resolver with app-layer fallback
+    startup_profiler.progress("step 4a: module resolver")
     fallback_resolver = create_foundation_resolver()
     prepared_bundle.resolver = AppModuleResolver(  # type: ignore[assignment]
         bundle_resolver=prepared_bundle.resolver,
@@ -391,6 +401,7 @@ async def _create_bundle_session(
     )
 
     # Step 4b: Inject user providers
+    startup_profiler.progress("step 4b: user providers")
     inject_user_providers(config.config, prepared_bundle)
 
     # Step 4b-post: Register app-cli observability event names with subscriber hooks.
@@ -401,6 +412,7 @@ async def _create_bundle_session(
     _inject_observability_events(prepared_bundle)
 
     # Step 4c: Create session (foundation handles init internally)
+    startup_profiler.progress("step 4c: create session (mount modules)")
     # Self-healing: The kernel intentionally swallows module load errors to be resilient.
     # If providers fail to load due to stale install state (missing dependencies),
     # the session is created but with no providers mounted. We detect this and retry.
@@ -452,9 +464,11 @@ async def _create_bundle_session(
         core_logger.setLevel(original_level)
 
     # Step 5: Register mention handling (wrap foundation's resolver)
+    startup_profiler.progress("step 5: mention handling")
     register_mention_handling(session)
 
     # Step 6: Register session spawning
+    startup_profiler.progress("step 6: session spawning")
     register_session_spawning(session)
 
     return session
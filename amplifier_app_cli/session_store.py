@@ -7,11 +7,20 @@ backup mechanism, and corruption recovery.
 Uses amplifier_foundation utilities for:
 - sanitize_message, sanitize_for_json: JSON sanitization for LLM responses
 - write_with_backup: Atomic writes with backup pattern
+
+Transcripts are append-only in the common case: once a transcript has been
+written by this store, later saves only sanitize and append the messages added
+since, falling back to a full atomic rewrite when earlier history changed
+(e.g. /clear or pre-turn transcript repair).
 """
 
 import json
 import logging
-import shutil
+import os
+import time
+from collections.abc import Iterator
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import UTC
 from datetime import datetime
 from pathlib import Path
@@ -20,7 +29,18 @@ from amplifier_core.utils.truncate import redact_secrets
 from amplifier_foundation import sanitize_message
 from amplifier_foundation import write_with_backup
 
+from amplifier_app_cli.cost_history import sum_prior_cost_usd
 from amplifier_app_cli.project_utils import get_project_slug
+from amplifier_app_cli.session_archive import SessionArchive
+from amplifier_app_cli.session_blobs import BlobStore
+from amplifier_app_cli.session_blobs import iter_blob_refs
+from amplifier_app_cli.session_cleanup import CleanupPolicy
+from amplifier_app_cli.session_cleanup import execute_cleanup
+from amplifier_app_cli.session_cleanup import measure_sessions
+from amplifier_app_cli.session_cleanup import plan_cleanup
+from amplifier_app_cli.session_index import SessionIndex
+from amplifier_app_cli.session_index import summarize_metadata
+from amplifier_app_cli.turn_index import TurnIndex
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +93,103 @@ def extract_session_mode(metadata: dict) -> tuple[str | None, None]:
     return (None, None)
 
 
+@dataclass
+class _TranscriptCursor:
+    """What this store last persisted to a session's transcript.jsonl.
+
+    Used to decide whether a save can append only the new messages or must
+    rewrite the whole file.
+    """
+
+    count: int  # Number of persisted (non-system/developer) messages
+    size: int  # Byte size of transcript.jsonl after the last write
+    lines: list[str]  # Serialized persisted messages (shared with the line cache)
+
+
+@dataclass
+class _CachedLine:
+    """A message's serialized transcript line from an earlier save."""
+
+    message: object  # Held so id(message) cannot be reused while cached
+    fingerprint: tuple
+    line: str
+
+
+def _message_fingerprint(message) -> tuple | None:
+    """Cheap shallow fingerprint of a message's top-level fields.
+
+    Detects replaced field values and strings/lists that grew in place;
+    deeper in-place edits need SessionStore.invalidate_transcript(). Returns
+    None for objects whose fields can't be inspected (never cached).
+    """
+    fields = message
+    if not isinstance(fields, dict):
+        fields = getattr(message, "__dict__", None)
+    if not isinstance(fields, dict):
+        return None
+    fingerprint = []
+    for key, value in fields.items():
+        if isinstance(value, str):
+            fingerprint.append((key, hash(value)))
+        elif isinstance(value, (list, dict)):
+            fingerprint.append((key, id(value), len(value)))
+        elif value is None or isinstance(value, (bool, int, float)):
+            fingerprint.append((key, value))
+        else:
+            fingerprint.append((key, id(value)))
+    return tuple(fingerprint)
+
+
+class LazyTranscript(Sequence):
+    """Transcript that is only parsed in full when something iterates it.
+
+    Resume display needs the message count and the last few messages, which
+    come from the session index and a backward read of transcript.jsonl. The
+    full history is parsed (once) on first indexing/iteration, e.g. when the
+    context module restores it.
+    """
+
+    def __init__(self, store: "SessionStore", session_id: str):
+        self._store = store
+        self._session_id = session_id
+        self._messages: list | None = None
+        self._count: int | None = None
+
+    @property
+    def materialized(self) -> bool:
+        """Whether the full transcript has been parsed."""
+        return self._messages is not None
+
+    def tail(self, n: int, *, roles: tuple[str, ...] | None = None) -> list[dict]:
+        """Get the last n messages (optionally only those with given roles)."""
+        if self._messages is not None:
+            matching = [
+                m for m in self._messages if not roles or m.get("role") in roles
+            ]
+            return matching[-n:] if n > 0 else []
+        return self._store.load_tail(self._session_id, n, roles=roles)
+
+    def _materialize(self) -> list:
+        if self._messages is None:
+            self._messages = self._store._load_transcript(
+                self._store.base_dir / self._session_id
+            )
+        return self._messages
+
+    def __len__(self) -> int:
+        if self._messages is not None:
+            return len(self._messages)
+        if self._count is None:
+            self._count = self._store.count_messages(self._session_id)
+        return self._count
+
+    def __getitem__(self, index):
+        return self._materialize()[index]
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self._materialize())
+
+
 class SessionStore:
     """
     Manages session persistence to filesystem.
@@ -82,7 +199,10 @@ class SessionStore:
     - Outputs: Saved files or loaded data tuples
     - Side Effects: Filesystem writes to ~/.amplifier/projects/<project-slug>/sessions/<session-id>/
     - Errors: FileNotFoundError for missing sessions, IOError for disk issues
-    - Files created: transcript.jsonl, metadata.json, config.md
+    - Files created: transcript.jsonl, metadata.json, config.md,
+      cost_checkpoint.json, turn_index.json (plus the shared
+      sessions/.index.jsonl summary index, sessions/.archive/ tier and
+      sessions/.blobs/ tool-result store)
     """
 
     def __init__(self, base_dir: Path | None = None):
@@ -99,6 +219,13 @@ class SessionStore:
             )
         self.base_dir = base_dir
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        # Per-session append cursors, keyed by session_id
+        self._cursors: dict[str, _TranscriptCursor] = {}
+        # Per-session serialized lines, keyed by id() of the message object
+        self._line_cache: dict[str, dict[int, _CachedLine]] = {}
+        self.index = SessionIndex(self.base_dir)
+        self.archive = SessionArchive(self.base_dir)
+        self.blobs = BlobStore(self.base_dir)
 
     def save(self, session_id: str, transcript: list, metadata: dict) -> None:
         """Save session state atomically with backup.
@@ -119,6 +246,8 @@ class SessionStore:
         if "/" in session_id or "\\" in session_id or session_id in (".", ".."):
             raise ValueError(f"Invalid session_id: {session_id}")
 
+        self.restore(session_id)
+
         session_dir = self.base_dir / session_id
         session_dir.mkdir(parents=True, exist_ok=True)
 
@@ -128,10 +257,27 @@ class SessionStore:
         # Save metadata with atomic write
         self._save_metadata(session_dir, metadata)
 
+        self.index.record(
+            session_id,
+            mtime=time.time(),
+            message_count=self._cursors[session_id].count,
+            **summarize_metadata(metadata),
+        )
+
+        # Advance the cost checkpoint so resume/`session cost` stay incremental
+        events_file = session_dir / "events.jsonl"
+        if events_file.exists():
+            sum_prior_cost_usd(events_file)
+
         logger.debug(f"Session {session_id} saved successfully")
 
     def _save_transcript(self, session_dir: Path, transcript: list) -> None:
-        """Save transcript with atomic write and backup.
+        """Save transcript, appending new messages when history is unchanged.
+
+        If this store already wrote the transcript and the persisted prefix
+        still matches (same file size, same line for every persisted message),
+        only the messages added since are sanitized and appended. Otherwise
+        the whole transcript is rewritten atomically with backup.
 
         Args:
             session_dir: Directory for this session
@@ -139,25 +285,132 @@ class SessionStore:
         """
         transcript_file = session_dir / "transcript.jsonl"
 
-        # Build JSONL content
-        lines = []
+        # Skip system and developer role messages from transcript
+        # Keep only user/assistant conversation (the actual interaction)
+        # - system: Internal instructions merged by providers
+        # - developer: Context files merged by providers
+        messages = []
+        roles = []
         for message in transcript:
-            # Skip system and developer role messages from transcript
-            # Keep only user/assistant conversation (the actual interaction)
-            # - system: Internal instructions merged by providers
-            # - developer: Context files merged by providers
             msg_dict = message if isinstance(message, dict) else message.model_dump()
-            if msg_dict.get("role") in ("system", "developer"):
-                continue
-
-            # Sanitize message to ensure it's JSON-serializable
-            sanitized_msg = sanitize_message(message)
-            # Timestamps are added by context module at creation time (metadata.timestamp)
-            # No fallback needed - replay handles missing timestamps via content-based timing
-            lines.append(json.dumps(sanitized_msg, ensure_ascii=False))
-
+            if msg_dict.get("role") not in ("system", "developer"):
+                messages.append(message)
+                roles.append(msg_dict.get("role"))
+
+        session_id = session_dir.name
+        cache = self._line_cache.setdefault(session_id, {})
+        if len(cache) > len(messages):
+            # Drop lines of messages no longer in the transcript
+            live = {id(m) for m in messages}
+            for key in [key for key in cache if key not in live]:
+                del cache[key]
+
+        cursor = self._cursors.get(session_id)
+        if cursor is not None and self._can_append(
+            transcript_file, session_id, messages, cursor
+        ):
+            new_lines = [
+                self._serialize_cached(session_id, m)
+                for m in messages[cursor.count :]
+            ]
+            if new_lines:
+                appended = "".join(line + "\n" for line in new_lines).encode("utf-8")
+                with open(transcript_file, "ab") as f:
+                    f.write(appended)
+                    f.flush()
+                    os.fsync(f.fileno())
+                TurnIndex(session_dir).record_transcript(
+                    new_lines, roles[cursor.count :], cursor.size
+                )
+                cursor.count = len(messages)
+                cursor.size += len(appended)
+                cursor.lines.extend(new_lines)
+            return
+
+        lines = [self._serialize_cached(session_id, m) for m in messages]
         content = "\n".join(lines) + "\n" if lines else ""
         write_with_backup(transcript_file, content)
+        TurnIndex(session_dir).record_transcript(lines, roles, 0)
+        self._cursors[session_id] = _TranscriptCursor(
+            count=len(lines),
+            size=len(content.encode("utf-8")),
+            lines=lines,
+        )
+
+    def _can_append(
+        self,
+        transcript_file: Path,
+        session_id: str,
+        messages: list,
+        cursor: _TranscriptCursor,
+    ) -> bool:
+        """Check whether the persisted transcript is still a prefix of messages.
+
+        Compares the file size and the line of every persisted message.
+        Unchanged message objects hit the line cache (a shallow fingerprint,
+        no serialization), so only replaced or edited messages are encoded.
+        Shrinking history (/clear) or any edited earlier message (compaction,
+        repair) forces a rewrite.
+        """
+        if len(messages) < cursor.count:
+            return False
+        try:
+            if transcript_file.stat().st_size != cursor.size:
+                return False
+        except OSError:
+            return False
+        return all(
+            self._serialize_cached(session_id, message) == line
+            for message, line in zip(messages, cursor.lines)
+        )
+
+    def _serialize_cached(self, session_id: str, message) -> str:
+        """Serialize a message, reusing its line from an earlier save.
+
+        Messages are effectively immutable once in the context, so a line is
+        reused when the same message object comes back with an unchanged
+        shallow fingerprint. Saves then only sanitize/encode new messages,
+        including on full rewrites (e.g. after context compaction).
+        """
+        cache = self._line_cache.setdefault(session_id, {})
+        fingerprint = _message_fingerprint(message)
+        cached = cache.get(id(message))
+        if (
+            cached is not None
+            and cached.message is message
+            and cached.fingerprint == fingerprint
+        ):
+            return cached.line
+
+        line = self._serialize_message(message)
+        if fingerprint is not None:
+            cache[id(message)] = _CachedLine(message, fingerprint, line)
+        return line
+
+    def _serialize_message(self, message) -> str:
+        """Sanitize a message and encode it as a single JSONL line.
+
+        Large tool results are moved to the blob store and referenced.
+        """
+        # Sanitize message to ensure it's JSON-serializable
+        # Timestamps are added by context module at creation time (metadata.timestamp)
+        # No fallback needed - replay handles missing timestamps via content-based timing
+        return json.dumps(
+            self.blobs.offload(sanitize_message(message)), ensure_ascii=False
+        )
+
+    def invalidate_transcript(self, session_id: str) -> None:
+        """Force the next save of a session to rewrite its whole transcript.
+
+        Call after mutating earlier messages in place below the top level
+        (e.g. transcript repair), which the shallow fingerprints behind the
+        prefix check in ``_can_append`` may not detect.
+
+        Args:
+            session_id: Session identifier
+        """
+        self._cursors.pop(session_id, None)
+        self._line_cache.pop(session_id, None)
 
     def _save_metadata(self, session_dir: Path, metadata: dict) -> None:
         """Save metadata with atomic write and backup.
@@ -191,6 +444,8 @@ class SessionStore:
         if "/" in session_id or "\\" in session_id or session_id in (".", ".."):
             raise ValueError(f"Invalid session_id: {session_id}")
 
+        self.restore(session_id)
+
         session_dir = self.base_dir / session_id
         if not session_dir.exists():
             raise FileNotFoundError(f"Session '{session_id}' not found")
@@ -204,6 +459,104 @@ class SessionStore:
         logger.debug(f"Session {session_id} loaded successfully")
         return transcript, metadata
 
+    def load_lazy(self, session_id: str) -> tuple[LazyTranscript, dict]:
+        """Load session metadata, deferring transcript parsing.
+
+        Args:
+            session_id: Session identifier to load
+
+        Returns:
+            Tuple of (LazyTranscript, metadata)
+
+        Raises:
+            FileNotFoundError: If session does not exist
+            ValueError: If session_id is invalid
+        """
+        metadata = self.get_metadata(session_id)
+        return LazyTranscript(self, session_id), metadata
+
+    def load_tail(
+        self, session_id: str, n: int, *, roles: tuple[str, ...] | None = None
+    ) -> list[dict]:
+        """Load the last n messages of a transcript by reading it backwards.
+
+        Cost depends on the size of the returned messages, not on the length
+        of the session.
+
+        Args:
+            session_id: Session identifier
+            n: Number of messages to return
+            roles: If given, only count and return messages with these roles
+
+        Returns:
+            Up to n messages, oldest first
+
+        Raises:
+            FileNotFoundError: If session does not exist
+            ValueError: If session_id is invalid
+        """
+        if not session_id or not session_id.strip():
+            raise ValueError("session_id cannot be empty")
+
+        # Sanitize session_id
+        if "/" in session_id or "\\" in session_id or session_id in (".", ".."):
+            raise ValueError(f"Invalid session_id: {session_id}")
+
+        self.restore(session_id)
+
+        session_dir = self.base_dir / session_id
+        if not session_dir.exists():
+            raise FileNotFoundError(f"Session '{session_id}' not found")
+
+        if n <= 0:
+            return []
+
+        transcript_file = session_dir / "transcript.jsonl"
+        if not transcript_file.exists():
+            # Missing/backup-only transcripts take the recovering path
+            messages = self._load_transcript(session_dir)
+            return [m for m in messages if not roles or m.get("role") in roles][-n:]
+
+        tail: list[dict] = []
+        for line in _iter_lines_reversed(transcript_file):
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Torn final append; repaired on full load
+            if roles and message.get("role") not in roles:
+                continue
+            tail.append(self.blobs.rehydrate(message))
+            if len(tail) == n:
+                break
+        tail.reverse()
+        return tail
+
+    def count_messages(self, session_id: str) -> int:
+        """Count transcript messages without parsing them.
+
+        Uses the session index when it has the count, otherwise counts lines.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Number of persisted messages (0 if no transcript yet)
+        """
+        info = self.get_session_info(session_id)
+        if info and info.get("message_count") is not None:
+            return info["message_count"]
+
+        transcript_file = self.base_dir / session_id / "transcript.jsonl"
+        count = 0
+        try:
+            with open(transcript_file, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        count += 1
+        except OSError:
+            pass
+        return count
+
     def _load_transcript(self, session_dir: Path) -> list:
         """Load transcript with corruption recovery.
 
@@ -223,13 +576,7 @@ class SessionStore:
         # Try main file first
         if transcript_file.exists():
             try:
-                transcript = []
-                with open(transcript_file, encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:  # Skip empty lines
-                            transcript.append(json.loads(line))
-                return transcript
+                return self._read_transcript_file(transcript_file)
             except (OSError, json.JSONDecodeError) as e:
                 logger.warning(f"Failed to load transcript, trying backup: {e}")
 
@@ -241,7 +588,7 @@ class SessionStore:
                     for line in f:
                         line = line.strip()
                         if line:  # Skip empty lines
-                            transcript.append(json.loads(line))
+                            transcript.append(self.blobs.rehydrate(json.loads(line)))
                 logger.info("Loaded transcript from backup")
                 return transcript
             except (OSError, json.JSONDecodeError) as e:
@@ -251,6 +598,47 @@ class SessionStore:
         logger.warning("Both transcript files corrupted, returning empty transcript")
         return []
 
+    def _read_transcript_file(self, transcript_file: Path) -> list:
+        """Read transcript.jsonl, repairing a torn final append.
+
+        Appends are not atomic, so a crash mid-append can leave a partial last
+        line. Such a tail is truncated away (the messages before it are intact);
+        corruption anywhere else raises so the caller can fall back to backup.
+
+        Raises:
+            OSError: If the file cannot be read
+            json.JSONDecodeError: If a line other than the last is corrupt
+        """
+        with open(transcript_file, "rb") as f:
+            data = f.read()
+
+        transcript = []
+        offset = 0
+        good_end = 0
+        while offset < len(data):
+            newline = data.find(b"\n", offset)
+            end = len(data) if newline == -1 else newline + 1
+            line = data[offset:end].strip()
+            if line:  # Skip empty lines
+                try:
+                    transcript.append(self.blobs.rehydrate(json.loads(line)))
+                except json.JSONDecodeError:
+                    if data[end:].strip():
+                        raise
+                    logger.warning(
+                        f"Truncating torn tail of {transcript_file} "
+                        f"({len(data) - good_end} bytes)"
+                    )
+                    with open(transcript_file, "r+b") as f:
+                        f.truncate(good_end)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    break
+            if newline != -1:
+                good_end = end
+            offset = end
+        return transcript
+
     def _load_metadata(self, session_dir: Path) -> dict:
         """Load metadata with corruption recovery.
 
@@ -314,6 +702,8 @@ class SessionStore:
         if "/" in session_id or "\\" in session_id or session_id in (".", ".."):
             raise ValueError(f"Invalid session_id: {session_id}")
 
+        self.restore(session_id)
+
         session_dir = self.base_dir / session_id
         if not session_dir.exists():
             raise FileNotFoundError(f"Session '{session_id}' not found")
@@ -326,6 +716,7 @@ class SessionStore:
 
         # Save updated metadata
         self._save_metadata(session_dir, metadata)
+        self.index.record(session_id, mtime=time.time(), **summarize_metadata(metadata))
 
         logger.debug(f"Session {session_id} metadata updated: {list(updates.keys())}")
         return metadata
@@ -350,6 +741,8 @@ class SessionStore:
         if "/" in session_id or "\\" in session_id or session_id in (".", ".."):
             raise ValueError(f"Invalid session_id: {session_id}")
 
+        self.restore(session_id)
+
         session_dir = self.base_dir / session_id
         if not session_dir.exists():
             raise FileNotFoundError(f"Session '{session_id}' not found")
@@ -373,7 +766,48 @@ class SessionStore:
             return False
 
         session_dir = self.base_dir / session_id
-        return session_dir.exists() and session_dir.is_dir()
+        return session_dir.is_dir() or self.archive.is_archived(session_id)
+
+    def restore(self, session_id: str) -> bool:
+        """Restore a session from the compressed archive if it is archived.
+
+        Called by the load paths, so archived sessions resume, show and fork
+        transparently.
+
+        Args:
+            session_id: Session identifier (already validated)
+
+        Returns:
+            True if the session was restored from an archive
+        """
+        if (self.base_dir / session_id).exists():
+            return False
+        if not self.archive.is_archived(session_id):
+            return False
+        summary = self.archive.restore(session_id)
+        if summary:
+            self.index.record(
+                session_id, **{k: v for k, v in summary.items() if k != "id"}
+            )
+        return True
+
+    def archive_session(self, session_id: str) -> dict:
+        """Move a session into the compressed archive.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Manifest entry (archive sizes, timestamps, summary)
+
+        Raises:
+            FileNotFoundError: If the session directory does not exist
+        """
+        summary = self.index.get(session_id)
+        entry = self.archive.archive(session_id, summary)
+        self.invalidate_transcript(session_id)
+        self.index.remove(session_id)
+        return entry
 
     def find_session(self, partial_id: str, *, top_level_only: bool = True) -> str:
         """Find session by partial ID prefix.
@@ -427,29 +861,55 @@ class SessionStore:
         Returns:
             List of session identifiers, sorted by modification time (newest first)
         """
+        return [
+            info["id"] for info in self.list_session_info(top_level_only=top_level_only)
+        ]
+
+    def list_session_info(self, *, top_level_only: bool = True) -> list[dict]:
+        """List session summaries from the session index.
+
+        Args:
+            top_level_only: If True (default), return only top-level sessions,
+                           excluding spawned sub-sessions. Set to False to include all.
+
+        Returns:
+            Index records (id, name, bundle, model, mtime, message_count,
+            parent_id; archived=True for archived sessions), sorted by
+            modification time (newest first)
+        """
         if not self.base_dir.exists():
             return []
 
-        sessions = []
-        for session_dir in self.base_dir.iterdir():
-            if session_dir.is_dir() and not session_dir.name.startswith("."):
-                session_name = session_dir.name
+        records = self.index.entries()
+        # Archived sessions stay listed from their manifest summary
+        for session_id, entry in self.archive.entries().items():
+            if session_id not in records:
+                records[session_id] = {**entry.get("summary", {}), "archived": True}
+
+        sessions = [
+            info
+            for session_id, info in records.items()
+            # Filter to top-level sessions if requested
+            if not top_level_only or is_top_level_session(session_id)
+        ]
+        sessions.sort(key=lambda info: info.get("mtime") or 0, reverse=True)
+        return sessions
 
-                # Filter to top-level sessions if requested
-                if top_level_only and not is_top_level_session(session_name):
-                    continue
+    def get_session_info(self, session_id: str) -> dict | None:
+        """Get the index summary for one session.
 
-                # Include session with its modification time for sorting
-                try:
-                    mtime = session_dir.stat().st_mtime
-                    sessions.append((session_name, mtime))
-                except Exception:
-                    # If we can't get mtime, include with 0
-                    sessions.append((session_name, 0))
+        Args:
+            session_id: Session identifier
 
-        # Sort by modification time (newest first) and return just the names
-        sessions.sort(key=lambda x: x[1], reverse=True)
-        return [name for name, _ in sessions]
+        Returns:
+            Index record, or None if the session does not exist
+        """
+        if not self.exists(session_id):
+            return None
+        if self.archive.is_archived(session_id):
+            entry = self.archive.entries().get(session_id, {})
+            return {**entry.get("summary", {}), "archived": True}
+        return self.index.get(session_id)
 
     def save_config_snapshot(self, session_id: str, config: dict) -> None:
         """Save config snapshot used for session.
@@ -488,6 +948,9 @@ class SessionStore:
     def cleanup_old_sessions(self, days: int = 30) -> int:
         """Remove sessions older than specified days.
 
+        Spawned sub-sessions are removed together with their parent session.
+        See amplifier_app_cli.session_cleanup for size and count policies.
+
         Args:
             days: Number of days to keep sessions (default 30)
 
@@ -500,28 +963,103 @@ class SessionStore:
         if not self.base_dir.exists():
             return 0
 
+        plan = plan_cleanup(measure_sessions([self]), CleanupPolicy(days=days))
+        removed, _freed = execute_cleanup(plan)
+
+        if removed > 0:
+            logger.info(f"Cleaned up {removed} old sessions")
+
+        return removed
+
+    def collect_blobs(self) -> int:
+        """Delete tool-result blobs no longer referenced by any session.
+
+        Scans the transcripts (and backups) of live and archived sessions.
+
+        Returns:
+            Bytes freed
+        """
+        if not self.blobs.blob_dir.exists():
+            return 0
+
+        referenced: set[str] = set()
+        for session_dir in self.base_dir.iterdir():
+            if not session_dir.is_dir() or session_dir.name.startswith("."):
+                continue
+            for name in ("transcript.jsonl", "transcript.jsonl.backup"):
+                try:
+                    with open(session_dir / name, "rb") as f:
+                        referenced.update(iter_blob_refs(f))
+                except OSError:
+                    continue
+        for session_id in self.archive.entries():
+            referenced.update(self.archive.blob_refs(session_id))
+
+        freed = self.blobs.collect(referenced)
+        if freed:
+            logger.info(f"Removed {freed} bytes of unreferenced tool result blobs")
+        return freed
+
+    def archive_old_sessions(self, days: int = 30) -> dict[str, dict]:
+        """Move sessions older than specified days into the compressed archive.
+
+        Archived sessions stay listed and are restored on first load.
+
+        Args:
+            days: Archive sessions not modified for this many days (default 30)
+
+        Returns:
+            Manifest entries of the sessions archived, keyed by session_id
+        """
+        if days < 0:
+            raise ValueError("days must be non-negative")
+
+        if not self.base_dir.exists():
+            return {}
+
         from datetime import timedelta
 
         cutoff_time = datetime.now(UTC) - timedelta(days=days)
         cutoff_timestamp = cutoff_time.timestamp()
 
-        removed = 0
+        archived = {}
         for session_dir in self.base_dir.iterdir():
             if not session_dir.is_dir() or session_dir.name.startswith("."):
                 continue
 
             try:
-                # Check modification time
-                mtime = session_dir.stat().st_mtime
-                if mtime < cutoff_timestamp:
-                    # Remove old session
-                    shutil.rmtree(session_dir)
-                    logger.info(f"Removed old session: {session_dir.name}")
-                    removed += 1
+                if session_dir.stat().st_mtime < cutoff_timestamp:
+                    archived[session_dir.name] = self.archive_session(
+                        session_dir.name
+                    )
             except Exception as e:
-                logger.error(f"Failed to remove session {session_dir.name}: {e}")
+                logger.error(f"Failed to archive session {session_dir.name}: {e}")
 
-        if removed > 0:
-            logger.info(f"Cleaned up {removed} old sessions")
+        if archived:
+            logger.info(f"Archived {len(archived)} old sessions")
 
-        return removed
+        return archived
+
+
+def _iter_lines_reversed(path: Path, block_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Yield the non-empty lines of a file from last to first.
+
+    Reads fixed-size blocks backwards from the end of the file, so only the
+    bytes of the lines actually consumed are read.
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        remainder = b""
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + remainder).split(b"\n")
+            # First piece may be a partial line continuing in the previous block
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                if line.strip():
+                    yield line
+        if remainder.strip():
+            yield remainder
@@ -0,0 +1,138 @@
+"""Background session persistence off the asyncio event loop.
+
+Sanitizing, redacting and atomically writing a large transcript can take long
+enough to stall streaming output and other hooks. SessionWriter moves that
+work to a single worker thread with a coalescing queue:
+
+- submit() records the latest snapshot for a session and returns immediately;
+  a newer snapshot for the same session supersedes one not yet written.
+- flush() is the durability barrier, awaited at turn end, exit and cleanup.
+
+All writes for a SessionStore go through the one worker thread, so the
+store's append cursors are never touched concurrently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from .session_store import SessionStore
+
+logger = logging.getLogger(__name__)
+
+MetadataBuilder = Callable[[dict], dict]
+"""Builds the metadata to save from the session's existing metadata on disk."""
+
+
+@dataclass
+class _PendingSave:
+    messages: list
+    build_metadata: MetadataBuilder
+    rewrite: bool
+
+
+class SessionWriter:
+    """Coalescing background writer for one SessionStore.
+
+    Contract:
+    - Inputs: session snapshots via submit()
+    - Outputs: transcript.jsonl / metadata.json written by the worker thread
+    - Errors: a failed write is logged; the most recent failure is re-raised
+      by the next flush() so turn-end saves still surface problems
+
+    Usage:
+        writer = SessionWriter(store)
+        writer.submit(session_id, messages, build_metadata)
+        await writer.flush()  # at turn end
+        await writer.close()  # at exit
+    """
+
+    def __init__(self, store: SessionStore):
+        self.store = store
+        self.coalesced = 0  # Snapshots superseded before being written
+        self._pending: dict[str, _PendingSave] = {}
+        self._lock = threading.Lock()
+        self._draining = False
+        self._error: Exception | None = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="amplifier-session-writer"
+        )
+
+    def submit(
+        self,
+        session_id: str,
+        messages: list,
+        build_metadata: MetadataBuilder,
+        *,
+        rewrite: bool = False,
+    ) -> None:
+        """Queue a save of the given snapshot without blocking.
+
+        Args:
+            session_id: Session identifier
+            messages: Context messages (shallow-copied; messages themselves
+                are treated as immutable once added to the context)
+            build_metadata: Called on the worker with existing metadata
+            rewrite: Force a full transcript rewrite (after in-place edits)
+        """
+        with self._lock:
+            previous = self._pending.get(session_id)
+            if previous is not None:
+                self.coalesced += 1
+                rewrite = rewrite or previous.rewrite
+            self._pending[session_id] = _PendingSave(
+                list(messages), build_metadata, rewrite
+            )
+            if not self._draining:
+                self._draining = True
+                self._executor.submit(self._drain)
+
+    def _drain(self) -> None:
+        """Write pending snapshots until the queue is empty (worker thread)."""
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._draining = False
+                    return
+                session_id = next(iter(self._pending))
+                pending = self._pending.pop(session_id)
+
+            try:
+                existing = (
+                    self.store.get_metadata(session_id)
+                    if self.store.exists(session_id)
+                    else {}
+                )
+                if pending.rewrite:
+                    self.store.invalidate_transcript(session_id)
+                self.store.save(
+                    session_id, pending.messages, pending.build_metadata(existing)
+                )
+            except Exception as e:
+                logger.warning(f"Background session save failed: {e}")
+                self._error = e
+
+    async def flush(self) -> None:
+        """Wait until every snapshot submitted so far is on disk.
+
+        Raises:
+            Exception: The most recent write failure since the last flush
+        """
+        # The executor is FIFO on one thread, so a no-op queued now runs only
+        # after any in-flight drain (which also picks up later submissions).
+        await asyncio.wrap_future(self._executor.submit(lambda: None))
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    async def close(self) -> None:
+        """Flush outstanding saves and stop the worker thread."""
+        try:
+            await self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
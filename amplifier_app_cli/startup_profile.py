@@ -0,0 +1,234 @@
+"""Wall-time profiler for CLI startup phases (``amplifier --profile-startup``).
+
+Startup code wraps each phase in ``startup_profiler.phase(name)``. Phases nest
+(bundle preparation contains the foundation progress actions; session
+creation contains its numbered steps). When profiling is off, ``phase`` is a
+no-op.
+
+The report covers the time from importing the CLI up to the first prompt
+(interactive) or the start of execution (single-shot). It is written to
+stderr as a table, or as JSON with ``--profile-startup=json``, so it never
+mixes with ``--output-format json`` on stdout. With ``--profile-startup-dir``
+each top-level phase is also run under cProfile and dumped as
+``<NN>-<phase>.prof`` for ``python -m pstats`` or snakeviz.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import re
+import sys
+import time
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict
+from dataclasses import dataclass
+from pathlib import Path
+
+# Taken when main.py starts importing its dependencies
+_IMPORT_START = time.perf_counter()
+
+
+@dataclass
+class PhaseTiming:
+    """One timed phase. Times are seconds relative to the start of imports."""
+
+    name: str
+    start: float
+    duration: float
+    depth: int
+
+
+class StartupProfiler:
+    """Collects phase timings for one CLI invocation.
+
+    Contract:
+    - Inputs: phase names from startup code; progress actions from bundle
+      preparation
+    - Outputs: a table or JSON report on stderr (once per process)
+    - Side Effects: Writes cProfile dumps when a dump directory is set
+    - Errors: None raised; the profiler never fails a start
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.output_format = "table"
+        self.cprofile_dir: Path | None = None
+        self.phases: list[PhaseTiming] = []
+        self.counters: dict[str, Callable[[], int]] = {}
+        self._origin = _IMPORT_START
+        self._imports_done: float | None = None
+        self._depth = 0
+        self._progress: tuple[str, float] | None = None
+        self._last_end = _IMPORT_START
+        self._reported = False
+
+    def imports_done(self) -> None:
+        """Mark the end of module imports (called once main.py has loaded)."""
+        if self._imports_done is None:
+            self._imports_done = time.perf_counter()
+
+    def enable(self, output_format: str = "table", cprofile_dir: Path | None = None):
+        """Start profiling this invocation (called from the CLI group callback)."""
+        if self.enabled:
+            return
+        self.enabled = True
+        self.output_format = output_format
+        self.cprofile_dir = cprofile_dir
+        if cprofile_dir is not None:
+            cprofile_dir.mkdir(parents=True, exist_ok=True)
+        if self._imports_done is not None:
+            self._record("imports", self._origin, self._imports_done, 0)
+        self._record("cli dispatch", self._last_end, time.perf_counter(), 0)
+        # Commands that exit before the first prompt still get a report
+        atexit.register(self.report)
+
+    def add_counter(self, name: str, read: Callable[[], int]) -> None:
+        """Report ``read()`` under ``name`` (read when the report is written)."""
+        self.counters[name] = read
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as a phase (nested under any open phase)."""
+        if not self.enabled or self._reported:
+            yield
+            return
+
+        depth = self._depth
+        dump_dir = self.cprofile_dir
+        profile = None
+        if depth == 0 and dump_dir is not None:
+            import cProfile
+
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:  # Another profiler is already active
+                profile = None
+
+        self._close_progress()
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._close_progress()
+            end = time.perf_counter()
+            self._depth -= 1
+            if profile is not None and dump_dir is not None:
+                profile.disable()
+                profile.dump_stats(dump_dir / f"{len(self.phases):02d}-{_slug(name)}.prof")
+            self._record(name, start, end, depth)
+
+    def progress(self, action: str, detail: str = "") -> None:
+        """Record a progress action as a sub-phase lasting until the next one.
+
+        Matches the foundation ``progress_callback(action, detail)`` signature.
+        """
+        if not self.enabled or self._reported:
+            return
+        self._close_progress()
+        label = f"{action} {detail}".strip() if detail else action
+        self._progress = (label, time.perf_counter())
+
+    def finish(self, last_phase: str) -> None:
+        """Close startup with a final phase since the previous one, then report.
+
+        Args:
+            last_phase: Name for the time between the last recorded top-level
+                phase and now (e.g. "first prompt")
+        """
+        if not self.enabled or self._reported:
+            return
+        self._record(last_phase, self._last_end, time.perf_counter(), 0)
+        self.report()
+
+    def report(self) -> None:
+        """Write the report to stderr (once)."""
+        if not self.enabled or self._reported:
+            return
+        self._reported = True
+        if self.output_format == "json":
+            print(json.dumps(self.to_dict(), indent=2), file=sys.stderr)
+        else:
+            self._print_table()
+
+    def to_dict(self) -> dict:
+        top_level = [p for p in self.phases if p.depth == 0]
+        total = max((p.start + p.duration for p in top_level), default=0.0)
+        return {
+            "total_ms": round(total * 1000, 1),
+            "phases": [
+                {
+                    **asdict(p),
+                    "start": round(p.start * 1000, 1),
+                    "duration": round(p.duration * 1000, 1),
+                }
+                for p in self._ordered()
+            ],
+            "counters": {name: read() for name, read in self.counters.items()},
+            "units": "ms",
+        }
+
+    def _record(self, name: str, start: float, end: float, depth: int) -> None:
+        self.phases.append(
+            PhaseTiming(
+                name=name,
+                start=start - self._origin,
+                duration=end - start,
+                depth=depth,
+            )
+        )
+        if depth == 0:
+            self._last_end = end
+
+    def _close_progress(self) -> None:
+        if self._progress is not None:
+            label, start = self._progress
+            self._progress = None
+            self._record(label, start, time.perf_counter(), self._depth)
+
+    def _ordered(self) -> list[PhaseTiming]:
+        # Parents are recorded after their children; list them first
+        return sorted(self.phases, key=lambda p: (p.start, p.depth))
+
+    def _print_table(self) -> None:
+        from rich.console import Console
+        from rich.table import Table
+
+        data = self.to_dict()
+        total = data["total_ms"] or 1.0
+        table = Table(title=f"Startup profile ({data['total_ms']:.0f} ms)")
+        table.add_column("Phase")
+        table.add_column("Start", justify="right", style="dim")
+        table.add_column("Duration", justify="right")
+        table.add_column("%", justify="right", style="dim")
+        for phase in data["phases"]:
+            share = ""
+            if not phase["depth"]:
+                share = f"{phase['duration'] / total * 100:.0f}"
+            table.add_row(
+                "  " * phase["depth"] + phase["name"],
+                f"{phase['start']:.0f} ms",
+                f"{phase['duration']:.1f} ms",
+                share,
+            )
+        if data["counters"]:
+            table.caption = ", ".join(
+                f"{name}: {value}" for name, value in data["counters"].items()
+            )
+        Console(stderr=True).print(table)
+        if self.cprofile_dir is not None:
+            Console(stderr=True).print(
+                f"[dim]cProfile dumps: {self.cprofile_dir}[/dim]"
+            )
+
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+# Process-wide profiler used by the CLI
+startup_profiler = StartupProfiler()
@@ -0,0 +1,213 @@
+"""Byte-offset turn index for a session's transcript.jsonl and events.jsonl.
+
+Forking, fork previews and single-turn display used to parse the whole
+transcript to find turn boundaries. The index records, per session, the byte
+offset at which each turn starts in both files:
+
+    <session_dir>/turn_index.json
+    {
+      "transcript": {"size": <bytes indexed>, "turns": [<offset>, ...]},
+      "events": {"inode": ..., "scanned": <bytes indexed>, "turns": [...]}
+    }
+
+A turn starts at each ``user`` message in the transcript and at each
+``prompt:submit`` event in events.jsonl; turn N (1-based) is ``turns[N - 1]``.
+SessionStore updates the transcript side as it writes (including appends);
+the events side is extended incrementally from the last scanned offset, since
+events.jsonl is written by the logging hook rather than by the store. Either
+side is rebuilt with a single scan if it no longer matches its file.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from amplifier_app_cli.session_blobs import BlobStore
+
+logger = logging.getLogger(__name__)
+
+TURN_INDEX_FILENAME = "turn_index.json"
+
+_PROMPT_SUBMIT_EVENT = "prompt:submit"
+
+
+class TurnIndex:
+    """Turn boundary offsets for one session directory.
+
+    Contract:
+    - Inputs: session_dir; transcript lines as they are written
+    - Outputs: per-turn byte offsets, and messages/events sliced by turn
+    - Side Effects: Reads/writes <session_dir>/turn_index.json
+    - Errors: Index I/O problems are logged; reads fall back to a rescan
+    """
+
+    def __init__(self, session_dir: Path):
+        self.session_dir = session_dir
+        self.path = session_dir / TURN_INDEX_FILENAME
+        self.transcript_file = session_dir / "transcript.jsonl"
+        self.events_file = session_dir / "events.jsonl"
+
+    # --- Writing ---------------------------------------------------------
+
+    def record_transcript(
+        self, lines: list[str], roles: list[str | None], start_offset: int
+    ) -> None:
+        """Record turn starts for lines just written to transcript.jsonl.
+
+        Args:
+            lines: Serialized lines written (without trailing newlines)
+            roles: Role of each line's message
+            start_offset: Byte offset of the first line (0 for a rewrite)
+        """
+        data = self._read()
+        transcript = data.get("transcript") or {}
+        if start_offset and transcript.get("size") != start_offset:
+            # Index fell behind the file; rebuilt on next read
+            data["transcript"] = None
+            self._write(data)
+            return
+
+        turns = transcript.get("turns", []) if start_offset else []
+        offset = start_offset
+        for line, role in zip(lines, roles, strict=True):
+            if role == "user":
+                turns.append(offset)
+            offset += len(line.encode("utf-8")) + 1
+        data["transcript"] = {"size": offset, "turns": turns}
+        self._write(data)
+
+    # --- Reading ---------------------------------------------------------
+
+    def transcript_turns(self) -> list[int]:
+        """Turn start offsets in transcript.jsonl (rebuilt if stale)."""
+        data = self._read()
+        transcript = data.get("transcript") or {}
+        try:
+            size = self.transcript_file.stat().st_size
+        except OSError:
+            return []
+        if transcript.get("size") == size:
+            return transcript["turns"]
+
+        turns = []
+        offset = 0
+        with open(self.transcript_file, "rb") as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        if json.loads(line).get("role") == "user":
+                            turns.append(offset)
+                    except (json.JSONDecodeError, AttributeError):
+                        pass
+                offset += len(line)
+        data["transcript"] = {"size": offset, "turns": turns}
+        self._write(data)
+        return turns
+
+    def events_turns(self) -> list[int]:
+        """Turn start offsets in events.jsonl, scanning only new bytes."""
+        try:
+            stat = self.events_file.stat()
+        except OSError:
+            return []
+
+        data = self._read()
+        events = data.get("events") or {}
+        scanned = events.get("scanned", 0)
+        if events.get("inode") != stat.st_ino or scanned > stat.st_size:
+            events, scanned = {}, 0
+        turns = list(events.get("turns", []))
+        if scanned == stat.st_size:
+            return turns
+
+        marker = _PROMPT_SUBMIT_EVENT.encode()
+        with open(self.events_file, "rb") as f:
+            f.seek(scanned)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Partial line still being written
+                if marker in line:
+                    try:
+                        if json.loads(line).get("event") == _PROMPT_SUBMIT_EVENT:
+                            turns.append(scanned)
+                    except (json.JSONDecodeError, AttributeError):
+                        pass
+                scanned += len(line)
+        data["events"] = {"inode": stat.st_ino, "scanned": scanned, "turns": turns}
+        self._write(data)
+        return turns
+
+    def turn_count(self) -> int:
+        """Number of turns in the transcript."""
+        return len(self.transcript_turns())
+
+    def read_messages(self, first_turn: int, last_turn: int | None = None) -> list:
+        """Parse only the transcript messages of turns first..last (1-based).
+
+        Args:
+            first_turn: First turn to include
+            last_turn: Last turn to include (default: through the end)
+
+        Returns:
+            Messages of those turns, in order
+
+        Raises:
+            ValueError: If first_turn is out of range
+        """
+        turns = self.transcript_turns()
+        if not 1 <= first_turn <= len(turns):
+            raise ValueError(f"Turn {first_turn} out of range (1-{len(turns)})")
+        start = turns[first_turn - 1]
+        end = (
+            turns[last_turn]
+            if last_turn is not None and last_turn < len(turns)
+            else None
+        )
+
+        blobs = BlobStore(self.session_dir.parent)
+        messages = []
+        with open(self.transcript_file, "rb") as f:
+            f.seek(start)
+            data = f.read() if end is None else f.read(end - start)
+        for line in data.splitlines():
+            if line.strip():
+                try:
+                    messages.append(blobs.rehydrate(json.loads(line)))
+                except json.JSONDecodeError:
+                    continue  # Torn tail
+        return messages
+
+    def events_end_offset(self, turn: int) -> int | None:
+        """Byte offset in events.jsonl where events after ``turn`` begin.
+
+        Returns None when events after the turn cannot be bounded (no events
+        file, or the turn is the last indexed one).
+        """
+        turns = self.events_turns()
+        if turn < len(turns):
+            return turns[turn]
+        return None
+
+    # --- Storage ---------------------------------------------------------
+
+    def _read(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            return data if isinstance(data, dict) else {}
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _write(self, data: dict) -> None:
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.session_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp, self.path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.debug(f"Failed to write turn index {self.path}: {e}")
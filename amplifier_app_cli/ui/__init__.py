@@ -1,14 +1,32 @@
-"""UI implementations for CLI environment."""
+"""UI implementations for CLI environment.
 
-from .approval import CLIApprovalSystem
-from .display import CLIDisplaySystem
-from .message_renderer import render_message
-from .scope import (
-    is_scope_change_available,
-    print_scope_indicator,
-    prompt_scope_change,
-    validate_scope_cli,
-)
+Exports resolve on first access so importing one UI module (main imports the
+log filter and renderers at startup) does not import the approval and display
+systems.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from .approval import CLIApprovalSystem
+    from .display import CLIDisplaySystem
+    from .message_renderer import render_message
+    from .scope import is_scope_change_available
+    from .scope import print_scope_indicator
+    from .scope import prompt_scope_change
+    from .scope import validate_scope_cli
+
+_EXPORTS = {
+    "CLIApprovalSystem": ".approval",
+    "CLIDisplaySystem": ".display",
+    "render_message": ".message_renderer",
+    "is_scope_change_available": ".scope",
+    "print_scope_indicator": ".scope",
+    "prompt_scope_change": ".scope",
+    "validate_scope_cli": ".scope",
+}
 
 __all__ = [
     "CLIApprovalSystem",
@@ -19,3 +37,11 @@ __all__ = [
     "prompt_scope_change",
     "validate_scope_cli",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,205 @@
+"""Shared git object store for cached module checkouts.
+
+Foundation clones every cache entry independently, so modules and bundles
+checked out from one repository at several refs (or subdirectories) each
+carry a full copy of its objects. After an update, each checkout of a
+repository is linked to one bare store per repository through
+``.git/objects/info/alternates``, and its own objects are repacked away:
+
+    ~/.amplifier/cache/git-objects/<repo>-<hash>.git
+
+The store is filled from the local checkouts (no network). It keeps each
+linked checkout's refs under ``refs/checkouts/<key>/``; git never collects it
+on its own, since checkouts borrow its objects. When a checkout is linked,
+refs of checkouts that no longer borrow from the store (removed by
+``clear_module_cache`` or an update) are deleted, the remaining checkouts'
+refs are refreshed, and unreachable objects are pruned. The store is removed
+with the rest of the cache. Linked checkouts stay ordinary git repositories:
+later fetches into them store only the objects the store lacks.
+
+Any git failure leaves the checkout as it was; sharing never fails an update.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import subprocess
+from pathlib import Path
+
+from filelock import FileLock
+from filelock import Timeout
+
+from .cache_management import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+GIT_STORE_DIRNAME = "git-objects"
+
+_GIT_TIMEOUT_SECONDS = 120
+_CHECKOUT_REFS = "refs/checkouts"
+# Checkouts are cache entries, at most this many directories below the cache
+# dir (module_cache._MAX_ENTRY_DEPTH; that module imports this one). Borrowers
+# are searched to this depth, so deeper checkouts are never linked.
+_MAX_CHECKOUT_DEPTH = 3
+
+
+def get_git_store_dir() -> Path:
+    """Return ~/.amplifier/cache/git-objects path."""
+    return get_cache_dir() / GIT_STORE_DIRNAME
+
+
+def share_objects(repo_url: str, checkout: Path) -> bool:
+    """Move a cached checkout's git objects into its repository's shared store.
+
+    Args:
+        repo_url: Repository the checkout was cloned from
+        checkout: Cache entry path (or a subdirectory of one)
+
+    Returns:
+        True if the checkout now borrows from the store, False otherwise.
+    """
+    root = _git_root(checkout)
+    if root is None:
+        logger.debug(f"Not sharing git objects for {checkout}: no git checkout")
+        return False
+    if len(root.relative_to(get_cache_dir()).parts) > _MAX_CHECKOUT_DEPTH:
+        # _prune_stale could not find it again and would prune its objects
+        logger.debug(f"Not sharing git objects for {root}: nested too deep")
+        return False
+
+    store = _store_path(repo_url)
+    alternates = root / ".git" / "objects" / "info" / "alternates"
+    store_objects = str((store / "objects").resolve())
+    try:
+        if _borrows_from(root, store_objects):
+            return True
+
+        store.parent.mkdir(parents=True, exist_ok=True)
+        # Linking and pruning must not interleave across parallel updates
+        with FileLock(str(store) + ".lock", timeout=_GIT_TIMEOUT_SECONDS):
+            if not store.exists():
+                _git(store.parent, "init", "--bare", "--quiet", store.name)
+                # Checkouts borrow these objects; only _prune_stale collects
+                _git(store, "config", "gc.auto", "0")
+
+            _fetch_checkout_refs(store, root)
+
+            alternates.parent.mkdir(parents=True, exist_ok=True)
+            with open(alternates, "a", encoding="utf-8") as f:
+                f.write(f"{store_objects}\n")
+
+            # -l keeps only objects the store does not have
+            _git(root, "repack", "-a", "-d", "-l", "-q")
+            _git(root, "prune-packed")
+
+            _prune_stale(store, store_objects)
+    except (OSError, subprocess.SubprocessError, Timeout) as e:
+        logger.debug(f"Could not share git objects for {root}: {e}")
+        return False
+
+    logger.debug(f"Sharing git objects for {root} via {store.name}")
+    return True
+
+
+def _fetch_checkout_refs(store: Path, root: Path) -> None:
+    """Record a checkout's HEAD and refs in the store (no network)."""
+    prefix = f"{_CHECKOUT_REFS}/{_checkout_key(root)}"
+    # Layout before per-checkout namespaces: a single ref named like the prefix
+    existing = _git_output(store, "for-each-ref", "--format=%(refname)", prefix)
+    if prefix in existing.split():
+        _git(store, "update-ref", "-d", prefix)
+    _git(
+        store,
+        "fetch",
+        "--quiet",
+        "--no-tags",
+        "--update-shallow",
+        str(root),
+        f"+HEAD:{prefix}/HEAD",
+        f"+refs/*:{prefix}/refs/*",
+    )
+
+
+def _prune_stale(store: Path, store_objects: str) -> None:
+    """Drop refs of checkouts that no longer borrow from the store, then prune.
+
+    Live checkouts' refs are refreshed first, so every object a checkout may
+    have skipped because the store had it stays reachable.
+    """
+    borrowers = {
+        _checkout_key(root): root for root in _borrowing_checkouts(store_objects)
+    }
+    refs = _git_output(
+        store, "for-each-ref", "--format=%(refname)", f"{_CHECKOUT_REFS}/"
+    ).split()
+    stale = [ref for ref in refs if ref.split("/")[2] not in borrowers]
+    if not stale:
+        return
+
+    for ref in stale:
+        _git(store, "update-ref", "-d", ref)
+    for root in borrowers.values():
+        _fetch_checkout_refs(store, root)
+    _git(store, "gc", "--quiet", "--prune=now")
+    logger.debug(f"Pruned {len(stale)} stale checkout refs from {store.name}")
+
+
+def _borrowing_checkouts(store_objects: str) -> list[Path]:
+    """Cached checkouts (up to ``_MAX_CHECKOUT_DEPTH`` deep) linked to a store."""
+    cache_dir = get_cache_dir()
+    roots = []
+    for depth in range(1, _MAX_CHECKOUT_DEPTH + 1):
+        for git_dir in cache_dir.glob("*/" * depth + ".git"):
+            if _borrows_from(git_dir.parent, store_objects):
+                roots.append(git_dir.parent)
+    return roots
+
+
+def _borrows_from(root: Path, store_objects: str) -> bool:
+    alternates = root / ".git" / "objects" / "info" / "alternates"
+    try:
+        return store_objects in alternates.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return False
+
+
+def _checkout_key(root: Path) -> str:
+    return hashlib.sha256(str(root.resolve()).encode()).hexdigest()[:16]
+
+
+def _store_path(repo_url: str) -> Path:
+    url = repo_url.rstrip("/")
+    if url.endswith(".git"):
+        url = url[:-4]
+    key = hashlib.sha256(url.lower().encode()).hexdigest()[:12]
+    name = url.rsplit("/", 1)[-1] or "repo"
+    return get_git_store_dir() / f"{name}-{key}.git"
+
+
+def _git_root(path: Path) -> Path | None:
+    """The checkout containing ``path``, searching no higher than the cache."""
+    cache_dir = get_cache_dir()
+    if not path.is_relative_to(cache_dir):
+        return None
+    for candidate in (path, *path.parents):
+        if candidate == cache_dir:
+            break
+        if (candidate / ".git").is_dir():
+            return candidate
+    return None
+
+
+def _git(cwd: Path, *args: str) -> None:
+    _git_output(cwd, *args)
+
+
+def _git_output(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=_GIT_TIMEOUT_SECONDS,
+    ).stdout
@@ -1,24 +1,69 @@
 """Custom Click help formatter.
 
 This module provides AmplifierGroup, a custom Click group for
-consistent help output formatting.
+consistent help output formatting and lazily imported subcommands.
 """
 
+import importlib
+
 import click
 from click import Context
 from click import HelpFormatter
 
 
 class AmplifierGroup(click.Group):
-    """Custom Click group for consistent help output formatting."""
+    """Custom Click group for consistent help output formatting.
+
+    Subcommands registered with ``add_lazy_command`` are named by import path
+    and only imported when dispatched (or completed). Help listings use the
+    short help registered alongside them, so ``amplifier --help`` imports no
+    command modules.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # name -> (import path "package.module:attribute", short help)
+        self.lazy_commands: dict[str, tuple[str, str]] = {}
+
+    def add_lazy_command(self, name: str, import_path: str, short_help: str) -> None:
+        """Register a subcommand imported on first use.
+
+        Args:
+            name: Command name as typed on the command line
+            import_path: "package.module:attribute" of the click command
+            short_help: One-line help shown in ``--help`` listings
+        """
+        self.lazy_commands[name] = (import_path, short_help)
+
+    def list_commands(self, ctx: Context) -> list[str]:
+        return sorted({*self.commands, *self.lazy_commands})
+
+    def get_command(self, ctx: Context, cmd_name: str) -> click.Command | None:
+        command = self.commands.get(cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            command = self._load_lazy_command(cmd_name)
+        return command
+
+    def _load_lazy_command(self, cmd_name: str) -> click.Command:
+        import_path, _short_help = self.lazy_commands[cmd_name]
+        module_name, _, attribute = import_path.partition(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{import_path} is not a click command")
+        # Cache the real command; later lookups skip the import machinery
+        self.commands[cmd_name] = command
+        return command
 
     def format_commands(self, ctx: Context, formatter: HelpFormatter) -> None:
         """Write all commands to the help output."""
         commands = []
 
         for subcommand in self.list_commands(ctx):
-            cmd = self.get_command(ctx, subcommand)
-            if cmd is None or cmd.hidden:
+            if subcommand not in self.commands:
+                commands.append((subcommand, self.lazy_commands[subcommand][1]))
+                continue
+            cmd = self.commands[subcommand]
+            if cmd.hidden:
                 continue
             commands.append((subcommand, cmd))
 
@@ -27,6 +72,9 @@ class AmplifierGroup(click.Group):
             limit = formatter.width - 6 - max(len(cmd[0]) for cmd in commands)
             rows = []
             for subcommand, cmd in commands:
+                if isinstance(cmd, str):
+                    # Lazy command: format its manifest text like a docstring
+                    cmd = click.Command(subcommand, help=cmd)
                 help_text = cmd.get_short_help_str(limit=limit)
                 rows.append((subcommand, help_text))
             if rows:
@@ -0,0 +1,169 @@
+"""On-disk HTTP cache for GitHub update lookups.
+
+Update checks fetch the same Atom feeds, commit details and pyproject.toml
+files on every run, which burns GitHub's unauthenticated rate limit. Responses
+are stored with their ETag / Last-Modified validators:
+
+- within ``FRESH_SECONDS`` of the last fetch the stored body is served without
+  touching the network, so back-to-back ``amplifier update`` runs are free;
+- after that the request is sent with ``If-None-Match`` / ``If-Modified-Since``
+  and a 304 is answered from the stored body.
+
+    ~/.amplifier/cache/http/<key>.json
+
+Entries are keyed by URL and the Authorization header (hashed), so a token
+change never serves another identity's response. Only 200 responses are
+stored; errors go straight to the caller. ``amplifier update --force`` clears
+the whole cache directory, this cache included.
+
+Any problem reading or writing an entry falls back to a plain request; the
+cache never makes a lookup fail.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from .cache_management import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+HTTP_CACHE_DIRNAME = "http"
+
+# Stored responses younger than this are served without a request
+FRESH_SECONDS = 300
+# Entries not refreshed for this long are removed (checked once per process)
+_PRUNE_AFTER_SECONDS = 30 * 24 * 3600
+# Bump when the stored entry layout changes
+_FORMAT_VERSION = 1
+
+_pruned = False
+
+
+def get_http_cache_dir() -> Path:
+    """Return ~/.amplifier/cache/http path."""
+    return get_cache_dir() / HTTP_CACHE_DIRNAME
+
+
+async def cached_get(
+    client: httpx.AsyncClient, url: str, headers: dict | None = None
+) -> httpx.Response:
+    """GET ``url`` through the on-disk cache.
+
+    Returns a response like ``client.get`` would; call ``raise_for_status()``
+    on it as usual. Cache hits and 304s come back as a 200 with the stored body.
+    """
+    headers = dict(headers or {})
+    path = get_http_cache_dir() / f"{_cache_key(url, headers)}.json"
+    entry = _load(path, url)
+
+    if entry is not None:
+        if 0 <= time.time() - entry["fetched_at"] < FRESH_SECONDS:
+            logger.debug(f"HTTP cache fresh: {url}")
+            return _response(url, entry)
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    response = await client.get(url, headers=headers)
+
+    if entry is not None and response.status_code == 304:
+        logger.debug(f"HTTP cache revalidated: {url}")
+        entry["fetched_at"] = time.time()
+        _save(path, entry)
+        return _response(url, entry)
+
+    if response.status_code == 200:
+        _store(path, url, response)
+    return response
+
+
+def _cache_key(url: str, headers: dict) -> str:
+    identity = headers.get("Authorization", "")
+    return hashlib.sha256(f"{url}\0{identity}".encode()).hexdigest()[:32]
+
+
+def _load(path: Path, url: str) -> dict | None:
+    try:
+        entry = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(entry, dict)
+        or entry.get("format") != _FORMAT_VERSION
+        or entry.get("url") != url
+        or not isinstance(entry.get("body"), str)
+        or not isinstance(entry.get("fetched_at"), (int, float))
+    ):
+        return None
+    return entry
+
+
+def _response(url: str, entry: dict) -> httpx.Response:
+    headers = {"content-type": entry.get("content_type") or "text/plain"}
+    if entry.get("etag"):
+        headers["etag"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["last-modified"] = entry["last_modified"]
+    return httpx.Response(
+        200,
+        headers=headers,
+        content=entry["body"].encode("utf-8"),
+        request=httpx.Request("GET", url),
+    )
+
+
+def _store(path: Path, url: str, response: httpx.Response) -> None:
+    try:
+        entry = {
+            "format": _FORMAT_VERSION,
+            "url": url,
+            "fetched_at": time.time(),
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "content_type": response.headers.get("content-type"),
+            "body": response.text,
+        }
+        _save(path, entry)
+    except Exception as e:
+        logger.debug(f"Not caching response for {url}: {e}")
+
+
+def _save(path: Path, entry: dict) -> None:
+    global _pruned
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Failed to write HTTP cache entry {path}: {e}")
+        return
+
+    if not _pruned:
+        _pruned = True
+        _prune(path.parent)
+
+
+def _prune(cache_dir: Path) -> None:
+    cutoff = time.time() - _PRUNE_AFTER_SECONDS
+    for path in cache_dir.glob("*.json"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
@@ -15,9 +15,13 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import re
 import shutil
+import tempfile
+import time
 from collections.abc import Callable
+from dataclasses import asdict
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -28,8 +32,24 @@ except ImportError:
 
 import yaml
 
+from .git_store import GIT_STORE_DIRNAME
+from .git_store import share_objects
+
 logger = logging.getLogger(__name__)
 
+MODULE_INDEX_DIRNAME = "module-index"
+
+# Bump when the index layout changes
+_INDEX_FORMAT = 1
+_CACHE_META = ".amplifier_cache_meta.json"
+_LEGACY_CACHE_META = ".amplifier_cache_metadata.json"
+# Cache entries live at most this many directories below the cache dir
+# ({hash}/{ref}/ for the oldest layout, modules/<name>/ for nested caches)
+_MAX_ENTRY_DEPTH = 3
+# Paths modified this recently are re-checked: a rewrite within the
+# filesystem's timestamp granularity may leave the stamp unchanged
+_RACY_WINDOW_NS = 2_000_000_000
+
 
 # =============================================================================
 # Structural Type Detection (Authoritative - NOT name-based)
@@ -205,12 +225,13 @@ def _extract_repo_name(url: str) -> str:
 
 
 def scan_cached_modules(type_filter: str = "all") -> list[CachedModuleInfo]:
-    """Scan and return info for all cached modules and bundles.
+    """Return info for all cached modules and bundles.
 
     Single source of truth for cache scanning.
     Used by: module list, module check-updates, source_status.py
 
-    Uses RECURSIVE search to find all cached items, including those in
+    Served from the module cache index (see ModuleCacheIndex), which finds
+    entries up to three levels below the cache dir, including those in
     subdirectories like ~/.amplifier/cache/modules/.
 
     Type detection uses STRUCTURAL markers (not naming conventions):
@@ -225,149 +246,291 @@ def scan_cached_modules(type_filter: str = "all") -> list[CachedModuleInfo]:
         type_filter: Filter by type ("all", "tool", "hook", "provider", "bundle", etc.)
 
     Returns:
-        List of CachedModuleInfo sorted by module_id
+        List of CachedModuleInfo sorted by display name
     """
-    cache_dir = get_cache_dir()
+    modules = ModuleCacheIndex(get_cache_dir()).entries()
+    if type_filter != "all":
+        modules = [m for m in modules if m.module_type == type_filter]
+    return modules
 
-    if not cache_dir.exists():
-        return []
 
-    modules: list[CachedModuleInfo] = []
-    seen_paths: set[Path] = set()  # Avoid duplicates
+def _read_cache_entry(
+    cache_entry: Path, metadata: dict, *, legacy: bool
+) -> CachedModuleInfo | None:
+    """Build the info for one cache entry from its metadata file contents.
 
-    # RECURSIVE search for all cache metadata files
-    # This finds modules in subdirectories like cache/modules/
-    for meta_file in cache_dir.rglob(".amplifier_cache_meta.json"):
-        cache_entry = meta_file.parent
+    Returns None for entries that are not listed (skills sources).
+    """
+    # Skills sources (e.g. obra/superpowers) are handled separately
+    # by _refresh_skills_cache() in update.py. Including them here
+    # routes them through GitSourceHandler._verify_clone_integrity()
+    # which rejects them for lacking pyproject.toml/bundle.md.
+    if metadata.get("type") == "skills":
+        return None
 
-        # Avoid duplicates
-        if cache_entry in seen_paths:
-            continue
-        seen_paths.add(cache_entry)
+    url = metadata.get("url" if legacy else "git_url", "")
 
-        try:
-            metadata = json.loads(meta_file.read_text(encoding="utf-8"))
+    # === STRUCTURAL TYPE DETECTION ===
+    # Check for bundle first (has bundle.md or bundle.yaml)
+    if is_bundle(cache_entry):
+        module_type = "bundle"
+        # Get bundle name from its own definition
+        bundle_name = get_bundle_name(cache_entry)
+        module_id = bundle_name if bundle_name else _extract_repo_name(url)
+        display_name = bundle_name if bundle_name else module_id
+    else:
+        # Check for module (has pyproject.toml with entry points)
+        entry_id, entry_type = get_module_info_from_pyproject(cache_entry)
+        if entry_id:
+            module_id = entry_id
+            module_type = entry_type or "module"
+            display_name = entry_id
+        else:
+            # Fallback to name-based detection
+            repo_name = _extract_repo_name(url)
+            if repo_name.startswith("amplifier-module-"):
+                module_id = repo_name[len("amplifier-module-") :]
+            else:
+                module_id = repo_name
+            module_type = _infer_module_type_from_name(module_id)
+            display_name = module_id
+
+    if legacy:
+        # Older format: {hash}/{ref}/.amplifier_cache_metadata.json
+        ref = metadata.get("ref", "unknown")
+        sha = metadata.get("sha", "")[:8]
+        is_mutable = metadata.get("is_mutable", True)
+    else:
+        ref = metadata.get("ref", "main")
+        sha = metadata.get("commit", "")
+        sha = sha[:8] if sha else ""
+        is_mutable = not _is_immutable_ref(ref)
+
+    return CachedModuleInfo(
+        module_id=module_id,
+        module_type=module_type,
+        ref=ref,
+        sha=sha,
+        url=url,
+        is_mutable=is_mutable,
+        cached_at=metadata.get("cached_at", ""),
+        cache_path=cache_entry,
+        display_name=display_name,
+    )
 
-            # Skills sources (e.g. obra/superpowers) are handled separately
-            # by _refresh_skills_cache() in update.py. Including them here
-            # routes them through GitSourceHandler._verify_clone_integrity()
-            # which rejects them for lacking pyproject.toml/bundle.md.
-            if metadata.get("type") == "skills":
-                continue
 
-            url = metadata.get("git_url", "")
-            sha = metadata.get("commit", "")
-            ref = metadata.get("ref", "main")
-
-            # === STRUCTURAL TYPE DETECTION ===
-            # Check for bundle first (has bundle.md or bundle.yaml)
-            if is_bundle(cache_entry):
-                module_type = "bundle"
-                # Get bundle name from its own definition
-                bundle_name = get_bundle_name(cache_entry)
-                module_id = bundle_name if bundle_name else _extract_repo_name(url)
-                display_name = bundle_name if bundle_name else module_id
-            else:
-                # Check for module (has pyproject.toml with entry points)
-                entry_id, entry_type = get_module_info_from_pyproject(cache_entry)
-                if entry_id:
-                    module_id = entry_id
-                    module_type = entry_type or "module"
-                    display_name = entry_id
-                else:
-                    # Fallback to name-based detection
-                    repo_name = _extract_repo_name(url)
-                    if repo_name.startswith("amplifier-module-"):
-                        module_id = repo_name[len("amplifier-module-") :]
-                    else:
-                        module_id = repo_name
-                    module_type = _infer_module_type_from_name(module_id)
-                    display_name = module_id
-
-            # Apply type filter
-            if type_filter != "all" and type_filter != module_type:
-                continue
+class ModuleCacheIndex:
+    """Persistent index of cache entries, kept in step with the cache dir.
 
-            is_mutable = not _is_immutable_ref(ref)
-
-            modules.append(
-                CachedModuleInfo(
-                    module_id=module_id,
-                    module_type=module_type,
-                    ref=ref,
-                    sha=sha[:8] if sha else "",
-                    url=url,
-                    is_mutable=is_mutable,
-                    cached_at=metadata.get("cached_at", ""),
-                    cache_path=cache_entry,
-                    display_name=display_name,
-                )
-            )
-        except Exception as e:
-            logger.debug(f"Could not read metadata from {meta_file}: {e}")
-            continue
+    Scanning the cache means walking every clone and parsing its pyproject
+    or bundle files. The index records, per entry, the parsed info and the
+    (mtime_ns, size) of its metadata file, plus the mtime of every directory
+    that can hold entries. Foundation adds and removes entries without telling
+    the CLI, but creating or deleting an entry directory changes its parent's
+    mtime and re-caching rewrites the metadata file -- so a lookup costs a
+    stat per container directory (and per entry when listing), and only
+    changed directories are re-listed and changed entries re-parsed.
 
-    # Also check older format: {hash}/{ref}/.amplifier_cache_metadata.json
-    for legacy_meta in cache_dir.rglob(".amplifier_cache_metadata.json"):
-        cache_entry = legacy_meta.parent
+    Layout of ~/.amplifier/cache/module-index/index.json:
+        {"format": 1, "containers": {rel: mtime_ns}, "entries": {rel: record}}
 
-        if cache_entry in seen_paths:
-            continue
-        seen_paths.add(cache_entry)
+    Contract:
+    - Inputs: the cache directory
+    - Outputs: CachedModuleInfo for the entries under it
+    - Side Effects: Rewrites the index file when anything changed
+    - Errors: Index I/O problems are logged, never raised; an unreadable
+      index is rebuilt from the cache directory
+    """
 
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+        self.path = cache_dir / MODULE_INDEX_DIRNAME / "index.json"
+        self._containers: dict[str, int | None] = {}
+        self._entries: dict[str, dict] = {}
+        self._changed = False
+        # Entries already checked during the current call
+        self._checked: set[str] = set()
+
+    def entries(self) -> list[CachedModuleInfo]:
+        """All listed entries, sorted by display name (every entry re-checked)."""
+        if not self.cache_dir.exists():
+            return []
+        self._load()
+        self._refresh_containers()
+        for rel, record in list(self._entries.items()):
+            self._check_entry(rel, record)
+        self._save()
+        modules = [self._info(rel, record) for rel, record in self._entries.items()]
+        modules = [m for m in modules if m is not None]
+        # Sort by display_name for user-friendly output
+        modules.sort(key=lambda m: m.display_name)
+        return modules
+
+    def find(self, module_id: str) -> CachedModuleInfo | None:
+        """The entry for a module ID, re-checking only the matching entries."""
+        if not self.cache_dir.exists():
+            return None
+        self._load()
+        self._refresh_containers()
+        matches = []
+        for rel, record in list(self._entries.items()):
+            info = record.get("info") or {}
+            if info.get("module_id") != module_id:
+                continue
+            record = self._check_entry(rel, record)
+            module = self._info(rel, record) if record else None
+            if module is not None and module.module_id == module_id:
+                matches.append(module)
+        self._save()
+        matches.sort(key=lambda m: m.display_name)
+        return matches[0] if matches else None
+
+    def _load(self) -> None:
+        self._checked = set()
         try:
-            metadata = json.loads(legacy_meta.read_text(encoding="utf-8"))
-
-            # Skills sources are handled separately (see comment above)
-            if metadata.get("type") == "skills":
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = None
+        if not isinstance(data, dict) or data.get("format") != _INDEX_FORMAT:
+            self._containers, self._entries = {}, {}
+            return
+        self._containers = data.get("containers") or {}
+        self._entries = data.get("entries") or {}
+
+    def _save(self) -> None:
+        if not self._changed:
+            return
+        data = {
+            "format": _INDEX_FORMAT,
+            "containers": self._containers,
+            "entries": self._entries,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp, self.path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.debug(f"Could not write module cache index: {e}")
+        self._changed = False
+
+    def _refresh_containers(self) -> None:
+        """Re-list every container directory whose mtime changed."""
+        if "." not in self._containers:
+            self._rescan(".")
+            return
+        stale = [
+            rel
+            for rel, stamp in self._containers.items()
+            if stamp is None or _stamp(self.cache_dir / rel, dir_only=True) != stamp
+        ]
+        # A re-listed directory covers everything beneath it
+        for rel in sorted(stale, key=len):
+            if not any(_is_within(rel, other) for other in stale if other != rel):
+                self._rescan(rel)
+
+    def _rescan(self, rel: str) -> None:
+        previous = self._entries
+        self._containers = {
+            key: value
+            for key, value in self._containers.items()
+            if not _is_within(key, rel)
+        }
+        self._entries = {
+            key: value for key, value in previous.items() if not _is_within(key, rel)
+        }
+        self._changed = True
+        depth = 0 if rel == "." else rel.count("/") + 1
+        self._walk(rel, depth, previous)
+
+    def _walk(self, rel: str, depth: int, previous: dict[str, dict]) -> None:
+        directory = self.cache_dir if rel == "." else self.cache_dir / rel
+        # Stamp before listing so a change during the listing is seen next time
+        stamp = _stamp(directory, dir_only=True)
+        if stamp is None:
+            return
+        self._containers[rel] = _trusted(stamp)
+        try:
+            with os.scandir(directory) as children:
+                names = [
+                    child.name
+                    for child in children
+                    if child.is_dir(follow_symlinks=False)
+                    and not child.name.startswith(".")
+                ]
+        except OSError:
+            return
+
+        for name in sorted(names):
+            if rel == "." and name in (MODULE_INDEX_DIRNAME, GIT_STORE_DIRNAME):
                 continue
+            child_rel = name if rel == "." else f"{rel}/{name}"
+            record = self._check_entry(child_rel, previous.get(child_rel))
+            if record is None and depth + 1 < _MAX_ENTRY_DEPTH:
+                self._walk(child_rel, depth + 1, previous)
+
+    def _check_entry(self, rel: str, record: dict | None) -> dict | None:
+        """Re-parse an entry whose metadata file changed; drop it if gone."""
+        if rel in self._checked:
+            return self._entries.get(rel)
+        self._checked.add(rel)
+        directory = self.cache_dir / rel
+        for legacy, meta_name in ((False, _CACHE_META), (True, _LEGACY_CACHE_META)):
+            stamp = _stamp(directory / meta_name)
+            if stamp is not None:
+                break
+        else:
+            if self._entries.pop(rel, None) is not None:
+                self._changed = True
+            return None
+
+        if record and record.get("stamp") == stamp and record.get("legacy") == legacy:
+            self._entries[rel] = record
+            return record
+
+        info = None
+        try:
+            metadata = json.loads((directory / meta_name).read_text(encoding="utf-8"))
+            module = _read_cache_entry(directory, metadata, legacy=legacy)
+            if module is not None:
+                info = asdict(module)
+                del info["cache_path"]
+        except Exception as e:
+            logger.debug(f"Could not read metadata from {directory / meta_name}: {e}")
+        record = {"stamp": _trusted(stamp), "legacy": legacy, "info": info}
+        self._entries[rel] = record
+        self._changed = True
+        return record
 
-            url = metadata.get("url", "")
+    def _info(self, rel: str, record: dict) -> CachedModuleInfo | None:
+        info = record.get("info")
+        if not info:
+            return None
+        return CachedModuleInfo(**info, cache_path=self.cache_dir / rel)
 
-            # Use structural detection for older entries too
-            if is_bundle(cache_entry):
-                module_type = "bundle"
-                bundle_name = get_bundle_name(cache_entry)
-                module_id = bundle_name if bundle_name else _extract_repo_name(url)
-                display_name = bundle_name if bundle_name else module_id
-            else:
-                entry_id, entry_type = get_module_info_from_pyproject(cache_entry)
-                if entry_id:
-                    module_id = entry_id
-                    module_type = entry_type or "module"
-                    display_name = entry_id
-                else:
-                    repo_name = _extract_repo_name(url)
-                    if repo_name.startswith("amplifier-module-"):
-                        module_id = repo_name[len("amplifier-module-") :]
-                    else:
-                        module_id = repo_name
-                    module_type = _infer_module_type_from_name(module_id)
-                    display_name = module_id
-
-            if type_filter != "all" and type_filter != module_type:
-                continue
 
-            modules.append(
-                CachedModuleInfo(
-                    module_id=module_id,
-                    module_type=module_type,
-                    ref=metadata.get("ref", "unknown"),
-                    sha=metadata.get("sha", "")[:8],
-                    url=url,
-                    is_mutable=metadata.get("is_mutable", True),
-                    cached_at=metadata.get("cached_at", ""),
-                    cache_path=cache_entry,
-                    display_name=display_name,
-                )
-            )
-        except Exception as e:
-            logger.debug(f"Could not read metadata from {legacy_meta}: {e}")
-            continue
+def _stamp(path: Path, *, dir_only: bool = False) -> int | list[int] | None:
+    """mtime_ns (directories) or [mtime_ns, size] (files); None if missing."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns if dir_only else [st.st_mtime_ns, st.st_size]
+
+
+def _trusted(stamp: int | list[int]) -> int | list[int] | None:
+    """The stamp to record, or None if it is too recent to be trusted."""
+    mtime = stamp if isinstance(stamp, int) else stamp[0]
+    return stamp if time.time_ns() - mtime >= _RACY_WINDOW_NS else None
 
-    # Sort by display_name for user-friendly output
-    modules.sort(key=lambda m: m.display_name)
-    return modules
+
+def _is_within(rel: str, ancestor: str) -> bool:
+    return ancestor == "." or rel == ancestor or rel.startswith(ancestor + "/")
 
 
 def _is_immutable_ref(ref: str) -> bool:
@@ -388,10 +551,7 @@ def find_cached_module(module_id: str) -> CachedModuleInfo | None:
     Returns:
         CachedModuleInfo if found, None otherwise
     """
-    for module in scan_cached_modules():
-        if module.module_id == module_id:
-            return module
-    return None
+    return ModuleCacheIndex(get_cache_dir()).find(module_id)
 
 
 def clear_module_cache(
@@ -483,6 +643,30 @@ async def update_module(
     Returns:
         Path to the newly downloaded module
     """
+    paths = await update_repository(url, [ref], progress_callback=progress_callback)
+    return paths[0]
+
+
+async def update_repository(
+    url: str,
+    refs: list[str],
+    progress_callback: Callable[[str, str], None] | None = None,
+) -> list[Path]:
+    """Clear a repository's cache entries once, then re-download each ref.
+
+    Clearing is per module, across refs, so updating several refs of one
+    repository must clear before the first download rather than between them.
+    Afterwards the repository's checkouts share one git object store (see
+    git_store.share_objects).
+
+    Args:
+        url: Git repository URL
+        refs: Git refs (branch, tag, or SHA) to download, in order
+        progress_callback: Optional callback(module_id, status) for progress
+
+    Returns:
+        Path to each newly downloaded ref, in the order of ``refs``
+    """
     from amplifier_foundation.sources import SimpleSourceResolver
 
     repo_name = _extract_repo_name(url)
@@ -501,18 +685,34 @@ async def update_module(
     # Clear existing cache for this module
     clear_module_cache(module_id=module_id)
 
-    # Report progress: downloading
-    if progress_callback:
-        progress_callback(module_id, "downloading")
-
-    # Build git URI in foundation format (git+url@ref)
-    uri = f"git+{url}@{ref}"
-
     # Use foundation's resolver (creates proper .git directory via git clone)
     cache_dir = get_cache_dir()
     resolver = SimpleSourceResolver(cache_dir=cache_dir)
-    result = await resolver.resolve(uri)
 
-    logger.debug(f"Updated {module_id}@{ref} to {result.active_path}")
+    paths = []
+    for ref in refs:
+        # Report progress: downloading
+        if progress_callback:
+            progress_callback(module_id, "downloading")
+
+        # Build git URI in foundation format (git+url@ref)
+        result = await resolver.resolve(f"git+{url}@{ref}")
+        logger.debug(f"Updated {module_id}@{ref} to {result.active_path}")
+        paths.append(result.active_path)
+
+    # Fresh clones, and older entries of the same repository that are not
+    # linked yet, borrow their objects from one shared store
+    url_key = _normalized_url(url)
+    for path in paths + [
+        module.cache_path
+        for module in scan_cached_modules()
+        if module.url and _normalized_url(module.url) == url_key
+    ]:
+        share_objects(url, path)
+
+    return paths
+
 
-    return result.active_path
+def _normalized_url(url: str) -> str:
+    url = url.rstrip("/")
+    return (url[:-4] if url.endswith(".git") else url).lower()
@@ -4,10 +4,15 @@ Philosophy: One settings file prevents proliferation, maintains simplicity.
 """
 
 import logging
+import os
+import tempfile
 from datetime import datetime
 from pathlib import Path
 
 import yaml
+from filelock import FileLock
+
+from ..lib.settings import settings_file_cache
 
 logger = logging.getLogger(__name__)
 
@@ -28,12 +33,11 @@ def load_settings() -> dict:
     Creates file with defaults if it doesn't exist.
     """
     if not SETTINGS_FILE.exists():
-        # Create directory if needed
-        SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write defaults
-        with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-            yaml.safe_dump(DEFAULT_SETTINGS, f, default_flow_style=False, sort_keys=False)
+        # Never clobber a file another writer created in the meantime
+        try:
+            _write_settings_file(DEFAULT_SETTINGS, replace=False)
+        except Exception as e:
+            logger.debug(f"Could not create {SETTINGS_FILE}: {e}")
 
         return DEFAULT_SETTINGS.copy()
 
@@ -51,13 +55,39 @@ def load_settings() -> dict:
         return DEFAULT_SETTINGS.copy()
 
 
+def _settings_lock() -> FileLock:
+    """The advisory lock AppSettings takes for the global scope (same file)."""
+    SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    return FileLock(str(SETTINGS_FILE) + ".lock", timeout=10)
+
+
+def _write_settings_file(settings: dict, *, replace: bool = True) -> None:
+    """Write settings atomically so concurrent readers never see a partial file.
+
+    With replace=False the file is only created if it does not exist yet.
+    """
+    SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=SETTINGS_FILE.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            yaml.safe_dump(settings, f, default_flow_style=False, sort_keys=False)
+        if replace:
+            os.replace(tmp, SETTINGS_FILE)
+        else:
+            try:
+                os.link(tmp, SETTINGS_FILE)
+            except FileExistsError:
+                pass
+    finally:
+        Path(tmp).unlink(missing_ok=True)
+        settings_file_cache.invalidate(SETTINGS_FILE)
+
+
 def save_settings(settings: dict):
     """Save settings to ~/.amplifier/settings.yaml."""
     try:
-        SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-            yaml.safe_dump(settings, f, default_flow_style=False, sort_keys=False)
+        with _settings_lock():
+            _write_settings_file(settings)
     except Exception as e:
         logger.error(f"Could not save settings to {SETTINGS_FILE}: {e}")
 
@@ -69,7 +99,15 @@ def get_update_settings() -> dict:
 
 
 def save_update_last_check(timestamp: datetime):
-    """Update last_check timestamp in settings."""
-    settings = load_settings()
-    settings["updates"]["last_check"] = timestamp.isoformat()
-    save_settings(settings)
+    """Update last_check timestamp in settings.
+
+    Holds the settings lock across the read-modify-write so a concurrent
+    locked writer's changes are not overwritten.
+    """
+    try:
+        with _settings_lock():
+            settings = load_settings()
+            settings["updates"]["last_check"] = timestamp.isoformat()
+            _write_settings_file(settings)
+    except Exception as e:
+        logger.error(f"Could not save settings to {SETTINGS_FILE}: {e}")
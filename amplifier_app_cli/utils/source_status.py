@@ -9,14 +9,20 @@ import json
 import logging
 import re
 import subprocess
+import time
 from dataclasses import dataclass
 from dataclasses import field
 from pathlib import Path
 
 import httpx  # Fail fast if missing - required for GitHub Atom feeds
 
+from .http_cache import cached_get
+
 logger = logging.getLogger(__name__)
 
+# Remote SHA lookups in flight at once (updates.check_concurrency in settings)
+DEFAULT_CHECK_CONCURRENCY = 8
+
 
 @dataclass
 class LocalFileStatus:
@@ -58,6 +64,17 @@ class CachedGitStatus:
     age_days: int = 0
 
 
+@dataclass
+class RemoteCheckTiming:
+    """One remote SHA request made during an update check."""
+
+    url: str
+    ref: str
+    seconds: float = 0.0
+    sources: int = 1  # Sources answered by this one request
+    error: str | None = None
+
+
 @dataclass
 class UpdateReport:
     """Comprehensive update status for all sources."""
@@ -65,6 +82,7 @@ class UpdateReport:
     local_file_sources: list[LocalFileStatus]
     cached_git_sources: list[CachedGitStatus]
     cached_modules_checked: int = 0  # How many cache entries were examined
+    remote_checks: list[RemoteCheckTiming] = field(default_factory=list)
 
     @property
     def has_updates(self) -> bool:
@@ -88,18 +106,85 @@ class UpdateReport:
         )
 
 
+class RemoteShaLookup:
+    """Bounded, deduplicated remote SHA lookups for one update check.
+
+    Every source and cached module asks for the SHA of a (repo, ref). Several
+    modules from one repo share a single request, and at most
+    ``max_concurrency`` requests run at once over the shared client.
+
+    Contract:
+    - Inputs: repo URL and ref per lookup
+    - Outputs: the remote commit SHA; per-request timings via ``timings``
+    - Side Effects: HTTP requests through the shared client
+    - Errors: Request errors propagate to every caller sharing the request
+    """
+
+    def __init__(self, client: httpx.AsyncClient, max_concurrency: int) -> None:
+        self.client = client
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._requests: dict[tuple[str, str], asyncio.Future[str]] = {}
+        self._timings: dict[tuple[str, str], RemoteCheckTiming] = {}
+
+    @property
+    def timings(self) -> list[RemoteCheckTiming]:
+        return list(self._timings.values())
+
+    async def get_sha(self, repo_url: str, ref: str) -> str:
+        key = (_repo_key(repo_url), ref)
+        request = self._requests.get(key)
+        if request is None:
+            self._timings[key] = RemoteCheckTiming(url=repo_url, ref=ref)
+            request = asyncio.ensure_future(self._fetch(key, repo_url, ref))
+            self._requests[key] = request
+        else:
+            self._timings[key].sources += 1
+        return await request
+
+    async def _fetch(self, key: tuple[str, str], repo_url: str, ref: str) -> str:
+        async with self._semaphore:
+            timing = self._timings[key]
+            start = time.perf_counter()
+            try:
+                return await _get_github_commit_sha(self.client, repo_url, ref)
+            except Exception as e:
+                timing.error = type(e).__name__
+                raise
+            finally:
+                timing.seconds = time.perf_counter() - start
+
+
+def create_check_client(timeout: float = 10.0) -> httpx.AsyncClient:
+    """HTTP client for update checks, using HTTP/2 when h2 is installed."""
+    try:
+        import h2  # noqa: F401
+
+        http2 = True
+    except ImportError:
+        http2 = False
+    return httpx.AsyncClient(timeout=timeout, http2=http2)
+
+
 async def check_all_sources(
-    client: httpx.AsyncClient, include_all_cached: bool = False, force: bool = False
+    client: httpx.AsyncClient,
+    include_all_cached: bool = False,
+    force: bool = False,
+    max_concurrency: int | None = None,
 ) -> UpdateReport:
     """Check all libraries and modules for updates.
 
     Uses source-granular approach - checks each entity independently.
     Uses existing StandardModuleSourceResolver infrastructure.
 
+    Sources and cached modules are checked concurrently; remote SHA requests
+    are deduplicated by (repo, ref) and bounded by ``max_concurrency``.
+
     Args:
         client: Shared httpx client for all HTTP requests
         include_all_cached: Include all cached modules, not just active ones
         force: When True, include ALL sources for forced update (skip SHA comparison)
+        max_concurrency: Remote requests in flight at once (default: the
+            updates.check_concurrency setting, else DEFAULT_CHECK_CONCURRENCY)
 
     Returns:
         UpdateReport with all source statuses
@@ -107,46 +192,53 @@ async def check_all_sources(
     from amplifier_app_cli.lib.sources_compat import FileSource
     from amplifier_app_cli.lib.sources_compat import GitSource
 
+    lookup = RemoteShaLookup(client, max_concurrency or _configured_concurrency())
+
     # Get all sources to check
     all_sources = await _get_all_sources_to_check(client)
 
-    local_statuses = []
-    git_statuses = []
-
-    # Resolve each source independently
-    for name, source_info in all_sources.items():
+    async def check_source(name: str, source_info: dict):
         source = source_info["source"]
         layer = source_info["layer"]
 
         try:
             if isinstance(source, FileSource):
-                status = await _check_file_source(client, source, name, layer)
-                local_statuses.append(status)
+                return await _check_file_source(lookup, source, name, layer)
 
-            elif isinstance(source, GitSource):
-                status = await _check_git_source(
-                    client, source, name, layer, force=force
+            if isinstance(source, GitSource):
+                return await _check_git_source(
+                    lookup, source, name, layer, force=force
                 )
-                if status:  # Add ALL cached sources (with has_update flag)
-                    git_statuses.append(status)
 
             # PackageSource: skip (can't check for updates)
 
         except Exception as e:
             logger.debug(f"Failed to check {name}: {e}")
-            continue
+        return None
 
-    # If include_all_cached, also scan ALL cached modules (not just active)
-    cached_modules_checked = 0
-    if include_all_cached:
-        cached_statuses, cached_modules_checked = await _check_all_cached_modules(
-            client, force=force
-        )
-        # Add any not already in git_statuses (avoid duplicates from active bundle)
-        existing_names = {s.name for s in git_statuses}
-        for status in cached_statuses:
-            if status.name not in existing_names:
-                git_statuses.append(status)
+    async def check_cached() -> tuple[list[CachedGitStatus], int]:
+        # If include_all_cached, also scan ALL cached modules (not just active)
+        if not include_all_cached:
+            return [], 0
+        return await _check_all_cached_modules(lookup, force=force)
+
+    # Resolve each source independently
+    source_results, (cached_statuses, cached_modules_checked) = await asyncio.gather(
+        asyncio.gather(
+            *(check_source(name, info) for name, info in all_sources.items())
+        ),
+        check_cached(),
+    )
+
+    local_statuses = [s for s in source_results if isinstance(s, LocalFileStatus)]
+    # Add ALL cached sources (with has_update flag)
+    git_statuses = [s for s in source_results if isinstance(s, CachedGitStatus)]
+
+    # Add any not already in git_statuses (avoid duplicates from active bundle)
+    existing_names = {s.name for s in git_statuses}
+    for status in cached_statuses:
+        if status.name not in existing_names:
+            git_statuses.append(status)
 
     # Filter out cached sources that have local overrides (local takes precedence)
     local_override_names = {s.name for s in local_statuses}
@@ -156,9 +248,22 @@ async def check_all_sources(
         local_file_sources=local_statuses,
         cached_git_sources=git_statuses,
         cached_modules_checked=cached_modules_checked,
+        remote_checks=lookup.timings,
     )
 
 
+def _configured_concurrency() -> int:
+    """updates.check_concurrency from settings, else the default."""
+    try:
+        from ..lib.settings import AppSettings
+
+        updates = AppSettings().get_merged_settings().get("updates") or {}
+        value = int(updates.get("check_concurrency", DEFAULT_CHECK_CONCURRENCY))
+    except Exception:
+        return DEFAULT_CHECK_CONCURRENCY
+    return value if value > 0 else DEFAULT_CHECK_CONCURRENCY
+
+
 async def _get_all_sources_to_check(client: httpx.AsyncClient) -> dict[str, dict]:
     """Get all libraries and modules with their resolved sources.
 
@@ -192,7 +297,7 @@ async def _get_all_sources_to_check(client: httpx.AsyncClient) -> dict[str, dict
 
 
 async def _check_file_source(
-    client: httpx.AsyncClient, source, name: str, layer: str
+    lookup: RemoteShaLookup, source, name: str, layer: str
 ) -> LocalFileStatus:
     """Check local file source for updates.
 
@@ -201,7 +306,7 @@ async def _check_file_source(
     - Remote comparison (if has remote URL)
 
     Args:
-        client: Shared httpx client for all HTTP requests
+        lookup: Shared remote SHA lookup for this check
     """
 
     local_path = source.path
@@ -232,9 +337,7 @@ async def _check_file_source(
             # Get current branch
             current_branch = await asyncio.to_thread(_get_current_branch, local_path)
             if current_branch:
-                remote_sha = await _get_github_commit_sha(
-                    client, remote_url, current_branch
-                )
+                remote_sha = await lookup.get_sha(remote_url, current_branch)
 
                 if remote_sha != local_sha:
                     status.remote_sha = remote_sha[:7]
@@ -248,14 +351,14 @@ async def _check_file_source(
 
 
 async def _check_git_source(
-    client: httpx.AsyncClient, source, name: str, layer: str, force: bool = False
+    lookup: RemoteShaLookup, source, name: str, layer: str, force: bool = False
 ) -> CachedGitStatus | None:
     """Check cached git source for updates.
 
     Compares cached SHA with remote SHA.
 
     Args:
-        client: Shared httpx client for all HTTP requests
+        lookup: Shared remote SHA lookup for this check
         source: GitSource to check
         name: Module name
         layer: Resolution layer
@@ -290,7 +393,7 @@ async def _check_git_source(
             return None
 
         # Check remote
-        remote_sha = await _get_github_commit_sha(client, source.url, source.ref)
+        remote_sha = await lookup.get_sha(source.url, source.ref)
 
         # Return ALL cached sources (not just those with updates)
         has_update = (remote_sha != cached_sha) or force
@@ -417,14 +520,15 @@ def _count_commits_behind(repo_path: Path) -> int:
 
 
 async def _check_all_cached_modules(
-    client: httpx.AsyncClient, force: bool = False
+    lookup: RemoteShaLookup, force: bool = False
 ) -> tuple[list[CachedGitStatus], int]:
     """Check ALL cached modules for updates (not just active ones).
 
     Uses centralized scan_cached_modules() utility for DRY compliance.
+    Modules are checked concurrently through the shared lookup.
 
     Args:
-        client: Shared httpx client for all HTTP requests
+        lookup: Shared remote SHA lookup for this check
         force: When True, include all cached modules even if up to date
 
     Returns:
@@ -433,7 +537,7 @@ async def _check_all_cached_modules(
     from .module_cache import scan_cached_modules
 
     # Get all cached modules using centralized utility
-    cached_modules = scan_cached_modules()
+    cached_modules = await asyncio.to_thread(scan_cached_modules)
 
     # Filter out bundles (handled by update_bundle) and skills sources
     # (handled by _refresh_skills_cache). Both would fail module validation:
@@ -445,83 +549,86 @@ async def _check_all_cached_modules(
     if not cached_modules:
         return [], 0
 
-    statuses = []
-    modules_checked = len(cached_modules)
+    results = await asyncio.gather(
+        *(_check_cached_module(lookup, module, force) for module in cached_modules)
+    )
+    statuses = [status for status in results if status is not None]
+    return statuses, len(cached_modules)
 
-    for module in cached_modules:
-        # Skip immutable refs
-        if not module.is_mutable:
-            continue
 
-        # Must have url and ref to check for updates (sha may be missing from old cache)
-        if not module.url or not module.ref:
-            logger.debug(f"Skipping {module.module_id}: missing url or ref")
-            continue
+async def _check_cached_module(
+    lookup: RemoteShaLookup, module, force: bool
+) -> CachedGitStatus | None:
+    """Check one cached module against its remote; None if skipped or failed."""
+    # Skip immutable refs
+    if not module.is_mutable:
+        return None
 
-        try:
-            # Check remote SHA
-            remote_sha = await _get_github_commit_sha(client, module.url, module.ref)
-
-            # Add ALL cached modules (with has_update flag)
-            # Note: module.sha is already truncated to 8 chars by scan_cached_modules
-            # If cached SHA is missing (old cache format), consider it as needing update
-            if not module.sha:
-                has_update = True
-                cached_sha_display = "unknown"
-                logger.debug(
-                    f"{module.module_id}: missing cached SHA, marking as update available"
-                )
-            else:
-                has_update = (remote_sha[:8] != module.sha) or force
-                cached_sha_display = module.sha[:7]
-
-            statuses.append(
-                CachedGitStatus(
-                    name=module.module_id,
-                    url=module.url,
-                    ref=module.ref,
-                    layer="cache",
-                    cached_sha=cached_sha_display,  # Consistent 7 chars for display comparison
-                    remote_sha=remote_sha[:7],
-                    has_update=has_update,
-                    age_days=_cache_age_days_from_string(module.cached_at),
-                )
+    # Must have url and ref to check for updates (sha may be missing from old cache)
+    if not module.url or not module.ref:
+        logger.debug(f"Skipping {module.module_id}: missing url or ref")
+        return None
+
+    try:
+        # Check remote SHA
+        remote_sha = await lookup.get_sha(module.url, module.ref)
+
+        # Add ALL cached modules (with has_update flag)
+        # Note: module.sha is already truncated to 8 chars by scan_cached_modules
+        # If cached SHA is missing (old cache format), consider it as needing update
+        if not module.sha:
+            has_update = True
+            cached_sha_display = "unknown"
+            logger.debug(
+                f"{module.module_id}: missing cached SHA, marking as update available"
             )
+        else:
+            has_update = (remote_sha[:8] != module.sha) or force
+            cached_sha_display = module.sha[:7]
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code in (403, 404):
-                # 404: private repo, or GitHub returning 404 for rate-limited
-                #      unauthenticated Atom feed requests (documented behavior)
-                # 403: explicit rate limit response from GitHub
-                auth_available = bool(_get_github_auth_headers())
-                if auth_available:
-                    # Auth is configured but still failing — likely rate limited
-                    # or a transient issue; not a missing-token problem.
-                    logger.warning(
-                        f"Skipping {module.module_id} "
-                        f"(temporarily unavailable — GitHub may be rate limiting)"
-                    )
-                else:
-                    logger.warning(
-                        f"Skipping {module.module_id} "
-                        f"(private repo or rate limited — set GITHUB_TOKEN or run "
-                        f"gh auth login for higher rate limits)"
-                    )
+        return CachedGitStatus(
+            name=module.module_id,
+            url=module.url,
+            ref=module.ref,
+            layer="cache",
+            cached_sha=cached_sha_display,  # Consistent 7 chars for display comparison
+            remote_sha=remote_sha[:7],
+            has_update=has_update,
+            age_days=_cache_age_days_from_string(module.cached_at),
+        )
+
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code in (403, 404):
+            # 404: private repo, or GitHub returning 404 for rate-limited
+            #      unauthenticated Atom feed requests (documented behavior)
+            # 403: explicit rate limit response from GitHub
+            auth_available = bool(_get_github_auth_headers())
+            if auth_available:
+                # Auth is configured but still failing — likely rate limited
+                # or a transient issue; not a missing-token problem.
+                logger.warning(
+                    f"Skipping {module.module_id} "
+                    f"(temporarily unavailable — GitHub may be rate limiting)"
+                )
             else:
-                logger.warning(f"Could not check {module.module_id}: {e}")
-            continue
-        except (httpx.HTTPError, httpx.TimeoutException) as e:
-            # Network/timeout errors - log but continue checking other modules
+                logger.warning(
+                    f"Skipping {module.module_id} "
+                    f"(private repo or rate limited — set GITHUB_TOKEN or run "
+                    f"gh auth login for higher rate limits)"
+                )
+        else:
             logger.warning(f"Could not check {module.module_id}: {e}")
-            continue
-        except Exception as e:
-            # Unexpected errors - log at ERROR and continue
-            logger.error(
-                f"Unexpected error checking {module.module_id}: {type(e).__name__}: {e}"
-            )
-            continue
-
-    return statuses, modules_checked
+        return None
+    except (httpx.HTTPError, httpx.TimeoutException) as e:
+        # Network/timeout errors - log but continue checking other modules
+        logger.warning(f"Could not check {module.module_id}: {e}")
+        return None
+    except Exception as e:
+        # Unexpected errors - log at ERROR and continue
+        logger.error(
+            f"Unexpected error checking {module.module_id}: {type(e).__name__}: {e}"
+        )
+        return None
 
 
 def _cache_age_days(metadata: dict) -> int:
@@ -546,6 +653,15 @@ def _cache_age_days_from_string(cached_at: str) -> int:
 # GitHub API helpers (exposed for update_check.py)
 
 
+def _repo_key(repo_url: str) -> str:
+    """Normalized owner/repo for a GitHub URL, so URL variants share requests."""
+    url_clean = repo_url[:-4] if repo_url.endswith(".git") else repo_url
+    parts = url_clean.rstrip("/").split("github.com/")[-1].split("/")
+    if len(parts) < 2:
+        return repo_url
+    return f"{parts[0]}/{parts[1]}".lower()
+
+
 async def _get_github_commit_sha(
     client: httpx.AsyncClient, repo_url: str, ref: str
 ) -> str:
@@ -574,7 +690,7 @@ async def _get_github_commit_sha(
     # (60 req/hr). Authenticated requests get 5,000 req/hr. Falls back gracefully
     # to no-auth when GITHUB_TOKEN is unset and gh auth login hasn't been run.
     auth_headers = _get_github_auth_headers()
-    response = await client.get(atom_url, headers=auth_headers)
+    response = await cached_get(client, atom_url, headers=auth_headers)
     response.raise_for_status()
 
     # Parse XML for first commit SHA
@@ -604,7 +720,8 @@ async def _get_commit_details(
 
     owner, repo = parts[0], parts[1]
 
-    response = await client.get(
+    response = await cached_get(
+        client,
         f"https://api.github.com/repos/{owner}/{repo}/commits/{sha}",
         headers={
             "Accept": "application/vnd.github.v3+json",
@@ -3,20 +3,28 @@
 Philosophy: Simple, non-blocking, user-controllable.
 """
 
+import asyncio
+import atexit
 import logging
+import threading
+from collections.abc import Callable
 from datetime import datetime
 
-import httpx
 from rich.console import Console
 
 from .settings_manager import DEFAULT_SETTINGS
 from .settings_manager import get_update_settings
 from .settings_manager import save_update_last_check
 from .source_status import check_all_sources
+from .source_status import create_check_client
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# How long interpreter exit waits for a check still in flight, so a check that
+# finishes just after the session still gets its time saved
+EXIT_JOIN_TIMEOUT_S = 0.5
+
 
 def should_check_on_startup() -> bool:
     """Decide if we should check based on frequency settings.
@@ -46,33 +54,167 @@ def should_check_on_startup() -> bool:
         return True
 
 
-async def check_and_notify():
+async def check_and_notify(
+    *,
+    notify: bool = True,
+    on_checked: Callable[[datetime], None] = save_update_last_check,
+) -> bool:
     """Check for updates and notify user if available.
 
     Philosophy: Non-blocking, graceful failure, visible when updates exist.
+
+    Args:
+        notify: Show the progress spinner and the "updates available" notice.
+            The background startup check passes False and prints the notice
+            itself once the user reaches a prompt.
+        on_checked: Receives the check time (default: persist it). The
+            background check records it and persists from the main thread,
+            so the worker never writes settings.yaml.
+
+    Returns:
+        True if updates are available
     """
     if not should_check_on_startup():
-        return
+        return False
 
+    has_updates = False
     try:
         # Check all sources including cached modules (show progress indicator)
         # Use single shared httpx client to avoid cleanup race conditions
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            with console.status("[dim]Checking for updates...[/dim]", spinner="dots"):
+        async with create_check_client() as client:
+            if notify:
+                with console.status("[dim]Checking for updates...[/dim]", spinner="dots"):
+                    report = await check_all_sources(client=client, include_all_cached=True)
+            else:
                 report = await check_all_sources(client=client, include_all_cached=True)
 
-        if report.has_updates:
-            console.print()
-            console.print(
-                "[bold yellow]⚡ Updates available![/bold yellow] Run [cyan]amplifier update[/cyan] to install."
-            )
-            console.print()
+        has_updates = report.has_updates
+        if has_updates and notify:
+            print_update_notice(console)
 
         # Save check time even if no updates (respect frequency)
-        save_update_last_check(datetime.now())
+        on_checked(datetime.now())
 
     except Exception as e:
         # Silently fail - don't disrupt startup
         logger.debug(f"Startup update check failed: {e}")
         # Still save timestamp to avoid spam retries
-        save_update_last_check(datetime.now())
+        on_checked(datetime.now())
+
+    return has_updates
+
+
+def print_update_notice(console_arg: Console) -> None:
+    """Print the "updates available" notice."""
+    console_arg.print()
+    console_arg.print(
+        "[bold yellow]⚡ Updates available![/bold yellow] Run [cyan]amplifier update[/cyan] to install."
+    )
+    console_arg.print()
+
+
+class BackgroundUpdateCheck:
+    """Startup update check on a daemon thread, off the critical path.
+
+    Contract:
+    - Inputs: none (frequency and opt-out come from settings, as before)
+    - Outputs: ``pending_notice()`` is True once the check has finished and
+      found updates that have not been announced yet
+    - Side Effects: Network requests on the worker thread; never prints
+      from it. The last-check timestamp is only recorded there and written
+      by ``persist_last_check()`` on the main thread, so the worker never
+      races the session's own settings reads and writes
+    - Errors: Failures are logged at debug level and treated as "no updates"
+    """
+
+    def __init__(self) -> None:
+        self._thread: threading.Thread | None = None
+        self._has_updates = False
+        self._announced = False
+        self._checked_at: datetime | None = None
+
+    def start(self) -> None:
+        # Resolve the coroutine function now, on the caller's thread
+        check = check_and_notify
+        self._thread = threading.Thread(
+            target=self._run, args=(check,), name="amplifier-update-check", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, check) -> None:
+        try:
+            self._has_updates = asyncio.run(check(notify=False, on_checked=self._record)) is True
+        except Exception as e:
+            logger.debug(f"Background update check failed: {e}")
+
+    def _record(self, timestamp: datetime) -> None:
+        self._checked_at = timestamp
+
+    def persist_last_check(self) -> None:
+        """Write the recorded check time (main thread only; at most once)."""
+        timestamp, self._checked_at = self._checked_at, None
+        if timestamp is not None:
+            save_update_last_check(timestamp)
+
+    def finish(self, timeout: float = EXIT_JOIN_TIMEOUT_S) -> None:
+        """Wait up to ``timeout`` for the check, then persist its time (main thread)."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self.done:
+            self.persist_last_check()
+
+    @property
+    def done(self) -> bool:
+        return self._thread is not None and not self._thread.is_alive()
+
+    def pending_notice(self) -> bool:
+        """True once (per check) when finished updates should be announced."""
+        if self._announced or not self.done or not self._has_updates:
+            return False
+        self._announced = True
+        return True
+
+
+_background_check: BackgroundUpdateCheck | None = None
+
+
+def start_background_check() -> BackgroundUpdateCheck:
+    """Start the startup update check without waiting for it.
+
+    Registers an exit hook (once per process) that gives a check still in
+    flight a short bounded wait and then saves its time, whatever the output
+    format and however the run ends.
+    """
+    global _background_check
+    if _background_check is None:
+        atexit.register(_finish_at_exit)
+    _background_check = BackgroundUpdateCheck()
+    _background_check.start()
+    return _background_check
+
+
+def _finish_at_exit() -> None:
+    if _background_check is not None:
+        _background_check.finish()
+
+
+def persist_finished_check() -> None:
+    """Save the check time if the background check has finished (never waits)."""
+    if _background_check is not None and _background_check.done:
+        _background_check.persist_last_check()
+
+
+def notify_if_updates(console_arg: Console | None = None) -> bool:
+    """Print the notice if the background check has found updates (never waits).
+
+    Called where output does not interrupt the user: after the session banner,
+    before each REPL prompt, after single-shot output. Also persists the
+    check time once the check has finished. Returns True if printed.
+    """
+    if _background_check is None:
+        return False
+    persist_finished_check()
+    if not _background_check.pending_notice():
+        return False
+    print_update_notice(console_arg or console)
+    return True
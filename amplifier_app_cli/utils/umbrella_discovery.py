@@ -13,6 +13,8 @@ from dataclasses import dataclass
 
 import httpx  # Fail fast if missing - required for fetching umbrella dependencies
 
+from .http_cache import cached_get
+
 logger = logging.getLogger(__name__)
 
 
@@ -195,7 +197,7 @@ async def fetch_umbrella_dependencies(
 
     logger.debug(f"Fetching umbrella pyproject.toml from: {raw_url}")
 
-    response = await client.get(raw_url)
+    response = await cached_get(client, raw_url)
     response.raise_for_status()
 
     # Parse TOML
@@ -262,7 +264,7 @@ async def discover_ecosystem_packages(
         raw_url = f"https://raw.githubusercontent.com/{github_org}/{repo_name}/{ref}/pyproject.toml"
 
         try:
-            response = await client.get(raw_url)
+            response = await cached_get(client, raw_url)
             response.raise_for_status()
             config = tomllib.loads(response.text)
             sources = config.get("tool", {}).get("uv", {}).get("sources", {})
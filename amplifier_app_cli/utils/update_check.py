@@ -13,6 +13,7 @@ import httpx
 
 from .source_status import UpdateReport
 from .source_status import check_all_sources
+from .source_status import create_check_client
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +38,7 @@ async def check_updates(include_all_cached: bool = False) -> UpdateReport:
     Returns:
         UpdateReport with all source statuses
     """
-    async with httpx.AsyncClient(timeout=10.0) as client:
+    async with create_check_client() as client:
         return await check_all_sources(client=client, include_all_cached=include_all_cached)
 
 
@@ -55,7 +56,7 @@ async def check_updates_background() -> UpdateReport | None:
         return None
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with create_check_client() as client:
             result = await check_all_sources(client=client)
         _save_cached_result(result)
         _mark_checked()
@@ -4,10 +4,12 @@ Philosophy: Orchestrate, don't reimplement. Delegate to uv and existing commands
 Selective updates: Only update modules that actually have updates, then re-download.
 """
 
+import asyncio
 import logging
 import os
 import re
 import subprocess
+import sys
 import threading
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -23,6 +25,9 @@ from .uv_utils import remove_stale_uv_lock
 
 logger = logging.getLogger(__name__)
 
+# Repositories fetched at the same time by execute_selective_module_update
+DEFAULT_UPDATE_WORKERS = 4
+
 
 @dataclass
 class ExecutionResult:
@@ -38,21 +43,31 @@ class ExecutionResult:
 async def execute_selective_module_update(
     modules_to_update: list[CachedGitStatus],
     progress_callback: Callable[[str, str], None] | None = None,
+    max_workers: int = DEFAULT_UPDATE_WORKERS,
 ) -> ExecutionResult:
     """Selectively update only modules that have updates.
 
     Philosophy: Only update what needs updating, then re-download immediately.
     Uses centralized module_cache utilities for DRY compliance.
 
+    Modules are grouped by repository so each repository is cleared and
+    fetched once, by up to ``max_workers`` workers in parallel. Dependencies
+    of the updated modules are then installed with a single uv invocation.
+    A failed dependency install does not fail the update: the modules'
+    dependencies are installed again when they are next activated.
+
     Args:
         modules_to_update: List of CachedGitStatus with has_update=True
-        progress_callback: Optional callback(module_name, status) for progress reporting
+        progress_callback: Optional callback(module_name, status) for progress
+            reporting. Always called on the caller's thread.
+        max_workers: Repositories updated at the same time
 
     Returns:
         ExecutionResult with per-module success/failure
     """
     from .module_cache import find_cached_module
-    from .module_cache import update_module
+    from .module_cache import update_repository
+    from .source_status import _repo_key
 
     if not modules_to_update:
         return ExecutionResult(
@@ -60,57 +75,157 @@ async def execute_selective_module_update(
             messages=["No modules need updating"],
         )
 
-    updated = []
     failed = []
     errors = {}
 
+    # Repository key -> (url, {ref: [module names]})
+    repositories: dict[str, tuple[str, dict[str, list[str]]]] = {}
     for status in modules_to_update:
         module_name = status.name
-        if progress_callback:
-            progress_callback(module_name, "updating")
-
-        try:
-            # Use URL and ref from status if available
-            if status.url and status.ref:
-                logger.debug(f"Updating {module_name} from {status.url}@{status.ref}")
-                await update_module(
-                    url=status.url, ref=status.ref, progress_callback=progress_callback
+        url, ref = status.url, status.ref
+        if not (url and ref):
+            # Fallback: find module by name to get URL and ref
+            cached = find_cached_module(module_name)
+            if not cached:
+                failed.append(module_name)
+                errors[module_name] = "Could not find cache entry"
+                continue
+            url, ref = cached.url, cached.ref
+        _url, refs = repositories.setdefault(_repo_key(url), (url, {}))
+        refs.setdefault(ref, []).append(module_name)
+
+    report = _thread_safe_callback(progress_callback)
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+    # Module name -> (ref, new cache path) for every module that updated
+    updated_paths: dict[str, tuple[str, Path]] = {}
+
+    async def update_one(url: str, refs: dict[str, list[str]]) -> None:
+        async with semaphore:
+            names = [name for ref_names in refs.values() for name in ref_names]
+            for module_name in names:
+                report(module_name, "updating")
+            logger.debug(f"Updating {', '.join(names)} from {url}@{','.join(refs)}")
+            try:
+                # Own thread and event loop, so clearing and cloning overlap
+                # even where they block
+                paths = await asyncio.to_thread(
+                    asyncio.run,
+                    update_repository(url, list(refs), progress_callback=report),
                 )
-                updated.append(f"{module_name}@{status.ref}")
-                if progress_callback:
-                    progress_callback(module_name, "done")
-            else:
-                # Fallback: find module by name to get URL and ref
-                cached = find_cached_module(module_name)
-                if cached:
-                    await update_module(
-                        url=cached.url,
-                        ref=cached.ref,
-                        progress_callback=progress_callback,
-                    )
-                    updated.append(f"{module_name}@{cached.ref}")
-                    if progress_callback:
-                        progress_callback(module_name, "done")
-                else:
-                    failed.append(module_name)
-                    errors[module_name] = "Could not find cache entry"
-
-        except Exception as e:
-            logger.warning(f"Failed to update {module_name}: {e}")
-            failed.append(module_name)
-            errors[module_name] = str(e)
-            if progress_callback:
-                progress_callback(module_name, "failed")
+            except Exception as e:
+                for module_name in names:
+                    logger.warning(f"Failed to update {module_name}: {e}")
+                    errors[module_name] = str(e)
+                    report(module_name, "failed")
+                return
+            for (ref, ref_names), path in zip(refs.items(), paths, strict=True):
+                for module_name in ref_names:
+                    updated_paths[module_name] = (ref, path)
+                    report(module_name, "done")
+
+    await asyncio.gather(
+        *(update_one(url, refs) for url, refs in repositories.values())
+    )
+
+    updated = []
+    for status in modules_to_update:
+        if status.name in updated_paths:
+            updated.append(f"{status.name}@{updated_paths[status.name][0]}")
+        elif status.name not in failed:
+            failed.append(status.name)
+
+    messages = [f"Updated {len(updated)} module(s)"] if updated else []
+    install_paths = list(dict.fromkeys(path for _ref, path in updated_paths.values()))
+    if install_paths:
+        if progress_callback:
+            progress_callback(f"{len(install_paths)} module(s)", "installing_deps")
+        install_error = await asyncio.to_thread(
+            _install_module_dependencies, install_paths
+        )
+        if install_error:
+            logger.warning(f"Batched dependency install failed: {install_error}")
+            messages.append(
+                "Module dependencies will be installed on next use "
+                "(batched install failed)"
+            )
 
     return ExecutionResult(
         success=len(failed) == 0,
         updated=updated,
         failed=failed,
         errors=errors,
-        messages=[f"Updated {len(updated)} module(s)"] if updated else [],
+        messages=messages,
     )
 
 
+def _thread_safe_callback(
+    progress_callback: Callable[[str, str], None] | None,
+) -> Callable[[str, str], None]:
+    """Wrap a progress callback so worker threads report on the caller's loop."""
+    loop = asyncio.get_running_loop()
+    caller = threading.get_ident()
+
+    def report(name: str, phase: str) -> None:
+        if progress_callback is None:
+            return
+        if threading.get_ident() == caller:
+            progress_callback(name, phase)
+        else:
+            loop.call_soon_threadsafe(progress_callback, name, phase)
+
+    return report
+
+
+def _install_module_dependencies(paths: list[Path]) -> str | None:
+    """Install updated modules (editable, with dependencies) in one uv call.
+
+    Only checkouts that declare an ``amplifier.modules`` entry point are
+    installed -- the same set foundation's module activator would install.
+    uv rejects two editable paths for one distribution, so when several refs
+    of a module were updated only the first checkout is installed here; the
+    others are installed by the activator on first use.
+
+    Returns:
+        None on success (or nothing to install), otherwise an error message.
+    """
+    import tomllib
+
+    from .module_cache import get_module_info_from_pyproject
+
+    targets: dict[str, Path] = {}
+    for path in paths:
+        module_id = get_module_info_from_pyproject(path)[0]
+        if not module_id:
+            continue
+        try:
+            data = tomllib.loads((path / "pyproject.toml").read_text(encoding="utf-8"))
+            name = data.get("project", {}).get("name") or module_id
+        except (OSError, tomllib.TOMLDecodeError):
+            name = module_id
+        distribution = re.sub(r"[-_.]+", "-", name).lower()
+        if distribution in targets:
+            logger.debug(
+                f"Not batch-installing {path}: {distribution} is already "
+                f"installed from {targets[distribution]}"
+            )
+            continue
+        targets[distribution] = path
+    if not targets:
+        return None
+
+    command = ["uv", "pip", "install", "--python", sys.executable]
+    for path in targets.values():
+        command += ["-e", str(path)]
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, timeout=600)
+    except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+        return str(e)
+    if result.returncode != 0:
+        return result.stderr.strip() or f"uv exited with {result.returncode}"
+    logger.debug(f"Installed dependencies for {len(targets)} updated module(s)")
+    return None
+
+
 async def fetch_library_git_dependencies(repo_url: str, ref: str) -> dict[str, dict]:
     """Fetch git dependencies from a library's pyproject.toml.
 
@@ -125,6 +240,7 @@ async def fetch_library_git_dependencies(repo_url: str, ref: str) -> dict[str, d
 
     import httpx
 
+    from .http_cache import cached_get
     from .umbrella_discovery import extract_github_org
 
     try:
@@ -137,7 +253,7 @@ async def fetch_library_git_dependencies(repo_url: str, ref: str) -> dict[str, d
         logger.debug(f"Fetching library dependencies from: {raw_url}")
 
         async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(raw_url)
+            response = await cached_get(client, raw_url)
             response.raise_for_status()
 
             # Parse TOML
@@ -38,3 +38,21 @@ def reset_skill_shortcuts():
     CommandProcessor.SKILL_SHORTCUTS.clear()
     yield
     CommandProcessor.SKILL_SHORTCUTS.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolate_first_run_state(tmp_path, monkeypatch):
+    """Keep check_first_run()'s memo out of the real ~/.amplifier cache."""
+    from amplifier_app_cli.commands import init as init_cmd
+
+    path = tmp_path / "install-state" / "install-state.json"
+    monkeypatch.setattr(init_cmd, "get_install_state_path", lambda: path)
+
+
+@pytest.fixture(autouse=True)
+def isolate_http_cache(tmp_path, monkeypatch):
+    """Keep cached GitHub responses out of the real ~/.amplifier cache."""
+    from amplifier_app_cli.utils import http_cache
+
+    path = tmp_path / "http-cache"
+    monkeypatch.setattr(http_cache, "get_http_cache_dir", lambda: path)
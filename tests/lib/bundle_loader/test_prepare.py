@@ -241,3 +241,66 @@ class TestLoadAndPrepareBundleSourceOverrides:
 
         # set_include_source_resolver was NOT called
         mock_registry.set_include_source_resolver.assert_not_called()
+
+
+class TestLoadAndPrepareBundleBehaviors:
+    """Tests for concurrent loading of compose_behaviors."""
+
+    NOTIFY = "git+https://github.com/microsoft/amplifier-bundle-notify@main"
+    BEHAVIORS = [
+        "git+https://github.com/microsoft/amplifier-bundle-modes@main",
+        f"{NOTIFY}#subdirectory=behaviors/desktop-notifications.yaml",
+        "git+https://github.com/microsoft/amplifier-bundle-broken@main",
+        f"{NOTIFY}#subdirectory=behaviors/push-notifications.yaml",
+    ]
+
+    @pytest.mark.asyncio
+    async def test_behaviors_load_concurrently_and_compose_in_order(self):
+        """Loads overlap across repos, never within one; failures are skipped."""
+        import asyncio
+
+        from amplifier_app_cli.lib.bundle_loader.prepare import load_and_prepare_bundle
+
+        mock_discovery = MagicMock()
+        mock_discovery.find.return_value = "file:///path/to/bundle.yaml"
+
+        composed: list[str] = []
+        base = MagicMock()
+        base.compose.side_effect = lambda other: composed.append(other.name) or base
+        base.prepare = AsyncMock(return_value=MagicMock())
+
+        active: set[str] = set()
+        max_active = 0
+        same_repo_overlap = False
+
+        async def fake_load_bundle(uri, registry=None):
+            nonlocal max_active, same_repo_overlap
+            if uri == "file:///path/to/bundle.yaml":
+                return base
+            repository = uri.split("#", 1)[0]
+            same_repo_overlap |= repository in active
+            active.add(repository)
+            max_active = max(max_active, len(active))
+            # Earlier behaviors finish last
+            position = self.BEHAVIORS.index(uri)
+            await asyncio.sleep(0.01 * (len(self.BEHAVIORS) - position))
+            active.discard(repository)
+            if "broken" in uri:
+                raise RuntimeError("clone failed")
+            behavior = MagicMock()
+            behavior.name = uri
+            return behavior
+
+        with patch(
+            "amplifier_app_cli.lib.bundle_loader.prepare.load_bundle",
+            side_effect=fake_load_bundle,
+        ):
+            await load_and_prepare_bundle(
+                "my-bundle",
+                mock_discovery,
+                compose_behaviors=self.BEHAVIORS,
+            )
+
+        assert max_active > 1
+        assert not same_repo_overlap
+        assert composed == [uri for uri in self.BEHAVIORS if "broken" not in uri]
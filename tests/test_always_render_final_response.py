@@ -24,6 +24,9 @@ from prompt_toolkit.application import create_app_session
 from prompt_toolkit.output import DummyOutput
 
 _MODULE = "amplifier_app_cli.main"
+# interactive_chat imports these at call time; patch them where they live
+_RUNNER = "amplifier_app_cli.session_runner"
+_STORE = "amplifier_app_cli.session_store"
 
 
 @pytest.fixture(autouse=True)
@@ -133,12 +136,12 @@ class TestAlwaysRenderFinalResponse:
 
         with (
             patch(
-                f"{_MODULE}.create_initialized_session",
+                f"{_RUNNER}.create_initialized_session",
                 new=AsyncMock(return_value=initialized),
             ),
             patch(f"{_MODULE}._create_prompt_session", return_value=mock_ps),
             patch("amplifier_app_cli.incremental_save.register_incremental_save"),
-            patch(f"{_MODULE}.SessionStore") as MockStore,
+            patch(f"{_STORE}.SessionStore") as MockStore,
             patch(f"{_MODULE}.console"),
             patch(
                 f"{_MODULE}.process_runtime_mentions",
@@ -182,12 +185,12 @@ class TestAlwaysRenderFinalResponse:
 
         with (
             patch(
-                f"{_MODULE}.create_initialized_session",
+                f"{_RUNNER}.create_initialized_session",
                 new=AsyncMock(return_value=initialized),
             ),
             patch(f"{_MODULE}._create_prompt_session", return_value=mock_ps),
             patch("amplifier_app_cli.incremental_save.register_incremental_save"),
-            patch(f"{_MODULE}.SessionStore") as MockStore,
+            patch(f"{_STORE}.SessionStore") as MockStore,
             patch(f"{_MODULE}.console"),
             patch(
                 f"{_MODULE}.process_runtime_mentions",
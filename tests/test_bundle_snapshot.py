@@ -0,0 +1,129 @@
+"""Tests for frozen bundle snapshots (amplifier bundle freeze / run --snapshot)."""
+
+import json
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from amplifier_app_cli.runtime import plan_cache
+from amplifier_app_cli.runtime import snapshot
+from amplifier_app_cli.runtime.snapshot import SnapshotError
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    monkeypatch.setattr(plan_cache, "get_cache_dir", lambda: cache)
+    monkeypatch.setattr(snapshot, "get_cache_dir", lambda: cache)
+    return cache
+
+
+def _cached_module(cache_dir, name, commit):
+    module_dir = cache_dir / name
+    module_dir.mkdir()
+    (module_dir / ".amplifier_cache_meta.json").write_text(
+        json.dumps({"commit": commit})
+    )
+    return module_dir
+
+
+def _prepared(base_path):
+    return SimpleNamespace(
+        mount_plan={"session": {"orchestrator": "loop-basic"}, "providers": []},
+        bundle=SimpleNamespace(base_path=base_path, source_base_paths={}),
+    )
+
+
+def test_freeze_and_load_round_trip(cache_dir, tmp_path, monkeypatch):
+    used = _cached_module(cache_dir, "tool-bash-abc", "1111")
+    _cached_module(cache_dir, "tool-unused-def", "2222")
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    path = tmp_path / "out" / "foundation.snapshot"
+
+    info = snapshot.write_snapshot(
+        path, "foundation", _prepared(tmp_path), sys_path_added=[str(used)]
+    )
+
+    assert info.pinned == [("tool-bash-abc", "1111")]
+    assert snapshot.read_snapshot_info(path).bundle == "foundation"
+    loaded_info, prepared = snapshot.load_snapshot(path)
+    assert loaded_info.pinned == [("tool-bash-abc", "1111")]
+    assert prepared.mount_plan["session"] == {"orchestrator": "loop-basic"}
+    assert str(used) in sys.path
+
+
+def test_unusable_snapshots_are_rejected(cache_dir, tmp_path, monkeypatch):
+    module_dir = _cached_module(cache_dir, "tool-bash-abc", "1111")
+    path = tmp_path / "foundation.snapshot"
+    snapshot.write_snapshot(
+        path, "foundation", _prepared(tmp_path), sys_path_added=[str(module_dir)]
+    )
+
+    not_a_snapshot = tmp_path / "notes.txt"
+    not_a_snapshot.write_text("hello\n")
+    with pytest.raises(SnapshotError, match="not an amplifier bundle snapshot"):
+        snapshot.read_snapshot_info(not_a_snapshot)
+
+    (module_dir / ".amplifier_cache_meta.json").unlink()
+    module_dir.rmdir()
+    with pytest.raises(SnapshotError, match="module paths that are missing"):
+        snapshot.load_snapshot(path)
+
+    versions = {**plan_cache._distribution_versions(), "amplifier-core": "0.0.0"}
+    monkeypatch.setattr(snapshot, "_distribution_versions", lambda: versions)
+    with pytest.raises(SnapshotError, match="amplifier-core"):
+        snapshot.read_snapshot_info(path)
+
+
+@pytest.mark.asyncio
+async def test_resolve_from_snapshot_skips_preparation(cache_dir, tmp_path):
+    from amplifier_app_cli.runtime.config import resolve_bundle_config
+
+    path = tmp_path / "foundation.snapshot"
+    snapshot.write_snapshot(path, "foundation", _prepared(tmp_path), sys_path_added=[])
+    settings = MagicMock()
+    settings.get_config_overrides.return_value = {}
+    settings.get_provider_overrides.return_value = [
+        {"module": "provider-anthropic", "config": {"api_key": "${SNAPSHOT_KEY}"}}
+    ]
+    settings.get_tool_overrides.return_value = []
+    settings.get_notification_hook_overrides.return_value = []
+    settings.get_routing_config.return_value = None
+
+    with (
+        patch(
+            "amplifier_app_cli.runtime.config.prepare_bundle",
+            new_callable=AsyncMock,
+            side_effect=AssertionError("snapshot starts must not prepare"),
+        ),
+        patch.dict("os.environ", {"SNAPSHOT_KEY": "secret"}),
+    ):
+        config, prepared = await resolve_bundle_config(
+            "foundation", settings, snapshot=path
+        )
+
+    # Settings overrides still apply at run time
+    assert config["providers"][0]["config"]["api_key"] == "secret"
+    assert prepared.mount_plan["providers"][0]["module"] == "provider-anthropic"
+    # ...and were never written into the snapshot
+    assert b"secret" not in path.read_bytes()
+
+
+def test_changed_module_commit_is_rejected(cache_dir, tmp_path):
+    module_dir = _cached_module(cache_dir, "tool-bash-abc", "1111")
+    path = tmp_path / "foundation.snapshot"
+    snapshot.write_snapshot(
+        path, "foundation", _prepared(tmp_path), sys_path_added=[str(module_dir)]
+    )
+
+    # `amplifier update` re-cloned the module at the same path
+    (module_dir / ".amplifier_cache_meta.json").write_text(
+        json.dumps({"commit": "3333"})
+    )
+    with pytest.raises(SnapshotError, match="other commits of tool-bash-abc"):
+        snapshot.load_snapshot(path)
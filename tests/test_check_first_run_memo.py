@@ -0,0 +1,73 @@
+"""Tests for memoizing check_first_run() in install-state.json."""
+
+import json
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from amplifier_app_cli.commands import init as init_cmd
+
+
+@pytest.fixture
+def state_path(tmp_path, monkeypatch):
+    path = tmp_path / "cache" / "install-state.json"
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(json.dumps({"version": 1, "modules": {"/m": {"sha": "x"}}}))
+    monkeypatch.setattr(init_cmd, "get_install_state_path", lambda: path)
+    return path
+
+
+def _config(providers):
+    config = MagicMock()
+    config.get_provider_overrides.return_value = providers
+    return config
+
+
+def _check(config, installed=lambda module_id: True):
+    provider = MagicMock()
+    provider.module_id = "provider-anthropic"
+    provider_mgr = MagicMock()
+    provider_mgr.get_current_provider.return_value = provider
+    with (
+        patch.object(init_cmd, "create_config_manager", return_value=config),
+        patch.object(init_cmd, "ProviderManager", return_value=provider_mgr) as pm,
+        patch.object(
+            init_cmd, "_is_provider_module_installed", side_effect=installed
+        ) as probe,
+    ):
+        needs_init = init_cmd.check_first_run()
+    return needs_init, pm.called, probe.call_count
+
+
+def test_passing_check_is_skipped_until_something_changes(state_path):
+    config = _config([{"module": "provider-anthropic", "source": "git+a@main"}])
+
+    assert _check(config) == (False, True, 1)
+    state = json.loads(state_path.read_text())
+    # Foundation's module entries are preserved alongside the memo
+    assert state["modules"] == {"/m": {"sha": "x"}}
+    assert state[init_cmd._FIRST_RUN_STATE_KEY]["fingerprint"]
+
+    assert _check(config) == (False, False, 0)
+
+    # A changed provider source invalidates the memo
+    config.get_provider_overrides.return_value = [
+        {"module": "provider-anthropic", "source": "git+a@v2"}
+    ]
+    assert _check(config) == (False, True, 1)
+
+    # So does a module cache entry appearing or disappearing
+    (state_path.parent / "provider-openai-123").mkdir()
+    assert _check(config) == (False, True, 1)
+    assert _check(config) == (False, False, 0)
+
+
+def test_failing_or_unconfigured_checks_are_not_memoized(state_path):
+    config = _config([{"module": "provider-anthropic"}])
+
+    with patch.object(init_cmd, "install_known_providers", return_value=[]):
+        assert _check(config, installed=lambda module_id: False)[0] is True
+    assert init_cmd._FIRST_RUN_STATE_KEY not in json.loads(state_path.read_text())
+
+    assert init_cmd._first_run_fingerprint(_config([])) is None
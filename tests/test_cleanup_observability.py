@@ -34,6 +34,9 @@ sys.path.insert(0, os.path.dirname(__file__))
 # ---------------------------------------------------------------------------
 
 _MODULE = "amplifier_app_cli.main"
+# interactive_chat imports these at call time; patch them where they live
+_RUNNER = "amplifier_app_cli.session_runner"
+_STORE = "amplifier_app_cli.session_store"
 
 
 def _make_mock_hooks() -> tuple[MagicMock, list[tuple[str, dict]]]:
@@ -205,10 +208,10 @@ class TestExecuteSingleCleanupEvents:
 
         with (
             patch(
-                f"{_MODULE}.create_initialized_session",
+                f"{_RUNNER}.create_initialized_session",
                 new=AsyncMock(return_value=initialized),
             ),
-            patch(f"{_MODULE}.SessionStore") as MockStore,
+            patch(f"{_STORE}.SessionStore") as MockStore,
             patch(f"{_MODULE}.console"),  # suppress Rich output
             patch(f"{_MODULE}.process_runtime_mentions", new=AsyncMock()),
         ):
@@ -268,10 +271,10 @@ class TestExecuteSingleCleanupEvents:
 
         with (
             patch(
-                f"{_MODULE}.create_initialized_session",
+                f"{_RUNNER}.create_initialized_session",
                 new=AsyncMock(return_value=initialized),
             ),
-            patch(f"{_MODULE}.SessionStore") as MockStore,
+            patch(f"{_STORE}.SessionStore") as MockStore,
             patch(f"{_MODULE}.console"),
             patch(f"{_MODULE}.process_runtime_mentions", new=AsyncMock()),
         ):
@@ -310,10 +313,10 @@ class TestExecuteSingleCleanupEvents:
 
         with (
             patch(
-                f"{_MODULE}.create_initialized_session",
+                f"{_RUNNER}.create_initialized_session",
                 new=AsyncMock(return_value=initialized),
             ),
-            patch(f"{_MODULE}.SessionStore") as MockStore,
+            patch(f"{_STORE}.SessionStore") as MockStore,
             patch(f"{_MODULE}.console"),
             patch(f"{_MODULE}.process_runtime_mentions", new=AsyncMock()),
         ):
@@ -349,10 +352,10 @@ class TestExecuteSingleCleanupEvents:
 
         with (
             patch(
-                f"{_MODULE}.create_initialized_session",
+                f"{_RUNNER}.create_initialized_session",
                 new=AsyncMock(return_value=initialized),
             ),
-            patch(f"{_MODULE}.SessionStore") as MockStore,
+            patch(f"{_STORE}.SessionStore") as MockStore,
             patch(f"{_MODULE}.console"),
             patch(f"{_MODULE}.process_runtime_mentions", new=AsyncMock()),
         ):
@@ -393,10 +396,10 @@ class TestExecuteSingleCleanupEvents:
 
         with (
             patch(
-                f"{_MODULE}.create_initialized_session",
+                f"{_RUNNER}.create_initialized_session",
                 new=AsyncMock(return_value=initialized),
             ),
-            patch(f"{_MODULE}.SessionStore") as MockStore,
+            patch(f"{_STORE}.SessionStore") as MockStore,
             patch(f"{_MODULE}.console"),
             patch(f"{_MODULE}.process_runtime_mentions", new=AsyncMock()),
         ):
@@ -470,10 +473,10 @@ class TestExecuteSingleNoHooks:
 
         with (
             patch(
-                f"{_MODULE}.create_initialized_session",
+                f"{_RUNNER}.create_initialized_session",
                 new=AsyncMock(return_value=initialized),
             ),
-            patch(f"{_MODULE}.SessionStore") as MockStore,
+            patch(f"{_STORE}.SessionStore") as MockStore,
             patch(f"{_MODULE}.console"),
             patch(f"{_MODULE}.process_runtime_mentions", new=AsyncMock()),
         ):
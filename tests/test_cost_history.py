@@ -166,3 +166,69 @@ def test_restore_and_fresh_provider_sum_without_double_count(tmp_path):
     # every registered contributor is summed (str or Decimal payloads accepted).
     total = sum(Decimal(str(cb()["cost_usd"])) for cb in contributors)
     assert total == Decimal("0.22")
+
+
+# --------------------------------------------------------------------------
+# cost checkpoint sidecar
+# --------------------------------------------------------------------------
+
+
+def _checkpoint(events):
+    return json.loads((events.parent / "cost_checkpoint.json").read_text())
+
+
+def test_checkpoint_written_after_scan(tmp_path):
+    events = tmp_path / "events.jsonl"
+    _write_events(events, [_llm_response("0.10"), _llm_response("0.05")])
+
+    assert sum_prior_cost_usd(events) == Decimal("0.15")
+    checkpoint = _checkpoint(events)
+    assert checkpoint["total"] == "0.15"
+    assert checkpoint["offset"] == events.stat().st_size
+
+
+def test_checkpoint_scans_only_appended_bytes(tmp_path):
+    events = tmp_path / "events.jsonl"
+    _write_events(events, [_llm_response("0.10")])
+    sum_prior_cost_usd(events)
+
+    # Tamper with the stored total: a resumed scan must start from it rather
+    # than re-reading the prefix
+    checkpoint_file = tmp_path / "cost_checkpoint.json"
+    checkpoint = _checkpoint(events)
+    checkpoint["total"] = "1.00"
+    checkpoint_file.write_text(json.dumps(checkpoint))
+
+    with events.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(_llm_response("0.05")) + "\n")
+
+    assert sum_prior_cost_usd(events) == Decimal("1.05")
+
+
+def test_checkpoint_discarded_when_file_rewritten(tmp_path):
+    events = tmp_path / "events.jsonl"
+    _write_events(events, [_llm_response("0.10"), _llm_response("0.20")])
+    sum_prior_cost_usd(events)
+
+    # Same-size-or-larger rewrite with different content invalidates it
+    _write_events(events, [_llm_response("0.30"), _llm_response("0.40")])
+    assert sum_prior_cost_usd(events) == Decimal("0.70")
+
+    # Truncation invalidates it too
+    _write_events(events, [_llm_response("0.01")])
+    assert sum_prior_cost_usd(events) == Decimal("0.01")
+
+
+def test_partial_trailing_line_not_checkpointed(tmp_path):
+    events = tmp_path / "events.jsonl"
+    complete = json.dumps(_llm_response("0.10")) + "\n"
+    events.write_text(complete + json.dumps(_llm_response("0.05")), encoding="utf-8")
+
+    assert sum_prior_cost_usd(events) == Decimal("0.15")
+    assert _checkpoint(events)["offset"] == len(complete.encode())
+    assert _checkpoint(events)["total"] == "0.10"
+
+    # Once the line is finished it is counted exactly once
+    with events.open("a", encoding="utf-8") as f:
+        f.write("\n")
+    assert sum_prior_cost_usd(events) == Decimal("0.15")
@@ -0,0 +1,194 @@
+"""Tests for the warm `amplifier serve` daemon and its run client."""
+
+import json
+import signal
+import socket
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from amplifier_app_cli import daemon as daemon_module
+from amplifier_app_cli.daemon import daemon_request
+from amplifier_app_cli.daemon import forward_run
+
+# A daemon whose "CLI" reports the state each request runs with
+SERVER = textwrap.dedent(
+    """
+    import os
+    import sys
+    import time
+    from pathlib import Path
+
+    from amplifier_app_cli.daemon import RunDaemon
+
+    def execute(argv):
+        if argv[0] == "sleep":
+            # Announce only once inside the try, so an interrupt that follows
+            # the handshake always reaches the handler
+            try:
+                print("started", flush=True)
+                time.sleep(30)
+            except KeyboardInterrupt:
+                Path(argv[1]).write_text("interrupted")
+                raise
+        print("argv:" + " ".join(argv))
+        print("cwd:" + os.getcwd(), file=sys.stderr)
+        print("stdin:" + sys.stdin.read())
+        print("env:" + os.environ.get("DEMO_VALUE", "") + ":"
+              + os.environ.get("AMPLIFIER_DAEMON", "unset"))
+        return int(argv[-1])
+
+    daemon = RunDaemon(
+        Path(sys.argv[1]),
+        idle_timeout=float(sys.argv[2]),
+        execute=execute,
+        signature=lambda: "",
+    )
+    sys.exit(10 if daemon.serve_forever() else 0)
+    """
+)
+
+
+def _start(tmp_path, idle_timeout: float = 60):
+    script = tmp_path / "server.py"
+    script.write_text(SERVER)
+    socket_path = tmp_path / "serve.sock"
+    process = subprocess.Popen(
+        [sys.executable, str(script), str(socket_path), str(idle_timeout)]
+    )
+    deadline = time.monotonic() + 15
+    while not socket_path.exists():
+        assert process.poll() is None, "daemon exited during startup"
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.05)
+    return process, socket_path
+
+
+@pytest.fixture
+def running_daemon(tmp_path):
+    process, socket_path = _start(tmp_path)
+    yield process, socket_path
+    process.kill()
+    process.wait()
+
+
+def test_request_runs_with_client_cwd_env_and_stdin(
+    running_daemon, tmp_path, monkeypatch, capsys
+):
+    process, socket_path = running_daemon
+    work = tmp_path / "work"
+    work.mkdir()
+    monkeypatch.chdir(work)
+    monkeypatch.setenv("DEMO_VALUE", "demo")
+    monkeypatch.setenv("AMPLIFIER_DAEMON", str(socket_path))
+
+    code = forward_run(["run", "hi", "7"], socket_path=socket_path, stdin="piped")
+
+    captured = capsys.readouterr()
+    assert code == 7
+    assert "argv:run hi 7" in captured.out
+    assert "stdin:piped" in captured.out
+    # The daemon never forwards a request back to itself
+    assert "env:demo:unset" in captured.out
+    assert f"cwd:{work}" in captured.err
+
+    assert daemon_request(socket_path, "status")["status"]["requests"] == 1
+    assert daemon_request(socket_path, "stop") == {"exit": 0}
+    assert process.wait(timeout=10) == 0
+    assert not socket_path.exists()
+
+
+def test_client_disconnect_interrupts_request(running_daemon, tmp_path):
+    process, socket_path = running_daemon
+    marker = tmp_path / "interrupted"
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(str(socket_path))
+    request = {"argv": ["sleep", str(marker)], "cwd": str(tmp_path), "env": {}}
+    client.sendall((json.dumps(request) + "\n").encode())
+    assert b"started" in client.recv(4096)
+    client.close()
+
+    deadline = time.monotonic() + 10
+    while not marker.exists():
+        assert time.monotonic() < deadline, "request was not interrupted"
+        time.sleep(0.05)
+    # The daemon keeps serving
+    assert daemon_request(socket_path, "status") is not None
+
+
+def test_ctrl_c_after_client_disconnect_still_stops_daemon(running_daemon, tmp_path):
+    process, socket_path = running_daemon
+    marker = tmp_path / "interrupted"
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(str(socket_path))
+    request = {"argv": ["sleep", str(marker)], "cwd": str(tmp_path), "env": {}}
+    client.sendall((json.dumps(request) + "\n").encode())
+    assert b"started" in client.recv(4096)
+    client.close()
+
+    deadline = time.monotonic() + 10
+    while not marker.exists():
+        assert time.monotonic() < deadline, "request was not interrupted"
+        time.sleep(0.05)
+    assert daemon_request(socket_path, "status") is not None
+
+    # The disconnect's interrupt was consumed by the request, not left armed
+    # to swallow the operator's next Ctrl+C
+    process.send_signal(signal.SIGINT)
+    process.wait(timeout=10)
+
+
+def test_idle_daemon_exits_and_removes_socket(tmp_path):
+    process, socket_path = _start(tmp_path, idle_timeout=0.5)
+
+    assert process.wait(timeout=15) == 0
+    assert not socket_path.exists()
+
+
+def test_no_daemon_falls_back_to_local(tmp_path, monkeypatch):
+    missing = tmp_path / "missing.sock"
+
+    assert forward_run(["run", "hi"], socket_path=missing) is None
+    assert daemon_request(missing, "status") is None
+
+    monkeypatch.delenv("AMPLIFIER_DAEMON", raising=False)
+    assert daemon_module.requested_socket() is None
+    monkeypatch.setenv("AMPLIFIER_DAEMON", "1")
+    assert daemon_module.requested_socket() == daemon_module.get_socket_path()
+    monkeypatch.setenv("AMPLIFIER_DAEMON", str(missing))
+    assert daemon_module.requested_socket() == missing
+
+
+def test_busy_daemon_turns_second_client_away(running_daemon, tmp_path, capsys):
+    process, socket_path = running_daemon
+    marker = tmp_path / "interrupted"
+
+    first = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    first.connect(str(socket_path))
+    request = {"argv": ["sleep", str(marker)], "cwd": str(tmp_path), "env": {}}
+    first.sendall((json.dumps(request) + "\n").encode())
+    assert b"started" in first.recv(4096)
+
+    # The second client gets an immediate answer instead of queueing
+    started = time.monotonic()
+    assert forward_run(["run", "hi", "0"], socket_path=socket_path) is None
+    assert time.monotonic() - started < 5
+    assert "argv:" not in capsys.readouterr().out
+    assert daemon_request(socket_path, "status")["status"]["requests"] == 1
+
+    first.close()
+    deadline = time.monotonic() + 10
+    while not marker.exists():
+        assert time.monotonic() < deadline, "request was not interrupted"
+        time.sleep(0.05)
+    # Once the interrupted request has wound down, the daemon serves again
+    code = None
+    while code is None:
+        assert time.monotonic() < deadline, "daemon stayed busy"
+        code = forward_run(["run", "hi", "3"], socket_path=socket_path)
+    assert code == 3
@@ -0,0 +1,133 @@
+"""Tests for sharing git objects between cached checkouts of one repository."""
+
+import shutil
+import subprocess
+
+import pytest
+
+from amplifier_app_cli.utils import git_store
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="needs git")
+
+
+def _git(cwd, *args):
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def _local_objects(checkout):
+    stats = dict(
+        line.split(": ")
+        for line in _git(checkout, "count-objects", "-v").splitlines()
+    )
+    return int(stats["count"]) + int(stats["in-pack"])
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    monkeypatch.setattr(git_store, "get_cache_dir", lambda: cache)
+    return cache
+
+
+@pytest.fixture
+def origin(tmp_path):
+    origin = tmp_path / "origin"
+    origin.mkdir()
+    _git(origin, "init", "-q", "-b", "main")
+    for i in range(3):
+        (origin / f"file{i}").write_text(f"content {i}\n" * 1000)
+        _git(origin, "add", ".")
+        _git(origin, "commit", "-q", "-m", f"commit {i}")
+    _git(origin, "branch", "v1", "HEAD~1")
+    return origin
+
+
+def test_checkouts_borrow_objects_from_one_store(cache, origin):
+    url = origin.as_uri()
+    main = cache / "tool-a-main"
+    v1 = cache / "tool-a-v1"
+    _git(cache, "clone", "-q", "--depth", "1", url, main.name)
+    _git(cache, "clone", "-q", "-b", "v1", url, v1.name)
+
+    assert git_store.share_objects(url + ".git", main / "modules" / "tool-a")
+    assert git_store.share_objects(url, v1)
+    # Already linked: nothing to do
+    assert git_store.share_objects(url, v1)
+
+    stores = list(git_store.get_git_store_dir().glob("*.git"))
+    assert stores == [git_store._store_path(url)]
+    for checkout in (main, v1):
+        assert _local_objects(checkout) == 0
+        _git(checkout, "fsck", "--connectivity-only")
+    assert _git(v1, "log", "--format=%s") == "commit 1\ncommit 0\n"
+
+
+def test_paths_outside_a_checkout_are_left_alone(cache, tmp_path):
+    (cache / "plain").mkdir()
+
+    assert not git_store.share_objects("https://github.com/org/x", cache / "plain")
+    assert not git_store.share_objects("https://github.com/org/x", tmp_path)
+    assert not git_store.get_git_store_dir().exists()
+
+
+def test_refs_of_removed_checkouts_are_pruned(cache, origin):
+    url = origin.as_uri()
+    main = cache / "tool-a-main"
+    v1 = cache / "tool-a-v1"
+    _git(cache, "clone", "-q", "--depth", "1", url, main.name)
+    _git(cache, "clone", "-q", "-b", "v1", url, v1.name)
+    assert git_store.share_objects(url, main)
+    assert git_store.share_objects(url, v1)
+    first_commit = _git(origin, "rev-list", "--max-parents=0", "HEAD").strip()
+    store = git_store._store_path(url)
+    _git(store, "cat-file", "-e", first_commit)
+
+    # clear_module_cache() removed the v1 checkout; an update adds another
+    shutil.rmtree(v1)
+    fresh = cache / "tool-a-fresh"
+    _git(cache, "clone", "-q", "--depth", "1", url, fresh.name)
+    assert git_store.share_objects(url, fresh)
+
+    keys = {
+        ref.split("/")[2]
+        for ref in _git(store, "for-each-ref", "--format=%(refname)").split()
+    }
+    assert keys == {git_store._checkout_key(main), git_store._checkout_key(fresh)}
+    # Objects only the removed checkout used are gone
+    with pytest.raises(subprocess.CalledProcessError):
+        _git(store, "cat-file", "-e", first_commit)
+    for checkout in (main, fresh):
+        _git(checkout, "fsck", "--connectivity-only")
+        assert _git(checkout, "log", "--format=%s") == "commit 2\n"
+
+
+def test_nested_checkouts_keep_their_objects(cache, origin):
+    from amplifier_app_cli.utils import module_cache
+
+    # Borrowers are found as deep as the module index looks for cache entries
+    assert git_store._MAX_CHECKOUT_DEPTH == module_cache._MAX_ENTRY_DEPTH
+    url = origin.as_uri()
+    nested = cache / "modules" / "tool-a" / "v1"
+    nested.parent.mkdir(parents=True)
+    _git(nested.parent, "clone", "-q", "-b", "v1", url, nested.name)
+    assert git_store.share_objects(url, nested)
+
+    # Linking another checkout prunes the store; the nested one must survive
+    fresh = cache / "tool-a-fresh"
+    _git(cache, "clone", "-q", "--depth", "1", url, fresh.name)
+    assert git_store.share_objects(url, fresh)
+    _git(nested, "fsck", "--connectivity-only")
+    assert _git(nested, "log", "--format=%s") == "commit 1\ncommit 0\n"
+
+    # Deeper than the search reaches: left unlinked rather than lost
+    too_deep = cache / "a" / "b" / "c" / "d"
+    too_deep.parent.mkdir(parents=True)
+    _git(too_deep.parent, "clone", "-q", url, too_deep.name)
+    assert not git_store.share_objects(url, too_deep)
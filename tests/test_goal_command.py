@@ -18,6 +18,9 @@ from amplifier_app_cli.main import (
 from helpers import _make_command_processor
 
 _MODULE = "amplifier_app_cli.main"
+# interactive_chat imports these at call time; patch them where they live
+_RUNNER = "amplifier_app_cli.session_runner"
+_STORE = "amplifier_app_cli.session_store"
 
 # === _parse_goal_max_turns ===
 
@@ -244,10 +247,10 @@ class TestHeadlessGoalMentionExpansion:
 
         with (
             patch(
-                f"{_MODULE}.create_initialized_session",
+                f"{_RUNNER}.create_initialized_session",
                 new=AsyncMock(return_value=initialized),
             ),
-            patch(f"{_MODULE}.SessionStore") as MockStore,
+            patch(f"{_STORE}.SessionStore") as MockStore,
             patch(f"{_MODULE}.console"),
             patch(
                 f"{_MODULE}.process_runtime_mentions",
@@ -285,10 +288,10 @@ class TestHeadlessGoalMentionExpansion:
 
         with (
             patch(
-                f"{_MODULE}.create_initialized_session",
+                f"{_RUNNER}.create_initialized_session",
                 new=AsyncMock(return_value=initialized),
             ),
-            patch(f"{_MODULE}.SessionStore") as MockStore,
+            patch(f"{_STORE}.SessionStore") as MockStore,
             patch(f"{_MODULE}.console"),
             patch(
                 f"{_MODULE}.process_runtime_mentions",
@@ -325,10 +328,10 @@ class TestHeadlessGoalMentionExpansion:
 
         with (
             patch(
-                f"{_MODULE}.create_initialized_session",
+                f"{_RUNNER}.create_initialized_session",
                 new=AsyncMock(return_value=initialized),
             ),
-            patch(f"{_MODULE}.SessionStore") as MockStore,
+            patch(f"{_STORE}.SessionStore") as MockStore,
             patch(f"{_MODULE}.console"),
             patch(
                 f"{_MODULE}.process_runtime_mentions",
@@ -0,0 +1,65 @@
+"""Tests for the conditional-request cache behind GitHub update lookups."""
+
+import httpx
+import pytest
+
+from amplifier_app_cli.utils import http_cache
+from amplifier_app_cli.utils import source_status
+from amplifier_app_cli.utils.source_status import _get_github_commit_sha
+
+SHA = "abcdef1234567890abcdef1234567890abcdef12"
+ATOM = f"<feed><id>tag:github.com,2008:Grit::Commit/{SHA}</id></feed>"
+
+
+@pytest.fixture
+def github():
+    """MockTransport serving an Atom feed with an ETag; records requests."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"ETag": '"v1"'}, text=ATOM)
+
+    return httpx.MockTransport(handler), requests
+
+
+@pytest.mark.asyncio
+async def test_fresh_hits_skip_network_and_stale_ones_revalidate(
+    github, monkeypatch
+):
+    transport, requests = github
+    monkeypatch.setattr(source_status, "_get_github_auth_headers", lambda: {})
+    url = "https://github.com/org/repo"
+    async with httpx.AsyncClient(transport=transport) as client:
+        assert await _get_github_commit_sha(client, url, "main") == SHA
+        assert await _get_github_commit_sha(client, url, "main") == SHA
+        assert len(requests) == 1
+
+        monkeypatch.setattr(http_cache, "FRESH_SECONDS", 0)
+        assert await _get_github_commit_sha(client, url, "main") == SHA
+
+    assert len(requests) == 2
+    assert requests[1].headers["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached_and_identities_are_separate():
+    calls = []
+
+    def handler(request):
+        calls.append(request.headers.get("Authorization"))
+        if len(calls) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, text="ok")
+
+    url = "https://raw.githubusercontent.com/org/repo/main/pyproject.toml"
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        assert (await http_cache.cached_get(client, url)).status_code == 503
+        assert (await http_cache.cached_get(client, url)).text == "ok"
+        assert (await http_cache.cached_get(client, url)).text == "ok"
+        token = {"Authorization": "Bearer t"}
+        assert (await http_cache.cached_get(client, url, headers=token)).text == "ok"
+
+    assert calls == [None, None, "Bearer t"]
@@ -35,6 +35,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 _MODULE = "amplifier_app_cli.main"
+# interactive_chat imports these at call time; patch them where they live
+_RUNNER = "amplifier_app_cli.session_runner"
+_STORE = "amplifier_app_cli.session_store"
 
 
 # ---------------------------------------------------------------------------
@@ -88,12 +91,12 @@ def _run_interactive_chat(tmp_path: Path, mock_close: MagicMock) -> None:
 
     with (
         patch(
-            f"{_MODULE}.create_initialized_session",
+            f"{_RUNNER}.create_initialized_session",
             new=AsyncMock(return_value=initialized),
         ),
         patch(f"{_MODULE}._create_prompt_session", return_value=mock_ps),
         patch("amplifier_app_cli.incremental_save.register_incremental_save"),
-        patch(f"{_MODULE}.SessionStore") as MockStore,
+        patch(f"{_STORE}.SessionStore") as MockStore,
         patch(f"{_MODULE}.console"),
         patch(
             f"{_MODULE}.process_runtime_mentions",
@@ -143,12 +146,12 @@ class TestInteractiveChatClosesDedicatedTtyOnTeardown:
 
         with (
             patch(
-                f"{_MODULE}.create_initialized_session",
+                f"{_RUNNER}.create_initialized_session",
                 new=AsyncMock(return_value=initialized),
             ),
             patch(f"{_MODULE}._create_prompt_session", return_value=mock_ps),
             patch("amplifier_app_cli.incremental_save.register_incremental_save"),
-            patch(f"{_MODULE}.SessionStore") as MockStore,
+            patch(f"{_STORE}.SessionStore") as MockStore,
             patch(f"{_MODULE}.console"),
             patch(
                 f"{_MODULE}.process_runtime_mentions",
@@ -188,12 +191,12 @@ class TestInteractiveChatClosesDedicatedTtyOnTeardown:
 
         with (
             patch(
-                f"{_MODULE}.create_initialized_session",
+                f"{_RUNNER}.create_initialized_session",
                 new=AsyncMock(return_value=initialized),
             ),
             patch(f"{_MODULE}._create_prompt_session", return_value=mock_ps),
             patch("amplifier_app_cli.incremental_save.register_incremental_save"),
-            patch(f"{_MODULE}.SessionStore") as MockStore,
+            patch(f"{_STORE}.SessionStore") as MockStore,
             patch(f"{_MODULE}.console"),
             patch(
                 f"{_MODULE}.process_runtime_mentions",
@@ -262,12 +265,12 @@ class TestCloseDedicatedTtyTeardownIsRobust:
 
         with (
             patch(
-                f"{_MODULE}.create_initialized_session",
+                f"{_RUNNER}.create_initialized_session",
                 new=AsyncMock(return_value=initialized),
             ),
             patch(f"{_MODULE}._create_prompt_session", return_value=mock_ps),
             patch("amplifier_app_cli.incremental_save.register_incremental_save"),
-            patch(f"{_MODULE}.SessionStore") as MockStore,
+            patch(f"{_STORE}.SessionStore") as MockStore,
             patch(f"{_MODULE}.console"),
             patch(
                 f"{_MODULE}.process_runtime_mentions",
@@ -0,0 +1,127 @@
+"""Tests for lazily imported top-level subcommands."""
+
+import subprocess
+import sys
+import textwrap
+import time
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from amplifier_app_cli.utils.help_formatter import AmplifierGroup
+
+# `amplifier --help` / `amplifier version` wall time budget (median, seconds)
+STARTUP_TARGET_S = 1.0
+
+
+@pytest.fixture
+def lazy_module(tmp_path, monkeypatch):
+    (tmp_path / "lazy_cmd_fixture.py").write_text(
+        textwrap.dedent(
+            '''
+            import click
+
+            @click.command()
+            def hello():
+                """Say hello. Longer description here."""
+                click.echo("hello")
+            '''
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_cmd_fixture", raising=False)
+    yield "lazy_cmd_fixture"
+    sys.modules.pop("lazy_cmd_fixture", None)
+
+
+def _group(module_name: str) -> click.Group:
+    @click.group(cls=AmplifierGroup)
+    def cli():
+        """Test CLI."""
+
+    @cli.command()
+    def eager():
+        """Eager command."""
+
+    cli.add_lazy_command("hello", f"{module_name}:hello", "Say hello.")
+    return cli
+
+
+def test_help_lists_lazy_commands_without_importing(lazy_module):
+    cli = _group(lazy_module)
+
+    result = CliRunner().invoke(cli, ["--help"])
+
+    assert result.exit_code == 0
+    assert "hello" in result.output and "Say hello." in result.output
+    assert "eager" in result.output
+    assert lazy_module not in sys.modules
+
+
+def test_dispatch_imports_and_caches_command(lazy_module):
+    cli = _group(lazy_module)
+
+    result = CliRunner().invoke(cli, ["hello"])
+
+    assert result.exit_code == 0
+    assert result.output == "hello\n"
+    assert lazy_module in sys.modules
+    assert cli.commands["hello"] is sys.modules[lazy_module].hello
+
+
+def test_manifest_matches_command_docstrings():
+    from amplifier_app_cli.main import _LAZY_COMMANDS
+    from amplifier_app_cli.main import cli
+
+    for name, (_target, short_help) in _LAZY_COMMANDS.items():
+        command = cli.get_command(click.Context(cli), name)
+        assert command is not None and command.name == name
+        assert command.get_short_help_str(limit=200) == short_help
+
+
+def _median_run(*args: str) -> float:
+    samples = []
+    for _ in range(5):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "amplifier_app_cli", *args],
+            check=True,
+            capture_output=True,
+        )
+        samples.append(time.perf_counter() - start)
+    return sorted(samples)[len(samples) // 2]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("args", [("--help",), ("version",)])
+def test_startup_target(args):
+    """Run with: pytest -m benchmark -s tests/test_lazy_commands.py"""
+    elapsed = _median_run(*args)
+    print(f"\namplifier {' '.join(args)}: {elapsed * 1000:.0f} ms")
+    assert elapsed < STARTUP_TARGET_S
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("args", [["--help"], ["--version"]])
+def test_help_imports_no_command_modules(args):
+    code = (
+        "import sys\n"
+        "from click.testing import CliRunner\n"
+        "from amplifier_app_cli.main import cli\n"
+        f"CliRunner().invoke(cli, {args!r})\n"
+        "print(sorted(sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    loaded = set(eval(result.stdout))
+    assert not {m for m in loaded if m.startswith("amplifier_app_cli.commands.")}
+    # The session runtime loads only when a session command is dispatched
+    for heavy in (
+        "amplifier_core",
+        "amplifier_foundation",
+        "prompt_toolkit",
+        "rich.panel",
+    ):
+        assert heavy not in loaded
@@ -0,0 +1,128 @@
+"""Tests for the persistent module cache index behind scan_cached_modules()."""
+
+import json
+import os
+import shutil
+import time
+
+import pytest
+
+from amplifier_app_cli.utils import module_cache
+from amplifier_app_cli.utils.module_cache import find_cached_module
+from amplifier_app_cli.utils.module_cache import scan_cached_modules
+
+PYPROJECT = """\
+[project]
+name = "amplifier-module-{module_id}"
+
+[project.entry-points."amplifier.modules"]
+{module_id} = "amplifier_module_x:mount"
+"""
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    cache.mkdir()
+    monkeypatch.setattr(module_cache, "get_cache_dir", lambda: cache)
+    return cache
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    calls = []
+    read = module_cache._read_cache_entry
+
+    def counting(cache_entry, metadata, *, legacy):
+        calls.append(cache_entry.name)
+        return read(cache_entry, metadata, legacy=legacy)
+
+    monkeypatch.setattr(module_cache, "_read_cache_entry", counting)
+    return calls
+
+
+def _module(cache_dir, rel, module_id, commit="abcdef1234"):
+    entry = cache_dir / rel
+    entry.mkdir(parents=True)
+    (entry / "pyproject.toml").write_text(PYPROJECT.format(module_id=module_id))
+    (entry / ".git" / "objects").mkdir(parents=True)
+    (entry / ".amplifier_cache_meta.json").write_text(
+        json.dumps(
+            {
+                "git_url": f"https://github.com/x/amplifier-module-{module_id}",
+                "commit": commit,
+                "ref": "main",
+                "cached_at": "2026-01-01T00:00:00",
+            }
+        )
+    )
+    return entry
+
+
+def _age(cache_dir):
+    """Backdate everything past the racy window, as for an idle cache."""
+    past = time.time() - 60
+    for root, dirs, files in os.walk(cache_dir):
+        for name in dirs + files:
+            os.utime(os.path.join(root, name), (past, past))
+    os.utime(cache_dir, (past, past))
+
+
+def test_index_matches_layouts_and_skips_skills(cache_dir):
+    _module(cache_dir, "tool-bash-1", "tool-bash")
+    _module(cache_dir, "modules/provider-x-2", "provider-x")
+    legacy = cache_dir / "0a1b" / "v1.0"
+    legacy.mkdir(parents=True)
+    (legacy / "bundle.md").write_text("---\nbundle:\n  name: recipes\n---\n")
+    (legacy / ".amplifier_cache_metadata.json").write_text(
+        json.dumps({"url": "https://github.com/x/recipes", "ref": "v1.0", "sha": "f00"})
+    )
+    skills = cache_dir / "superpowers"
+    skills.mkdir()
+    (skills / ".amplifier_cache_meta.json").write_text(json.dumps({"type": "skills"}))
+
+    modules = scan_cached_modules()
+
+    assert [(m.display_name, m.module_type) for m in modules] == [
+        ("provider-x", "provider"),
+        ("recipes", "bundle"),
+        ("tool-bash", "tool"),
+    ]
+    assert modules[2].sha == "abcdef12" and modules[2].is_mutable
+    assert modules[1].ref == "v1.0" and modules[1].cache_path == legacy
+    assert [m.module_id for m in scan_cached_modules("bundle")] == ["recipes"]
+    assert (cache_dir / module_cache.MODULE_INDEX_DIRNAME / "index.json").exists()
+
+
+def test_unchanged_cache_is_served_without_parsing(cache_dir, parses):
+    _module(cache_dir, "tool-bash-1", "tool-bash")
+    _module(cache_dir, "tool-grep-1", "tool-grep")
+    _age(cache_dir)
+    scan_cached_modules()
+    parses.clear()
+
+    assert len(scan_cached_modules()) == 2
+    assert find_cached_module("tool-grep").cache_path == cache_dir / "tool-grep-1"
+    assert parses == []
+
+
+def test_added_changed_and_removed_entries_are_picked_up(cache_dir, parses):
+    _module(cache_dir, "tool-bash-1", "tool-bash")
+    _module(cache_dir, "tool-grep-1", "tool-grep")
+    _age(cache_dir)
+    scan_cached_modules()
+    parses.clear()
+
+    _module(cache_dir, "modules/tool-web-1", "tool-web")
+    assert find_cached_module("tool-web") is not None
+    assert parses == ["tool-web-1"]
+
+    shutil.rmtree(cache_dir / "tool-grep-1")
+    meta = cache_dir / "tool-bash-1" / ".amplifier_cache_meta.json"
+    meta.write_text(meta.read_text().replace("abcdef1234", "9876543210"))
+
+    assert find_cached_module("tool-grep") is None
+    assert [(m.module_id, m.sha) for m in scan_cached_modules()] == [
+        ("tool-bash", "98765432"),
+        ("tool-web", "abcdef12"),
+    ]
@@ -0,0 +1,161 @@
+"""Tests for the persistent mount-plan cache."""
+
+import json
+import logging
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from amplifier_app_cli.runtime import plan_cache
+
+
+@pytest.fixture
+def cache_home(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    monkeypatch.setattr(plan_cache, "get_cache_dir", lambda: cache_dir)
+    monkeypatch.setattr(plan_cache, "get_registry_path", lambda: tmp_path / "reg.json")
+    return tmp_path
+
+
+def _settings(tmp_path):
+    settings = tmp_path / "settings.yaml"
+    settings.write_text("bundle: foundation\n")
+    paths = SimpleNamespace(
+        global_settings=settings,
+        project_settings=None,
+        local_settings=None,
+        session_settings=None,
+    )
+    return SimpleNamespace(paths=paths), settings
+
+
+def _fingerprint(app_settings, bundle_uri="git+https://example.com/foundation@main"):
+    return plan_cache.plan_fingerprint(
+        "foundation",
+        app_settings,
+        bundle_uri=bundle_uri,
+        compose_behaviors=[],
+        source_overrides={},
+        bundle_sources={},
+    )
+
+
+def test_fingerprint_tracks_settings_and_module_commits(cache_home):
+    app_settings, settings = _settings(cache_home)
+    first = _fingerprint(app_settings)
+    assert _fingerprint(app_settings) == first
+
+    settings.write_text("bundle: foundation\nproviders: []\n")
+    second = _fingerprint(app_settings)
+    assert second != first
+
+    module_dir = cache_home / "cache" / "tool-bash-abc123"
+    module_dir.mkdir()
+    meta = module_dir / ".amplifier_cache_meta.json"
+    meta.write_text(json.dumps({"commit": "1111"}))
+    third = _fingerprint(app_settings)
+    assert third != second
+
+    meta.write_text(json.dumps({"commit": "2222"}))
+    assert _fingerprint(app_settings) != third
+
+
+def test_fingerprint_tracks_bundle_uri_and_ignores_update_checks(cache_home):
+    app_settings, settings = _settings(cache_home)
+    first = _fingerprint(app_settings)
+
+    # The name now resolves to another source
+    assert _fingerprint(app_settings, "file:///work/foundation") != first
+
+    # The startup update check only rewrites its own bookkeeping
+    settings.write_text(
+        "bundle: foundation\nupdates:\n  last_check: '2026-01-01T00:00:00'\n"
+    )
+    assert _fingerprint(app_settings) == first
+
+
+def test_store_and_load_round_trip(cache_home):
+    prepared = {"mount_plan": {"session": {"orchestrator": "loop-basic"}}}
+
+    plan_cache.store_prepared("abc", prepared, sys_path_added=[])
+
+    assert plan_cache.load_prepared("abc") == prepared
+    assert plan_cache.load_prepared("missing") is None
+
+
+def test_local_bundle_edit_invalidates_entry(cache_home):
+    bundle_dir = cache_home / "my-bundle"
+    bundle_dir.mkdir()
+    bundle_file = bundle_dir / "bundle.md"
+    bundle_file.write_text("---\nbundle:\n  name: mine\n---\n")
+    prepared = SimpleNamespace(
+        bundle=SimpleNamespace(base_path=bundle_dir, source_base_paths={})
+    )
+
+    plan_cache.store_prepared("local", prepared, sys_path_added=[])
+    assert plan_cache.load_prepared("local") is not None
+
+    stat = bundle_file.stat()
+    os.utime(bundle_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert plan_cache.load_prepared("local") is None
+
+
+def test_unpicklable_plan_is_skipped_and_clear_removes_entries(cache_home, caplog):
+    with caplog.at_level(logging.DEBUG, logger=plan_cache.__name__):
+        plan_cache.store_prepared("bad", lambda: None, sys_path_added=[])
+        # A later start with the same inputs (the marker is on disk)
+        plan_cache.store_prepared("bad", lambda: None, sys_path_added=[])
+    assert plan_cache.load_prepared("bad") is None
+    # Reported once at warning level: the cache would silently never hit
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert len(warnings) == 1
+    assert "not picklable" in warnings[0].getMessage()
+    marker = plan_cache.get_plan_cache_dir() / "bad.unpicklable"
+    assert marker.exists()
+
+    plan_cache.store_prepared("one", {"a": 1}, sys_path_added=[])
+    plan_cache.store_prepared("two", {"b": 2}, sys_path_added=[])
+    assert plan_cache.clear_plan_cache() == 2
+    assert plan_cache.load_prepared("one") is None
+    assert not marker.exists()
+
+
+@pytest.mark.asyncio
+async def test_real_prepared_bundle_round_trips(cache_home):
+    from amplifier_foundation.bundle import Bundle
+
+    bundle = Bundle(
+        name="round-trip",
+        context={},
+        tools=[],
+        hooks=[],
+        providers=[],
+    )
+    prepared = await bundle.prepare(install_deps=False)
+
+    plan_cache.store_prepared("real", prepared, sys_path_added=[])
+
+    assert not (plan_cache.get_plan_cache_dir() / "real.unpicklable").exists()
+    loaded = plan_cache.load_prepared("real")
+    assert type(loaded) is type(prepared)
+    assert loaded.mount_plan == prepared.mount_plan
+    assert loaded.bundle.name == "round-trip"
+
+
+def test_retained_entries_skip_disk_and_return_copies(cache_home):
+    plan_cache.retain_in_memory()
+    try:
+        plan_cache.store_prepared("warm", {"providers": []}, sys_path_added=[])
+        for path in plan_cache.get_plan_cache_dir().glob("*.pickle"):
+            path.unlink()
+
+        first = plan_cache.load_prepared("warm")
+        first["providers"].append("mutated")
+        assert plan_cache.load_prepared("warm") == {"providers": []}
+
+        plan_cache.clear_plan_cache()
+        assert plan_cache.load_prepared("warm") is None
+    finally:
+        plan_cache.retain_in_memory(False)
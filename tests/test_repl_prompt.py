@@ -71,7 +71,9 @@ class TestPromptSession:
         # Should not raise, should fall back to InMemoryHistory
         with (
             patch("amplifier_app_cli.main.logger") as mock_logger,
-            patch("amplifier_app_cli.main.FileHistory", side_effect=mock_file_history),
+            patch(
+                "prompt_toolkit.history.FileHistory", side_effect=mock_file_history
+            ),
         ):
             session = _create_prompt_session()
             assert session is not None
@@ -57,7 +57,7 @@ async def test_save_transcript_with_thinking_blocks():
         temp_path = Path(temp_dir)
 
         # Patch SessionStore to use temp directory
-        with patch("amplifier_app_cli.main.SessionStore") as mock_store_class:
+        with patch("amplifier_app_cli.session_store.SessionStore") as mock_store_class:
             mock_store = MagicMock()
             mock_store.base_dir = temp_path
             mock_store_class.return_value = mock_store
@@ -112,7 +112,7 @@ async def test_save_transcript_without_thinking():
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
 
-        with patch("amplifier_app_cli.main.SessionStore") as mock_store_class:
+        with patch("amplifier_app_cli.session_store.SessionStore") as mock_store_class:
             mock_store = MagicMock()
             mock_store.base_dir = temp_path
             mock_store_class.return_value = mock_store
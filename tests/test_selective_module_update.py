@@ -0,0 +1,155 @@
+"""Tests for parallel, repository-grouped execute_selective_module_update."""
+
+import subprocess
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from amplifier_app_cli.utils import update_executor
+from amplifier_app_cli.utils.source_status import CachedGitStatus
+from amplifier_app_cli.utils.update_executor import execute_selective_module_update
+
+
+def _status(name, url, ref="main"):
+    return CachedGitStatus(name=name, url=url, ref=ref, has_update=True)
+
+
+class FakeRepositories:
+    """Stands in for module_cache.update_repository; blocks like a git clone."""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    async def __call__(self, url, refs, progress_callback=None):
+        with self.lock:
+            self.calls.append((url, refs))
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        progress_callback(url.rsplit("/", 1)[-1], "downloading")
+        time.sleep(0.05)
+        with self.lock:
+            self.in_flight -= 1
+        if url in self.fail:
+            raise RuntimeError("clone failed")
+        return [Path("/cache") / f"{url.rsplit('/', 1)[-1]}-{ref}" for ref in refs]
+
+
+async def _update(modules, repositories, **kwargs):
+    installs = []
+    callbacks = []
+
+    def progress(name, phase):
+        callbacks.append((name, phase, threading.get_ident()))
+
+    with (
+        patch(
+            "amplifier_app_cli.utils.module_cache.update_repository", repositories
+        ),
+        patch.object(
+            update_executor,
+            "_install_module_dependencies",
+            side_effect=lambda paths: installs.append(paths),
+        ),
+    ):
+        result = await execute_selective_module_update(
+            modules, progress_callback=progress, **kwargs
+        )
+    return result, installs, callbacks
+
+
+@pytest.mark.asyncio
+async def test_modules_sharing_a_repository_are_fetched_once():
+    repositories = FakeRepositories(fail={"https://github.com/org/broken"})
+    modules = [
+        _status("tool-a", "https://github.com/org/tools"),
+        _status("tool-b", "https://github.com/org/tools.git"),
+        _status("tool-c", "https://github.com/org/tools", ref="v2"),
+        _status("tool-x", "https://github.com/org/broken"),
+        _status("hooks-d", "https://github.com/org/hooks"),
+    ]
+
+    result, installs, callbacks = await _update(modules, repositories)
+
+    assert sorted(repositories.calls) == [
+        ("https://github.com/org/broken", ["main"]),
+        ("https://github.com/org/hooks", ["main"]),
+        ("https://github.com/org/tools", ["main", "v2"]),
+    ]
+    assert result.updated == ["tool-a@main", "tool-b@main", "tool-c@v2", "hooks-d@main"]
+    assert result.failed == ["tool-x"] and not result.success
+    assert result.errors == {"tool-x": "clone failed"}
+    # One batched install for the distinct checkouts that changed
+    assert installs == [
+        [Path("/cache/tools-main"), Path("/cache/tools-v2"), Path("/cache/hooks-main")]
+    ]
+    # Worker progress is delivered on the caller's thread
+    assert {thread for _name, _phase, thread in callbacks} == {threading.get_ident()}
+    assert ("tools", "downloading") in [(n, p) for n, p, _t in callbacks]
+    assert callbacks[-1][:2] == ("3 module(s)", "installing_deps")
+
+
+@pytest.mark.asyncio
+async def test_repositories_update_in_parallel_up_to_max_workers():
+    repositories = FakeRepositories()
+    modules = [_status(f"tool-{i}", f"https://github.com/org/t{i}") for i in range(6)]
+
+    result, _installs, _callbacks = await _update(modules, repositories, max_workers=3)
+
+    assert result.success and len(result.updated) == 6
+    assert repositories.peak == 3
+
+
+def test_dependency_install_is_one_uv_call_for_module_checkouts(tmp_path):
+    module = tmp_path / "tool-a"
+    module.mkdir()
+    (module / "pyproject.toml").write_text(
+        '[project.entry-points."amplifier.modules"]\ntool-a = "m:mount"\n'
+    )
+    bundle = tmp_path / "bundle"
+    bundle.mkdir()
+    (bundle / "pyproject.toml").write_text('[project]\nname = "bundle"\n')
+
+    completed = subprocess.CompletedProcess([], 0, stdout="", stderr="")
+    with patch.object(
+        update_executor.subprocess, "run", return_value=completed
+    ) as run:
+        assert update_executor._install_module_dependencies([module, bundle]) is None
+
+    command = run.call_args.args[0]
+    assert command[:3] == ["uv", "pip", "install"]
+    assert command[-2:] == ["-e", str(module)] and str(bundle) not in command
+
+    with patch.object(update_executor.subprocess, "run", MagicMock()) as run:
+        assert update_executor._install_module_dependencies([bundle]) is None
+    run.assert_not_called()
+
+
+def test_dependency_install_takes_one_checkout_per_distribution(tmp_path):
+    checkouts = []
+    for ref in ("main", "v1"):
+        checkout = tmp_path / f"tool-a-{ref}"
+        checkout.mkdir()
+        (checkout / "pyproject.toml").write_text(
+            '[project]\nname = "amplifier-module-tool-a"\n'
+            '[project.entry-points."amplifier.modules"]\ntool-a = "m:mount"\n'
+        )
+        checkouts.append(checkout)
+
+    completed = subprocess.CompletedProcess([], 0, stdout="", stderr="")
+    with patch.object(
+        update_executor.subprocess, "run", return_value=completed
+    ) as run:
+        assert update_executor._install_module_dependencies(checkouts) is None
+
+    command = run.call_args.args[0]
+    # uv rejects two editable paths for one distribution
+    assert command.count("-e") == 1
+    assert command[-2:] == ["-e", str(checkouts[0])]
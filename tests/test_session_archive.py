@@ -0,0 +1,82 @@
+"""Tests for the compressed session archive tier."""
+
+import os
+import time
+
+from amplifier_app_cli.session_store import SessionStore
+
+
+def _messages(n: int) -> list[dict]:
+    return [{"role": "user", "content": f"message {i} " + "x" * 200} for i in range(n)]
+
+
+def _age(store: SessionStore, session_id: str, days: float) -> None:
+    old = time.time() - days * 86400
+    os.utime(store.base_dir / session_id, (old, old))
+
+
+def test_archive_old_sessions_keeps_them_listed(tmp_path):
+    store = SessionStore(tmp_path)
+    store.save("old", _messages(20), {"name": "Old work"})
+    store.save("new", _messages(2), {"name": "New work"})
+    _age(store, "old", 45)
+
+    archived = store.archive_old_sessions(days=30)
+
+    assert list(archived) == ["old"]
+    assert archived["old"]["archive_bytes"] < archived["old"]["original_bytes"]
+    assert not (tmp_path / "old").exists()
+    assert store.exists("old")
+
+    infos = {info["id"]: info for info in store.list_session_info()}
+    assert infos["old"]["archived"] is True
+    assert infos["old"]["name"] == "Old work"
+    assert infos["old"]["message_count"] == 20
+    assert "archived" not in infos["new"]
+    assert store.find_session("ol") == "old"
+
+
+def test_load_restores_archived_session(tmp_path):
+    store = SessionStore(tmp_path)
+    messages = _messages(5)
+    store.save("s1", messages, {"name": "Restore me"})
+    store.archive_session("s1")
+
+    transcript, metadata = store.load("s1")
+
+    assert transcript == messages
+    assert metadata["name"] == "Restore me"
+    assert (tmp_path / "s1").is_dir()
+    assert not store.archive.is_archived("s1")
+    assert store.get_session_info("s1")["name"] == "Restore me"
+    assert "archived" not in store.get_session_info("s1")
+
+
+def test_save_after_restore_appends(tmp_path):
+    store = SessionStore(tmp_path)
+    messages = _messages(3)
+    store.save("s1", messages, {})
+    store.archive_session("s1")
+
+    lazy, _ = store.load_lazy("s1")
+    messages = list(lazy) + _messages(1)
+    store.save("s1", messages, {})
+
+    assert store.load("s1")[0] == messages
+
+
+def test_plan_quota_evicts_least_recently_used(tmp_path):
+    store = SessionStore(tmp_path)
+    for session_id, age in (("a", 90), ("b", 60), ("c", 40)):
+        store.save(session_id, _messages(10), {})
+        _age(store, session_id, age)
+    store.archive_old_sessions(days=30)
+
+    entries = store.archive.entries()
+    keep = entries["b"]["archive_bytes"] + entries["c"]["archive_bytes"]
+    assert store.archive.plan_quota(keep) == ["a"]
+    assert store.archive.plan_quota(0) == ["a", "b", "c"]
+
+    store.archive.evict("a")
+    assert not store.exists("a")
+    assert set(store.archive.entries()) == {"b", "c"}
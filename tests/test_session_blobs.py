@@ -0,0 +1,108 @@
+"""Tests for offloading large tool results to the blob store."""
+
+import json
+import os
+import shutil
+import time
+
+from amplifier_app_cli.session_blobs import BlobStore
+from amplifier_app_cli.session_store import SessionStore
+from amplifier_app_cli.turn_index import TurnIndex
+
+BIG = "line of grep output\n" * 2000
+
+
+def _conversation(tool_content) -> list[dict]:
+    return [
+        {"role": "user", "content": "search"},
+        {"role": "assistant", "content": "", "tool_calls": [{"id": "t1"}]},
+        {"role": "tool", "tool_call_id": "t1", "content": tool_content},
+        {"role": "assistant", "content": "done"},
+    ]
+
+
+def test_large_tool_result_is_offloaded_and_rehydrated(tmp_path):
+    store = SessionStore(tmp_path)
+    messages = _conversation(BIG)
+    store.save("s1", messages, {})
+
+    raw = (tmp_path / "s1" / "transcript.jsonl").read_text()
+    assert BIG not in raw
+    assert len(raw) < len(BIG)
+    tool_line = json.loads(raw.splitlines()[2])
+    assert "content" not in tool_line
+    assert store.blobs.blob_path(tool_line["content_ref"]["sha256"]).exists()
+
+    assert store.load("s1")[0] == messages
+    assert store.load_tail("s1", 2)[0]["content"] == BIG
+    assert TurnIndex(tmp_path / "s1").read_messages(1)[2]["content"] == BIG
+
+
+def test_small_and_non_tool_content_stays_inline(tmp_path):
+    store = SessionStore(tmp_path)
+    messages = [{"role": "user", "content": BIG}] + _conversation("short")[1:]
+    store.save("s1", messages, {})
+
+    raw = (tmp_path / "s1" / "transcript.jsonl").read_text()
+    assert "content_ref" not in raw
+    assert not store.blobs.blob_dir.exists()
+
+
+def test_blobs_deduplicate_and_appends_still_work(tmp_path):
+    store = SessionStore(tmp_path)
+    blocks = [{"type": "text", "text": BIG}]
+    messages = _conversation(blocks)
+    store.save("s1", messages, {})
+    messages = messages + _conversation(blocks)
+    store.save("s1", messages, {})
+    store.save("s2", _conversation(blocks), {})
+
+    assert len(list(store.blobs.blob_dir.glob("*/*"))) == 1
+    assert store.load("s1")[0] == messages
+    assert SessionStore(tmp_path).load("s2")[0][2]["content"] == blocks
+
+
+def test_collect_removes_unreferenced_blobs(tmp_path):
+    store = SessionStore(tmp_path)
+    store.save("keep", _conversation(BIG), {})
+    store.save("drop", _conversation(BIG + "other"), {})
+    store.save("archived", _conversation(BIG + "archived"), {})
+    store.archive_session("archived")
+    assert len(list(store.blobs.blob_dir.glob("*/*"))) == 3
+
+    # Drop the session directory, leaving its blob unreferenced
+    shutil.rmtree(tmp_path / "drop")
+    assert store.collect_blobs() == 0  # Still within the grace window
+    _age_blobs(store.blobs)
+    assert store.collect_blobs() > 0
+
+    assert len(list(store.blobs.blob_dir.glob("*/*"))) == 2
+    assert store.load("keep")[0][2]["content"] == BIG
+    assert store.load("archived")[0][2]["content"] == BIG + "archived"
+
+
+def test_collect_spares_reused_blob(tmp_path):
+    blobs = BlobStore(tmp_path, threshold=1)
+    blobs.offload({"role": "tool", "content": "payload"})
+    _age_blobs(blobs)
+
+    # A live session reuses the unreferenced blob just before collection
+    ref = blobs.offload({"role": "tool", "content": "payload"})
+    assert blobs.collect([]) == 0
+    assert blobs.rehydrate(ref)["content"] == "payload"
+
+
+def _age_blobs(blobs: BlobStore, seconds: float = 2 * 24 * 3600) -> None:
+    old = time.time() - seconds
+    for path in blobs.blob_dir.glob("*/*"):
+        os.utime(path, (old, old))
+
+
+def test_missing_blob_rehydrates_placeholder(tmp_path):
+    blobs = BlobStore(tmp_path, threshold=1)
+    ref = blobs.offload({"role": "tool", "content": "payload"})
+    blobs.blob_path(ref["content_ref"]["sha256"]).unlink()
+
+    restored = blobs.rehydrate(ref)
+    assert "unavailable" in restored["content"]
+    assert "content_ref" not in restored
@@ -0,0 +1,85 @@
+"""Tests for the size-aware session cleanup engine."""
+
+import os
+import time
+
+from amplifier_app_cli.session_cleanup import CleanupPolicy
+from amplifier_app_cli.session_cleanup import execute_cleanup
+from amplifier_app_cli.session_cleanup import measure_sessions
+from amplifier_app_cli.session_cleanup import plan_cleanup
+from amplifier_app_cli.session_store import SessionStore
+
+NOW = time.time()
+
+
+def _make(store: SessionStore, session_id: str, *, days_old: float, size: int):
+    store.save(session_id, [{"role": "user", "content": "x" * size}], {})
+    old = NOW - days_old * 86400
+    os.utime(store.base_dir / session_id, (old, old))
+
+
+def _planned(plan) -> list[str]:
+    return [usage.session_id for usage in plan]
+
+
+def test_measure_folds_sub_sessions_into_parent(tmp_path):
+    store = SessionStore(tmp_path)
+    _make(store, "parent", days_old=10, size=1000)
+    _make(store, "parent_explorer", days_old=2, size=3000)
+
+    (usage,) = measure_sessions([store])
+
+    assert usage.session_id == "parent"
+    assert usage.session_ids == ["parent_explorer", "parent"]
+    assert usage.bytes > 4000
+    assert usage.mtime > NOW - 3 * 86400
+
+
+def test_policies_combine(tmp_path):
+    store = SessionStore(tmp_path)
+    _make(store, "a", days_old=40, size=100)
+    _make(store, "b", days_old=20, size=5000)
+    _make(store, "c", days_old=10, size=100)
+    _make(store, "d", days_old=1, size=100)
+    usages = measure_sessions([store])
+
+    assert _planned(plan_cleanup(usages, CleanupPolicy(days=30), now=NOW)) == ["a"]
+    assert _planned(plan_cleanup(usages, CleanupPolicy(keep_last=2), now=NOW)) == [
+        "a",
+        "b",
+    ]
+    # Budget drops the oldest sessions until the rest fit
+    plan = plan_cleanup(usages, CleanupPolicy(max_bytes=2000), now=NOW)
+    assert _planned(plan) == ["a", "b"]
+    assert plan[1].reason == "over size budget"
+
+    plan = plan_cleanup(usages, CleanupPolicy(days=30, keep_last=3), now=NOW)
+    assert [u.reason for u in plan] == ["older than 30 days"]
+
+
+def test_keep_last_is_per_project(tmp_path):
+    one = SessionStore(tmp_path / "one")
+    two = SessionStore(tmp_path / "two")
+    _make(one, "a", days_old=3, size=10)
+    _make(one, "b", days_old=1, size=10)
+    _make(two, "c", days_old=5, size=10)
+
+    plan = plan_cleanup(measure_sessions([one, two]), CleanupPolicy(keep_last=1))
+    assert _planned(plan) == ["a"]
+
+
+def test_execute_deletes_and_updates_index(tmp_path):
+    store = SessionStore(tmp_path)
+    _make(store, "old", days_old=40, size=100)
+    _make(store, "old_agent", days_old=40, size=100)
+    _make(store, "new", days_old=1, size=100)
+
+    plan = plan_cleanup(measure_sessions([store]), CleanupPolicy(days=30))
+    removed, freed = execute_cleanup(plan, max_workers=2)
+
+    assert removed == 2
+    assert freed == plan[0].bytes
+    assert sorted(p.name for p in tmp_path.iterdir() if not p.name.startswith(".")) == [
+        "new"
+    ]
+    assert store.list_sessions(top_level_only=False) == ["new"]
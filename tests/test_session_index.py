@@ -0,0 +1,133 @@
+"""Tests for the persistent session index behind session list/find."""
+
+import json
+import shutil
+
+from amplifier_app_cli.session_index import INDEX_FILENAME
+from amplifier_app_cli.session_index import SessionIndex
+from amplifier_app_cli.session_store import SessionStore
+
+
+def _save(store: SessionStore, session_id: str, n: int = 2, **metadata) -> None:
+    transcript = [{"role": "user", "content": f"m{i}"} for i in range(n)]
+    store.save(session_id, transcript, metadata)
+
+
+def test_save_records_summary(tmp_path):
+    store = SessionStore(tmp_path)
+    _save(store, "abc", n=3, name="My session", bundle="bundle:foundation")
+
+    info = store.get_session_info("abc")
+    assert info["message_count"] == 3
+    assert info["name"] == "My session"
+    assert info["bundle"] == "bundle:foundation"
+    assert info["mtime"] > 0
+
+
+def test_list_sessions_newest_first_and_top_level(tmp_path):
+    store = SessionStore(tmp_path)
+    _save(store, "older")
+    _save(store, "newer")
+    _save(store, "newer_agent", parent_id="newer")
+
+    assert store.list_sessions() == ["newer", "older"]
+    assert set(store.list_sessions(top_level_only=False)) == {
+        "older",
+        "newer",
+        "newer_agent",
+    }
+    assert store.get_session_info("newer_agent")["parent_id"] == "newer"
+
+
+def test_update_metadata_keeps_message_count(tmp_path):
+    store = SessionStore(tmp_path)
+    _save(store, "abc", n=4)
+    store.update_metadata("abc", {"name": "Renamed"})
+
+    info = SessionStore(tmp_path).get_session_info("abc")
+    assert info["name"] == "Renamed"
+    assert info["message_count"] == 4
+
+
+def test_find_session_uses_index(tmp_path):
+    store = SessionStore(tmp_path)
+    _save(store, "abc123")
+    _save(store, "def456")
+
+    assert store.find_session("abc") == "abc123"
+
+
+def test_cleanup_removes_from_index(tmp_path):
+    store = SessionStore(tmp_path)
+    _save(store, "abc")
+    store.cleanup_old_sessions(days=0)
+
+    assert store.list_sessions() == []
+    lines = (tmp_path / INDEX_FILENAME).read_text().splitlines()
+    assert json.loads(lines[-1]) == {"id": "abc", "deleted": True}
+
+
+def test_drift_is_healed(tmp_path):
+    """Sessions created or deleted behind the index's back are reconciled."""
+    store = SessionStore(tmp_path)
+    _save(store, "kept")
+    _save(store, "deleted")
+    shutil.rmtree(tmp_path / "deleted")
+
+    # A session written without going through SessionStore (e.g. an older CLI)
+    foreign = tmp_path / "foreign"
+    foreign.mkdir()
+    (foreign / "transcript.jsonl").write_text('{"role": "user"}\n' * 5)
+    (foreign / "metadata.json").write_text(json.dumps({"name": "Foreign"}))
+
+    infos = {info["id"]: info for info in SessionStore(tmp_path).list_session_info()}
+    assert set(infos) == {"kept", "foreign"}
+    assert infos["foreign"]["message_count"] == 5
+    assert infos["foreign"]["name"] == "Foreign"
+
+    # The healed state was written back as a compact log
+    lines = (tmp_path / INDEX_FILENAME).read_text().splitlines()
+    assert {json.loads(line)["id"] for line in lines} == {"kept", "foreign"}
+
+
+def test_torn_index_line_is_ignored(tmp_path):
+    store = SessionStore(tmp_path)
+    _save(store, "abc")
+    with open(tmp_path / INDEX_FILENAME, "a") as f:
+        f.write('{"id": "abc", "na')
+
+    assert SessionStore(tmp_path).list_sessions() == ["abc"]
+
+
+def test_rebuild_from_directories(tmp_path):
+    store = SessionStore(tmp_path)
+    _save(store, "abc", n=2, name="One")
+    (tmp_path / INDEX_FILENAME).write_text("")
+
+    records = SessionIndex(tmp_path).rebuild()
+    assert records["abc"]["message_count"] == 2
+    assert records["abc"]["name"] == "One"
+
+
+def test_compaction_keeps_lines_appended_meanwhile(tmp_path):
+    """A running session's append between replay and compaction survives."""
+    (tmp_path / "live").mkdir()
+    (tmp_path / "unindexed").mkdir()
+    index = SessionIndex(tmp_path)
+    index.record("live", message_count=1, name="Old")
+
+    scan = index.scan_session
+
+    def scan_and_interleave(session_id):
+        # Another process appends after entries() replayed the log
+        SessionIndex(tmp_path).record("live", message_count=7, name="New")
+        return scan(session_id)
+
+    index.scan_session = scan_and_interleave
+    records = index.entries()
+
+    assert records["live"]["message_count"] == 7
+    assert records["live"]["name"] == "New"
+    persisted = SessionIndex(tmp_path).entries()
+    assert persisted["live"]["message_count"] == 7
+    assert set(persisted) == {"live", "unindexed"}
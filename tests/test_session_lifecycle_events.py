@@ -29,6 +29,9 @@ import pytest
 sys.path.insert(0, os.path.dirname(__file__))
 
 _MODULE = "amplifier_app_cli.main"
+# interactive_chat imports these at call time; patch them where they live
+_RUNNER = "amplifier_app_cli.session_runner"
+_STORE = "amplifier_app_cli.session_store"
 
 # ────────────────────────────────────────────────────────────────────────────
 # Helpers
@@ -137,10 +140,10 @@ class TestSessionEndExactlyOnce:
 
         with (
             patch(
-                f"{_MODULE}.create_initialized_session",
+                f"{_RUNNER}.create_initialized_session",
                 new=AsyncMock(return_value=initialized),
             ),
-            patch(f"{_MODULE}.SessionStore") as MockStore,
+            patch(f"{_STORE}.SessionStore") as MockStore,
             patch(f"{_MODULE}.console"),
             patch(f"{_MODULE}.process_runtime_mentions", new=AsyncMock()),
         ):
@@ -177,10 +180,10 @@ class TestSessionEndExactlyOnce:
 
         with (
             patch(
-                f"{_MODULE}.create_initialized_session",
+                f"{_RUNNER}.create_initialized_session",
                 new=AsyncMock(return_value=initialized),
             ),
-            patch(f"{_MODULE}.SessionStore") as MockStore,
+            patch(f"{_STORE}.SessionStore") as MockStore,
             patch(f"{_MODULE}.console"),
             patch(f"{_MODULE}.process_runtime_mentions", new=AsyncMock()),
         ):
@@ -215,10 +218,10 @@ class TestSessionEndExactlyOnce:
 
         with (
             patch(
-                f"{_MODULE}.create_initialized_session",
+                f"{_RUNNER}.create_initialized_session",
                 new=AsyncMock(return_value=initialized),
             ),
-            patch(f"{_MODULE}.SessionStore") as MockStore,
+            patch(f"{_STORE}.SessionStore") as MockStore,
             patch(f"{_MODULE}.console"),
             patch(f"{_MODULE}.process_runtime_mentions", new=AsyncMock()),
         ):
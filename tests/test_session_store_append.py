@@ -0,0 +1,178 @@
+"""Tests for append-only transcript persistence in SessionStore."""
+
+import json
+from pathlib import Path
+
+from amplifier_app_cli.session_store import SessionStore
+
+
+def _lines(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines() if line]
+
+
+def _messages(n: int) -> list[dict]:
+    return [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"message {i}"}
+        for i in range(n)
+    ]
+
+
+def test_second_save_appends_without_rewriting(tmp_path):
+    """Saving a grown transcript appends and leaves the backup untouched."""
+    store = SessionStore(tmp_path)
+    store.save("s1", _messages(2), {})
+    store.save("s1", _messages(4), {})
+
+    transcript_file = tmp_path / "s1" / "transcript.jsonl"
+    assert _lines(transcript_file) == _messages(4)
+    # write_with_backup was only used for the first save, which had no
+    # previous file to back up
+    assert not (tmp_path / "s1" / "transcript.jsonl.backup").exists()
+
+
+def test_system_messages_not_counted_for_append(tmp_path):
+    """System/developer messages are filtered before computing the append cursor."""
+    store = SessionStore(tmp_path)
+    system = {"role": "system", "content": "instructions"}
+    store.save("s1", [system, *_messages(2)], {})
+    store.save("s1", [system, *_messages(3)], {})
+
+    loaded, _ = store.load("s1")
+    assert loaded == _messages(3)
+
+
+def test_shrunk_transcript_forces_rewrite(tmp_path):
+    """A shorter transcript (e.g. after /clear) rewrites the file."""
+    store = SessionStore(tmp_path)
+    store.save("s1", _messages(4), {})
+    store.save("s1", [{"role": "user", "content": "fresh"}], {})
+
+    loaded, _ = store.load("s1")
+    assert loaded == [{"role": "user", "content": "fresh"}]
+
+
+def test_mutated_boundary_forces_rewrite(tmp_path):
+    """Changing the last persisted message rewrites instead of appending."""
+    store = SessionStore(tmp_path)
+    messages = _messages(3)
+    store.save("s1", messages, {})
+
+    messages[2] = {"role": "user", "content": "edited"}
+    messages.append({"role": "assistant", "content": "reply"})
+    store.save("s1", messages, {})
+
+    loaded, _ = store.load("s1")
+    assert loaded == messages
+
+
+def test_edited_middle_message_forces_rewrite(tmp_path):
+    """Editing any earlier message (e.g. compaction) rewrites, not appends."""
+    store = SessionStore(tmp_path)
+    messages = _messages(5)
+    store.save("s1", messages, {})
+
+    # Same-length edit keeps the file size unchanged
+    messages[2]["content"] = "message X"
+    messages.append({"role": "assistant", "content": "reply"})
+    store.save("s1", messages, {})
+
+    assert _lines(tmp_path / "s1" / "transcript.jsonl") == messages
+
+
+def test_invalidate_transcript_forces_rewrite(tmp_path):
+    """invalidate_transcript() makes the next save rewrite mid-history edits."""
+    store = SessionStore(tmp_path)
+    messages = _messages(4)
+    store.save("s1", messages, {})
+
+    messages[1] = {"role": "assistant", "content": "repaired"}
+    store.invalidate_transcript("s1")
+    store.save("s1", messages, {})
+
+    loaded, _ = store.load("s1")
+    assert loaded == messages
+
+
+def test_external_write_forces_rewrite(tmp_path):
+    """A transcript modified by another writer is not appended onto."""
+    store = SessionStore(tmp_path)
+    store.save("s1", _messages(2), {})
+
+    transcript_file = tmp_path / "s1" / "transcript.jsonl"
+    transcript_file.write_text(transcript_file.read_text() + "{}\n")
+    store.save("s1", _messages(3), {})
+
+    assert _lines(transcript_file) == _messages(3)
+
+
+def test_load_truncates_torn_tail(tmp_path):
+    """A partial final line left by a crashed append is dropped on load."""
+    store = SessionStore(tmp_path)
+    store.save("s1", _messages(2), {})
+
+    transcript_file = tmp_path / "s1" / "transcript.jsonl"
+    intact = transcript_file.read_bytes()
+    transcript_file.write_bytes(intact + b'{"role": "user", "cont')
+
+    loaded, _ = SessionStore(tmp_path).load("s1")
+    assert loaded == _messages(2)
+    assert transcript_file.read_bytes() == intact
+
+
+def test_load_mid_file_corruption_uses_backup(tmp_path):
+    """Corruption before the last line still falls back to the backup."""
+    store = SessionStore(tmp_path)
+    store.save("s1", _messages(1), {})
+    store.invalidate_transcript("s1")
+    store.save("s1", _messages(2), {})
+
+    transcript_file = tmp_path / "s1" / "transcript.jsonl"
+    transcript_file.write_text('{"broken\n' + json.dumps(_messages(2)[1]) + "\n")
+
+    loaded, _ = SessionStore(tmp_path).load("s1")
+    assert loaded == _messages(1)
+
+
+def _count_serializations(store: SessionStore, monkeypatch) -> list:
+    calls = []
+    original = store._serialize_message
+
+    def counting(message):
+        calls.append(message)
+        return original(message)
+
+    monkeypatch.setattr(store, "_serialize_message", counting)
+    return calls
+
+
+def test_rewrite_reuses_cached_lines(tmp_path, monkeypatch):
+    """A compaction-style rewrite only serializes messages it hasn't seen."""
+    store = SessionStore(tmp_path)
+    messages = _messages(50)
+    store.save("s1", messages, {})
+    calls = _count_serializations(store, monkeypatch)
+
+    summary = {"role": "user", "content": "summary of earlier turns"}
+    compacted = [summary, *messages[40:]]
+    store.save("s1", compacted, {})
+
+    assert calls == [summary]
+    assert _lines(tmp_path / "s1" / "transcript.jsonl") == compacted
+
+
+def test_replaced_content_is_reserialized(tmp_path, monkeypatch):
+    store = SessionStore(tmp_path)
+    messages = _messages(3)
+    store.save("s1", messages, {})
+    calls = _count_serializations(store, monkeypatch)
+
+    messages[1]["content"] = "edited"
+    store.invalidate_transcript("s1")
+    store.save("s1", messages, {})
+    assert len(calls) == 3  # invalidate drops cached lines too
+
+    messages[2]["content"] = "edited again"
+    store.save("s1", messages, {})
+    assert _lines(tmp_path / "s1" / "transcript.jsonl")[2]["content"] == (
+        "edited again"
+    )
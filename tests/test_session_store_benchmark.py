@@ -0,0 +1,56 @@
+"""Save latency vs. transcript length, with and without cached lines.
+
+Run with: pytest -m benchmark -s tests/test_session_store_benchmark.py
+"""
+
+import time
+
+import pytest
+
+from amplifier_app_cli.session_store import SessionStore
+
+LENGTHS = (100, 1000, 5000)
+ROUNDS = 5
+
+
+def _conversation(n: int) -> list[dict]:
+    messages = []
+    for i in range(n // 2):
+        messages.append({"role": "user", "content": f"question {i} " + "q" * 200})
+        messages.append(
+            {
+                "role": "assistant",
+                "content": [{"type": "text", "text": f"answer {i} " + "a" * 800}],
+            }
+        )
+    return messages
+
+
+def _time_saves(store: SessionStore, messages: list, *, cached: bool) -> float:
+    """Median latency of a full-rewrite save (as after context compaction)."""
+    samples = []
+    for _ in range(ROUNDS):
+        store._cursors.pop("bench", None)  # Force the rewrite path
+        if not cached:
+            store._line_cache.pop("bench", None)  # Behaviour before the cache
+        start = time.perf_counter()
+        store.save("bench", messages, {})
+        samples.append(time.perf_counter() - start)
+    return sorted(samples)[len(samples) // 2]
+
+
+@pytest.mark.benchmark
+def test_save_latency_vs_transcript_length(tmp_path):
+    print(f"\n{'messages':>10} {'uncached ms':>12} {'cached ms':>10} {'speedup':>8}")
+    for length in LENGTHS:
+        store = SessionStore(tmp_path / str(length))
+        messages = _conversation(length)
+        store.save("bench", messages, {})
+
+        uncached = _time_saves(store, messages, cached=False)
+        cached = _time_saves(store, messages, cached=True)
+        print(
+            f"{length:>10} {uncached * 1000:>12.2f} {cached * 1000:>10.2f} "
+            f"{uncached / cached:>7.1f}x"
+        )
+        assert cached < uncached
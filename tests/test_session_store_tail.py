@@ -0,0 +1,65 @@
+"""Tests for tail-only transcript loading used by resume display."""
+
+from amplifier_app_cli.session_store import LazyTranscript
+from amplifier_app_cli.session_store import SessionStore
+from amplifier_app_cli.session_store import _iter_lines_reversed
+
+
+def _conversation(n: int) -> list[dict]:
+    messages = []
+    for i in range(n):
+        messages.append({"role": "user", "content": f"question {i}"})
+        messages.append({"role": "tool", "content": "x" * 100})
+        messages.append({"role": "assistant", "content": f"answer {i}"})
+    return messages
+
+
+def test_iter_lines_reversed_across_blocks(tmp_path):
+    path = tmp_path / "lines.jsonl"
+    lines = [f"line-{i}-" + "y" * (i % 7) for i in range(50)]
+    path.write_text("\n".join(lines) + "\n")
+
+    got = [line.decode() for line in _iter_lines_reversed(path, block_size=8)]
+    assert got == list(reversed(lines))
+
+
+def test_load_tail_filters_roles(tmp_path):
+    store = SessionStore(tmp_path)
+    store.save("s1", _conversation(5), {})
+
+    tail = store.load_tail("s1", 3, roles=("user", "assistant"))
+    assert tail == [
+        {"role": "assistant", "content": "answer 3"},
+        {"role": "user", "content": "question 4"},
+        {"role": "assistant", "content": "answer 4"},
+    ]
+    assert store.load_tail("s1", 0) == []
+    assert len(store.load_tail("s1", 100)) == 15
+
+
+def test_load_tail_skips_torn_last_line(tmp_path):
+    store = SessionStore(tmp_path)
+    store.save("s1", _conversation(1), {})
+    with open(tmp_path / "s1" / "transcript.jsonl", "a") as f:
+        f.write('{"role": "user", "con')
+
+    assert store.load_tail("s1", 1) == [{"role": "assistant", "content": "answer 0"}]
+
+
+def test_lazy_transcript_defers_full_parse(tmp_path):
+    store = SessionStore(tmp_path)
+    store.save("s1", _conversation(4), {"bundle": "bundle:foundation"})
+
+    transcript, metadata = store.load_lazy("s1")
+    assert isinstance(transcript, LazyTranscript)
+    assert metadata == {"bundle": "bundle:foundation"}
+
+    # Count and tail come from the index and a backward read
+    assert len(transcript) == 12
+    assert transcript.tail(1) == [{"role": "assistant", "content": "answer 3"}]
+    assert not transcript.materialized
+
+    # Iteration materializes the same messages load() returns
+    assert list(transcript) == store.load("s1")[0]
+    assert transcript.materialized
+    assert transcript[0] == {"role": "user", "content": "question 0"}
@@ -0,0 +1,89 @@
+"""Tests for the background SessionWriter."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from amplifier_app_cli.session_store import SessionStore
+from amplifier_app_cli.session_writer import SessionWriter
+
+
+class _BlockingStore(SessionStore):
+    """SessionStore whose saves wait on an event, to observe coalescing."""
+
+    def __init__(self, base_dir: Path):
+        super().__init__(base_dir)
+        self.release = threading.Event()
+        self.saved: list[int] = []
+
+    def save(self, session_id, transcript, metadata):
+        self.release.wait(timeout=5)
+        self.saved.append(len(transcript))
+        super().save(session_id, transcript, metadata)
+
+
+def _messages(n: int) -> list[dict]:
+    return [{"role": "user", "content": f"m{i}"} for i in range(n)]
+
+
+@pytest.mark.asyncio
+async def test_flush_persists_submitted_snapshot(tmp_path):
+    store = SessionStore(tmp_path)
+    writer = SessionWriter(store)
+
+    writer.submit("s1", _messages(2), lambda existing: {**existing, "turn_count": 2})
+    await writer.flush()
+
+    transcript, metadata = store.load("s1")
+    assert transcript == _messages(2)
+    assert metadata == {"turn_count": 2}
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_superseded_snapshots_are_coalesced(tmp_path):
+    store = _BlockingStore(tmp_path)
+    writer = SessionWriter(store)
+
+    # First save occupies the worker; the next three queue up behind it
+    writer.submit("s1", _messages(1), lambda existing: {})
+    for n in (2, 3, 4):
+        writer.submit("s1", _messages(n), lambda existing: {})
+    store.release.set()
+    await writer.flush()
+
+    assert store.saved[-1] == 4
+    assert len(store.saved) <= 2
+    assert writer.coalesced >= 2
+    assert store.load("s1")[0] == _messages(4)
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_builder_receives_existing_metadata(tmp_path):
+    store = SessionStore(tmp_path)
+    store.save("s1", [], {"name": "named by hook"})
+    writer = SessionWriter(store)
+
+    writer.submit("s1", _messages(1), lambda existing: {**existing, "model": "m"})
+    await writer.close()
+
+    assert store.get_metadata("s1") == {"name": "named by hook", "model": "m"}
+
+
+@pytest.mark.asyncio
+async def test_flush_reraises_write_failure(tmp_path):
+    store = SessionStore(tmp_path)
+    writer = SessionWriter(store)
+
+    def _fail(existing):
+        raise OSError("disk full")
+
+    writer.submit("s1", _messages(1), _fail)
+    with pytest.raises(OSError, match="disk full"):
+        await writer.flush()
+
+    # The error is reported once; later flushes succeed
+    writer.submit("s1", _messages(1), lambda existing: {})
+    await writer.close()
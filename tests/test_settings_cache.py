@@ -0,0 +1,75 @@
+"""Tests for the process-wide settings file cache."""
+
+import os
+import time
+
+import pytest
+import yaml
+
+from amplifier_app_cli.lib.settings import AppSettings
+from amplifier_app_cli.lib.settings import SettingsPaths
+from amplifier_app_cli.lib.settings import settings_file_cache
+
+
+@pytest.fixture
+def settings(tmp_path):
+    settings_file_cache.clear()
+    paths = SettingsPaths(
+        global_settings=tmp_path / "global.yaml",
+        project_settings=tmp_path / "project.yaml",
+        local_settings=tmp_path / "local.yaml",
+    )
+    yield AppSettings(paths)
+    settings_file_cache.clear()
+
+
+def _write(path, data, *, age: float = 60) -> None:
+    path.write_text(yaml.safe_dump(data))
+    old = time.time() - age
+    os.utime(path, (old, old))
+
+
+def test_repeated_reads_parse_each_file_once(settings):
+    _write(settings.paths.global_settings, {"bundle": {"active": "foundation"}})
+    _write(settings.paths.project_settings, {"bundle": {"app": ["x"]}})
+    parses = settings_file_cache.parses
+
+    for _ in range(5):
+        merged = settings.get_merged_settings()
+        settings.get_provider_overrides()
+        settings.get_allowed_write_paths()
+
+    assert merged == {"bundle": {"active": "foundation", "app": ["x"]}}
+    assert settings_file_cache.parses - parses == 2
+    assert settings_file_cache.hits > 0
+
+
+def test_returned_settings_are_copies(settings):
+    _write(settings.paths.global_settings, {"bundle": {"active": "foundation"}})
+
+    settings.get_merged_settings()["bundle"]["active"] = "mutated"
+    settings._read_scope("global")["bundle"]["active"] = "mutated"
+
+    assert settings.get_active_bundle() == "foundation"
+
+
+def test_external_edit_and_write_scope_invalidate(settings):
+    path = settings.paths.global_settings
+    _write(path, {"bundle": {"active": "foundation"}}, age=120)
+    assert settings.get_active_bundle() == "foundation"
+
+    _write(path, {"bundle": {"active": "recipes"}}, age=60)
+    assert settings.get_active_bundle() == "recipes"
+
+    settings.set_active_bundle("anchors", scope="global")
+    assert settings.get_active_bundle() == "anchors"
+
+
+def test_recently_modified_files_are_not_trusted(settings):
+    path = settings.paths.global_settings
+    path.write_text("a: 1\n")
+    assert settings.get_merged_settings() == {"a": 1}
+
+    # Same size and, on coarse filesystems, possibly the same mtime
+    path.write_text("a: 2\n")
+    assert settings.get_merged_settings() == {"a": 2}
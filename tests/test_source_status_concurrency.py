@@ -0,0 +1,96 @@
+"""Tests for concurrent, deduplicated remote SHA checks in source_status."""
+
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from amplifier_app_cli.utils import source_status
+from amplifier_app_cli.utils.module_cache import CachedModuleInfo
+
+
+def _cached(module_id, url, ref="main", sha="aaaaaaaa"):
+    return CachedModuleInfo(
+        module_id=module_id,
+        module_type="tool",
+        ref=ref,
+        sha=sha,
+        url=url,
+        is_mutable=True,
+        cached_at="",
+        cache_path=MagicMock(),
+        display_name=module_id,
+    )
+
+
+async def _check(modules, fake_sha, **kwargs):
+    with (
+        patch(
+            "amplifier_app_cli.utils.module_cache.scan_cached_modules",
+            return_value=modules,
+        ),
+        patch.object(
+            source_status, "_get_all_sources_to_check", AsyncMock(return_value={})
+        ),
+        patch.object(source_status, "_get_github_commit_sha", side_effect=fake_sha),
+    ):
+        return await source_status.check_all_sources(
+            client=MagicMock(spec=httpx.AsyncClient), include_all_cached=True, **kwargs
+        )
+
+
+@pytest.mark.asyncio
+async def test_modules_from_one_repo_share_a_request():
+    requested = []
+
+    async def fake_sha(client, url, ref):
+        requested.append((url, ref))
+        await asyncio.sleep(0.01)
+        return "b" * 40
+
+    report = await _check(
+        [
+            _cached("tool-a", "https://github.com/org/tools"),
+            _cached("tool-b", "https://github.com/Org/tools.git"),
+            _cached("tool-c", "https://github.com/org/other"),
+        ],
+        fake_sha,
+    )
+
+    assert len(requested) == 2
+    assert [s.name for s in report.cached_git_sources] == ["tool-a", "tool-b", "tool-c"]
+    assert all(s.has_update for s in report.cached_git_sources)
+    assert sorted(t.sources for t in report.remote_checks) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_requests_are_bounded_and_failures_are_isolated():
+    in_flight = 0
+    peak = 0
+
+    async def fake_sha(client, url, ref):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if url.endswith("broken"):
+            raise httpx.ConnectError("down")
+        return "a" * 40
+
+    modules = [_cached(f"tool-{i}", f"https://github.com/org/t{i}") for i in range(9)]
+    modules.append(_cached("tool-x", "https://github.com/org/broken"))
+
+    report = await _check(modules, fake_sha, max_concurrency=3)
+
+    assert peak == 3
+    assert report.cached_modules_checked == 10
+    assert len(report.cached_git_sources) == 9
+    assert not any(s.has_update for s in report.cached_git_sources)
+    errors = [t for t in report.remote_checks if t.error]
+    assert [(t.url, t.error) for t in errors] == [
+        ("https://github.com/org/broken", "ConnectError")
+    ]
@@ -0,0 +1,430 @@
+"""CLI overhead benchmarks with a JSON report for diffing between commits.
+
+Everything runs offline against a synthetic home: a local bundle whose
+provider (echo), orchestrator and context manager are stub modules, update
+checks disabled, and a project with 10k saved sessions. Each case runs the
+CLI in fresh interpreters and records the median wall time.
+
+Run with:
+
+    pytest -m benchmark -s tests/test_startup_benchmark.py
+
+The report goes to ``startup-benchmark.json`` (or $AMPLIFIER_BENCHMARK_REPORT).
+Set $AMPLIFIER_BENCHMARK_BASELINE to an earlier report to print the change
+per metric.
+"""
+
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import textwrap
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+REPO_ROOT = Path(__file__).parent.parent
+REPORT_FORMAT = 1
+ROUNDS = 5
+SLOW_ROUNDS = 3
+SESSION_COUNT = 10_000
+
+BUNDLE = """\
+---
+bundle:
+  name: bench
+  version: 0.0.0
+  description: Benchmark bundle backed by stub modules
+
+session:
+  orchestrator:
+    module: loop-bench
+    source: file://{modules}/loop-bench
+  context:
+    module: context-bench
+    source: file://{modules}/context-bench
+
+providers:
+  - module: provider-echo
+    source: file://{modules}/provider-echo
+    config:
+      default_model: echo
+---
+
+Benchmark bundle.
+"""
+
+STUB_MODULES = {
+    "provider-echo": '''
+        """Provider that answers every request with the last user message."""
+
+
+        class EchoProvider:
+            name = "echo"
+            default_model = "echo"
+
+            def get_info(self):
+                return {"id": "echo", "display_name": "Echo"}
+
+            async def list_models(self):
+                return []
+
+            async def complete(self, messages, **kwargs):
+                for message in reversed(messages):
+                    if message.get("role") == "user":
+                        return f"echo: {message.get('content')}"
+                return "echo"
+
+            def parse_tool_calls(self, response):
+                return []
+
+
+        async def mount(coordinator, config=None):
+            await coordinator.mount("providers", EchoProvider(), name="echo")
+        ''',
+    "loop-bench": '''
+        """Orchestrator that makes exactly one provider call per prompt."""
+
+
+        class BenchOrchestrator:
+            async def execute(
+                self, prompt, context, providers, tools, hooks, **kwargs
+            ):
+                await context.add_message({"role": "user", "content": prompt})
+                provider = next(iter(providers.values()))
+                reply = await provider.complete(await context.get_messages())
+                await context.add_message({"role": "assistant", "content": reply})
+                return reply
+
+
+        async def mount(coordinator, config=None):
+            await coordinator.mount("orchestrator", BenchOrchestrator())
+        ''',
+    "context-bench": '''
+        """In-memory context manager."""
+
+
+        class BenchContext:
+            def __init__(self):
+                self.messages = []
+
+            async def add_message(self, message):
+                self.messages.append(message)
+
+            async def get_messages(self):
+                return list(self.messages)
+
+            async def get_messages_for_request(self, *args, **kwargs):
+                return list(self.messages)
+
+            async def set_messages(self, messages):
+                self.messages = list(messages)
+
+            async def clear(self):
+                self.messages = []
+
+
+        async def mount(coordinator, config=None):
+            await coordinator.mount("context", BenchContext())
+        ''',
+}
+
+RESOLVE_SCRIPT = textwrap.dedent(
+    """
+    import asyncio
+    import time
+
+    from amplifier_app_cli.lib.settings import AppSettings
+    from amplifier_app_cli.runtime.config import resolve_bundle_config
+
+    start = time.perf_counter()
+    asyncio.run(resolve_bundle_config("bench", AppSettings()))
+    print(time.perf_counter() - start)
+    """
+)
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| +(\S+)")
+
+
+@pytest.fixture(scope="module")
+def home(tmp_path_factory):
+    """Synthetic ~ with the stub bundle configured and a project of sessions."""
+    home = tmp_path_factory.mktemp("bench-home")
+    modules = home / "modules"
+    for module_id, source in STUB_MODULES.items():
+        package_name = f"amplifier_module_{module_id.replace('-', '_')}"
+        package = modules / module_id / package_name
+        package.mkdir(parents=True)
+        (package / "__init__.py").write_text(textwrap.dedent(source).lstrip())
+    (home / "bench").mkdir()
+    (home / "bench" / "bundle.md").write_text(BUNDLE.format(modules=modules))
+
+    amplifier_dir = home / ".amplifier"
+    amplifier_dir.mkdir()
+    settings = {
+        "updates": {"auto_prompt": False, "check_frequency_hours": 4},
+        "bundle": {
+            "active": "bench",
+            "added": {"bench": f"file://{home / 'bench' / 'bundle.md'}"},
+        },
+        "config": {
+            "providers": [
+                {
+                    "module": "provider-echo",
+                    "source": f"file://{modules / 'provider-echo'}",
+                    "config": {"default_model": "echo"},
+                }
+            ]
+        },
+    }
+    # JSON is valid YAML
+    (amplifier_dir / "settings.yaml").write_text(json.dumps(settings, indent=2))
+
+    project = home / "project"
+    project.mkdir()
+    # Same slug as project_utils.get_project_slug() for this cwd
+    slug = str(project.resolve()).replace("/", "-").replace("\\", "-")
+    slug = slug.replace(":", "")
+    if not slug.startswith("-"):
+        slug = "-" + slug
+    _write_sessions(amplifier_dir / "projects" / slug / "sessions", SESSION_COUNT)
+    return home
+
+
+@pytest.fixture(scope="module")
+def report():
+    """Collects metrics; written (and compared to a baseline) after the module."""
+    metrics: dict[str, dict] = {}
+    yield metrics
+
+    path = Path(
+        os.environ.get("AMPLIFIER_BENCHMARK_REPORT", "startup-benchmark.json")
+    )
+    data = {
+        "format": REPORT_FORMAT,
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "metrics": dict(sorted(metrics.items())),
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n")
+    print(f"\nBenchmark report: {path.resolve()}")
+
+    baseline = os.environ.get("AMPLIFIER_BENCHMARK_BASELINE")
+    if baseline:
+        _print_comparison(json.loads(Path(baseline).read_text()), data)
+
+
+def test_import_main(home, report):
+    code = "import amplifier_app_cli.main"
+    elapsed = _time_runs(lambda: _run(home, "-c", code), ROUNDS)
+
+    result = _run(home, "-X", "importtime", "-c", code)
+    imports = []
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, name = match.groups()
+        imports.append((name, int(self_us)))
+        if name == "amplifier_app_cli.main":
+            total_us = int(cumulative_us)
+    slowest = sorted(imports, key=lambda item: item[1], reverse=True)[:15]
+
+    report["import_main"] = {
+        **_summary(elapsed),
+        "importtime_ms": round(total_us / 1000, 1),
+        "modules_imported": len(imports),
+        "slowest_self_ms": {name: round(us / 1000, 1) for name, us in slowest},
+    }
+    print(f"\nimport amplifier_app_cli.main: {report['import_main']['median_ms']} ms")
+
+
+def test_help(home, report):
+    help_args = ("-m", "amplifier_app_cli", "--help")
+    report["help"] = _summary(_time_runs(lambda: _run(home, *help_args), ROUNDS))
+    print(f"\namplifier --help: {report['help']['median_ms']} ms")
+
+
+def test_session_list(home, report):
+    project = home / "project"
+    sessions_dirs = list((home / ".amplifier" / "projects").glob("*/sessions"))
+
+    def cold():
+        # Without an index the store rebuilds it from the session directories
+        for sessions in sessions_dirs:
+            (sessions / ".index.jsonl").unlink(missing_ok=True)
+        return _run(home, "-m", "amplifier_app_cli", "session", "list", cwd=project)
+
+    def warm():
+        return _run(home, "-m", "amplifier_app_cli", "session", "list", cwd=project)
+
+    report["session_list_cold"] = _summary(_time_runs(cold, SLOW_ROUNDS))
+    report["session_list_warm"] = _summary(_time_runs(warm, ROUNDS))
+    report["session_list_warm"]["sessions"] = SESSION_COUNT
+    print(
+        f"\namplifier session list ({SESSION_COUNT} sessions): "
+        f"cold {report['session_list_cold']['median_ms']} ms, "
+        f"warm {report['session_list_warm']['median_ms']} ms"
+    )
+
+
+def test_resolve_bundle_config(home, report):
+    plan_cache = home / ".amplifier" / "cache" / "mount-plans"
+
+    def resolve(clear_cache: bool) -> float:
+        if clear_cache:
+            shutil.rmtree(plan_cache, ignore_errors=True)
+        result = _run(home, "-c", RESOLVE_SCRIPT, cwd=home / "project")
+        return float(result.stdout.strip().splitlines()[-1])
+
+    cold = sorted(resolve(clear_cache=True) for _ in range(SLOW_ROUNDS))
+    warm = sorted(resolve(clear_cache=False) for _ in range(SLOW_ROUNDS))
+
+    report["resolve_bundle_config_cold"] = _summary(cold)
+    report["resolve_bundle_config_warm"] = _summary(warm)
+    print(
+        f"\nresolve_bundle_config: cold "
+        f"{report['resolve_bundle_config_cold']['median_ms']} ms, warm "
+        f"{report['resolve_bundle_config_warm']['median_ms']} ms"
+    )
+
+
+def test_first_turn(home, report):
+    args = ("-m", "amplifier_app_cli", "--profile-startup=json", "run", "hello")
+    results = []
+
+    def first_turn():
+        result = _run(home, *args, cwd=home / "project")
+        results.append(result)
+        return result
+
+    samples = _time_runs(first_turn, SLOW_ROUNDS)
+    assert "echo: hello" in results[-1].stdout
+
+    profile = _startup_profile(results[-1].stderr)
+    report["first_turn"] = {
+        **_summary(samples),
+        "startup_phases_ms": {
+            phase["name"]: phase["duration"]
+            for phase in profile.get("phases", [])
+            if phase.get("depth") == 0
+        },
+    }
+    print(f"\namplifier run (echo provider): {report['first_turn']['median_ms']} ms")
+
+
+def _write_sessions(sessions: Path, count: int) -> None:
+    base = time.time() - count
+    for i in range(count):
+        session_id = str(uuid.UUID(int=i + 1))
+        session_dir = sessions / session_id
+        session_dir.mkdir(parents=True)
+        metadata = {
+            "session_id": session_id,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(base + i)),
+            "bundle": "bench",
+            "model": "echo",
+            "name": f"benchmark session {i}",
+        }
+        (session_dir / "metadata.json").write_text(json.dumps(metadata))
+        (session_dir / "transcript.jsonl").write_text(
+            json.dumps({"role": "user", "content": f"question {i}"})
+            + "\n"
+            + json.dumps({"role": "assistant", "content": f"echo: question {i}"})
+            + "\n"
+        )
+        os.utime(session_dir / "metadata.json", (base + i, base + i))
+
+
+def _run(home: Path, *args: str, cwd: Path | None = None):
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith("AMPLIFIER_")
+    }
+    env["HOME"] = env["USERPROFILE"] = str(home)
+    # Stub modules are importable directly, so nothing is installed or fetched
+    modules = [str(path) for path in sorted((home / "modules").iterdir())]
+    env["PYTHONPATH"] = os.pathsep.join(
+        [*modules, str(REPO_ROOT), env.get("PYTHONPATH", "")]
+    ).rstrip(os.pathsep)
+    result = subprocess.run(
+        [sys.executable, *args],
+        cwd=cwd or home,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=600,
+    )
+    assert result.returncode == 0, (
+        f"{' '.join(args)} failed:\n{result.stdout}\n{result.stderr[-4000:]}"
+    )
+    return result
+
+
+def _time_runs(run, rounds: int) -> list[float]:
+    """Sorted wall-time samples (seconds) of ``rounds`` calls."""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+    return sorted(samples)
+
+
+def _summary(samples: list[float]) -> dict:
+    return {
+        "median_ms": round(samples[len(samples) // 2] * 1000, 1),
+        "samples_ms": [round(sample * 1000, 1) for sample in samples],
+    }
+
+
+def _startup_profile(stderr: str) -> dict:
+    start = stderr.find('{\n  "total_ms"')
+    if start == -1:
+        return {}
+    try:
+        profile, _end = json.JSONDecoder().raw_decode(stderr[start:])
+    except ValueError:
+        return {}
+    return profile
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except OSError:
+        return None
+    return result.stdout.strip() or None
+
+
+def _print_comparison(baseline: dict, current: dict) -> None:
+    print(
+        f"\n{'metric':<28} {'baseline ms':>12} {'current ms':>11} {'change':>8}"
+        f"   ({(baseline.get('commit') or '?')[:10]} -> "
+        f"{(current.get('commit') or '?')[:10]})"
+    )
+    for name, metric in current["metrics"].items():
+        before = baseline.get("metrics", {}).get(name, {}).get("median_ms")
+        after = metric["median_ms"]
+        if not before:
+            print(f"{name:<28} {'-':>12} {after:>11.1f}")
+            continue
+        change = (after - before) / before * 100
+        print(f"{name:<28} {before:>12.1f} {after:>11.1f} {change:>+7.1f}%")
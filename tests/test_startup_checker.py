@@ -0,0 +1,119 @@
+"""Tests for the background startup update check."""
+
+import threading
+from datetime import datetime
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from amplifier_app_cli.utils import startup_checker
+
+
+def test_background_check_does_not_block_and_notifies_once():
+    release = threading.Event()
+    calls = []
+
+    async def fake_check(*, notify: bool = True, on_checked=None) -> bool:
+        calls.append(notify)
+        release.wait(timeout=5)
+        return True
+
+    console = MagicMock()
+    with patch.object(startup_checker, "check_and_notify", fake_check):
+        check = startup_checker.start_background_check()
+
+        # Still running: nothing printed, caller not blocked
+        assert not startup_checker.notify_if_updates(console)
+
+        release.set()
+        check._thread.join(timeout=5)
+
+    assert calls == [False]
+    assert startup_checker.notify_if_updates(console)
+    assert not startup_checker.notify_if_updates(console)
+    printed = " ".join(str(c.args[0]) for c in console.print.call_args_list if c.args)
+    assert "Updates available" in printed
+
+
+def test_background_check_failure_means_no_notice():
+    async def failing_check(*, notify: bool = True, on_checked=None) -> bool:
+        raise RuntimeError("network down")
+
+    with patch.object(startup_checker, "check_and_notify", failing_check):
+        check = startup_checker.start_background_check()
+        check._thread.join(timeout=5)
+
+    assert check.done
+    assert not startup_checker.notify_if_updates(MagicMock())
+
+
+def test_background_check_persists_last_check_on_main_thread():
+    checked_at = datetime(2026, 1, 2, 3, 4, 5)
+
+    async def fake_check(*, notify: bool = True, on_checked=None) -> bool:
+        on_checked(checked_at)
+        return False
+
+    saved = []
+
+    def fake_save(timestamp):
+        saved.append((timestamp, threading.current_thread()))
+
+    with (
+        patch.object(startup_checker, "check_and_notify", fake_check),
+        patch.object(startup_checker, "save_update_last_check", fake_save),
+    ):
+        check = startup_checker.start_background_check()
+        check._thread.join(timeout=5)
+        assert saved == []
+
+        assert not startup_checker.notify_if_updates(MagicMock())
+        assert not startup_checker.notify_if_updates(MagicMock())
+
+    assert saved == [(checked_at, threading.current_thread())]
+
+
+def test_save_update_last_check_replaces_settings_atomically(tmp_path):
+    from amplifier_app_cli.utils import settings_manager
+
+    settings_file = tmp_path / "settings.yaml"
+    settings_file.write_text("config:\n  providers: [p]\n")
+    inode = settings_file.stat().st_ino
+
+    with patch.object(settings_manager, "SETTINGS_FILE", settings_file):
+        settings_manager.save_update_last_check(datetime(2026, 1, 2))
+        settings = settings_manager.load_settings()
+
+    assert settings["config"] == {"providers": ["p"]}
+    assert settings["updates"]["last_check"] == "2026-01-02T00:00:00"
+    # Written to a temp file and renamed over, never truncated in place
+    assert settings_file.stat().st_ino != inode
+    assert sorted(p.name for p in tmp_path.iterdir() if not p.name.endswith(".lock")) == [
+        "settings.yaml"
+    ]
+
+
+def test_exit_hook_waits_briefly_and_persists_without_a_notice_call(monkeypatch):
+    # json output never calls notify_if_updates; the exit hook saves instead
+    checked_at = datetime(2026, 1, 2, 3, 4, 5)
+    release = threading.Event()
+
+    async def fake_check(*, notify: bool = True, on_checked=None) -> bool:
+        release.wait(timeout=5)
+        on_checked(checked_at)
+        return True
+
+    saved = []
+    with (
+        patch.object(startup_checker, "check_and_notify", fake_check),
+        patch.object(startup_checker, "save_update_last_check", saved.append),
+        patch.object(startup_checker.atexit, "register") as register,
+    ):
+        monkeypatch.setattr(startup_checker, "_background_check", None)
+        startup_checker.start_background_check()
+        startup_checker.start_background_check()
+        assert register.call_count == 1
+
+        release.set()
+        startup_checker._finish_at_exit()
+
+    assert saved == [checked_at]
@@ -0,0 +1,71 @@
+"""Tests for the --profile-startup phase profiler."""
+
+import json
+
+from amplifier_app_cli.startup_profile import StartupProfiler
+
+
+def _profiler(**kwargs) -> StartupProfiler:
+    profiler = StartupProfiler()
+    profiler.imports_done()
+    profiler.enable(**kwargs)
+    return profiler
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = StartupProfiler()
+
+    with profiler.phase("settings"):
+        profiler.progress("load", "foundation")
+    profiler.finish("first prompt")
+
+    assert profiler.phases == []
+
+
+def test_nested_phases_and_progress_actions(capsys):
+    profiler = _profiler(output_format="json")
+
+    with profiler.phase("bundle preparation"):
+        profiler.progress("load", "foundation")
+        profiler.progress("prepare", "")
+    with profiler.phase("update check"):
+        pass
+    profiler.finish("first prompt")
+
+    report = json.loads(capsys.readouterr().err)
+    names = [(p["name"], p["depth"]) for p in report["phases"]]
+    assert names == [
+        ("imports", 0),
+        ("cli dispatch", 0),
+        ("bundle preparation", 0),
+        ("load foundation", 1),
+        ("prepare", 1),
+        ("update check", 0),
+        ("first prompt", 0),
+    ]
+    assert report["total_ms"] >= report["phases"][-1]["duration"]
+
+
+def test_report_is_written_once(capsys):
+    profiler = _profiler()
+
+    profiler.finish("first prompt")
+    profiler.report()
+    with profiler.phase("late"):
+        pass
+
+    err = capsys.readouterr().err
+    assert err.count("Startup profile") == 1
+    assert "late" not in [p.name for p in profiler.phases]
+
+
+def test_cprofile_dump_per_top_level_phase(tmp_path, capsys):
+    profiler = _profiler(cprofile_dir=tmp_path / "prof")
+
+    with profiler.phase("Bundle preparation"):
+        with profiler.phase("agent metadata"):
+            sum(range(1000))
+    profiler.finish("first prompt")
+
+    dumps = sorted(p.name for p in (tmp_path / "prof").iterdir())
+    assert len(dumps) == 1 and dumps[0].endswith("-bundle-preparation.prof")
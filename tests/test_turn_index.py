@@ -0,0 +1,89 @@
+"""Tests for the byte-offset turn index (turn_index.json)."""
+
+import json
+
+from amplifier_app_cli.session_store import SessionStore
+from amplifier_app_cli.turn_index import TURN_INDEX_FILENAME
+from amplifier_app_cli.turn_index import TurnIndex
+
+
+def _turn(i: int) -> list[dict]:
+    return [
+        {"role": "user", "content": f"question {i}"},
+        {"role": "assistant", "content": f"answer {i}"},
+    ]
+
+
+def _conversation(n: int) -> list[dict]:
+    return [m for i in range(1, n + 1) for m in _turn(i)]
+
+
+def test_index_maintained_across_rewrite_and_appends(tmp_path):
+    store = SessionStore(tmp_path)
+    store.save("s1", _conversation(2), {})
+    store.save("s1", _conversation(3), {})  # append
+    store.save("s1", _conversation(5), {})  # append
+
+    index = TurnIndex(tmp_path / "s1")
+    data = json.loads((tmp_path / "s1" / TURN_INDEX_FILENAME).read_text())
+    transcript_file = tmp_path / "s1" / "transcript.jsonl"
+    assert data["transcript"]["size"] == transcript_file.stat().st_size
+
+    assert index.turn_count() == 5
+    assert index.read_messages(3, 3) == _turn(3)
+    assert index.read_messages(4) == _turn(4) + _turn(5)
+
+
+def test_stale_index_is_rebuilt(tmp_path):
+    store = SessionStore(tmp_path)
+    store.save("s1", _conversation(2), {})
+
+    # Transcript rewritten by something other than the store (e.g. a fork)
+    transcript_file = tmp_path / "s1" / "transcript.jsonl"
+    transcript_file.write_text(
+        "".join(json.dumps(m) + "\n" for m in _conversation(4))
+    )
+
+    index = TurnIndex(tmp_path / "s1")
+    assert index.turn_count() == 4
+    assert index.read_messages(4, 4) == _turn(4)
+
+
+def test_events_turns_scan_incrementally(tmp_path):
+    session_dir = tmp_path / "s1"
+    session_dir.mkdir()
+    events_file = session_dir / "events.jsonl"
+
+    def _events(turn: int) -> str:
+        return (
+            json.dumps({"event": "prompt:submit", "data": {"prompt": f"q{turn}"}})
+            + "\n"
+            + json.dumps({"event": "llm:response", "data": {"turn": turn}})
+            + "\n"
+        )
+
+    events_file.write_text(_events(1) + _events(2))
+    index = TurnIndex(session_dir)
+    first_two = index.events_turns()
+    assert first_two == [0, len(_events(1))]
+
+    with open(events_file, "a") as f:
+        f.write(_events(3))
+    assert index.events_turns() == [*first_two, len(_events(1) + _events(2))]
+
+    assert index.events_end_offset(2) == len(_events(1) + _events(2))
+    assert index.events_end_offset(3) is None
+
+
+def test_partial_event_line_not_indexed(tmp_path):
+    session_dir = tmp_path / "s1"
+    session_dir.mkdir()
+    events_file = session_dir / "events.jsonl"
+    events_file.write_text('{"event": "prompt:submit"}\n{"event": "prompt:sub')
+
+    index = TurnIndex(session_dir)
+    assert index.events_turns() == [0]
+
+    with open(events_file, "a") as f:
+        f.write('mit"}\n')
+    assert index.events_turns() == [0, len('{"event": "prompt:submit"}\n')]